@@ -128,11 +128,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             await app.state.redis.aclose()
         raise
 
-    # Initialize PostgreSQL connection pool
+    # Initialize shared async PostgreSQL connection pool
     try:
-        from packages.common.postgres_pool import PostgresPool
+        from packages.common.async_postgres_pool import AsyncPostgresPool
 
-        postgres_pool = PostgresPool(config)
+        postgres_pool = await AsyncPostgresPool.create(config)
         app.state.postgres_pool = postgres_pool
         logger.info(
             "PostgreSQL connection pool initialized",
@@ -160,10 +160,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down Taboot API")
 
+    # Flush buffered document events before connections go away
+    try:
+        await ingest.close_event_dispatcher()
+    except Exception as e:
+        logger.exception("Error flushing document events", extra={"error": str(e)})
+
+    try:
+        await ingest.close_embedder()
+    except Exception as e:
+        logger.exception("Error closing embedder", extra={"error": str(e)})
+
+    try:
+        ingest.close_document_preparer()
+    except Exception as e:
+        logger.exception("Error shutting down document preparer", extra={"error": str(e)})
+
     # Close PostgreSQL pool
     if hasattr(app.state, "postgres_pool"):
         try:
-            app.state.postgres_pool.close_all()
+            await app.state.postgres_pool.close()
             logger.info("PostgreSQL connection pool closed")
         except Exception as e:
             logger.exception("Error closing PostgreSQL pool", extra={"error": str(e)})
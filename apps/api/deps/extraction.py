@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator
 from functools import lru_cache
 from typing import Annotated
 
@@ -11,9 +10,8 @@ from fastapi import Depends, Request
 from redis.asyncio import Redis
 
 from apps.api.deps.auth import get_redis_client
-from packages.clients.postgres_document_store import PostgresDocumentStore
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
 from packages.common.config import get_config
-from packages.common.db_schema import get_postgres_client
 from packages.common.health import check_system_health
 from packages.core.use_cases.extract_pending import ExtractPendingUseCase
 from packages.core.use_cases.get_status import GetStatusUseCase
@@ -93,19 +91,14 @@ def get_extraction_orchestrator(
     return orchestrator
 
 
-def get_document_store() -> Iterator[PostgresDocumentStore]:
-    """Yield a PostgreSQL-backed document store for request-scoped operations."""
-    conn = get_postgres_client()
-    store = PostgresDocumentStore(conn)
-    try:
-        yield store
-    finally:
-        conn.close()
+def get_document_store(request: Request) -> AsyncPostgresDocumentStore:
+    """Provide a document store backed by the application's shared async pool."""
+    return AsyncPostgresDocumentStore(request.app.state.postgres_pool)
 
 
 def get_extract_use_case(
     orchestrator: Annotated[ExtractionOrchestrator, Depends(get_extraction_orchestrator)],
-    document_store: Annotated[PostgresDocumentStore, Depends(get_document_store)],
+    document_store: Annotated[AsyncPostgresDocumentStore, Depends(get_document_store)],
 ) -> ExtractPendingUseCase:
     """Construct the extract pending use case with injected dependencies."""
     return ExtractPendingUseCase(
@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 from apps.api.deps import get_document_store
 from apps.api.schemas import ResponseEnvelope
-from packages.clients.postgres_document_store import PostgresDocumentStore
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
 from packages.core.use_cases.list_documents import DocumentListResponse
 from packages.schemas.models import ExtractionState, SourceType
 
@@ -22,7 +22,7 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 
 
 @router.get("", response_model=ResponseEnvelope[DocumentListResponse])
-def list_documents(
+async def list_documents(
     limit: Annotated[
         int,
         Query(
@@ -51,7 +51,7 @@ def list_documents(
         ),
     ] = None,
     *,
-    document_store: Annotated[PostgresDocumentStore, Depends(get_document_store)],
+    document_store: Annotated[AsyncPostgresDocumentStore, Depends(get_document_store)],
 ) -> ResponseEnvelope[DocumentListResponse]:
     """List ingested documents with optional filters and pagination.
 
@@ -109,7 +109,7 @@ def list_documents(
                 ) from None
 
         # Query documents with filters
-        documents = document_store.query_documents(
+        documents = await document_store.query_documents(
             limit=limit,
             offset=offset,
             source_type=source_type_enum,
@@ -117,7 +117,7 @@ def list_documents(
         )
 
         # Get total count for pagination
-        total = document_store.count_documents(
+        total = await document_store.count_documents(
             source_type=source_type_enum,
             extraction_state=extraction_state_enum,
         )
@@ -9,6 +9,7 @@ Required by FR-033: API MUST provide ingestion endpoints with job tracking.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from functools import lru_cache
 from types import ModuleType
 from typing import TYPE_CHECKING, Any
@@ -18,17 +19,21 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request,
 from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
-    from packages.ingest.postgres_job_store import PostgresJobStore
+    from packages.common.async_postgres_pool import AsyncPostgresPool
+    from packages.ingest.async_postgres_job_store import AsyncPostgresJobStore
 
 from datetime import UTC, datetime
 
 from apps.api.deps.auth import verify_api_key
+from apps.api.routes.metrics import ingest_pipeline_queue_depth
 from packages.common.validators import URLValidationError, validate_url
 from packages.core.use_cases.ingest_web import IngestWebUseCase
 from packages.ingest.adapters.redis_streams_publisher import RedisDocumentEventPublisher
 from packages.ingest.chunker import Chunker
 from packages.ingest.embedder import Embedder
+from packages.ingest.embedding_cache import CachedEmbedder
 from packages.ingest.normalizer import Normalizer
+from packages.ingest.preparer import DocumentPreparer
 from packages.ingest.readers.web import WebReader
 from packages.ingest.services.document_events import DocumentEventDispatcher
 from packages.schemas.models import (
@@ -39,6 +44,7 @@ from packages.schemas.models import (
     JobState,
     SourceType,
 )
+from packages.vector.embedding_store import LocalEmbeddingStore
 from packages.vector.writer import QdrantWriter
 
 redis_async: ModuleType | None
@@ -53,8 +59,8 @@ router = APIRouter()
 
 
 @lru_cache(maxsize=1)
-def _get_event_dispatcher() -> DocumentEventDispatcher | None:
-    """Lazily construct a document event dispatcher when enabled."""
+def _get_event_publisher() -> RedisDocumentEventPublisher | None:
+    """Lazily construct the lag-aware document event publisher when enabled."""
 
     if redis_async is None:
         return None
@@ -67,12 +73,107 @@ def _get_event_dispatcher() -> DocumentEventDispatcher | None:
         return None
 
     redis_client = redis_async.from_url(config.redis_url)
-    publisher = RedisDocumentEventPublisher(
+    # API ingests are interactive: publish on the priority lane when configured
+    return RedisDocumentEventPublisher(
         redis_client=redis_client,
-        stream_name=config.ingest_events_stream,
+        stream_name=config.ingest_events_priority_stream or config.ingest_events_stream,
+        group_name=config.ingest_events_group,
+        lag_high_watermark=config.ingest_events_lag_high_watermark,
+        lag_low_watermark=config.ingest_events_lag_low_watermark,
+        lag_check_interval=config.ingest_events_lag_check_interval,
+        max_backpressure_wait=config.ingest_events_backpressure_max_wait,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_event_dispatcher() -> DocumentEventDispatcher | None:
+    """Lazily construct a document event dispatcher when enabled."""
+
+    publisher = _get_event_publisher()
+    if publisher is None:
+        return None
+
+    from packages.common.config import get_config
+
+    config = get_config()
+    return DocumentEventDispatcher(
+        publisher,
+        enabled=True,
+        max_batch_size=config.ingest_events_flush_size,
+        flush_interval=config.ingest_events_flush_interval,
     )
 
-    return DocumentEventDispatcher(publisher, enabled=True)
+
+@lru_cache(maxsize=1)
+def _get_embedder() -> Embedder | CachedEmbedder:
+    """Shared embedder so ingestion jobs reuse one pooled TEI connection set."""
+
+    from packages.common.config import get_config
+    from packages.common.factories import make_embedder
+
+    return make_embedder(get_config())
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_store() -> LocalEmbeddingStore | None:
+    """Shared local embedding store (None unless EMBEDDING_STORE_DIR is set)."""
+
+    from packages.common.config import get_config
+    from packages.common.factories import make_embedding_store
+
+    return make_embedding_store(get_config())
+
+
+@lru_cache(maxsize=1)
+def _get_document_preparer() -> DocumentPreparer:
+    """Shared normalize/chunk preparer so jobs reuse one process pool."""
+
+    from packages.common.config import get_config
+
+    return DocumentPreparer(Normalizer(), Chunker(), workers=get_config().ingest_prepare_workers)
+
+
+def _queue_depth_recorder() -> Callable[[str, int], None]:
+    """Build a per-job callback that adds its queue depths to the shared gauge.
+
+    Depth changes are applied as deltas so concurrent jobs sum rather than
+    overwrite each other.
+    """
+
+    last: dict[str, int] = {}
+
+    def record(stage: str, depth: int) -> None:
+        ingest_pipeline_queue_depth.labels(stage=stage).inc(depth - last.get(stage, 0))
+        last[stage] = depth
+
+    return record
+
+
+async def close_event_dispatcher() -> None:
+    """Flush buffered ingest events; called on application shutdown."""
+
+    if _get_event_dispatcher.cache_info().currsize:
+        dispatcher = _get_event_dispatcher()
+        if dispatcher is not None:
+            await dispatcher.aclose()
+
+
+async def close_embedder() -> None:
+    """Close the shared embedder's HTTP clients; called on application shutdown."""
+
+    if _get_embedder.cache_info().currsize:
+        embedder = _get_embedder()
+        await embedder.aclose()
+        embedder.close()
+        _get_embedder.cache_clear()
+
+
+def close_document_preparer() -> None:
+    """Shut down the shared preparer's process pool; called on application shutdown."""
+
+    if _get_document_preparer.cache_info().currsize:
+        _get_document_preparer().close()
+        _get_document_preparer.cache_clear()
 
 
 class IngestionRequest(BaseModel):
@@ -135,15 +236,17 @@ class IngestionJobStatus(BaseModel):
     errors: list[dict[str, Any]] | None
 
 
-def get_ingest_use_case() -> IngestWebUseCase:
+def get_ingest_use_case(pool: AsyncPostgresPool) -> IngestWebUseCase:
     """Dependency factory for IngestWebUseCase.
 
+    Args:
+        pool: Shared async PostgreSQL pool from application state.
+
     Returns:
         IngestWebUseCase: Configured use case instance.
     """
-    from packages.clients.postgres_document_store import PostgresDocumentStore
+    from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
     from packages.common.config import get_config
-    from packages.common.db_schema import get_postgres_client
 
     config = get_config()
 
@@ -151,23 +254,17 @@ def get_ingest_use_case() -> IngestWebUseCase:
     web_reader = WebReader(
         firecrawl_url=config.firecrawl_api_url,
         firecrawl_api_key=config.firecrawl_api_key.get_secret_value(),
+        poll_interval=config.firecrawl_poll_interval,
     )
-    normalizer = Normalizer()
-    chunker = Chunker()
-    tei_settings = config.tei_config
-    embedder = Embedder(
-        tei_url=str(tei_settings.url),
-        batch_size=tei_settings.batch_size,
-        timeout=float(tei_settings.timeout),
-    )
+    preparer = _get_document_preparer()
     qdrant_writer = QdrantWriter(
         url=config.qdrant_url,
         collection_name=config.collection_name,
+        embedding_store=_get_embedding_store(),
     )
 
-    # Initialize PostgreSQL document store
-    pg_conn = get_postgres_client()
-    document_store = PostgresDocumentStore(pg_conn)
+    # Initialize PostgreSQL document store on the shared pool
+    document_store = AsyncPostgresDocumentStore(pool)
 
     dispatcher = _get_event_dispatcher()
     document_callback = None
@@ -180,28 +277,36 @@ def get_ingest_use_case() -> IngestWebUseCase:
 
     return IngestWebUseCase(
         web_reader=web_reader,
-        normalizer=normalizer,
-        chunker=chunker,
-        embedder=embedder,
+        normalizer=preparer.normalizer,
+        chunker=preparer.chunker,
+        embedder=_get_embedder(),
         qdrant_writer=qdrant_writer,
         document_store=document_store,
         collection_name=config.collection_name,
         flush_threshold=config.ingest_flush_threshold,
         document_ingested_callback=document_callback,
+        backpressure=_get_event_publisher(),
+        queue_size=config.ingest_pipeline_queue_size,
+        queue_depth_callback=_queue_depth_recorder(),
+        embed_concurrency=config.ingest_embed_concurrency,
+        upsert_concurrency=config.ingest_upsert_concurrency,
+        vectors_as_array=config.ingest_vectors_as_array,
+        preparer=preparer,
     )
 
 
-def get_job_store() -> PostgresJobStore:
-    """Dependency factory for PostgresJobStore.
+def get_job_store(pool: AsyncPostgresPool) -> AsyncPostgresJobStore:
+    """Dependency factory for AsyncPostgresJobStore.
+
+    Args:
+        pool: Shared async PostgreSQL pool from application state.
 
     Returns:
-        PostgresJobStore: Configured job store instance.
+        AsyncPostgresJobStore: Configured job store instance.
     """
-    from packages.common.db_schema import get_postgres_client
-    from packages.ingest.postgres_job_store import PostgresJobStore
+    from packages.ingest.async_postgres_job_store import AsyncPostgresJobStore
 
-    pg_conn = get_postgres_client()
-    return PostgresJobStore(pg_conn)
+    return AsyncPostgresJobStore(pool)
 
 
 async def _execute_ingestion_job(
@@ -209,7 +314,7 @@ async def _execute_ingestion_job(
     url: str,
     limit: int | None,
     use_case: IngestWebUseCase,
-    job_store: PostgresJobStore,
+    job_store: AsyncPostgresJobStore,
 ) -> None:
     """Background task to execute ingestion and update job store asynchronously.
 
@@ -218,14 +323,14 @@ async def _execute_ingestion_job(
         url: URL to ingest.
         limit: Optional page limit.
         use_case: IngestWebUseCase instance.
-        job_store: PostgresJobStore instance.
+        job_store: AsyncPostgresJobStore instance.
     """
     try:
         logger.info(f"Starting background ingestion for job {job_id}")
         # Execute use case asynchronously with pre-generated job_id
         completed_job = await use_case.execute(url=url, limit=limit, job_id=job_id)
         # Update job store with final state
-        job_store.update(completed_job)
+        await job_store.update(completed_job)
         logger.info(f"Completed background ingestion for job {job_id}")
     except Exception as e:
         logger.exception(f"Background ingestion failed for job {job_id}: {e}")
@@ -301,11 +406,12 @@ async def start_ingestion(
     )
 
     # Persist PENDING job immediately
-    job_store = get_job_store()
-    job_store.create(job)
+    pool = request.app.state.postgres_pool
+    job_store = get_job_store(pool)
+    await job_store.create(job)
 
     # Queue background task to execute ingestion
-    use_case = get_ingest_use_case()
+    use_case = get_ingest_use_case(pool)
     background_tasks.add_task(
         _execute_ingestion_job,
         job_id=job_id,
@@ -329,12 +435,13 @@ async def start_ingestion(
 
 
 @router.get("/{job_id}", response_model=dict[str, Any], status_code=status.HTTP_200_OK)
-async def get_ingestion_status(job_id: UUID) -> dict[str, Any]:
+async def get_ingestion_status(request: Request, job_id: UUID) -> dict[str, Any]:
     """Get ingestion job status.
 
     Retrieves current status and progress of an ingestion job.
 
     Args:
+        request: FastAPI request (for the shared PostgreSQL pool).
         job_id: Job UUID to retrieve.
 
     Returns:
@@ -345,8 +452,8 @@ async def get_ingestion_status(job_id: UUID) -> dict[str, Any]:
     """
     from apps.api.schemas.envelope import ResponseEnvelope
 
-    job_store = get_job_store()
-    job = job_store.get_by_id(job_id)
+    job_store = get_job_store(request.app.state.postgres_pool)
+    job = await job_store.get_by_id(job_id)
 
     if job is None:
         raise HTTPException(
@@ -112,6 +112,13 @@ qdrant_points_count = Gauge(
     registry=REGISTRY,
 )
 
+ingest_pipeline_queue_depth = Gauge(
+    "ingest_pipeline_queue_depth",
+    "Items waiting between web ingestion pipeline stages",
+    ["stage"],
+    registry=REGISTRY,
+)
+
 # LLM metrics
 llm_call_duration_seconds = Histogram(
     "llm_call_duration_seconds",
@@ -8,6 +8,7 @@ This package contains all CLI command implementations organized by functionality
 - graph: Direct Neo4j graph operations
 - init: System initialization
 - list_documents: List ingested documents
+- vector: Qdrant collection maintenance
 
 Shared sub-apps are created here to avoid duplication across command modules.
 """
@@ -23,6 +24,7 @@ extract_app = typer.Typer(name="extract", help="Run extraction pipeline")
 list_app = typer.Typer(name="list", help="List resources")
 graph_app = typer.Typer(name="graph", help="Execute Cypher queries")
 schema_app = typer.Typer(name="schema", help="Manage database schema versions")
+vector_app = typer.Typer(name="vector", help="Manage the Qdrant vector collection")
 
 __all__ = [
     "extract_app",
@@ -46,4 +48,6 @@ __all__ = [
     "query",
     "schema_app",
     "status",
+    "vector",
+    "vector_app",
 ]
@@ -1,7 +1,7 @@
 """Extract pending command for Taboot CLI.
 
 Implements the extraction workflow using ExtractPendingUseCase:
-1. Accept optional --limit parameter
+1. Accept optional --limit and --concurrency parameters
 2. Create and configure all dependencies (ExtractionOrchestrator, DocumentStore)
 3. Execute ExtractPendingUseCase
 4. Display progress and results
@@ -47,26 +47,48 @@ class InMemoryDocumentStore:
         self._documents: dict[UUID, Document] = {}
         self._content: dict[UUID, str] = {}
 
-    def query_pending(self, limit: int | None = None) -> list[Document]:
-        """Query documents in PENDING extraction state.
+    async def claim_pending(
+        self, worker_id: str, limit: int = 1, lease_seconds: int = 300
+    ) -> list[Document]:
+        """Move up to ``limit`` PENDING documents to PROCESSING.
 
         Args:
-            limit: Optional maximum number of documents to return.
+            worker_id: Claiming worker (unused; there is a single process).
+            limit: Maximum number of documents to claim.
+            lease_seconds: Lease duration (unused; leases never expire here).
 
         Returns:
-            list[Document]: List of documents with extraction_state == PENDING.
+            list[Document]: Claimed documents.
         """
         pending = [
             doc
             for doc in self._documents.values()
             if doc.extraction_state == ExtractionState.PENDING
+        ][:limit]
+
+        claimed = [
+            doc.model_copy(update={"extraction_state": ExtractionState.PROCESSING})
+            for doc in pending
         ]
+        for doc in claimed:
+            self._documents[doc.doc_id] = doc
+        return claimed
+
+    async def renew_lease(self, doc_id: UUID, worker_id: str, lease_seconds: int = 300) -> bool:
+        """Report whether the document is still being processed.
 
-        if limit is not None:
-            return pending[:limit]
-        return pending
+        Args:
+            doc_id: Leased document UUID.
+            worker_id: Worker that holds the lease.
+            lease_seconds: New lease duration (unused).
 
-    def get_content(self, doc_id: UUID) -> str:
+        Returns:
+            bool: True while the document is PROCESSING.
+        """
+        doc = self._documents.get(doc_id)
+        return doc is not None and doc.extraction_state == ExtractionState.PROCESSING
+
+    async def get_content(self, doc_id: UUID) -> str:
         """Get document text content by doc_id.
 
         Args:
@@ -83,7 +105,7 @@ class InMemoryDocumentStore:
             raise KeyError(str(doc_id))
         return self._content[doc_id]
 
-    def update_document(self, document: Document) -> None:
+    async def update_document(self, document: Document) -> None:
         """Update document in store.
 
         Args:
@@ -108,6 +130,12 @@ async def extract_pending_command(
     limit: Annotated[
         int | None, typer.Option("--limit", "-l", help="Maximum number of documents to process")
     ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency", "-c", min=1, help="Number of documents to extract concurrently"
+        ),
+    ] = 1,
 ) -> None:
     """Extract pending documents through multi-tier extraction pipeline.
 
@@ -121,10 +149,12 @@ async def extract_pending_command(
 
     Args:
         limit: Optional maximum number of documents to process.
+        concurrency: Maximum number of documents extracted concurrently.
 
     Example:
         uv run apps/cli extract pending
         uv run apps/cli extract pending --limit 10
+        uv run apps/cli extract pending --concurrency 8
 
     Expected output:
         Extraction Pipeline
@@ -142,7 +172,10 @@ async def extract_pending_command(
 
         # Display starting message
         limit_str = f"limit: {limit}" if limit else "no limit"
-        console.print(f"[yellow]Starting extraction pipeline ({limit_str})[/yellow]")
+        console.print(
+            f"[yellow]Starting extraction pipeline ({limit_str}, "
+            f"concurrency: {concurrency})[/yellow]"
+        )
 
         # Create dependencies
         logger.info("Creating extraction pipeline dependencies")
@@ -173,23 +206,23 @@ async def extract_pending_command(
             redis_client=redis_client,
         )
 
-        # Create document store (PostgreSQL)
-        from packages.clients.postgres_document_store import PostgresDocumentStore
-        from packages.common.db_schema import get_postgres_client
+        # Create document store (PostgreSQL, shared async pool)
+        from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
+        from packages.common.async_postgres_pool import AsyncPostgresPool
 
-        pg_conn = get_postgres_client()
-        try:
-            document_store = PostgresDocumentStore(pg_conn)
+        async with AsyncPostgresPool(config) as pg_pool:
+            document_store = AsyncPostgresDocumentStore(pg_pool)
 
             # Create use case
             use_case = ExtractPendingUseCase(
                 orchestrator=orchestrator,
                 document_store=document_store,
+                lease_seconds=config.extraction_lease_seconds,
             )
 
             # Execute extraction
             logger.info("Executing extraction for pending documents")
-            summary = await use_case.execute(limit=limit)
+            summary = await use_case.execute(limit=limit, concurrency=concurrency)
 
             # Display results
             console.print("\n[bold cyan]Extraction Pipeline[/bold cyan]")
@@ -208,8 +241,6 @@ async def extract_pending_command(
                 summary["succeeded"],
                 summary["failed"],
             )
-        finally:
-            pg_conn.close()
 
         # Close Redis connection
         await redis_client.close()
@@ -1,5 +1,6 @@
 """Ingest Elasticsearch command for Taboot CLI."""
 
+import asyncio
 import json
 import logging
 from typing import Annotated
@@ -7,12 +8,11 @@ from typing import Annotated
 import typer
 from rich.console import Console
 
-from packages.clients.postgres_document_store import PostgresDocumentStore
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
+from packages.common.async_postgres_pool import AsyncPostgresPool
 from packages.common.config import get_config
-from packages.common.db_schema import get_postgres_client
 from packages.core.use_cases.ingest_elasticsearch import IngestElasticsearchUseCase
 from packages.ingest.chunker import Chunker
-from packages.ingest.embedder import Embedder
 from packages.ingest.normalizer import Normalizer
 from packages.ingest.readers.elasticsearch import ElasticsearchReader
 from packages.vector.writer import QdrantWriter
@@ -67,35 +67,45 @@ from __future__ import annotations
         )
         normalizer = Normalizer()
         chunker = Chunker()
-        tei_settings = config.tei_config
-        embedder = Embedder(
-            tei_url=str(tei_settings.url),
-            batch_size=tei_settings.batch_size,
-            timeout=float(tei_settings.timeout),
-        )
+
+        from packages.common.factories import make_embedder, make_embedding_store
+
+        embedder = make_embedder(config)
         qdrant_writer = QdrantWriter(
             url=config.qdrant_url,
             collection_name=config.collection_name,
+            embedding_store=make_embedding_store(config),
         )
-        pg_conn = get_postgres_client()
-        document_store = PostgresDocumentStore(pg_conn)
 
         try:
-            # Create and execute use case
-            use_case = IngestElasticsearchUseCase(
-                elasticsearch_reader=elasticsearch_reader,
-                normalizer=normalizer,
-                chunker=chunker,
-                embedder=embedder,
-                qdrant_writer=qdrant_writer,
-                document_store=document_store,
-                collection_name=config.collection_name,
-                index=index,
-            )
+
+            async def _run_ingestion() -> dict[str, int]:
+                # The pool must live on the same event loop as the use case
+                async with AsyncPostgresPool(config) as pg_pool:
+                    use_case = IngestElasticsearchUseCase(
+                        elasticsearch_reader=elasticsearch_reader,
+                        normalizer=normalizer,
+                        chunker=chunker,
+                        embedder=embedder,
+                        qdrant_writer=qdrant_writer,
+                        document_store=AsyncPostgresDocumentStore(pg_pool),
+                        collection_name=config.collection_name,
+                        index=index,
+                        flush_threshold=config.ingest_flush_threshold,
+                        queue_size=config.ingest_pipeline_queue_size,
+                        embed_concurrency=config.ingest_embed_concurrency,
+                        upsert_concurrency=config.ingest_upsert_concurrency,
+                        vectors_as_array=config.ingest_vectors_as_array,
+                    )
+                    try:
+                        return await use_case.execute(query=query_dict, limit=limit)
+                    finally:
+                        # Keep-alive connections belong to this loop
+                        await embedder.aclose()
 
             # Display progress
             console.print("[yellow]Loading documents from Elasticsearch...[/yellow]")
-            stats = use_case.execute(query=query_dict, limit=limit)
+            stats = asyncio.run(_run_ingestion())
 
             # Display results
             console.print(
@@ -106,8 +116,7 @@ from __future__ import annotations
 
         finally:
             # Ensure all resources are closed
-            document_store.close()
-            pg_conn.close()
+            qdrant_writer.close()
 
     except ValueError as e:
         console.print(f"[yellow]⚠ {e}[/yellow]")
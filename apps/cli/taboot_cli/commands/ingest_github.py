@@ -111,9 +111,12 @@ def ingest_github_command(
                 timeout=float(tei_settings.timeout),
             )
             stack.callback(embedder.close)
+            from packages.common.factories import make_embedding_store
+
             qdrant_writer = QdrantWriter(
                 url=config.qdrant_url,
                 collection_name=config.collection_name,
+                embedding_store=make_embedding_store(config),
             )
             stack.callback(qdrant_writer.close)
             pg_conn = get_postgres_client()
@@ -58,9 +58,12 @@ from __future__ import annotations
             batch_size=tei_settings.batch_size,
             timeout=float(tei_settings.timeout),
         )
+        from packages.common.factories import make_embedding_store
+
         qdrant_writer = QdrantWriter(
             url=config.qdrant_url,
             collection_name=config.collection_name,
+            embedding_store=make_embedding_store(config),
         )
 
         try:
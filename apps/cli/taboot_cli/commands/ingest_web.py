@@ -22,6 +22,7 @@ import typer
 from rich.console import Console
 
 if TYPE_CHECKING:
+
     class RedisClient(Protocol):
         """Protocol for async Redis client."""
 
@@ -34,19 +35,20 @@ if TYPE_CHECKING:
         def from_url(self, url: str, *args, **kwargs) -> RedisClient:
             """Create Redis client from URL."""
 
+
 from apps.cli.taboot_cli.commands import ingest_app as app
-from packages.clients.postgres_document_store import PostgresDocumentStore
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
+from packages.common.async_postgres_pool import AsyncPostgresPool
 from packages.common.config import get_config
-from packages.common.db_schema import get_postgres_client
 from packages.core.use_cases.ingest_web import IngestWebUseCase
 from packages.ingest.adapters.redis_streams_publisher import RedisDocumentEventPublisher
 from packages.ingest.chunker import Chunker
-from packages.ingest.embedder import Embedder
 from packages.ingest.normalizer import Normalizer
+from packages.ingest.preparer import DocumentPreparer
 from packages.ingest.readers.web import WebReader
 from packages.ingest.services.document_events import DocumentEventDispatcher
 from packages.schemas.models import Document as DocumentModel
-from packages.schemas.models import JobState
+from packages.schemas.models import IngestionJob, JobState
 from packages.vector.writer import QdrantWriter
 
 redis_async: RedisAsyncModule | None
@@ -102,32 +104,31 @@ def ingest_web_command(
         web_reader = WebReader(
             firecrawl_url=config.firecrawl_api_url,
             firecrawl_api_key=config.firecrawl_api_key.get_secret_value(),
+            poll_interval=config.firecrawl_poll_interval,
         )
         normalizer = Normalizer()
         chunker = Chunker()
-        tei_settings = config.tei_config
+
+        from packages.common.factories import make_embedder, make_embedding_store
 
         # Initialize resources with ExitStack to ensure cleanup
         with ExitStack() as stack:
-            embedder = Embedder(
-                tei_url=str(tei_settings.url).rstrip("/"),
-                batch_size=tei_settings.batch_size,
-                timeout=float(tei_settings.timeout),
-            )
+            embedder = make_embedder(config)
             stack.callback(embedder.close)
 
             qdrant_writer = QdrantWriter(
                 url=config.qdrant_url,
                 collection_name=config.collection_name,
+                embedding_store=make_embedding_store(config),
             )
             stack.callback(qdrant_writer.close)
 
-            pg_conn = get_postgres_client()
-            stack.callback(pg_conn.close)
-
-            document_store = PostgresDocumentStore(pg_conn)
+            preparer = DocumentPreparer(normalizer, chunker, workers=config.ingest_prepare_workers)
+            stack.callback(preparer.close)
 
             document_callback = None
+            event_publisher: RedisDocumentEventPublisher | None = None
+            dispatcher: DocumentEventDispatcher | None = None
             redis_client = None
             if config.enable_ingest_events and redis_async is not None:
                 redis_client = redis_async.from_url(config.redis_url)
@@ -137,37 +138,64 @@ def ingest_web_command(
 
                 stack.callback(_close_redis)
 
-                dispatcher = DocumentEventDispatcher(
-                    RedisDocumentEventPublisher(
-                        redis_client=redis_client,
-                        stream_name=config.ingest_events_stream,
-                    ),
+                event_publisher = RedisDocumentEventPublisher(
+                    redis_client=redis_client,
+                    stream_name=config.ingest_events_stream,
+                    group_name=config.ingest_events_group,
+                    lag_high_watermark=config.ingest_events_lag_high_watermark,
+                    lag_low_watermark=config.ingest_events_lag_low_watermark,
+                    lag_check_interval=config.ingest_events_lag_check_interval,
+                    max_backpressure_wait=config.ingest_events_backpressure_max_wait,
+                )
+                event_dispatcher = DocumentEventDispatcher(
+                    event_publisher,
                     enabled=True,
+                    max_batch_size=config.ingest_events_flush_size,
+                    flush_interval=config.ingest_events_flush_interval,
                 )
 
                 def _dispatch(document: DocumentModel, chunk_count: int) -> None:
-                    dispatcher.dispatch_document_ingested(document, chunk_count=chunk_count)
+                    event_dispatcher.dispatch_document_ingested(document, chunk_count=chunk_count)
 
+                dispatcher = event_dispatcher
                 document_callback = _dispatch
 
-            # Create use case
-            use_case = IngestWebUseCase(
-                web_reader=web_reader,
-                normalizer=normalizer,
-                chunker=chunker,
-                embedder=embedder,
-                qdrant_writer=qdrant_writer,
-                document_store=document_store,
-                collection_name=config.collection_name,
-                document_ingested_callback=document_callback,
-            )
+            async def _run_ingestion() -> IngestionJob:
+                # The pool must live on the same event loop as the use case
+                async with AsyncPostgresPool(config) as pg_pool:
+                    use_case = IngestWebUseCase(
+                        web_reader=web_reader,
+                        normalizer=normalizer,
+                        chunker=chunker,
+                        embedder=embedder,
+                        qdrant_writer=qdrant_writer,
+                        document_store=AsyncPostgresDocumentStore(pg_pool),
+                        collection_name=config.collection_name,
+                        flush_threshold=config.ingest_flush_threshold,
+                        document_ingested_callback=document_callback,
+                        backpressure=event_publisher,
+                        queue_size=config.ingest_pipeline_queue_size,
+                        embed_concurrency=config.ingest_embed_concurrency,
+                        upsert_concurrency=config.ingest_upsert_concurrency,
+                        vectors_as_array=config.ingest_vectors_as_array,
+                        preparer=preparer,
+                    )
+
+                    logger.info("Executing web ingestion for %s", url)
+                    try:
+                        return await use_case.execute(url=url, limit=limit)
+                    finally:
+                        # Publish events still buffered before the loop shuts down
+                        if dispatcher is not None:
+                            await dispatcher.aclose()
+                        # Keep-alive connections belong to this loop
+                        await embedder.aclose()
 
             # Track start time for duration calculation
             start_time = datetime.now(UTC)
 
             # Execute ingestion
-            logger.info("Executing web ingestion for %s", url)
-            job = asyncio.run(use_case.execute(url=url, limit=limit))
+            job = asyncio.run(_run_ingestion())
 
             # Calculate duration
             end_time = datetime.now(UTC)
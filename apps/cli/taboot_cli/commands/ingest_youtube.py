@@ -1,5 +1,6 @@
 """Ingest YouTube command for Taboot CLI."""
 
+import asyncio
 import logging
 from typing import Annotated
 
@@ -27,8 +28,16 @@ from __future__ import annotations
 
         use_case, cleanup = make_ingest_youtube_use_case()
         try:
+
+            async def _run_ingestion() -> dict[str, int]:
+                try:
+                    return await use_case.execute(urls=urls)
+                finally:
+                    # Keep-alive connections and the cache client belong to this loop
+                    await use_case.embedder.aclose()
+
             console.print("[yellow]Loading transcripts...[/yellow]")
-            result = use_case.execute(urls=urls)
+            result = asyncio.run(_run_ingestion())
 
             videos_processed = result["videos_processed"]
             chunks_created = result["chunks_created"]
@@ -0,0 +1,81 @@
+"""Vector collection commands for Taboot CLI.
+
+Provides commands for managing the Qdrant collection:
+- vector rebuild: Re-index from the local embedding store into a new version
+"""
+
+from __future__ import annotations
+
+import typer
+from qdrant_client import QdrantClient
+from rich.console import Console
+
+from packages.common.config import get_config
+from packages.common.logging import get_logger
+from packages.vector.embedding_store import LocalEmbeddingStore
+from packages.vector.migrations.versioning import QdrantMigration, versioned_collection_name
+
+console = Console()
+logger = get_logger(__name__)
+
+
+def rebuild_command(
+    version: str,
+    store_dir: str | None = None,
+    batch_size: int = 1000,
+    force: bool = False,
+) -> None:
+    """Rebuild the Qdrant collection from the local embedding store.
+
+    Streams stored vectors and payloads into ``<collection>_v<version>``
+    (created with the current collection contract), then switches the
+    collection alias to it. No TEI calls are made. The alias is left alone if
+    the store holds fewer or more points than the live collection, unless
+    ``force`` is set.
+
+    Args:
+        version: New collection version (e.g., "2.0.0").
+        store_dir: Embedding store directory (default: EMBEDDING_STORE_DIR).
+        batch_size: Points per upsert request.
+        force: Switch the alias even if the point counts differ.
+
+    Example:
+        $ taboot vector rebuild 2.0.0
+        ✓ Rebuilt taboot_documents_v2_0_0 with 184223 points
+          Alias taboot_documents → taboot_documents_v2_0_0
+    """
+    config = get_config()
+    directory = store_dir or config.embedding_store_dir
+    if not directory:
+        console.print(
+            "[red]No embedding store configured (set EMBEDDING_STORE_DIR or --store-dir)[/red]"
+        )
+        raise typer.Exit(1)
+
+    collection_name = config.collection_name
+    versioned_name = versioned_collection_name(collection_name, version)
+    client = QdrantClient(url=config.qdrant_url)
+
+    try:
+        store = LocalEmbeddingStore(
+            directory,
+            dim=config.qdrant_embedding_dim,
+            model_id=config.tei_embedding_model,
+        )
+        console.print(
+            f"[yellow]Rebuilding {versioned_name} from {store.row_count} stored vectors...[/yellow]"
+        )
+
+        written = QdrantMigration(client).rebuild_from_store(
+            store, collection_name, version, batch_size=batch_size, force=force
+        )
+
+        console.print(f"[green]✓ Rebuilt {versioned_name} with {written} points[/green]")
+        console.print(f"  Alias {collection_name} → {versioned_name}")
+
+    except Exception as e:
+        console.print(f"[red]Error rebuilding vector collection: {e}[/red]")
+        logger.exception("Failed to rebuild vector collection")
+        raise typer.Exit(1) from e
+    finally:
+        client.close()
@@ -14,6 +14,7 @@ from apps.cli.taboot_cli.commands import (
     ingest_app,
     list_app,
     schema_app,
+    vector_app,
 )
 # Import ingest commands to trigger registration (web and swag have @app.command decorators)
 from apps.cli.taboot_cli.commands import ingest_swag, ingest_web  # noqa: F401
@@ -41,6 +42,9 @@ async def extract_pending(
     limit: int | None = typer.Option(
         None, "--limit", "-l", help="Maximum number of documents to process"
     ),
+    concurrency: int = typer.Option(
+        1, "--concurrency", "-c", min=1, help="Number of documents to extract concurrently"
+    ),
 ) -> None:
     """
     Process all documents awaiting extraction.
@@ -53,10 +57,11 @@ async def extract_pending(
     Examples:
         taboot extract pending
         taboot extract pending --limit 10
+        taboot extract pending --concurrency 8
     """
     from apps.cli.taboot_cli.commands.extract_pending import extract_pending_command
 
-    await extract_pending_command(limit=limit)
+    await extract_pending_command(limit=limit, concurrency=concurrency)
 
 
 @extract_app.command(name="status")
@@ -260,6 +265,42 @@ def schema_history(
 app.add_typer(schema_app, name="schema")
 
 
+# Register vector subcommand group with commands
+@vector_app.command(name="rebuild")
+def vector_rebuild(
+    version: str = typer.Argument(..., help="New collection version (e.g., 2.0.0)"),
+    store_dir: str | None = typer.Option(
+        None, "--store-dir", help="Embedding store directory (default: EMBEDDING_STORE_DIR)"
+    ),
+    batch_size: int = typer.Option(
+        1000, "--batch-size", "-b", min=1, help="Points per Qdrant upsert"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Switch the alias even if point counts differ from the live one"
+    ),
+) -> None:
+    """
+    Rebuild the vector collection from the local embedding store.
+
+    Creates a new versioned collection with the current collection settings,
+    streams stored vectors into it without re-embedding, and switches the
+    collection alias to the new version. The old version is kept for rollback.
+    The alias is not switched if the rebuilt collection's point count differs
+    from the live collection's, unless --force is given.
+
+    Examples:
+        taboot vector rebuild 2.0.0
+        taboot vector rebuild 2.0.0 --store-dir /data/embeddings --batch-size 2000
+        taboot vector rebuild 2.0.0 --force
+    """
+    from apps.cli.taboot_cli.commands.vector import rebuild_command
+
+    rebuild_command(version=version, store_dir=store_dir, batch_size=batch_size, force=force)
+
+
+app.add_typer(vector_app, name="vector")
+
+
 @app.command()
 def init() -> None:
     """
@@ -4,21 +4,34 @@ Polls Redis queue for pending extraction jobs and processes them asynchronously.
 Supports graceful shutdown and error handling.
 """
 
+import argparse
 import asyncio
+import contextlib
 import json
 import logging
+import os
 import signal
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from multiprocessing.queues import Queue
 from types import FrameType
-from typing import Protocol
+from typing import Any, Protocol
 from uuid import UUID, uuid4
 
-import psycopg2
+from prometheus_client import Histogram, start_http_server
 from redis import asyncio as redis
 from redis.exceptions import ResponseError
 
-from packages.clients.postgres_document_store import PostgresDocumentStore
+from apps.worker.supervisor import StatsMessage, WorkerSupervisor
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
+from packages.clients.postgres_document_store import DEFAULT_LEASE_SECONDS
+from packages.common.async_postgres_pool import AsyncPostgresPool
 from packages.common.config import get_config
+from packages.common.dlq import DeadLetterQueue
 from packages.core.events import DocumentIngestedEvent
+from packages.core.ports.event_publisher import DocumentEventPublisher
 from packages.core.use_cases.extract_pending import ExtractPendingUseCase
 from packages.extraction.orchestrator import ExtractionOrchestrator
 from packages.extraction.tier_a import parsers
@@ -26,117 +39,148 @@ from packages.extraction.tier_a.patterns import EntityPatternMatcher
 from packages.extraction.tier_b.window_selector import WindowSelector
 from packages.extraction.tier_c.llm_client import TierCLLMClient
 from packages.ingest.adapters.redis_streams_consumer import RedisDocumentEventConsumer
+from packages.ingest.adapters.redis_streams_publisher import RedisDocumentEventPublisher
 
 logger = logging.getLogger(__name__)
 
 # Queue names
 QUEUE_EXTRACTION = "queue:extraction"
 
+# Ingest event priority lanes
+LANE_BULK = "bulk"
+LANE_INTERACTIVE = "interactive"
+
+extraction_lane_latency_seconds = Histogram(
+    "taboot_extraction_lane_latency_seconds",
+    "Time from ingest event publish to extraction completion",
+    ["lane"],
+    buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0),
+)
+
+
+class ExtractionFailedError(RuntimeError):
+    """Raised when a claimed document finished extraction in a failed state."""
+
 
 class SingleDocExtractor(Protocol):
     """Protocol for single-document extraction."""
 
-    async def execute(self, doc_id: UUID) -> None:
+    async def execute(self, doc_id: UUID) -> bool:
         """Execute extraction for a single document.
 
         Args:
             doc_id: Document ID to extract.
+
+        Returns:
+            False if the document could not be claimed (nothing was extracted).
         """
         ...
 
 
+class LeaseReaper(Protocol):
+    """Protocol for returning expired extraction leases to the backlog."""
+
+    async def reap_expired_leases(self) -> list[UUID]:
+        """Reset expired PROCESSING documents to PENDING.
+
+        Returns:
+            Ids of the documents reaped.
+        """
+        ...
+
+
+class FailedDocumentRequeuer(Protocol):
+    """Protocol for returning failed documents to the backlog for a retry."""
+
+    async def requeue_failed(self, doc_ids: Sequence[UUID]) -> list[UUID]:
+        """Reset FAILED (or abandoned PROCESSING) documents to PENDING.
+
+        Returns:
+            Ids of the documents that are PENDING and can be claimed.
+        """
+        ...
+
+
+@dataclass
+class EventLane:
+    """An ingest event stream scheduled with a relative weight."""
+
+    name: str
+    consumer: RedisDocumentEventConsumer
+    weight: int = 1
+    credit: int = 0
+
+
 class SingleDocExtractorAdapter:
     """Adapter for ExtractPendingUseCase to SingleDocExtractor protocol.
 
-    Wraps ExtractPendingUseCase and filters to process a single document by doc_id.
-    This adapter allows the worker to process individual documents from the queue
-    while reusing the batch-oriented ExtractPendingUseCase infrastructure.
+    Claims a single pending document by doc_id and runs it through the
+    use case's per-document pipeline. The claim is a lease (SKIP LOCKED), so
+    concurrent workers never extract the same document; the use case renews
+    the lease while extraction runs.
     """
 
     def __init__(
         self,
         use_case: ExtractPendingUseCase,
-        document_store: PostgresDocumentStore,
+        document_store: AsyncPostgresDocumentStore,
+        worker_id: str | None = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
     ) -> None:
         """Initialize adapter with use case and document store.
 
         Args:
             use_case: ExtractPendingUseCase instance for extraction pipeline.
-            document_store: PostgresDocumentStore for document filtering.
+            document_store: AsyncPostgresDocumentStore for claiming documents.
+            worker_id: Lease owner identifier (defaults to a random id).
+            lease_seconds: Lease duration; renewed every third of this interval.
         """
         self.use_case = use_case
         self.document_store = document_store
-        logger.info("Initialized SingleDocExtractorAdapter")
+        self.worker_id = worker_id or f"worker-{uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
+        logger.info(
+            "Initialized SingleDocExtractorAdapter (worker_id=%s, lease=%ss)",
+            self.worker_id,
+            lease_seconds,
+        )
 
-    async def execute(self, doc_id: UUID) -> None:
+    async def execute(self, doc_id: UUID) -> bool:
         """Execute extraction for a single document.
 
-        Filters pending documents by doc_id and processes through the use case.
-        If the document is not in PENDING state or doesn't exist, logs a warning.
+        Claims the document with one indexed query restricted to PENDING state.
+        If the document is not pending, doesn't exist, or is claimed by another
+        worker, logs a warning.
 
         Args:
             doc_id: Document ID to extract.
 
+        Returns:
+            bool: True if the document was claimed and extracted, False if it
+                was not claimable.
+
         Raises:
-            Exception: If extraction pipeline fails for the document.
+            ExtractionFailedError: If extraction left the document FAILED.
         """
-        # Query all pending documents (use case handles filtering by PENDING state)
-        # Then filter by doc_id
-        from packages.schemas.models import Document
-
-        pending_docs = self.document_store.query_pending(limit=None)
-        target_doc: Document | None = None
-
-        for doc in pending_docs:
-            if doc.doc_id == doc_id:
-                target_doc = doc
-                break
+        target_doc = await self.document_store.claim_by_id(
+            doc_id, self.worker_id, lease_seconds=self.lease_seconds
+        )
 
         if target_doc is None:
             logger.warning(
                 f"Document {doc_id} not found in PENDING state - may have been "
-                f"processed already or does not exist"
+                f"processed already, claimed by another worker, or does not exist"
             )
-            return
-
-        # Process single document by temporarily replacing query_pending
-        # to return only this document
-        class SingleDocStore:
-            """Wrapper that filters to single document."""
-
-            def __init__(self, base_store: PostgresDocumentStore, doc: Document):
-                self.base_store = base_store
-                self.target_doc = doc
-
-            def query_pending(self, limit: int | None = None) -> list[Document]:
-                """Return only the target document."""
-                return [self.target_doc]
+            return False
 
-            def get_content(self, doc_id: UUID) -> str:
-                """Delegate to base store."""
-                return self.base_store.get_content(doc_id)
-
-            def update_document(self, document: Document) -> None:
-                """Delegate to base store."""
-                self.base_store.update_document(document)
-
-        # Create single-doc filtered store
-        single_doc_store = SingleDocStore(self.document_store, target_doc)
-
-        # Execute use case with filtered store
-        # Temporarily swap the store
-        original_store = self.use_case.document_store
-        self.use_case.document_store = single_doc_store
+        succeeded = await self.use_case.process_leased(
+            target_doc, worker_id=self.worker_id, lease_seconds=self.lease_seconds
+        )
 
-        try:
-            result = await self.use_case.execute(limit=1)
-            logger.info(
-                f"Extraction complete for {doc_id}: processed={result['processed']}, "
-                f"succeeded={result['succeeded']}, failed={result['failed']}"
-            )
-        finally:
-            # Restore original store
-            self.use_case.document_store = original_store
+        logger.info(f"Extraction complete for {doc_id}: succeeded={succeeded}")
+        if not succeeded:
+            raise ExtractionFailedError(f"Extraction failed for document {doc_id}")
+        return True
 
 
 class ExtractionWorker:
@@ -152,6 +196,18 @@ class ExtractionWorker:
         extract_use_case: SingleDocExtractor | None = None,
         poll_timeout: int = 5,
         event_consumer: RedisDocumentEventConsumer | None = None,
+        lease_reaper: LeaseReaper | None = None,
+        reap_interval: float = 60.0,
+        batch_size: int = 1,
+        concurrency: int = 1,
+        reclaim_idle_ms: int | None = None,
+        retry_queue: DeadLetterQueue | None = None,
+        retry_store: FailedDocumentRequeuer | None = None,
+        retry_publisher: DocumentEventPublisher | None = None,
+        retry_poll_interval: float = 5.0,
+        retry_batch_size: int = 100,
+        priority_consumer: RedisDocumentEventConsumer | None = None,
+        priority_weight: int = 4,
     ) -> None:
         """Initialize ExtractionWorker.
 
@@ -159,14 +215,70 @@ class ExtractionWorker:
             redis_client: Redis client for queue operations.
             extract_use_case: Use case for extraction (optional for testing).
             poll_timeout: Timeout for Redis BLPOP in seconds.
+            event_consumer: Optional Redis Streams consumer for bulk ingest events.
+            lease_reaper: Optional store used to reap expired extraction leases.
+            reap_interval: Seconds between expired-lease sweeps.
+            batch_size: Maximum stream events read per XREADGROUP call.
+            concurrency: Maximum stream events extracted concurrently.
+            reclaim_idle_ms: Reclaim stream events left pending by other
+                consumers for at least this long (None disables XAUTOCLAIM).
+            retry_queue: Optional delayed-retry scheduler for failed documents.
+                When set, failures are scheduled with backoff (and dead-lettered
+                after max_retries) instead of being retried immediately.
+            retry_store: Store used to reset failed documents before a retry.
+            retry_publisher: Publisher used to re-emit due retries and reaped
+                documents onto the ingest stream (defaults to pushing onto
+                queue:extraction).
+            retry_poll_interval: Seconds between due-retry promotion sweeps.
+            retry_batch_size: Maximum retries promoted per sweep.
+            priority_consumer: Optional consumer for the interactive lane.
+            priority_weight: Batches taken from the interactive lane for every
+                bulk batch while both lanes have a backlog.
+
+        Raises:
+            ValueError: If batch_size, concurrency or priority_weight is less than 1.
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        if priority_weight < 1:
+            raise ValueError(f"priority_weight must be >= 1, got {priority_weight}")
+
         self.redis_client = redis_client
         self.extract_use_case = extract_use_case
         self.poll_timeout = poll_timeout
         self.event_consumer = event_consumer
+        self.lease_reaper = lease_reaper
+        self.reap_interval = reap_interval
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.reclaim_idle_ms = reclaim_idle_ms
+        self.retry_queue = retry_queue
+        self.retry_store = retry_store
+        self.retry_publisher = retry_publisher
+        self.retry_poll_interval = retry_poll_interval
+        self.retry_batch_size = retry_batch_size
+        self._last_reap = float("-inf")
+        self._last_retry_poll = float("-inf")
         self._stop_flag = False
-
-        logger.info("Initialized ExtractionWorker (poll_timeout=%ss)", poll_timeout)
+        self._processed = 0
+        self._failed = 0
+
+        # Lanes in priority order; the first one is blocked on when all are idle
+        self.lanes: list[EventLane] = []
+        if priority_consumer is not None:
+            self.lanes.append(EventLane(LANE_INTERACTIVE, priority_consumer, priority_weight))
+        if event_consumer is not None:
+            self.lanes.append(EventLane(LANE_BULK, event_consumer))
+        self._lane_stats = {lane.name: {"processed": 0, "latency_ms": 0} for lane in self.lanes}
+
+        logger.info(
+            "Initialized ExtractionWorker (poll_timeout=%ss, batch_size=%s, concurrency=%s)",
+            poll_timeout,
+            batch_size,
+            concurrency,
+        )
 
     def should_stop(self) -> bool:
         """Check if worker should stop.
@@ -181,6 +293,65 @@ class ExtractionWorker:
         logger.info("Received stop signal")
         self._stop_flag = True
 
+    def get_stats(self) -> dict[str, int]:
+        """Get cumulative extraction counters for this worker.
+
+        Returns:
+            dict[str, int]: Documents processed successfully and failed, plus
+                per-lane processed counts and summed publish-to-done latency.
+        """
+        stats = {"processed": self._processed, "failed": self._failed}
+        for lane, lane_stats in self._lane_stats.items():
+            stats[f"{lane}_processed"] = lane_stats["processed"]
+            stats[f"{lane}_latency_ms_total"] = lane_stats["latency_ms"]
+        return stats
+
+    def _lane_order(self) -> list[EventLane]:
+        """Order lanes for the next poll using smooth weighted round-robin.
+
+        The lane with the most accumulated credit goes first; the rest follow
+        in priority order so an idle lane never leaves the worker waiting.
+        """
+        total = sum(lane.weight for lane in self.lanes)
+        for lane in self.lanes:
+            lane.credit += lane.weight
+        chosen = max(self.lanes, key=lambda lane: lane.credit)
+        chosen.credit -= total
+        return [chosen, *(lane for lane in self.lanes if lane is not chosen)]
+
+    async def _read_lane(
+        self, lane: EventLane, block_ms: int | None
+    ) -> list[tuple[str, DocumentIngestedEvent]]:
+        """Reclaim stranded events from a lane, else read new ones."""
+        events: list[tuple[str, DocumentIngestedEvent]] = []
+
+        # Recover events stranded by crashed consumers before reading new ones
+        if self.reclaim_idle_ms is not None:
+            events = await lane.consumer.autoclaim(
+                min_idle_ms=self.reclaim_idle_ms,
+                count=self.batch_size,
+            )
+            await self._requeue_reclaimed(events)
+
+        if not events:
+            events = await lane.consumer.read(count=self.batch_size, block_ms=block_ms)
+
+        return events
+
+    async def _requeue_reclaimed(self, events: list[tuple[str, DocumentIngestedEvent]]) -> None:
+        """Return the documents of reclaimed events to PENDING so they can be claimed.
+
+        A failed extraction leaves its document FAILED; without this, the
+        reclaimed event would find nothing to claim and be acked unretried.
+        """
+        if not events or self.retry_store is None:
+            return
+
+        try:
+            await self.retry_store.requeue_failed([event.doc_id for _, event in events])
+        except Exception:
+            logger.exception("Failed to requeue documents of %s reclaimed events", len(events))
+
     async def poll_once(self) -> None:
         """Poll queue once and process a single job if available.
 
@@ -191,15 +362,24 @@ class ExtractionWorker:
             Does not raise - handles errors internally.
         """
         try:
-            if self.event_consumer is not None:
-                events = await self.event_consumer.read(
-                    count=1,
-                    block_ms=self.poll_timeout * 1000,
-                )
-
-                if events:
-                    await self._process_stream_events(events)
-                    return
+            if self.lanes:
+                block_ms = self.poll_timeout * 1000
+                multi_lane = len(self.lanes) > 1
+
+                # Weighted-fair pass over lanes without blocking
+                for lane in self._lane_order():
+                    events = await self._read_lane(lane, None if multi_lane else block_ms)
+                    if events:
+                        await self._process_stream_events(events, lane)
+                        return
+
+                # All lanes idle: wait on the highest-priority lane
+                if multi_lane:
+                    lane = self.lanes[0]
+                    events = await lane.consumer.read(count=self.batch_size, block_ms=block_ms)
+                    if events:
+                        await self._process_stream_events(events, lane)
+                        return
 
             # Poll queue with timeout
             result = await self.redis_client.blpop(QUEUE_EXTRACTION, timeout=self.poll_timeout)
@@ -230,43 +410,233 @@ class ExtractionWorker:
 
                 # Process job if use case provided
                 if self.extract_use_case:
-                    await self.extract_use_case.execute(uuid)
+                    try:
+                        claimed = await self.extract_use_case.execute(uuid)
+                    except Exception as exc:
+                        self._failed += 1
+                        logger.exception("Extraction failed for job")
+                        await self._schedule_retry(job, exc)
+                        return
+
+                    if not claimed:
+                        # Not a success: keep the retry count of a pending retry
+                        return
+
+                    self._processed += 1
+                    await self._clear_retry(doc_id)
                     logger.info("Completed extraction for doc_id=%s", doc_id)
 
             except json.JSONDecodeError:
                 logger.exception("Failed to parse job data")
-            except Exception:
-                logger.exception("Extraction failed for job")
                 # Job fails but worker continues
 
         except Exception:
             logger.exception("Error in poll_once")
 
     async def _process_stream_events(
-        self, events: list[tuple[str, DocumentIngestedEvent]]
+        self,
+        events: list[tuple[str, DocumentIngestedEvent]],
+        lane: EventLane | None = None,
     ) -> None:
-        """Handle events read from Redis Streams."""
+        """Handle a batch of events read from one lane of Redis Streams.
 
-        ack_ids: list[str] = []
+        Events are extracted with up to ``concurrency`` in flight. Failed events
+        are acknowledged once a delayed retry has been scheduled for them;
+        without a retry queue (or if scheduling fails) they stay in the
+        consumer group's pending list and are retried via XAUTOCLAIM, which
+        first returns their documents to PENDING through ``retry_store``.
 
-        for message_id, event in events:
-            ack_ids.append(message_id)
+        Args:
+            events: (message_id, event) tuples read from the lane.
+            lane: Lane the events came from (default: the lowest-priority lane).
+        """
+        if lane is None and self.lanes:
+            lane = self.lanes[-1]
 
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def handle(message_id: str, event: DocumentIngestedEvent) -> str | None:
             logger.info(
                 "Processing stream event doc_id=%s chunks=%s", event.doc_id, event.chunk_count
             )
 
             if self.extract_use_case is None:
-                continue
+                return message_id
 
+            async with semaphore:
+                try:
+                    claimed = await self.extract_use_case.execute(event.doc_id)
+                except Exception as exc:
+                    self._failed += 1
+                    logger.exception("Extraction failed for stream event doc_id=%s", event.doc_id)
+                    job = {
+                        "doc_id": str(event.doc_id),
+                        "source_url": event.source_url,
+                        "chunk_count": event.chunk_count,
+                    }
+                    return message_id if await self._schedule_retry(job, exc) else None
+
+            if not claimed:
+                # Nothing to retry from this event; leave the retry count alone
+                return message_id
+
+            self._processed += 1
+            if lane is not None:
+                self._record_lane_latency(lane.name, message_id)
+            await self._clear_retry(str(event.doc_id))
+            logger.info("Completed extraction for doc_id=%s", event.doc_id)
+            return message_id
+
+        results = await asyncio.gather(*(handle(message_id, event) for message_id, event in events))
+        ack_ids = [message_id for message_id in results if message_id is not None]
+
+        if len(ack_ids) < len(events):
+            logger.warning(
+                "Leaving %s failed stream events pending for reclaim", len(events) - len(ack_ids)
+            )
+
+        if lane is not None:
+            await lane.consumer.ack(ack_ids)
+
+    def _record_lane_latency(self, lane: str, message_id: str) -> None:
+        """Record publish-to-completion latency from the stream entry timestamp."""
+        try:
+            published_ms = int(message_id.partition("-")[0])
+        except ValueError:
+            return
+
+        latency_ms = max(0, int(time.time() * 1000) - published_ms)
+        extraction_lane_latency_seconds.labels(lane=lane).observe(latency_ms / 1000)
+        self._lane_stats[lane]["processed"] += 1
+        self._lane_stats[lane]["latency_ms"] += latency_ms
+
+    async def _schedule_retry(self, job: dict[str, Any], exc: Exception) -> bool:
+        """Schedule a delayed retry for a failed job.
+
+        Returns:
+            True if the retry queue took ownership of the job.
+        """
+        if self.retry_queue is None:
+            return False
+
+        try:
+            await self.retry_queue.schedule_retry(job, f"{type(exc).__name__}: {exc}")
+        except Exception:
+            logger.exception("Failed to schedule retry for doc_id=%s", job.get("doc_id"))
+            return False
+        return True
+
+    async def _clear_retry(self, doc_id: str) -> None:
+        """Reset the retry count of a successfully extracted document."""
+        if self.retry_queue is None:
+            return
+
+        try:
+            await self.retry_queue.clear_retry_count(doc_id)
+        except Exception:
+            logger.exception("Failed to clear retry count for doc_id=%s", doc_id)
+
+    async def promote_due_retries(self) -> int:
+        """Move due retries back onto the work queue at most once per interval.
+
+        Failed documents are reset to PENDING, then re-emitted on the ingest
+        stream (or pushed onto queue:extraction) in one batch. Retries whose
+        document is no longer failed (completed, or held by a live lease) are
+        dropped. If requeueing or publishing fails, the claimed retries are put
+        back on the retry set instead of being lost.
+
+        Returns:
+            Number of retries promoted. Does not raise - handles errors internally.
+        """
+        if self.retry_queue is None:
+            return 0
+
+        now = time.monotonic()
+        if now - self._last_retry_poll < self.retry_poll_interval:
+            return 0
+        self._last_retry_poll = now
+
+        try:
+            jobs = await self.retry_queue.promote_due(limit=self.retry_batch_size)
+        except Exception:
+            logger.exception("Failed to claim due extraction retries")
+            return 0
+        if not jobs:
+            return 0
+
+        try:
+            due = jobs
+            if self.retry_store is not None:
+                requeued = set(
+                    await self.retry_store.requeue_failed([UUID(job["doc_id"]) for job in jobs])
+                )
+                due = [job for job in jobs if UUID(job["doc_id"]) in requeued]
+                if len(due) < len(jobs):
+                    logger.info(
+                        "Dropped %s retries for documents that are no longer failed",
+                        len(jobs) - len(due),
+                    )
+
+            if due:
+                await self._republish(due)
+        except Exception:
+            logger.exception("Failed to promote due extraction retries; rescheduling them")
             try:
-                await self.extract_use_case.execute(event.doc_id)
-                logger.info("Completed extraction for doc_id=%s", event.doc_id)
+                await self.retry_queue.reschedule(jobs)
             except Exception:
-                logger.exception("Extraction failed for stream event doc_id=%s", event.doc_id)
+                logger.exception("Failed to reschedule %s extraction retries", len(jobs))
+            return 0
+
+        logger.info("Promoted %s due extraction retries", len(due))
+        return len(due)
 
-        if self.event_consumer is not None:
-            await self.event_consumer.ack(ack_ids)
+    async def reap_expired_leases(self) -> int:
+        """Return expired extraction leases to PENDING at most once per interval.
+
+        Reaped documents are re-emitted like promoted retries; stream workers
+        would otherwise never see them again.
+
+        Returns:
+            Number of documents reaped. Does not raise - handles errors internally.
+        """
+        if self.lease_reaper is None:
+            return 0
+
+        now = time.monotonic()
+        if now - self._last_reap < self.reap_interval:
+            return 0
+        self._last_reap = now
+
+        try:
+            doc_ids = await self.lease_reaper.reap_expired_leases()
+            if not doc_ids:
+                return 0
+            await self._republish([{"doc_id": str(doc_id)} for doc_id in doc_ids])
+        except Exception:
+            logger.exception("Failed to reap expired extraction leases")
+            return 0
+
+        logger.info("Re-published %s documents with expired extraction leases", len(doc_ids))
+        return len(doc_ids)
+
+    async def _republish(self, jobs: Sequence[dict[str, Any]]) -> None:
+        """Re-emit jobs on the ingest stream, or push them onto queue:extraction."""
+        if self.retry_publisher is not None:
+            await self.retry_publisher.publish_many(
+                [
+                    DocumentIngestedEvent(
+                        doc_id=UUID(job["doc_id"]),
+                        source_url=job.get("source_url", ""),
+                        chunk_count=int(job.get("chunk_count", 0)),
+                    )
+                    for job in jobs
+                ]
+            )
+        else:
+            await self.redis_client.rpush(
+                QUEUE_EXTRACTION,
+                *(json.dumps({"doc_id": job["doc_id"]}) for job in jobs),
+            )
 
     async def run(self) -> None:
         """Run worker continuously until stopped.
@@ -277,6 +647,8 @@ class ExtractionWorker:
 
         try:
             while not self.should_stop():
+                await self.reap_expired_leases()
+                await self.promote_due_retries()
                 await self.poll_once()
 
         except asyncio.CancelledError:
@@ -287,11 +659,56 @@ class ExtractionWorker:
             logger.info("Worker stopped")
 
 
-async def main() -> None:
+async def _create_event_consumer(
+    redis_client: "redis.Redis[str]",
+    stream_name: str,
+    group_name: str,
+    consumer_name: str,
+) -> RedisDocumentEventConsumer:
+    """Ensure the consumer group exists on a stream and return a consumer for it."""
+    try:
+        await redis_client.xgroup_create(
+            name=stream_name,
+            groupname=group_name,
+            id="0-0",
+            mkstream=True,
+        )
+    except ResponseError as exc:
+        if "BUSYGROUP" not in str(exc):
+            raise
+
+    return RedisDocumentEventConsumer(
+        redis_client=redis_client,
+        stream_name=stream_name,
+        group_name=group_name,
+        consumer_name=consumer_name,
+    )
+
+
+async def _report_stats(
+    worker: ExtractionWorker,
+    process_index: int,
+    stats_queue: "Queue[StatsMessage]",
+    interval: float,
+) -> None:
+    """Periodically publish worker counters to the supervisor."""
+    while True:
+        await asyncio.sleep(interval)
+        stats_queue.put((process_index, os.getpid(), worker.get_stats()))
+
+
+async def main(
+    process_index: int | None = None,
+    stats_queue: "Queue[StatsMessage] | None" = None,
+) -> None:
     """Main entry point for extraction worker.
 
     Sets up all dependencies (Redis, PostgreSQL, extraction pipeline)
     and runs the worker until stopped.
+
+    Args:
+        process_index: Slot of this process when run under WorkerSupervisor.
+        stats_queue: Queue used to report counters to the supervisor.
     """
     # Configure logging
     logging.basicConfig(
@@ -304,46 +721,39 @@ async def main() -> None:
     # Load configuration
     config = get_config()
 
+    # Unique identity used as stream consumer name and extraction lease owner
+    worker_id = f"{config.ingest_events_consumer_prefix}-{uuid4().hex[:8]}"
+    if process_index is not None:
+        worker_id = f"{config.ingest_events_consumer_prefix}-p{process_index}-{uuid4().hex[:8]}"
+
     # Create Redis client (decode to str for JSON parsing)
     logger.info(f"Connecting to Redis at {config.redis_url}")
     redis_client = redis.from_url(config.redis_url, decode_responses=True)
 
     event_consumer: RedisDocumentEventConsumer | None = None
+    priority_consumer: RedisDocumentEventConsumer | None = None
+    retry_publisher: RedisDocumentEventPublisher | None = None
     if config.enable_ingest_events:
         stream_name = config.ingest_events_stream
         group_name = config.ingest_events_group
-        consumer_name = f"{config.ingest_events_consumer_prefix}-{uuid4().hex[:8]}"
 
-        try:
-            await redis_client.xgroup_create(
-                name=stream_name,
-                groupname=group_name,
-                id="0-0",
-                mkstream=True,
+        event_consumer = await _create_event_consumer(
+            redis_client, stream_name, group_name, worker_id
+        )
+        if config.ingest_events_priority_stream:
+            priority_consumer = await _create_event_consumer(
+                redis_client, config.ingest_events_priority_stream, group_name, worker_id
             )
-        except ResponseError as exc:
-            if "BUSYGROUP" not in str(exc):
-                raise
-
-        event_consumer = RedisDocumentEventConsumer(
-            redis_client=redis_client,
-            stream_name=stream_name,
-            group_name=group_name,
-            consumer_name=consumer_name,
+        retry_publisher = RedisDocumentEventPublisher(
+            redis_client, stream_name, group_name=group_name
         )
 
-    # Create PostgreSQL connection
+    # Create shared async PostgreSQL pool
     logger.info(f"Connecting to PostgreSQL at {config.postgres_host}:{config.postgres_port}")
-    pg_conn = psycopg2.connect(
-        host=config.postgres_host,
-        port=config.postgres_port,
-        user=config.postgres_user,
-        password=config.postgres_password.get_secret_value(),
-        dbname=config.postgres_db,
-    )
+    pg_pool = await AsyncPostgresPool.create(config)
 
     # Initialize document store
-    document_store = PostgresDocumentStore(conn=pg_conn)
+    document_store = AsyncPostgresDocumentStore(pg_pool)
 
     # Initialize Tier A components
     logger.info("Initializing Tier A extraction components")
@@ -377,6 +787,8 @@ async def main() -> None:
     extract_use_case = ExtractPendingUseCase(
         orchestrator=orchestrator,
         document_store=document_store,
+        worker_id=worker_id,
+        lease_seconds=config.extraction_lease_seconds,
     )
 
     # Wrap use case in SingleDocExtractor adapter
@@ -384,6 +796,8 @@ async def main() -> None:
     single_doc_extractor = SingleDocExtractorAdapter(
         use_case=extract_use_case,
         document_store=document_store,
+        worker_id=worker_id,
+        lease_seconds=config.extraction_lease_seconds,
     )
 
     # Create worker
@@ -392,8 +806,30 @@ async def main() -> None:
         redis_client=redis_client,
         extract_use_case=single_doc_extractor,
         event_consumer=event_consumer,
+        lease_reaper=document_store,
+        reap_interval=config.extraction_lease_reap_interval,
+        batch_size=config.ingest_events_batch_size,
+        concurrency=config.ingest_events_concurrency,
+        reclaim_idle_ms=config.ingest_events_reclaim_idle_ms,
+        retry_queue=DeadLetterQueue(
+            redis_client,
+            max_retries=config.extraction_max_retries,
+            base_delay_seconds=config.extraction_retry_base_delay,
+        ),
+        retry_store=document_store,
+        retry_publisher=retry_publisher,
+        retry_poll_interval=config.extraction_retry_poll_interval,
+        retry_batch_size=config.extraction_retry_batch_size,
+        priority_consumer=priority_consumer,
+        priority_weight=config.ingest_events_priority_weight,
     )
 
+    if config.worker_metrics_port:
+        # Supervised children each listen on their own port
+        metrics_port = config.worker_metrics_port + (process_index or 0)
+        start_http_server(metrics_port)
+        logger.info("Serving worker metrics on port %s", metrics_port)
+
     # Setup signal handlers for graceful shutdown
     def handle_signal(sig: int, _frame: FrameType | None) -> None:
         logger.info("Received signal %s", sig)
@@ -402,15 +838,68 @@ async def main() -> None:
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
 
+    stats_task: asyncio.Task[None] | None = None
+    if process_index is not None and stats_queue is not None:
+        stats_task = asyncio.create_task(
+            _report_stats(worker, process_index, stats_queue, config.worker_stats_interval)
+        )
+
     # Run worker
     logger.info("Starting extraction worker loop")
     try:
         await worker.run()
     finally:
         logger.info("Cleaning up resources")
+        if stats_task is not None:
+            stats_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await stats_task
+        if process_index is not None and stats_queue is not None:
+            stats_queue.put((process_index, os.getpid(), worker.get_stats()))
         await redis_client.close()
-        document_store.close()
+        await pg_pool.close()
+
+
+def run_worker_process(
+    process_index: int,
+    stats_queue: "Queue[StatsMessage]",
+) -> None:
+    """Process target used by WorkerSupervisor for each child worker."""
+    asyncio.run(main(process_index=process_index, stats_queue=stats_queue))
+
+
+def cli(argv: list[str] | None = None) -> int:
+    """Command-line entry point for the extraction worker.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv).
+
+    Returns:
+        int: Process exit code.
+    """
+    parser = argparse.ArgumentParser(description="Taboot extraction worker")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Number of worker processes to supervise (default: WORKER_PROCESSES or 1)",
+    )
+    args = parser.parse_args(argv)
+
+    processes = args.processes if args.processes is not None else get_config().worker_processes
+    if processes < 1:
+        parser.error("--processes must be >= 1")
+
+    if processes == 1:
+        asyncio.run(main())
+        return 0
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    return WorkerSupervisor(processes, target=run_worker_process).run()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(cli())
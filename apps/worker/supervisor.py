@@ -0,0 +1,278 @@
+"""Multi-process supervisor for the extraction worker.
+
+Runs N extraction worker processes that share the same Redis consumer group,
+restarts children that exit unexpectedly (with exponential backoff), forwards
+SIGTERM/SIGINT for a graceful drain and aggregates per-child throughput stats.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from types import FrameType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Message sent by children over the stats queue: (process_index, pid, stats)
+StatsMessage = tuple[int, int, dict[str, int]]
+WorkerTarget = Callable[[int, "Queue[StatsMessage]"], None]
+
+
+@dataclass
+class _ChildSlot:
+    """Book-keeping for one supervised worker slot."""
+
+    index: int
+    process: BaseProcess | None = None
+    started_at: float = 0.0
+    restart_at: float = 0.0
+    restarts: int = 0
+    consecutive_failures: int = 0
+
+
+class WorkerSupervisor:
+    """Supervise a fixed number of extraction worker processes.
+
+    Each child runs ``target(process_index, stats_queue)`` and periodically
+    reports its cumulative counters (``processed``/``failed``) on the stats
+    queue, keyed by pid so restarted children never overwrite earlier totals.
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        *,
+        target: WorkerTarget,
+        restart_backoff: float = 1.0,
+        max_restart_backoff: float = 60.0,
+        stable_after: float = 60.0,
+        shutdown_timeout: float = 30.0,
+        stats_log_interval: float = 60.0,
+        poll_interval: float = 0.5,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Initialize WorkerSupervisor.
+
+        Args:
+            processes: Number of worker processes to keep running.
+            target: Child entry point called with (process_index, stats_queue).
+            restart_backoff: Initial delay in seconds before restarting a child.
+            max_restart_backoff: Upper bound for the exponential restart delay.
+            stable_after: Seconds a child must run before its backoff resets.
+            shutdown_timeout: Seconds to wait for children to drain before killing.
+            stats_log_interval: Seconds between aggregated throughput log lines.
+            poll_interval: Seconds between child liveness checks.
+            mp_context: Multiprocessing context (defaults to "spawn").
+
+        Raises:
+            ValueError: If processes is less than 1.
+        """
+        if processes < 1:
+            raise ValueError(f"processes must be >= 1, got {processes}")
+
+        self.processes = processes
+        self.target = target
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.stable_after = stable_after
+        self.shutdown_timeout = shutdown_timeout
+        self.stats_log_interval = stats_log_interval
+        self.poll_interval = poll_interval
+
+        self._ctx = mp_context or multiprocessing.get_context("spawn")
+        self._stats_queue: Queue[StatsMessage] = self._ctx.Queue()
+        self._slots = [_ChildSlot(index=i) for i in range(processes)]
+        # Latest cumulative counters reported by each child pid: pid -> (index, stats)
+        self._reported: dict[int, tuple[int, dict[str, int]]] = {}
+        self._stop_requested = False
+        self._last_log = 0.0
+        self._last_processed = 0
+
+    def request_stop(self) -> None:
+        """Request a graceful shutdown of the supervisor and all children."""
+        if not self._stop_requested:
+            logger.info("Supervisor stopping; draining %s worker processes", self.processes)
+        self._stop_requested = True
+
+    def run(self) -> int:
+        """Start all children and supervise them until stopped.
+
+        Returns:
+            int: Process exit code (0 on graceful shutdown).
+        """
+
+        def handle_signal(sig: int, _frame: FrameType | None) -> None:
+            logger.info("Supervisor received signal %s", sig)
+            self.request_stop()
+
+        previous = {
+            sig: signal.signal(sig, handle_signal) for sig in (signal.SIGTERM, signal.SIGINT)
+        }
+
+        logger.info("Starting worker supervisor with %s processes", self.processes)
+        self._last_log = time.monotonic()
+        try:
+            while not self._stop_requested:
+                self.supervise_once()
+                time.sleep(self.poll_interval)
+        finally:
+            self.shutdown()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+        logger.info("Worker supervisor stopped: %s", self.get_stats())
+        return 0
+
+    def supervise_once(self, now: float | None = None) -> None:
+        """Collect stats, reap exited children and (re)start due slots.
+
+        Args:
+            now: Monotonic timestamp to evaluate against (defaults to now).
+        """
+        now = time.monotonic() if now is None else now
+        self._collect_stats()
+
+        for slot in self._slots:
+            process = slot.process
+            if process is not None and not process.is_alive():
+                self._handle_exit(slot, process, now)
+
+            if slot.process is None and not self._stop_requested and now >= slot.restart_at:
+                self._start(slot, now)
+
+        if now - self._last_log >= self.stats_log_interval:
+            self._log_throughput(now)
+
+    def shutdown(self) -> None:
+        """Forward SIGTERM to children and wait for them to drain.
+
+        Children still alive after ``shutdown_timeout`` are killed.
+        """
+        self._stop_requested = True
+        alive = [slot.process for slot in self._slots if slot.process is not None]
+
+        for process in alive:
+            if process.is_alive():
+                process.terminate()  # SIGTERM triggers the worker's graceful stop
+
+        # Keep draining stats while waiting: children block on exit until their
+        # queued messages have been flushed to the pipe
+        deadline = time.monotonic() + self.shutdown_timeout
+        while any(process.is_alive() for process in alive) and time.monotonic() < deadline:
+            self._collect_stats()
+            time.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+
+        for process in alive:
+            if process.is_alive():
+                logger.warning("Worker pid=%s did not drain in time; killing", process.pid)
+                process.kill()
+                process.join()
+
+        self._collect_stats()
+        for slot in self._slots:
+            slot.process = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get aggregated throughput stats across all children.
+
+        Returns:
+            dict[str, Any]: Totals, restart count and per-child counters.
+        """
+        per_child: dict[int, dict[str, int]] = {slot.index: {} for slot in self._slots}
+        for index, stats in self._reported.values():
+            counters = per_child.setdefault(index, {})
+            for key, value in stats.items():
+                counters[key] = counters.get(key, 0) + value
+
+        return {
+            "processes": self.processes,
+            "alive": sum(
+                1 for slot in self._slots if slot.process is not None and slot.process.is_alive()
+            ),
+            "restarts": sum(slot.restarts for slot in self._slots),
+            "processed": sum(c.get("processed", 0) for c in per_child.values()),
+            "failed": sum(c.get("failed", 0) for c in per_child.values()),
+            "per_child": per_child,
+        }
+
+    def _start(self, slot: _ChildSlot, now: float) -> None:
+        """Spawn the worker process for a slot."""
+        process = self._ctx.Process(
+            target=self.target,
+            args=(slot.index, self._stats_queue),
+            name=f"extraction-worker-{slot.index}",
+        )
+        process.start()
+        slot.process = process
+        slot.started_at = now
+        logger.info("Started worker process index=%s pid=%s", slot.index, process.pid)
+
+    def _handle_exit(self, slot: _ChildSlot, process: BaseProcess, now: float) -> None:
+        """Record an unexpected child exit and schedule its restart with backoff."""
+        process.join(0)
+        slot.process = None
+
+        if self._stop_requested:
+            return
+
+        if now - slot.started_at >= self.stable_after:
+            slot.consecutive_failures = 0
+        slot.consecutive_failures += 1
+        slot.restarts += 1
+
+        delay = min(
+            self.restart_backoff * 2 ** (slot.consecutive_failures - 1),
+            self.max_restart_backoff,
+        )
+        slot.restart_at = now + delay
+        logger.warning(
+            "Worker process index=%s pid=%s exited with code %s; restarting in %.1fs",
+            slot.index,
+            process.pid,
+            process.exitcode,
+            delay,
+        )
+
+    def _collect_stats(self) -> None:
+        """Drain pending stats messages from children."""
+        while True:
+            try:
+                index, pid, stats = self._stats_queue.get_nowait()
+            except queue.Empty:
+                return
+            except (OSError, ValueError):
+                # Queue closed while shutting down
+                return
+            self._reported[pid] = (index, dict(stats))
+
+    def _log_throughput(self, now: float) -> None:
+        """Log aggregated throughput since the previous log line."""
+        stats = self.get_stats()
+        elapsed = max(now - self._last_log, 1e-9)
+        rate = (stats["processed"] - self._last_processed) / elapsed
+        logger.info(
+            "Supervisor stats pid=%s: alive=%s/%s processed=%s failed=%s restarts=%s "
+            "rate=%.2f docs/s",
+            os.getpid(),
+            stats["alive"],
+            stats["processes"],
+            stats["processed"],
+            stats["failed"],
+            stats["restarts"],
+            rate,
+        )
+        self._last_log = now
+        self._last_processed = stats["processed"]
+
+
+__all__ = ["StatsMessage", "WorkerSupervisor", "WorkerTarget"]
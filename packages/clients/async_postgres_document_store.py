@@ -0,0 +1,692 @@
+"""Async PostgreSQL implementation of DocumentStore protocol.
+
+Mirrors PostgresDocumentStore on top of the shared asyncpg pool so document
+persistence never blocks the event loop. Each method checks a connection out
+of the pool for the duration of a single statement (or transaction).
+"""
+
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime
+from uuid import UUID
+
+import asyncpg
+
+from packages.clients.document_rows import (
+    CLAIMED_DOCUMENT_COLUMNS,
+    DOCUMENT_COLUMNS,
+    row_to_document,
+)
+from packages.clients.postgres_document_store import DEFAULT_LEASE_SECONDS, PENDING_BATCH_SIZE
+from packages.common.async_postgres_pool import AsyncPostgresPool
+from packages.common.logging import get_logger
+from packages.schemas.models import Document, ExtractionState, SourceType
+
+logger = get_logger(__name__)
+
+
+def _affected_rows(status: str) -> int:
+    """Parse the row count from an asyncpg command status (e.g. ``UPDATE 3``).
+
+    Args:
+        status: Command status string returned by Connection.execute().
+
+    Returns:
+        int: Number of affected rows (0 if the status carries no count).
+    """
+    count = status.rsplit(" ", 1)[-1]
+    return int(count) if count.isdigit() else 0
+
+
+class AsyncPostgresDocumentStore:
+    """Async PostgreSQL implementation of DocumentStore protocol.
+
+    Same queries and semantics as PostgresDocumentStore, with every method
+    awaitable. The pool is owned by the caller and is not closed here.
+    """
+
+    def __init__(self, pool: AsyncPostgresPool) -> None:
+        """Initialize with a shared async connection pool.
+
+        Args:
+            pool: Opened AsyncPostgresPool.
+        """
+        self.pool = pool
+        logger.info("Initialized AsyncPostgresDocumentStore")
+
+    async def create(self, document: Document, content: str) -> None:
+        """Create document record and store content.
+
+        Args:
+            document: Document model to persist.
+            content: Full document text content.
+        """
+        async with self.pool.acquire() as conn, conn.transaction():
+            status = await conn.execute(
+                """
+                INSERT INTO rag.documents (
+                    doc_id, source_url, source_type, content_hash,
+                    ingested_at, extraction_state, extraction_version,
+                    updated_at, metadata
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                ON CONFLICT (content_hash) DO NOTHING
+            """,
+                document.doc_id,
+                document.source_url,
+                document.source_type.value,
+                document.content_hash,
+                document.ingested_at,
+                document.extraction_state.value,
+                document.extraction_version,
+                document.updated_at,
+                document.metadata or None,
+            )
+
+            if _affected_rows(status) == 0:
+                logger.debug(
+                    f"Document with content_hash {document.content_hash[:16]}... already exists, "
+                    "skipping content insert (deduplication)"
+                )
+                return
+
+            await conn.execute(
+                """
+                INSERT INTO rag.document_content (doc_id, content, created_at)
+                VALUES ($1, $2, $3)
+                ON CONFLICT (doc_id) DO NOTHING
+            """,
+                document.doc_id,
+                content,
+                datetime.now(UTC),
+            )
+
+        logger.debug(f"Created document {document.doc_id}")
+
+    async def upsert(self, document: Document, content: str) -> bool:
+        """Insert a document or replace the stored version with the same doc_id.
+
+        Unlike create(), a changed document overwrites its record and content
+        and returns to PENDING (releasing any lease) for re-extraction.
+
+        content_hash is unique, so if another document already holds the same
+        content this one is not stored: its outdated record (if any) is
+        deleted instead, as the content is tracked (and extracted) once
+        under the other doc_id.
+
+        Args:
+            document: Document model to persist.
+            content: Full document text content.
+
+        Returns:
+            bool: False if the content is a duplicate of another document.
+        """
+        async with self.pool.acquire() as conn, conn.transaction():
+            try:
+                async with conn.transaction():
+                    await self._upsert_record(conn, document)
+            except asyncpg.UniqueViolationError:
+                await conn.execute("DELETE FROM rag.documents WHERE doc_id = $1", document.doc_id)
+                logger.info(
+                    f"Document {document.doc_id} duplicates the content of another document "
+                    f"(content_hash {document.content_hash[:16]}...), not storing it"
+                )
+                return False
+
+            await conn.execute(
+                """
+                INSERT INTO rag.document_content (doc_id, content, created_at)
+                VALUES ($1, $2, $3)
+                ON CONFLICT (doc_id) DO UPDATE SET
+                    content = EXCLUDED.content,
+                    created_at = EXCLUDED.created_at
+            """,
+                document.doc_id,
+                content,
+                datetime.now(UTC),
+            )
+
+        logger.debug(f"Upserted document {document.doc_id}")
+        return True
+
+    @staticmethod
+    async def _upsert_record(conn: asyncpg.Connection, document: Document) -> None:
+        """Insert or overwrite the document row keyed by doc_id.
+
+        Raises:
+            asyncpg.UniqueViolationError: If another doc_id holds the content_hash.
+        """
+        await conn.execute(
+            """
+            INSERT INTO rag.documents (
+                doc_id, source_url, source_type, content_hash,
+                ingested_at, extraction_state, extraction_version,
+                updated_at, metadata
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+            ON CONFLICT (doc_id) DO UPDATE SET
+                source_url = EXCLUDED.source_url,
+                content_hash = EXCLUDED.content_hash,
+                extraction_state = EXCLUDED.extraction_state,
+                extraction_version = EXCLUDED.extraction_version,
+                updated_at = EXCLUDED.updated_at,
+                metadata = EXCLUDED.metadata,
+                lease_owner = NULL,
+                lease_expires_at = NULL
+            """,
+            document.doc_id,
+            document.source_url,
+            document.source_type.value,
+            document.content_hash,
+            document.ingested_at,
+            document.extraction_state.value,
+            document.extraction_version,
+            document.updated_at,
+            document.metadata or None,
+        )
+
+    async def get_by_id(self, doc_id: UUID) -> Document | None:
+        """Fetch a document record by doc_id.
+
+        Args:
+            doc_id: Document UUID.
+
+        Returns:
+            Document | None: The stored document, or None if it does not exist.
+        """
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"SELECT {DOCUMENT_COLUMNS} FROM rag.documents WHERE doc_id = $1",
+                doc_id,
+            )
+
+        return row_to_document(row) if row is not None else None
+
+    async def query_pending(self, limit: int | None = None) -> list[Document]:
+        """Query documents with extraction_state=PENDING.
+
+        Args:
+            limit: Optional max number of documents to return.
+
+        Returns:
+            list[Document]: Documents awaiting extraction, oldest first.
+        """
+        documents = [doc async for doc in self.iter_pending(limit=limit)]
+        logger.info(f"Found {len(documents)} pending documents")
+        return documents
+
+    async def iter_pending(
+        self, batch_size: int = PENDING_BATCH_SIZE, limit: int | None = None
+    ) -> AsyncIterator[Document]:
+        """Iterate over PENDING documents using keyset pagination.
+
+        The connection is returned to the pool between pages.
+
+        Args:
+            batch_size: Number of rows fetched per round-trip.
+            limit: Optional max number of documents to yield in total.
+
+        Yields:
+            Document: Documents awaiting extraction, oldest first.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        remaining = limit
+        last_key: tuple[datetime, UUID] | None = None
+
+        while remaining is None or remaining > 0:
+            page_size = batch_size if remaining is None else min(batch_size, remaining)
+
+            async with self.pool.acquire() as conn:
+                if last_key is None:
+                    rows = await conn.fetch(
+                        f"""
+                        SELECT {DOCUMENT_COLUMNS} FROM rag.documents
+                        WHERE extraction_state = 'pending'
+                        ORDER BY ingested_at ASC, doc_id ASC
+                        LIMIT $1
+                    """,
+                        page_size,
+                    )
+                else:
+                    rows = await conn.fetch(
+                        f"""
+                        SELECT {DOCUMENT_COLUMNS} FROM rag.documents
+                        WHERE extraction_state = 'pending'
+                          AND (ingested_at, doc_id) > ($1, $2)
+                        ORDER BY ingested_at ASC, doc_id ASC
+                        LIMIT $3
+                    """,
+                        last_key[0],
+                        last_key[1],
+                        page_size,
+                    )
+
+            for row in rows:
+                yield row_to_document(row)
+
+            if len(rows) < page_size:
+                return
+
+            last_row = rows[-1]
+            last_key = (last_row["ingested_at"], last_row["doc_id"])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    async def claim_pending(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    ) -> list[Document]:
+        """Atomically lease up to ``limit`` pending documents for a worker.
+
+        Args:
+            worker_id: Unique identifier of the claiming worker.
+            limit: Maximum number of documents to claim.
+            lease_seconds: Lease duration in seconds.
+
+        Returns:
+            list[Document]: Claimed documents (state PROCESSING), oldest first.
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                WITH claimable AS (
+                    SELECT doc_id FROM rag.documents
+                    WHERE extraction_state = 'pending'
+                    ORDER BY ingested_at ASC, doc_id ASC
+                    LIMIT $1
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE rag.documents d SET
+                    extraction_state = 'processing',
+                    lease_owner = $2,
+                    lease_expires_at = NOW() + make_interval(secs => $3)
+                FROM claimable
+                WHERE d.doc_id = claimable.doc_id
+                RETURNING {CLAIMED_DOCUMENT_COLUMNS}
+            """,
+                limit,
+                worker_id,
+                float(lease_seconds),
+            )
+
+        documents = sorted(
+            (row_to_document(row) for row in rows),
+            key=lambda doc: (doc.ingested_at, str(doc.doc_id)),
+        )
+        logger.debug(f"Worker {worker_id} claimed {len(documents)} pending documents")
+        return documents
+
+    async def claim_by_id(
+        self,
+        doc_id: UUID,
+        worker_id: str,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    ) -> Document | None:
+        """Atomically lease a specific pending document.
+
+        Args:
+            doc_id: Document UUID to claim.
+            worker_id: Unique identifier of the claiming worker.
+            lease_seconds: Lease duration in seconds.
+
+        Returns:
+            Document | None: The claimed document (state PROCESSING), or None if
+                it does not exist, is not pending, or is locked by another worker.
+        """
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"""
+                WITH claimable AS (
+                    SELECT doc_id FROM rag.documents
+                    WHERE doc_id = $1 AND extraction_state = 'pending'
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE rag.documents d SET
+                    extraction_state = 'processing',
+                    lease_owner = $2,
+                    lease_expires_at = NOW() + make_interval(secs => $3)
+                FROM claimable
+                WHERE d.doc_id = claimable.doc_id
+                RETURNING {CLAIMED_DOCUMENT_COLUMNS}
+            """,
+                doc_id,
+                worker_id,
+                float(lease_seconds),
+            )
+
+        return row_to_document(row) if row is not None else None
+
+    async def renew_lease(
+        self,
+        doc_id: UUID,
+        worker_id: str,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    ) -> bool:
+        """Extend a worker's lease on a PROCESSING document (heartbeat).
+
+        Args:
+            doc_id: Leased document UUID.
+            worker_id: Worker that holds the lease.
+            lease_seconds: New lease duration from now, in seconds.
+
+        Returns:
+            bool: True if the lease was renewed, False if it was lost.
+        """
+        async with self.pool.acquire() as conn:
+            status = await conn.execute(
+                """
+                UPDATE rag.documents SET
+                    lease_expires_at = NOW() + make_interval(secs => $1)
+                WHERE doc_id = $2
+                  AND extraction_state = 'processing'
+                  AND lease_owner = $3
+            """,
+                float(lease_seconds),
+                doc_id,
+                worker_id,
+            )
+
+        renewed = _affected_rows(status) > 0
+        if not renewed:
+            logger.warning(f"Worker {worker_id} lost lease on document {doc_id}")
+        return renewed
+
+    async def reap_expired_leases(self) -> list[UUID]:
+        """Return PROCESSING documents with expired leases to PENDING.
+
+        Returns:
+            list[UUID]: Documents returned to the pending backlog; callers must
+                re-publish them for stream workers to pick them up.
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                UPDATE rag.documents SET
+                    extraction_state = 'pending',
+                    lease_owner = NULL,
+                    lease_expires_at = NULL
+                WHERE extraction_state = 'processing'
+                  AND lease_expires_at < NOW()
+                RETURNING doc_id
+            """
+            )
+
+        reaped = [row["doc_id"] for row in rows]
+        if reaped:
+            logger.info(f"Reaped {len(reaped)} expired extraction leases")
+        return reaped
+
+    async def requeue_failed(self, doc_ids: Sequence[UUID]) -> list[UUID]:
+        """Return failed documents to PENDING so they can be claimed again.
+
+        Besides FAILED documents this takes back PROCESSING documents whose
+        lease expired (a worker died mid-extraction). Documents that are
+        COMPLETED or still held by a live lease are left alone.
+
+        Args:
+            doc_ids: Documents scheduled for another extraction attempt.
+
+        Returns:
+            list[UUID]: Documents that are now PENDING (including those that
+                already were), i.e. the ones worth re-announcing.
+        """
+        if not doc_ids:
+            return []
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                WITH requeued AS (
+                    UPDATE rag.documents SET
+                        extraction_state = 'pending',
+                        lease_owner = NULL,
+                        lease_expires_at = NULL,
+                        updated_at = NOW()
+                    WHERE doc_id = ANY($1::uuid[])
+                      AND (
+                          extraction_state = 'failed'
+                          OR (extraction_state = 'processing' AND lease_expires_at < NOW())
+                      )
+                    RETURNING doc_id
+                )
+                SELECT doc_id FROM requeued
+                UNION
+                SELECT doc_id FROM rag.documents
+                WHERE doc_id = ANY($1::uuid[]) AND extraction_state = 'pending'
+            """,
+                list(doc_ids),
+            )
+
+        return [row["doc_id"] for row in rows]
+
+    async def query_by_date(self, since_date: datetime) -> list[Document]:
+        """Query documents modified since specified date.
+
+        Args:
+            since_date: Return documents updated after this datetime.
+
+        Returns:
+            list[Document]: Documents modified since the specified date.
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT {DOCUMENT_COLUMNS} FROM rag.documents
+                WHERE updated_at >= $1
+                ORDER BY updated_at DESC
+            """,
+                since_date,
+            )
+
+        documents = [row_to_document(row) for row in rows]
+
+        logger.info(f"Found {len(documents)} documents since {since_date}")
+        return documents
+
+    async def get_content(self, doc_id: UUID) -> str:
+        """Get full document content by doc_id.
+
+        Args:
+            doc_id: Document UUID.
+
+        Returns:
+            str: Full document text.
+
+        Raises:
+            KeyError: If document not found.
+        """
+        async with self.pool.acquire() as conn:
+            content: str | None = await conn.fetchval(
+                "SELECT content FROM rag.document_content WHERE doc_id = $1",
+                doc_id,
+            )
+
+        if content is None:
+            raise KeyError(f"Document content not found for {doc_id}")
+
+        return content
+
+    async def update_document(self, document: Document) -> None:
+        """Update document metadata.
+
+        Moving a document out of PROCESSING releases its extraction lease.
+
+        Args:
+            document: Document with updated fields.
+
+        Raises:
+            KeyError: If document not found.
+        """
+        async with self.pool.acquire() as conn:
+            status = await conn.execute(
+                """
+                UPDATE rag.documents SET
+                    extraction_state = $1::varchar,
+                    extraction_version = $2,
+                    updated_at = $3,
+                    metadata = $4,
+                    lease_owner = CASE
+                        WHEN $1::varchar = 'processing' THEN lease_owner END,
+                    lease_expires_at = CASE
+                        WHEN $1::varchar = 'processing' THEN lease_expires_at END
+                WHERE doc_id = $5
+            """,
+                document.extraction_state.value,
+                document.extraction_version,
+                datetime.now(UTC),
+                document.metadata or None,
+                document.doc_id,
+            )
+
+        if _affected_rows(status) == 0:
+            raise KeyError(f"Document not found for update: {document.doc_id}")
+        logger.debug(f"Updated document {document.doc_id}")
+
+    async def update_states_bulk(self, documents: Sequence[Document]) -> int:
+        """Update extraction state for many documents in one statement.
+
+        Columns are sent as parallel arrays and expanded with ``unnest`` so the
+        whole batch is a single round-trip regardless of its size.
+
+        Args:
+            documents: Documents with updated extraction_state,
+                extraction_version and metadata.
+
+        Returns:
+            int: Number of rows updated (missing doc_ids are skipped).
+        """
+        if not documents:
+            return 0
+
+        async with self.pool.acquire() as conn:
+            status = await conn.execute(
+                """
+                UPDATE rag.documents AS d SET
+                    extraction_state = v.extraction_state,
+                    extraction_version = v.extraction_version,
+                    updated_at = NOW(),
+                    metadata = v.metadata,
+                    lease_owner = CASE
+                        WHEN v.extraction_state = 'processing' THEN d.lease_owner END,
+                    lease_expires_at = CASE
+                        WHEN v.extraction_state = 'processing' THEN d.lease_expires_at END
+                FROM unnest($1::uuid[], $2::varchar[], $3::varchar[], $4::jsonb[])
+                    AS v(doc_id, extraction_state, extraction_version, metadata)
+                WHERE d.doc_id = v.doc_id
+            """,
+                [doc.doc_id for doc in documents],
+                [doc.extraction_state.value for doc in documents],
+                [doc.extraction_version for doc in documents],
+                [doc.metadata or None for doc in documents],
+            )
+
+        updated = _affected_rows(status)
+        if updated < len(documents):
+            logger.warning(f"Bulk update skipped {len(documents) - updated} missing documents")
+        logger.debug(f"Bulk updated {updated} documents")
+        return updated
+
+    async def reset_extraction_state_since(self, since_date: datetime) -> int:
+        """Reset documents modified since a date back to PENDING in one statement.
+
+        Documents currently leased by a worker (PROCESSING) are left alone.
+
+        Args:
+            since_date: Reset documents updated at or after this datetime.
+
+        Returns:
+            int: Number of documents queued for re-extraction.
+        """
+        async with self.pool.acquire() as conn:
+            status = await conn.execute(
+                """
+                UPDATE rag.documents SET
+                    extraction_state = 'pending',
+                    updated_at = NOW()
+                WHERE updated_at >= $1
+                  AND extraction_state <> 'processing'
+            """,
+                since_date,
+            )
+
+        reset = _affected_rows(status)
+        logger.info(f"Reset {reset} documents to pending since {since_date}")
+        return reset
+
+    async def query_documents(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        source_type: SourceType | None = None,
+        extraction_state: ExtractionState | None = None,
+    ) -> list[Document]:
+        """Query documents with filters and pagination.
+
+        Args:
+            limit: Maximum documents to return.
+            offset: Number of documents to skip.
+            source_type: Optional source type filter.
+            extraction_state: Optional extraction state filter.
+
+        Returns:
+            list[Document]: Matching documents.
+        """
+        query = f"SELECT {DOCUMENT_COLUMNS} FROM rag.documents WHERE 1=1"
+        params: list[str | int] = []
+
+        if source_type:
+            params.append(source_type.value)
+            query += f" AND source_type = ${len(params)}"
+
+        if extraction_state:
+            params.append(extraction_state.value)
+            query += f" AND extraction_state = ${len(params)}"
+
+        params.extend([limit, offset])
+        query += f" ORDER BY ingested_at DESC LIMIT ${len(params) - 1} OFFSET ${len(params)}"
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+
+        documents = [row_to_document(row) for row in rows]
+
+        logger.debug(f"Queried {len(documents)} documents (limit={limit}, offset={offset})")
+        return documents
+
+    async def count_documents(
+        self,
+        source_type: SourceType | None = None,
+        extraction_state: ExtractionState | None = None,
+    ) -> int:
+        """Count documents with optional filters.
+
+        Args:
+            source_type: Optional source type filter.
+            extraction_state: Optional extraction state filter.
+
+        Returns:
+            int: Total count of matching documents.
+        """
+        query = "SELECT COUNT(*) FROM rag.documents WHERE 1=1"
+        params: list[str] = []
+
+        if source_type:
+            params.append(source_type.value)
+            query += f" AND source_type = ${len(params)}"
+
+        if extraction_state:
+            params.append(extraction_state.value)
+            query += f" AND extraction_state = ${len(params)}"
+
+        async with self.pool.acquire() as conn:
+            count: int = await conn.fetchval(query, *params)
+
+        logger.debug(f"Counted {count} documents")
+        return count
+
+
+__all__ = ["AsyncPostgresDocumentStore"]
@@ -0,0 +1,45 @@
+"""rag.documents row mapping shared by the sync and async document stores.
+
+Both stores select the same explicit projection and build Document models
+from psycopg2 RealDictRow and asyncpg Record rows alike.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+from uuid import UUID
+
+from packages.schemas.models import Document, ExtractionState, SourceType
+
+# Explicit projection for Document rows (avoids SELECT * on wide tables)
+DOCUMENT_COLUMNS = (
+    "doc_id, source_url, source_type, content_hash, ingested_at, "
+    "extraction_state, extraction_version, updated_at, metadata"
+)
+
+# Same projection qualified with the "d" alias used by UPDATE ... FROM claims
+CLAIMED_DOCUMENT_COLUMNS = ", ".join(f"d.{col.strip()}" for col in DOCUMENT_COLUMNS.split(","))
+
+
+def row_to_document(row: Mapping[str, Any]) -> Document:
+    """Convert a rag.documents row into a Document model.
+
+    Args:
+        row: Row mapping with DOCUMENT_COLUMNS keys.
+
+    Returns:
+        Document: Parsed document model.
+    """
+    return Document(
+        doc_id=UUID(str(row["doc_id"])),
+        source_url=row["source_url"],
+        source_type=SourceType(row["source_type"]),
+        content_hash=row["content_hash"],
+        ingested_at=row["ingested_at"],
+        extraction_state=ExtractionState(row["extraction_state"]),
+        extraction_version=row["extraction_version"],
+        updated_at=row["updated_at"],
+        metadata=row["metadata"],
+    )
+
+
+__all__ = ["CLAIMED_DOCUMENT_COLUMNS", "DOCUMENT_COLUMNS", "row_to_document"]
@@ -3,17 +3,25 @@
 Implements document persistence and querying for extraction pipeline.
 """
 
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
 from uuid import UUID
 
 from psycopg2.extensions import connection
-from psycopg2.extras import Json, RealDictCursor
+from psycopg2.extras import Json, RealDictCursor, execute_values
 
+from packages.clients.document_rows import DOCUMENT_COLUMNS, row_to_document
 from packages.common.logging import get_logger
 from packages.schemas.models import Document, ExtractionState, SourceType
 
 logger = get_logger(__name__)
 
+# Default page size for keyset-paginated pending-document scans
+PENDING_BATCH_SIZE = 500
+
+# Default extraction lease duration for claimed documents
+DEFAULT_LEASE_SECONDS = 300
+
 
 class PostgresDocumentStore:
     """PostgreSQL implementation of DocumentStore protocol.
@@ -88,43 +96,82 @@ class PostgresDocumentStore:
     def query_pending(self, limit: int | None = None) -> list[Document]:
         """Query documents with extraction_state=PENDING.
 
+        Rows are fetched in keyset-paginated chunks via iter_pending() so a large
+        backlog never materializes as a single result set on the server side.
+
         Args:
             limit: Optional max number of documents to return.
 
         Returns:
-            list[Document]: Documents awaiting extraction.
+            list[Document]: Documents awaiting extraction, oldest first.
         """
-        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-            query = """
-                SELECT * FROM rag.documents
-                WHERE extraction_state = 'pending'
-                ORDER BY ingested_at ASC
-            """
-            params: list[object] = []
-            if limit is not None:
-                query += " LIMIT %s"
-                params.append(limit)
+        documents = list(self.iter_pending(limit=limit))
+        logger.info(f"Found {len(documents)} pending documents")
+        return documents
 
-            cur.execute(query, params)
-            rows = cur.fetchall()
+    def iter_pending(
+        self, batch_size: int = PENDING_BATCH_SIZE, limit: int | None = None
+    ) -> Iterator[Document]:
+        """Iterate over PENDING documents using keyset pagination.
 
-        documents = []
-        for row in rows:
-            doc = Document(
-                doc_id=UUID(row["doc_id"]),
-                source_url=row["source_url"],
-                source_type=SourceType(row["source_type"]),
-                content_hash=row["content_hash"],
-                ingested_at=row["ingested_at"],
-                extraction_state=ExtractionState(row["extraction_state"]),
-                extraction_version=row["extraction_version"],
-                updated_at=row["updated_at"],
-                metadata=row["metadata"],
-            )
-            documents.append(doc)
+        Each page is a separate indexed query ordered by (ingested_at, doc_id)
+        and resumed from the last row seen, so no server-side cursor or
+        transaction is held open between pages. Callers may update documents
+        (and commit) on the same connection while iterating.
 
-        logger.info(f"Found {len(documents)} pending documents")
-        return documents
+        Args:
+            batch_size: Number of rows fetched per round-trip.
+            limit: Optional max number of documents to yield in total.
+
+        Yields:
+            Document: Documents awaiting extraction, oldest first.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        remaining = limit
+        last_key: tuple[datetime, str] | None = None
+
+        while remaining is None or remaining > 0:
+            page_size = batch_size if remaining is None else min(batch_size, remaining)
+
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                if last_key is None:
+                    cur.execute(
+                        f"""
+                        SELECT {DOCUMENT_COLUMNS} FROM rag.documents
+                        WHERE extraction_state = 'pending'
+                        ORDER BY ingested_at ASC, doc_id ASC
+                        LIMIT %s
+                    """,
+                        (page_size,),
+                    )
+                else:
+                    cur.execute(
+                        f"""
+                        SELECT {DOCUMENT_COLUMNS} FROM rag.documents
+                        WHERE extraction_state = 'pending'
+                          AND (ingested_at, doc_id) > (%s, %s)
+                        ORDER BY ingested_at ASC, doc_id ASC
+                        LIMIT %s
+                    """,
+                        (last_key[0], last_key[1], page_size),
+                    )
+                rows = cur.fetchall()
+
+            for row in rows:
+                yield row_to_document(row)
+
+            if len(rows) < page_size:
+                return
+
+            last_row = rows[-1]
+            last_key = (last_row["ingested_at"], str(last_row["doc_id"]))
+            if remaining is not None:
+                remaining -= len(rows)
 
     def query_by_date(self, since_date: datetime) -> list[Document]:
         """Query documents modified since specified date.
@@ -137,8 +184,8 @@ class PostgresDocumentStore:
         """
         with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
-                """
-                SELECT * FROM rag.documents
+                f"""
+                SELECT {DOCUMENT_COLUMNS} FROM rag.documents
                 WHERE updated_at >= %s
                 ORDER BY updated_at DESC
             """,
@@ -146,20 +193,7 @@ class PostgresDocumentStore:
             )
             rows = cur.fetchall()
 
-        documents = []
-        for row in rows:
-            doc = Document(
-                doc_id=UUID(row["doc_id"]),
-                source_url=row["source_url"],
-                source_type=SourceType(row["source_type"]),
-                content_hash=row["content_hash"],
-                ingested_at=row["ingested_at"],
-                extraction_state=ExtractionState(row["extraction_state"]),
-                extraction_version=row["extraction_version"],
-                updated_at=row["updated_at"],
-                metadata=row["metadata"],
-            )
-            documents.append(doc)
+        documents = [row_to_document(row) for row in rows]
 
         logger.info(f"Found {len(documents)} documents since {since_date}")
         return documents
@@ -192,6 +226,8 @@ class PostgresDocumentStore:
     def update_document(self, document: Document) -> None:
         """Update document metadata.
 
+        Moving a document out of PROCESSING releases its extraction lease.
+
         Args:
             document: Document with updated fields.
 
@@ -205,7 +241,9 @@ class PostgresDocumentStore:
                     extraction_state = %s,
                     extraction_version = %s,
                     updated_at = %s,
-                    metadata = %s
+                    metadata = %s,
+                    lease_owner = CASE WHEN %s = 'processing' THEN lease_owner END,
+                    lease_expires_at = CASE WHEN %s = 'processing' THEN lease_expires_at END
                 WHERE doc_id = %s
             """,
                 (
@@ -213,6 +251,8 @@ class PostgresDocumentStore:
                     document.extraction_version,
                     datetime.now(UTC),
                     Json(document.metadata) if document.metadata else None,
+                    document.extraction_state.value,
+                    document.extraction_state.value,
                     str(document.doc_id),
                 ),
             )
@@ -222,6 +262,90 @@ class PostgresDocumentStore:
         self.conn.commit()
         logger.debug(f"Updated document {document.doc_id}")
 
+    def update_states_bulk(self, documents: Sequence[Document]) -> int:
+        """Update extraction state for many documents in one statement.
+
+        Sends a single ``UPDATE ... FROM (VALUES ...)`` round-trip and one
+        COMMIT for the whole batch. Like update_document(), moving a document
+        out of PROCESSING releases its extraction lease.
+
+        Args:
+            documents: Documents with updated extraction_state,
+                extraction_version and metadata.
+
+        Returns:
+            int: Number of rows updated (missing doc_ids are skipped).
+        """
+        if not documents:
+            return 0
+
+        rows = [
+            (
+                str(doc.doc_id),
+                doc.extraction_state.value,
+                doc.extraction_version,
+                Json(doc.metadata) if doc.metadata else None,
+            )
+            for doc in documents
+        ]
+
+        with self.conn.cursor() as cur:
+            execute_values(
+                cur,
+                """
+                UPDATE rag.documents AS d SET
+                    extraction_state = v.extraction_state,
+                    extraction_version = v.extraction_version,
+                    updated_at = NOW(),
+                    metadata = v.metadata,
+                    lease_owner = CASE
+                        WHEN v.extraction_state = 'processing' THEN d.lease_owner END,
+                    lease_expires_at = CASE
+                        WHEN v.extraction_state = 'processing' THEN d.lease_expires_at END
+                FROM (VALUES %s) AS v(doc_id, extraction_state, extraction_version, metadata)
+                WHERE d.doc_id = v.doc_id::uuid
+            """,
+                rows,
+                template="(%s, %s, %s::varchar, %s::jsonb)",
+                page_size=len(rows),
+            )
+            updated = cur.rowcount
+        self.conn.commit()
+
+        if updated < len(rows):
+            logger.warning(f"Bulk update skipped {len(rows) - updated} missing documents")
+        logger.debug(f"Bulk updated {updated} documents")
+        return updated
+
+    def reset_extraction_state_since(self, since_date: datetime) -> int:
+        """Reset documents modified since a date back to PENDING in one statement.
+
+        Documents currently leased by a worker (PROCESSING) are left alone so
+        in-flight extractions are not duplicated.
+
+        Args:
+            since_date: Reset documents updated at or after this datetime.
+
+        Returns:
+            int: Number of documents queued for re-extraction.
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE rag.documents SET
+                    extraction_state = 'pending',
+                    updated_at = NOW()
+                WHERE updated_at >= %s
+                  AND extraction_state <> 'processing'
+            """,
+                (since_date,),
+            )
+            reset = cur.rowcount
+        self.conn.commit()
+
+        logger.info(f"Reset {reset} documents to pending since {since_date}")
+        return reset
+
     def query_documents(
         self,
         limit: int = 10,
@@ -242,7 +366,7 @@ class PostgresDocumentStore:
         """
         with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
             # Build query with optional filters
-            query = "SELECT * FROM rag.documents WHERE 1=1"
+            query = f"SELECT {DOCUMENT_COLUMNS} FROM rag.documents WHERE 1=1"
             params: list[str | int] = []
 
             if source_type:
@@ -259,20 +383,7 @@ class PostgresDocumentStore:
             cur.execute(query, params)
             rows = cur.fetchall()
 
-        documents = []
-        for row in rows:
-            doc = Document(
-                doc_id=UUID(row["doc_id"]),
-                source_url=row["source_url"],
-                source_type=SourceType(row["source_type"]),
-                content_hash=row["content_hash"],
-                ingested_at=row["ingested_at"],
-                extraction_state=ExtractionState(row["extraction_state"]),
-                extraction_version=row["extraction_version"],
-                updated_at=row["updated_at"],
-                metadata=row["metadata"],
-            )
-            documents.append(doc)
+        documents = [row_to_document(row) for row in rows]
 
         logger.debug(f"Queried {len(documents)} documents (limit={limit}, offset={offset})")
         return documents
@@ -316,4 +427,4 @@ class PostgresDocumentStore:
         logger.debug("PostgreSQL connection closed")
 
 
-__all__ = ["PostgresDocumentStore"]
+__all__ = ["DEFAULT_LEASE_SECONDS", "PENDING_BATCH_SIZE", "PostgresDocumentStore"]
@@ -12,12 +12,15 @@ from packages.common.env_validator import (
     validate_environment,
     validate_required_secret,
 )
+
+from packages.common.async_postgres_pool import AsyncPostgresPool
 from packages.common.postgres_pool import PostgresPool, PostgresPoolError
 
 __all__ = [
     "ValidationError",
     "validate_environment",
     "validate_required_secret",
+    "AsyncPostgresPool",
     "PostgresPool",
     "PostgresPoolError",
 ]
@@ -0,0 +1,231 @@
+"""Async PostgreSQL connection pool for Taboot.
+
+Provides a shared asyncpg connection pool for code running on an event loop
+(API routes, extraction worker, async CLI commands). Connection checkout is
+timed so pool exhaustion shows up as wait-time metrics instead of silent
+latency.
+"""
+
+import json
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import asyncpg
+from prometheus_client import Histogram
+
+from packages.common.config import TabootConfig
+from packages.common.logging import get_logger
+from packages.common.postgres_pool import PostgresPoolError
+
+logger = get_logger(__name__)
+
+postgres_pool_wait_seconds = Histogram(
+    "postgres_pool_wait_seconds",
+    "Time spent waiting to acquire a PostgreSQL connection from the async pool",
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Register JSON codecs so json/jsonb columns round-trip as Python objects.
+
+    Args:
+        conn: Newly opened asyncpg connection.
+    """
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typename,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema="pg_catalog",
+        )
+
+
+class AsyncPostgresPool:
+    """Shared asyncpg connection pool.
+
+    Sized from ``postgres_min_pool_size``/``postgres_max_pool_size`` and
+    records how long each checkout waited for a free connection.
+
+    Attributes:
+        pool: The underlying asyncpg Pool (None until open() is awaited).
+        acquire_timeout: Maximum seconds to wait for a free connection.
+
+    Example:
+        >>> pool = await AsyncPostgresPool.create(config)
+        >>> async with pool.acquire() as conn:
+        ...     await conn.fetchval("SELECT 1")
+        >>> await pool.close()
+    """
+
+    def __init__(self, config: TabootConfig) -> None:
+        """Configure the pool (connections are opened by open()).
+
+        Args:
+            config: TabootConfig instance with PostgreSQL connection parameters.
+        """
+        self._config = config
+        self.pool: asyncpg.Pool | None = None
+        self.acquire_timeout = config.postgres_pool_acquire_timeout
+
+        self._acquisitions = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    @classmethod
+    async def create(cls, config: TabootConfig) -> "AsyncPostgresPool":
+        """Create and open a pool.
+
+        Args:
+            config: TabootConfig instance with PostgreSQL connection parameters.
+
+        Returns:
+            AsyncPostgresPool: Opened pool.
+
+        Raises:
+            PostgresPoolError: If the pool cannot be opened.
+        """
+        pool = cls(config)
+        await pool.open()
+        return pool
+
+    async def open(self) -> None:
+        """Open the pool and its minimum number of connections.
+
+        Raises:
+            PostgresPoolError: If pool initialization fails.
+        """
+        if self.pool is not None:
+            return
+
+        config = self._config
+        try:
+            self.pool = await asyncpg.create_pool(
+                host=config.postgres_host,
+                port=config.postgres_port,
+                database=config.postgres_db,
+                user=config.postgres_user,
+                password=config.postgres_password.get_secret_value(),
+                min_size=config.postgres_min_pool_size,
+                max_size=config.postgres_max_pool_size,
+                init=_init_connection,
+            )
+        except (asyncpg.PostgresError, OSError) as e:
+            logger.exception(
+                "Failed to initialize async PostgreSQL connection pool",
+                extra={"host": config.postgres_host, "error": str(e)},
+            )
+            raise PostgresPoolError(f"Failed to initialize async PostgreSQL pool: {e}") from e
+
+        logger.info(
+            "Async PostgreSQL connection pool initialized",
+            extra={
+                "host": config.postgres_host,
+                "database": config.postgres_db,
+                "min_pool_size": config.postgres_min_pool_size,
+                "max_pool_size": config.postgres_max_pool_size,
+            },
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        """Check out a connection, recording how long the checkout waited.
+
+        Yields:
+            asyncpg.Connection: Connection released back to the pool on exit.
+
+        Raises:
+            PostgresPoolError: If the pool is not open or no connection became
+                available within ``acquire_timeout`` seconds.
+        """
+        if self.pool is None:
+            raise PostgresPoolError("Async PostgreSQL pool is not open")
+
+        start = time.perf_counter()
+        try:
+            conn = await self.pool.acquire(timeout=self.acquire_timeout)
+        except TimeoutError as e:
+            self._record_wait(time.perf_counter() - start)
+            logger.warning(
+                "Timed out waiting for PostgreSQL connection",
+                extra={"timeout": self.acquire_timeout, "max_pool_size": self.pool.get_max_size()},
+            )
+            raise PostgresPoolError(
+                f"Timed out after {self.acquire_timeout}s waiting for a PostgreSQL connection"
+            ) from e
+        self._record_wait(time.perf_counter() - start)
+
+        try:
+            yield conn
+        finally:
+            await self.pool.release(conn)
+
+    def _record_wait(self, waited: float) -> None:
+        """Record a single checkout wait time.
+
+        Args:
+            waited: Seconds spent waiting for a connection.
+        """
+        postgres_pool_wait_seconds.observe(waited)
+        self._acquisitions += 1
+        self._wait_seconds_total += waited
+        self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return pool size and checkout wait-time statistics.
+
+        Returns:
+            dict[str, Any]: Keys size, idle, max_size, acquisitions,
+                wait_seconds_total, wait_seconds_avg and wait_seconds_max.
+        """
+        acquisitions = self._acquisitions
+        return {
+            "size": self.pool.get_size() if self.pool is not None else 0,
+            "idle": self.pool.get_idle_size() if self.pool is not None else 0,
+            "max_size": self._config.postgres_max_pool_size,
+            "acquisitions": acquisitions,
+            "wait_seconds_total": self._wait_seconds_total,
+            "wait_seconds_avg": self._wait_seconds_total / acquisitions if acquisitions else 0.0,
+            "wait_seconds_max": self._wait_seconds_max,
+        }
+
+    async def close(self) -> None:
+        """Close all pooled connections.
+
+        Safe to call more than once.
+        """
+        if self.pool is None:
+            return
+
+        pool, self.pool = self.pool, None
+        try:
+            await pool.close()
+            logger.info(
+                "Async PostgreSQL connection pool closed",
+                extra={
+                    "host": self._config.postgres_host,
+                    "database": self._config.postgres_db,
+                },
+            )
+        except Exception as e:
+            logger.exception("Error closing async PostgreSQL pool", extra={"error": str(e)})
+
+    async def __aenter__(self) -> "AsyncPostgresPool":
+        """Open the pool on context entry."""
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Close the pool on context exit."""
+        await self.close()
+
+
+# Export public API
+__all__ = ["AsyncPostgresPool", "postgres_pool_wait_seconds"]
@@ -8,6 +8,7 @@ import os
 from functools import lru_cache
 from pathlib import Path
 from threading import Lock
+from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic import Field, HttpUrl, SecretStr, field_validator
@@ -126,6 +127,9 @@ class TeiConfig(BaseSettings):
     url: HttpUrl
     batch_size: int = Field(default=32, ge=1, le=128)
     timeout: int = Field(default=30, ge=1, le=300)
+    max_concurrency: int = Field(default=4, ge=1, le=64)
+    max_retries: int = Field(default=3, ge=0, le=10)
+    max_batch_tokens: int | None = Field(default=None, ge=1)
 
     @field_validator("batch_size")
     @classmethod
@@ -178,12 +182,15 @@ class TabootConfig(BaseSettings):
     qdrant_max_connections: int = 200
     postgres_min_pool_size: int = 5
     postgres_max_pool_size: int = 20
+    postgres_pool_acquire_timeout: float = Field(default=10.0, gt=0)  # Seconds
 
     # ========== Vector & Embedding Config ==========
     collection_name: str = "documents"
     tei_embedding_model: str = "Qwen/Qwen3-Embedding-0.6B"
     qdrant_embedding_dim: int = 1024
     tei_timeout: int = Field(default=30, ge=1, le=300)
+    tei_client_concurrency: int = Field(default=4, ge=1, le=64)  # In-flight batches per client
+    tei_client_max_retries: int = Field(default=3, ge=0, le=10)  # Retries per failed batch
     tei_max_concurrent_requests: int = 80
     tei_max_batch_tokens: int = 163840
     tei_tokenization_workers: int = 8
@@ -206,16 +213,47 @@ class TabootConfig(BaseSettings):
     tier_c_workers: int = 4  # Concurrent LLM workers
     redis_cache_ttl: int = 604800  # 7 days in seconds
     neo4j_batch_size: int = 2000  # UNWIND batch size (2k rows optimal)
+    extraction_lease_seconds: int = Field(default=300, ge=10)  # Document claim lease
+    extraction_lease_reap_interval: int = Field(default=60, ge=1)  # Expired-lease sweep
+    extraction_max_retries: int = Field(default=3, ge=0)  # Before moving to queue:dlq
+    extraction_retry_base_delay: int = Field(default=30, ge=1)  # Backoff base in seconds
+    extraction_retry_poll_interval: float = Field(default=5.0, gt=0)  # Due-retry sweep
+    extraction_retry_batch_size: int = Field(default=100, ge=1)  # Retries promoted per sweep
+    worker_processes: int = Field(default=1, ge=1)  # Supervised extraction processes
+    worker_stats_interval: float = Field(default=30.0, gt=0)  # Child stats report period
+    worker_metrics_port: int = Field(default=0, ge=0, le=65535)  # 0 disables /metrics
 
     # ========== Ingestion Tuning ==========
     crawl_concurrency: int = 5  # Concurrent crawling requests
     embedding_batch_size: int = Field(default=64, ge=1, le=128)
+    embedding_batch_tokens: int | None = Field(default=16384, ge=1)  # Token budget per TEI call
+    embedding_cache_backend: Literal["none", "redis", "disk"] = "none"  # Skip unchanged chunks
+    embedding_cache_dir: str = ".cache/embeddings"  # Disk backend root
+    embedding_cache_dtype: Literal["float16", "float32"] = "float16"  # Stored precision
+    embedding_cache_ttl: int | None = Field(default=30 * 24 * 3600, ge=1)  # Redis expiry (s)
     qdrant_upsert_batch_size: int = 200  # Qdrant upsert batch size
     ingest_flush_threshold: int = 1000  # Flush threshold for ingestion
+    ingest_pipeline_queue_size: int = Field(default=4, ge=1)  # Items buffered per stage
+    ingest_embed_concurrency: int = Field(default=2, ge=1)  # Embedding batches in flight
+    ingest_upsert_concurrency: int = Field(default=2, ge=1)  # Qdrant upserts in flight
+    ingest_vectors_as_array: bool = False  # float32 ndarray vectors from TEI to Qdrant
+    ingest_prepare_workers: int | None = Field(default=None, ge=1)  # Normalize/chunk processes
+    embedding_store_dir: str | None = None  # Local vector copy for `taboot vector rebuild`
     enable_ingest_events: bool = False
     ingest_events_stream: str = "stream:documents"
     ingest_events_group: str = "ingestion-events"
     ingest_events_consumer_prefix: str = "worker"
+    ingest_events_batch_size: int = Field(default=10, ge=1)  # XREADGROUP COUNT
+    ingest_events_concurrency: int = Field(default=4, ge=1)  # Events extracted in parallel
+    ingest_events_reclaim_idle_ms: int = Field(default=600_000, ge=1000)  # XAUTOCLAIM idle
+    ingest_events_priority_stream: str = "stream:documents:interactive"  # "" disables
+    ingest_events_priority_weight: int = Field(default=4, ge=1)  # Interactive:bulk batches
+    ingest_events_flush_size: int = Field(default=100, ge=1)  # Events per pipelined XADD
+    ingest_events_flush_interval: float = Field(default=0.5, gt=0)  # Max buffering delay
+    ingest_events_lag_high_watermark: int = Field(default=10_000, ge=1)  # Pause ingestion
+    ingest_events_lag_low_watermark: int = Field(default=5_000, ge=0)  # Resume ingestion
+    ingest_events_lag_check_interval: float = Field(default=1.0, gt=0)  # XINFO GROUPS period
+    ingest_events_backpressure_max_wait: float = Field(default=300.0, ge=0)  # Longest pause
 
     # ========== External API Credentials (Optional) ==========
     github_token: SecretStr | None = None
@@ -236,6 +274,7 @@ class TabootConfig(BaseSettings):
     firecrawl_api_key: SecretStr = SecretStr("changeme")
     firecrawl_default_country: str = "US"  # ISO 3166-1 alpha-2 country code
     firecrawl_default_languages: str = "en-US"  # Comma-separated locale codes
+    firecrawl_poll_interval: float = Field(default=2.0, gt=0)  # Crawl status poll period
 
     # Firecrawl URL path filtering (Firecrawl v2 feature)
     # includePaths: Whitelist regex patterns for URL paths to crawl
@@ -307,6 +346,9 @@ class TabootConfig(BaseSettings):
                 "url": self.tei_embedding_url,
                 "batch_size": self.embedding_batch_size,
                 "timeout": self.tei_timeout,
+                "max_concurrency": self.tei_client_concurrency,
+                "max_retries": self.tei_client_max_retries,
+                "max_batch_tokens": self.embedding_batch_tokens,
             }
         )
 
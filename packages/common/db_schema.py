@@ -21,7 +21,7 @@ from packages.common.tracing import TracingContext
 logger = get_logger(__name__)
 
 # Current schema version - must match "THIS VERSION:" comment in postgresql-schema.sql
-CURRENT_SCHEMA_VERSION = "2.0.0"
+CURRENT_SCHEMA_VERSION = "2.2.0"
 
 
 def load_schema_file(path: Path) -> str:
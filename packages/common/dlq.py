@@ -1,12 +1,15 @@
 """Dead Letter Queue (DLQ) implementation with retry policy (T172).
 
-Redis-based DLQ with exponential backoff retry mechanism.
+Redis-based DLQ with exponential backoff retry mechanism. Failed jobs are
+scheduled on a sorted set scored by their due timestamp; a poller promotes
+due jobs back to the work queue and jobs exceeding max_retries land in the DLQ.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -15,6 +18,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+DLQ_QUEUE = "queue:dlq"
+RETRY_QUEUE = "queue:retry"
+
 
 class DeadLetterQueue:
     """Redis-based Dead Letter Queue with retry policy.
@@ -24,6 +30,7 @@ class DeadLetterQueue:
     - Exponential backoff calculation
     - Max retry limit (default: 3)
     - Error metadata storage
+    - Delayed retries on a sorted set scored by due timestamp
     """
 
     def __init__(
@@ -31,6 +38,7 @@ class DeadLetterQueue:
         redis_client: Redis,
         max_retries: int = 3,
         base_delay_seconds: int = 2,
+        retry_queue_name: str = RETRY_QUEUE,
     ) -> None:
         """Initialize DeadLetterQueue.
 
@@ -38,10 +46,12 @@ class DeadLetterQueue:
             redis_client: Redis client for queue operations.
             max_retries: Maximum retry attempts (default: 3).
             base_delay_seconds: Base delay for exponential backoff (default: 2).
+            retry_queue_name: Sorted set holding scheduled retries.
         """
         self.redis_client = redis_client
         self.max_retries = max_retries
         self.base_delay_seconds = base_delay_seconds
+        self.retry_queue_name = retry_queue_name
 
         logger.info(
             "Initialized DeadLetterQueue",
@@ -55,7 +65,7 @@ class DeadLetterQueue:
         self,
         job_data: dict[str, Any],
         error: str,
-        queue_name: str = "queue:dlq",
+        queue_name: str = DLQ_QUEUE,
     ) -> None:
         """Send failed job to dead letter queue with error metadata.
 
@@ -173,6 +183,124 @@ class DeadLetterQueue:
 
         logger.debug("Cleared retry count", extra={"job_id": job_id})
 
+    async def schedule_retry(
+        self,
+        job_data: dict[str, Any],
+        error: str,
+        *,
+        job_id: str | None = None,
+        now: float | None = None,
+    ) -> float | None:
+        """Schedule a failed job for a delayed retry, or dead-letter it.
+
+        Increments the job's retry count and adds it to the retry sorted set
+        scored by ``now + calculate_backoff_delay(count)``. Once the count
+        exceeds ``max_retries`` the job is sent to the DLQ instead.
+
+        Args:
+            job_data: Original job data (must contain ``doc_id`` if job_id omitted).
+            error: Error message describing the failure.
+            job_id: Retry-tracking key (default: ``job_data["doc_id"]``).
+            now: Current UNIX timestamp (default: time.time()).
+
+        Returns:
+            UNIX timestamp at which the retry becomes due, or None if the job
+            was dead-lettered.
+        """
+        key = job_id if job_id is not None else str(job_data["doc_id"])
+        count = await self.increment_retry_count(key)
+
+        if count > self.max_retries:
+            await self.send_to_dlq({**job_data, "retry_count": count - 1}, error)
+            await self.clear_retry_count(key)
+            return None
+
+        due_at = (time.time() if now is None else now) + self.calculate_backoff_delay(count)
+        entry = json.dumps({**job_data, "retry_count": count, "error": error}, sort_keys=True)
+        await self.redis_client.zadd(self.retry_queue_name, {entry: due_at})
+
+        logger.info(
+            "Scheduled job retry",
+            extra={"job_id": key, "retry_count": count, "due_at": due_at},
+        )
+
+        return due_at
+
+    async def promote_due(
+        self,
+        *,
+        limit: int = 100,
+        now: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Claim up to ``limit`` retries whose due timestamp has passed.
+
+        Claimed entries are removed from the retry set. Removal is checked per
+        entry, so concurrent pollers never promote the same job twice.
+
+        Args:
+            limit: Maximum number of jobs to promote.
+            now: Current UNIX timestamp (default: time.time()).
+
+        Returns:
+            Job data of the claimed retries, oldest due first.
+        """
+        due_before = time.time() if now is None else now
+        members = await self.redis_client.zrangebyscore(
+            self.retry_queue_name, "-inf", due_before, start=0, num=limit
+        )
+        if not members:
+            return []
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for member in members:
+            pipe.zrem(self.retry_queue_name, member)
+        removed = await pipe.execute()
+
+        jobs = [
+            json.loads(member)
+            for member, was_removed in zip(members, removed, strict=True)
+            if was_removed
+        ]
+
+        if jobs:
+            logger.info("Promoted due retries", extra={"count": len(jobs)})
+
+        return jobs
+
+    async def reschedule(
+        self,
+        jobs: list[dict[str, Any]],
+        *,
+        now: float | None = None,
+    ) -> None:
+        """Put promoted retries back on the retry set, due immediately.
+
+        Used when promoted jobs could not be handed to the work queue. Retry
+        counts are left unchanged, so this does not consume an attempt.
+
+        Args:
+            jobs: Job data as returned by promote_due().
+            now: Current UNIX timestamp (default: time.time()).
+        """
+        if not jobs:
+            return
+
+        due_at = time.time() if now is None else now
+        await self.redis_client.zadd(
+            self.retry_queue_name,
+            {json.dumps(job, sort_keys=True): due_at for job in jobs},
+        )
+
+        logger.warning("Rescheduled promoted retries", extra={"count": len(jobs)})
+
+    async def pending_retry_count(self) -> int:
+        """Get the number of scheduled retries (due or not).
+
+        Returns:
+            Size of the retry sorted set.
+        """
+        return int(await self.redis_client.zcard(self.retry_queue_name))
+
 
 # Export public API
-__all__ = ["DeadLetterQueue"]
+__all__ = ["DLQ_QUEUE", "RETRY_QUEUE", "DeadLetterQueue"]
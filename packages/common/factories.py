@@ -6,17 +6,86 @@ Centralizes dependency injection to keep CLI commands and API routes thin.
 from collections.abc import Callable
 
 from packages.clients.postgres_document_store import PostgresDocumentStore
-from packages.common.config import get_config
+from packages.common.config import TabootConfig, get_config
 from packages.common.db_schema import get_postgres_client
 from packages.core.use_cases.ingest_youtube import IngestYouTubeUseCase
 from packages.core.use_cases.reprocess import ReprocessUseCase
 from packages.ingest.chunker import Chunker
 from packages.ingest.embedder import Embedder
+from packages.ingest.embedding_cache import (
+    CachedEmbedder,
+    DiskEmbeddingCacheBackend,
+    EmbeddingCache,
+    EmbeddingCacheBackend,
+    RedisEmbeddingCacheBackend,
+)
 from packages.ingest.normalizer import Normalizer
 from packages.ingest.readers.youtube import YoutubeReader
+from packages.vector.embedding_store import LocalEmbeddingStore
 from packages.vector.writer import QdrantWriter
 
 
+def make_embedder(config: TabootConfig) -> Embedder | CachedEmbedder:
+    """Create the TEI embedder, wrapped in the embedding cache when enabled.
+
+    Args:
+        config: Loaded Taboot configuration.
+
+    Returns:
+        Embedder or CachedEmbedder; both expose ``embed_texts_async``,
+        ``aclose`` and ``close``.
+    """
+    tei_settings = config.tei_config
+    embedder = Embedder(
+        tei_url=str(tei_settings.url).rstrip("/"),
+        batch_size=tei_settings.batch_size,
+        expected_dim=config.qdrant_embedding_dim,
+        timeout=float(tei_settings.timeout),
+        max_concurrency=tei_settings.max_concurrency,
+        max_retries=tei_settings.max_retries,
+        max_batch_tokens=tei_settings.max_batch_tokens,
+    )
+
+    backend: EmbeddingCacheBackend
+    if config.embedding_cache_backend == "redis":
+        from redis import asyncio as redis_async
+
+        backend = RedisEmbeddingCacheBackend(
+            redis_async.from_url(config.redis_url),
+            ttl=config.embedding_cache_ttl,
+        )
+    elif config.embedding_cache_backend == "disk":
+        backend = DiskEmbeddingCacheBackend(config.embedding_cache_dir)
+    else:
+        return embedder
+
+    cache = EmbeddingCache(
+        backend,
+        model_id=config.tei_embedding_model,
+        dtype=config.embedding_cache_dtype,
+        expected_dim=config.qdrant_embedding_dim,
+    )
+    return CachedEmbedder(embedder, cache)
+
+
+def make_embedding_store(config: TabootConfig) -> LocalEmbeddingStore | None:
+    """Open the local embedding store when ``embedding_store_dir`` is set.
+
+    Args:
+        config: Loaded Taboot configuration.
+
+    Returns:
+        LocalEmbeddingStore, or None when the store is disabled.
+    """
+    if not config.embedding_store_dir:
+        return None
+    return LocalEmbeddingStore(
+        config.embedding_store_dir,
+        dim=config.qdrant_embedding_dim,
+        model_id=config.tei_embedding_model,
+    )
+
+
 def make_reprocess_use_case() -> tuple[ReprocessUseCase, Callable[[], None]]:
     """Create a fully-wired ReprocessUseCase with its dependencies.
 
@@ -47,12 +116,22 @@ def make_ingest_youtube_use_case() -> tuple[IngestYouTubeUseCase, Callable[[], N
 
     Returns:
         Tuple of (use_case, cleanup_fn) where cleanup_fn must be called
-        after use to close connections and release resources.
+        after use to close connections and release resources. The embedder's
+        async clients (pooled TEI connections, Redis cache) belong to the
+        event loop that ran the use case, so ``use_case.embedder.aclose()``
+        must be awaited on that loop before it ends.
 
     Example:
         use_case, cleanup = make_ingest_youtube_use_case()
+
+        async def run() -> dict[str, int]:
+            try:
+                return await use_case.execute(urls=video_urls)
+            finally:
+                await use_case.embedder.aclose()
+
         try:
-            result = use_case.execute(urls=video_urls)
+            result = asyncio.run(run())
         finally:
             cleanup()
     """
@@ -63,16 +142,12 @@ def make_ingest_youtube_use_case() -> tuple[IngestYouTubeUseCase, Callable[[], N
     normalizer = Normalizer()
     chunker = Chunker()
 
-    tei_settings = config.tei_config
-    embedder = Embedder(
-        tei_url=str(tei_settings.url),
-        batch_size=tei_settings.batch_size,
-        timeout=float(tei_settings.timeout),
-    )
+    embedder = make_embedder(config)
 
     qdrant_writer = QdrantWriter(
         url=config.qdrant_url,
         collection_name=config.collection_name,
+        embedding_store=make_embedding_store(config),
     )
 
     # Create use case
@@ -82,6 +157,11 @@ def make_ingest_youtube_use_case() -> tuple[IngestYouTubeUseCase, Callable[[], N
         chunker=chunker,
         embedder=embedder,
         qdrant_writer=qdrant_writer,
+        flush_threshold=config.ingest_flush_threshold,
+        queue_size=config.ingest_pipeline_queue_size,
+        embed_concurrency=config.ingest_embed_concurrency,
+        upsert_concurrency=config.ingest_upsert_concurrency,
+        vectors_as_array=config.ingest_vectors_as_array,
     )
 
     def cleanup() -> None:
@@ -10,6 +10,21 @@ import tiktoken
 _ENCODER_CACHE: dict[str, tiktoken.Encoding] = {}
 
 
+def get_encoder(model: str = "cl100k_base") -> tiktoken.Encoding:
+    """Return the cached tiktoken encoder for an encoding name.
+
+    Args:
+        model: Encoding name (cl100k_base for GPT-3.5/4, p50k_base for older models).
+
+    Returns:
+        tiktoken.Encoding: Shared encoder instance.
+    """
+    if model not in _ENCODER_CACHE:
+        _ENCODER_CACHE[model] = tiktoken.get_encoding(model)
+
+    return _ENCODER_CACHE[model]
+
+
 def count_tokens(text: str, model: str = "cl100k_base") -> int:
     """Count tokens using tiktoken.
 
@@ -20,12 +35,8 @@ def count_tokens(text: str, model: str = "cl100k_base") -> int:
     Returns:
         int: Exact token count.
     """
-    if model not in _ENCODER_CACHE:
-        _ENCODER_CACHE[model] = tiktoken.get_encoding(model)
-
-    encoder = _ENCODER_CACHE[model]
-    return len(encoder.encode(text))
+    return len(get_encoder(model).encode(text))
 
 
 # Export public API
-__all__ = ["count_tokens"]
+__all__ = ["count_tokens", "get_encoder"]
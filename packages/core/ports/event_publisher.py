@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
 
 from packages.core.events import DocumentIngestedEvent
 
@@ -14,5 +16,18 @@ class DocumentEventPublisher(ABC):
     async def publish_document_ingested(self, event: DocumentIngestedEvent) -> None:
         """Emit a document ingested event to downstream subscribers."""
 
+    async def publish_many(self, events: Sequence[DocumentIngestedEvent]) -> None:
+        """Emit several document ingested events (one at a time by default)."""
+        for event in events:
+            await self.publish_document_ingested(event)
 
-__all__ = ["DocumentEventPublisher"]
+
+class EventBackpressure(Protocol):
+    """Signal that lets producers wait while downstream consumers catch up."""
+
+    async def wait_for_capacity(self) -> None:
+        """Return once downstream consumers can accept more work."""
+        ...
+
+
+__all__ = ["DocumentEventPublisher", "EventBackpressure"]
@@ -0,0 +1,419 @@
+"""Staged ingestion pipeline shared by all ingest use cases.
+
+A pipeline is a source of items followed by a chain of stages. Each stage
+pulls batches from a bounded input queue, runs its handler and pushes the
+returned items to the next stage's queue, so every stage works concurrently
+and a slow stage throttles the ones upstream instead of growing memory.
+
+Typical ingest chain::
+
+    reader → chunk (normalize/chunk/token-count) → embed → upsert
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Protocol, cast
+
+from packages.core.ports.event_publisher import EventBackpressure
+from packages.schemas.models import Chunk
+
+logger = logging.getLogger(__name__)
+
+StageHandler = Callable[[list[Any]], Awaitable[Iterable[Any]] | Iterable[Any]]
+
+# Marks the end of a stage's input; one is queued per downstream worker
+_END = object()
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineStage:
+    """One step of an ingestion pipeline.
+
+    Attributes:
+        name: Stage name used for queue depth and timing stats.
+        handler: Called with a batch of input items; returns the items passed
+            to the next stage (ignored for the last stage).
+        batch_size: Maximum items handed to one handler call.
+        concurrency: Workers pulling batches from the stage's queue. Output
+            order is only preserved with a single worker.
+        queue_size: Capacity of the stage's input queue in items
+            (default: two batches per worker).
+        max_wait: Seconds to wait for a batch to fill before handling it
+            partially (None waits until the batch is full or input ends).
+        in_thread: Run a synchronous, CPU-bound handler in a worker thread.
+        gated: Await the pipeline's backpressure before each batch.
+    """
+
+    name: str
+    handler: StageHandler
+    batch_size: int = 1
+    concurrency: int = 1
+    queue_size: int | None = None
+    max_wait: float | None = None
+    in_thread: bool = False
+    gated: bool = False
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError(f"Stage {self.name}: batch_size must be >= 1")
+        if self.concurrency < 1:
+            raise ValueError(f"Stage {self.name}: concurrency must be >= 1")
+        if self.queue_size is not None and self.queue_size < 1:
+            raise ValueError(f"Stage {self.name}: queue_size must be >= 1")
+
+    @property
+    def capacity(self) -> int:
+        """Effective input queue capacity."""
+        return self.queue_size or 2 * self.batch_size * self.concurrency
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Throughput and timing counters for one stage.
+
+    Attributes:
+        items_processed: Input items whose batch was handled successfully.
+        items_emitted: Items passed on to the next stage.
+        batches: Handler calls that completed.
+        busy_seconds: Total time spent inside the handler (summed over workers).
+        max_queue_depth: Highest input queue depth observed.
+    """
+
+    items_processed: int = 0
+    items_emitted: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+
+
+@dataclass(slots=True)
+class _StageRuntime:
+    """Queue and counters of a stage during one run."""
+
+    stage: PipelineStage
+    queue: asyncio.Queue[Any]
+    stats: StageStats = field(default_factory=StageStats)
+
+
+class SupportsAsyncEmbedding(Protocol):
+    """Embedder used by :func:`embedding_stage`."""
+
+    async def embed_texts_async(
+        self, texts: list[str], token_counts: Sequence[int] | None = None
+    ) -> list[list[float]]: ...
+
+
+class SupportsAsyncArrayEmbedding(Protocol):
+    """Embedder returning one float32 matrix per call (``as_array=True``)."""
+
+    async def embed_array_async(
+        self, texts: list[str], token_counts: Sequence[int] | None = None
+    ) -> Sequence[Sequence[float]]: ...
+
+
+class SupportsAsyncUpsert(Protocol):
+    """Vector writer used by :func:`upsert_stage`."""
+
+    async def upsert_batch_async(
+        self, chunks: list[Chunk], embeddings: Sequence[Sequence[float]]
+    ) -> None: ...
+
+
+class IngestionPipeline:
+    """Run a source through a chain of concurrent, bounded stages.
+
+    A pipeline instance holds the stats of its latest run, so create one per
+    job when jobs run concurrently.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[PipelineStage],
+        *,
+        backpressure: EventBackpressure | None = None,
+        queue_depth_callback: Callable[[str, int], None] | None = None,
+    ) -> None:
+        """Initialize IngestionPipeline.
+
+        Args:
+            stages: Stages in execution order.
+            backpressure: Shared gate awaited before each batch of gated stages.
+            queue_depth_callback: Optional hook receiving (stage, depth) whenever
+                a stage's input queue grows or shrinks, e.g. to export a gauge.
+
+        Raises:
+            ValueError: If no stages are given or stage names are not unique.
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        names = [stage.name for stage in stages]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Stage names must be unique: {names}")
+
+        self.stages = list(stages)
+        self.backpressure = backpressure
+        self._queue_depth_callback = queue_depth_callback
+        self._runtimes: list[_StageRuntime] = []
+        self._stats: dict[str, StageStats] = {stage.name: StageStats() for stage in self.stages}
+
+    @property
+    def stats(self) -> dict[str, StageStats]:
+        """Per-stage stats of the current or latest run (kept after failures)."""
+        return self._stats
+
+    def queue_depths(self) -> dict[str, int]:
+        """Get the number of items waiting in front of each stage.
+
+        Returns:
+            dict[str, int]: Depth per stage; all zero when not running.
+        """
+        depths = {stage.name: 0 for stage in self.stages}
+        for runtime in self._runtimes:
+            depths[runtime.stage.name] = runtime.queue.qsize()
+        return depths
+
+    async def run(self, source: AsyncIterable[Any] | Iterable[Any]) -> dict[str, StageStats]:
+        """Feed every source item through all stages.
+
+        Synchronous iterables are consumed on the event loop, so blocking
+        readers should be wrapped in an async iterator that offloads I/O.
+        The first failing stage cancels the others and its exception propagates.
+
+        Args:
+            source: Items for the first stage.
+
+        Returns:
+            dict[str, StageStats]: Per-stage stats for this run.
+        """
+        self._runtimes = [
+            _StageRuntime(stage=stage, queue=asyncio.Queue(stage.capacity)) for stage in self.stages
+        ]
+        self._stats = {runtime.stage.name: runtime.stats for runtime in self._runtimes}
+
+        tasks = [asyncio.create_task(self._feed(source, self._runtimes[0]))]
+        for index, runtime in enumerate(self._runtimes):
+            downstream = self._runtimes[index + 1] if index + 1 < len(self._runtimes) else None
+            tasks.append(asyncio.create_task(self._run_stage(runtime, downstream)))
+
+        started = time.monotonic()
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the surviving stages; they would otherwise block on their queues
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            runtimes, self._runtimes = self._runtimes, []
+            # Queues abandoned by a failed run are gone; do not leave stale depths behind
+            for runtime in runtimes:
+                self._report_depth(runtime, 0)
+
+        self._log_summary(time.monotonic() - started)
+        return self._stats
+
+    async def _feed(self, source: AsyncIterable[Any] | Iterable[Any], first: _StageRuntime) -> None:
+        """Push source items into the first stage's queue."""
+        if isinstance(source, AsyncIterable):
+            async for item in source:
+                await self._put(first, item)
+        else:
+            for item in source:
+                await self._put(first, item)
+        await self._close(first)
+
+    async def _run_stage(self, runtime: _StageRuntime, downstream: _StageRuntime | None) -> None:
+        """Run the stage's workers, then signal end of input downstream."""
+        await asyncio.gather(
+            *(self._worker(runtime, downstream) for _ in range(runtime.stage.concurrency))
+        )
+        if downstream is not None:
+            await self._close(downstream)
+
+    async def _worker(self, runtime: _StageRuntime, downstream: _StageRuntime | None) -> None:
+        """Handle batches until this worker's end-of-input marker arrives."""
+        stage = runtime.stage
+        ended = False
+        while not ended:
+            item = await self._get(runtime)
+            if item is _END:
+                return
+
+            batch = [item]
+            while len(batch) < stage.batch_size:
+                try:
+                    item = await asyncio.wait_for(self._get(runtime), stage.max_wait)
+                except TimeoutError:
+                    break
+                if item is _END:
+                    ended = True
+                    break
+                batch.append(item)
+
+            if stage.gated and self.backpressure is not None:
+                await self.backpressure.wait_for_capacity()
+
+            started = time.monotonic()
+            if stage.in_thread:
+                result = await asyncio.to_thread(stage.handler, batch)
+            else:
+                result = stage.handler(batch)
+                if inspect.isawaitable(result):
+                    result = await result
+            runtime.stats.busy_seconds += time.monotonic() - started
+            runtime.stats.batches += 1
+            runtime.stats.items_processed += len(batch)
+
+            if downstream is not None:
+                for output in result:
+                    await self._put(downstream, output)
+                    runtime.stats.items_emitted += 1
+
+    async def _close(self, runtime: _StageRuntime) -> None:
+        """Queue one end-of-input marker per worker of the stage."""
+        for _ in range(runtime.stage.concurrency):
+            await runtime.queue.put(_END)
+
+    async def _put(self, runtime: _StageRuntime, item: Any) -> None:
+        """Put an item on a stage queue (waiting while it is full) and report depth."""
+        await runtime.queue.put(item)
+        depth = runtime.queue.qsize()
+        runtime.stats.max_queue_depth = max(runtime.stats.max_queue_depth, depth)
+        self._report_depth(runtime, depth)
+
+    async def _get(self, runtime: _StageRuntime) -> Any:
+        """Take the next item from a stage queue and report depth."""
+        item = await runtime.queue.get()
+        if item is not _END:
+            self._report_depth(runtime, runtime.queue.qsize())
+        return item
+
+    def _report_depth(self, runtime: _StageRuntime, depth: int) -> None:
+        """Forward a queue depth change to the optional callback."""
+        if self._queue_depth_callback is None:
+            return
+        try:
+            self._queue_depth_callback(runtime.stage.name, depth)
+        except Exception:  # noqa: BLE001 - metrics failures should not break ingestion
+            logger.exception("Queue depth callback failed", extra={"stage": runtime.stage.name})
+
+    def _log_summary(self, elapsed: float) -> None:
+        """Log per-stage busy time so the bottleneck stage is visible."""
+        logger.info(
+            "Pipeline finished in %.2fs: %s",
+            elapsed,
+            ", ".join(
+                f"{name}={stats.items_processed} items/{stats.batches} batches "
+                f"busy {stats.busy_seconds:.2f}s (max queue {stats.max_queue_depth})"
+                for name, stats in self._stats.items()
+            ),
+        )
+
+
+def embedding_stage(
+    embedder: SupportsAsyncEmbedding,
+    *,
+    batch_size: int,
+    concurrency: int = 1,
+    queue_size: int | None = None,
+    max_wait: float | None = None,
+    name: str = "embed",
+    as_array: bool = False,
+) -> PipelineStage:
+    """Build a gated stage turning chunks into (chunk, embedding) pairs.
+
+    Args:
+        embedder: Embedder with ``embed_texts_async`` (and ``embed_array_async``
+            when ``as_array`` is set).
+        batch_size: Chunks embedded per call.
+        concurrency: Batches embedded in parallel.
+        queue_size: Chunks buffered in front of the stage.
+        max_wait: Seconds to wait for a full batch before embedding a partial one.
+        name: Stage name.
+        as_array: Embed into a float32 matrix; pairs then carry row views that
+            the writer re-stacks without building per-float lists.
+
+    Returns:
+        PipelineStage: The embedding stage.
+    """
+    embed_batch = (
+        cast(SupportsAsyncArrayEmbedding, embedder).embed_array_async
+        if as_array
+        else embedder.embed_texts_async
+    )
+
+    async def embed(chunks: list[Chunk]) -> list[tuple[Chunk, Sequence[float]]]:
+        logger.info(f"Flushing {len(chunks)} chunks to vector store")
+        embeddings = await embed_batch(
+            [chunk.content for chunk in chunks],
+            token_counts=[chunk.token_count for chunk in chunks],
+        )
+        return list(zip(chunks, embeddings, strict=True))
+
+    return PipelineStage(
+        name=name,
+        handler=embed,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        queue_size=queue_size,
+        max_wait=max_wait,
+        gated=True,
+    )
+
+
+def upsert_stage(
+    writer: SupportsAsyncUpsert,
+    *,
+    batch_size: int,
+    concurrency: int = 1,
+    queue_size: int | None = None,
+    max_wait: float | None = None,
+    name: str = "upsert",
+) -> PipelineStage:
+    """Build a stage writing (chunk, embedding) pairs to the vector store.
+
+    Args:
+        writer: Vector writer with ``upsert_batch_async``.
+        batch_size: Points written per call.
+        concurrency: Upserts in flight at once.
+        queue_size: Pairs buffered in front of the stage.
+        max_wait: Seconds to wait for a full batch before writing a partial one.
+        name: Stage name.
+
+    Returns:
+        PipelineStage: The upsert stage; emits the written chunks.
+    """
+
+    async def upsert(pairs: list[tuple[Chunk, Sequence[float]]]) -> list[Chunk]:
+        chunks = [chunk for chunk, _ in pairs]
+        await writer.upsert_batch_async(chunks, [embedding for _, embedding in pairs])
+        return chunks
+
+    return PipelineStage(
+        name=name,
+        handler=upsert,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        queue_size=queue_size,
+        max_wait=max_wait,
+    )
+
+
+__all__ = [
+    "IngestionPipeline",
+    "PipelineStage",
+    "StageHandler",
+    "StageStats",
+    "SupportsAsyncArrayEmbedding",
+    "SupportsAsyncEmbedding",
+    "SupportsAsyncUpsert",
+    "embedding_stage",
+    "upsert_stage",
+]
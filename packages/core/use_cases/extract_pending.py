@@ -1,16 +1,18 @@
 """ExtractPendingUseCase - Core orchestration for pending document extraction.
 
 Orchestrates the extraction of pending documents:
-DocumentStore → ExtractionOrchestratorPort → DocumentStore (update state)
+DocumentStore (claim lease) → ExtractionOrchestratorPort → DocumentStore (update state)
 
 With per-document error handling and batch summary statistics.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from typing import Protocol
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from packages.schemas.models import Document, ExtractionJob, ExtractionState
 
@@ -28,22 +30,40 @@ class ExtractionOrchestratorPort(Protocol):
 class DocumentStore(Protocol):
     """Protocol for document persistence operations.
 
-    Defines the interface for querying and updating documents.
+    Defines the interface for claiming and updating documents.
     Implementations can use PostgreSQL, in-memory stores, or other backends.
+    All operations are awaitable so persistence never blocks the event loop.
     """
 
-    def query_pending(self, limit: int | None = None) -> list[Document]:
-        """Query documents in PENDING extraction state.
+    async def claim_pending(
+        self, worker_id: str, limit: int = 1, lease_seconds: int = 300
+    ) -> list[Document]:
+        """Lease up to ``limit`` PENDING documents for a worker.
 
         Args:
-            limit: Optional maximum number of documents to return.
+            worker_id: Unique identifier of the claiming worker.
+            limit: Maximum number of documents to claim.
+            lease_seconds: Lease duration in seconds.
 
         Returns:
-            list[Document]: List of documents with extraction_state == PENDING.
+            list[Document]: Claimed documents (state PROCESSING), oldest first.
         """
         ...
 
-    def get_content(self, doc_id: UUID) -> str:
+    async def renew_lease(self, doc_id: UUID, worker_id: str, lease_seconds: int = 300) -> bool:
+        """Extend a worker's lease on a PROCESSING document.
+
+        Args:
+            doc_id: Leased document UUID.
+            worker_id: Worker that holds the lease.
+            lease_seconds: New lease duration from now, in seconds.
+
+        Returns:
+            bool: False if the lease was lost.
+        """
+        ...
+
+    async def get_content(self, doc_id: UUID) -> str:
         """Get document text content by doc_id.
 
         Args:
@@ -54,7 +74,7 @@ class DocumentStore(Protocol):
         """
         ...
 
-    def update_document(self, document: Document) -> None:
+    async def update_document(self, document: Document) -> None:
         """Update document in store.
 
         Args:
@@ -67,9 +87,12 @@ class ExtractPendingUseCase:
     """Use case for extracting pending documents via multi-tier extraction.
 
     Orchestrates the extraction pipeline:
-    1. Query pending documents from store
+    1. Claim pending documents from store (leased, so stream workers and other
+       batch runs never extract the same document)
     2. For each document, call ExtractionOrchestratorPort.process_document()
-    3. Update document extraction_state based on ExtractionJob result
+       (optionally with bounded concurrency) while renewing its lease
+    3. Update document extraction_state based on ExtractionJob result, which
+       releases the lease
     4. Return summary statistics
 
     NO framework dependencies - only imports from packages.schemas and packages.common.
@@ -77,30 +100,39 @@ class ExtractPendingUseCase:
     Attributes:
         orchestrator: ExtractionOrchestratorPort for multi-tier extraction.
         document_store: DocumentStore for persistence operations.
+        worker_id: Lease owner used when claiming documents.
+        lease_seconds: Lease duration; renewed every third of this interval.
     """
 
     def __init__(
         self,
         orchestrator: ExtractionOrchestratorPort,
         document_store: DocumentStore,
+        worker_id: str | None = None,
+        lease_seconds: int = 300,
     ) -> None:
         """Initialize ExtractPendingUseCase with dependencies.
 
         Args:
             orchestrator: ExtractionOrchestratorPort instance for extraction.
             document_store: DocumentStore instance for persistence.
+            worker_id: Lease owner identifier (defaults to a random id).
+            lease_seconds: Extraction lease duration in seconds.
         """
         self.orchestrator = orchestrator
         self.document_store = document_store
+        self.worker_id = worker_id or f"extract-{uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
 
-        logger.info("Initialized ExtractPendingUseCase")
+        logger.info("Initialized ExtractPendingUseCase (worker_id=%s)", self.worker_id)
 
-    async def execute(self, limit: int | None = None) -> dict[str, int]:
+    async def execute(self, limit: int | None = None, concurrency: int = 1) -> dict[str, int]:
         """Execute extraction pipeline for pending documents.
 
         Pipeline flow:
-        1. Query documents where extraction_state == PENDING
-        2. For each document:
+        1. Claim documents where extraction_state == PENDING, one at a time
+           per in-flight slot, until ``limit`` is reached or none are left
+        2. For each claimed document (up to ``concurrency`` in flight):
            a. Get document content
            b. Call orchestrator.process_document(doc.doc_id, content)
            c. Update doc.extraction_state from job.state
@@ -110,106 +142,189 @@ class ExtractPendingUseCase:
 
         Args:
             limit: Optional maximum number of documents to process.
+            concurrency: Maximum number of documents processed concurrently
+                (default: 1, i.e. sequential).
 
         Returns:
             dict[str, int]: Summary statistics with keys:
                 - processed: Total documents attempted
                 - succeeded: Documents successfully extracted
                 - failed: Documents that failed extraction
-        """
-        # Step 1: Query pending documents
-        logger.info("Querying pending documents (limit=%s)", limit)
-        pending_docs = self.document_store.query_pending(limit=limit)
-        logger.info("Found %s pending documents", len(pending_docs))
 
-        # Early exit for empty queue
-        if not pending_docs:
-            logger.info("No pending documents to process")
-            return {"processed": 0, "succeeded": 0, "failed": 0}
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+        # Counters are only mutated between awaits, so no lock is needed
+        stats = {"processed": 0, "succeeded": 0, "failed": 0}
+        claimed = 0
+
+        # Step 1-2: Each worker claims the next pending document only when it is
+        # free, so no lease is held on a document that is still waiting its turn
+        async def worker() -> None:
+            nonlocal claimed
+            while limit is None or claimed < limit:
+                claimed += 1  # Reserve a slot before awaiting the claim
+                docs = await self.document_store.claim_pending(
+                    self.worker_id, limit=1, lease_seconds=self.lease_seconds
+                )
+                if not docs:
+                    claimed -= 1
+                    return
 
-        # Initialize counters
-        processed = 0
-        succeeded = 0
-        failed = 0
+                succeeded = await self.process_leased(docs[0])
+                stats["processed"] += 1
+                stats["succeeded" if succeeded else "failed"] += 1
 
-        # Step 2: Process each document
-        for doc in pending_docs:
-            try:
                 # Log progress every 10 documents
-                if processed > 0 and processed % 10 == 0:
+                if stats["processed"] % 10 == 0:
                     logger.info(
-                        "Progress: %s/%s documents processed (succeeded=%s, failed=%s)",
-                        processed,
-                        len(pending_docs),
-                        succeeded,
-                        failed,
+                        "Progress: %s documents processed (succeeded=%s, failed=%s)",
+                        stats["processed"],
+                        stats["succeeded"],
+                        stats["failed"],
                     )
 
-                # Step 2a: Get document content
-                content = self.document_store.get_content(doc.doc_id)
-
-                # Step 2b: Call orchestrator
-                logger.debug(f"Processing document {doc.doc_id}")
-                job: ExtractionJob = await self.orchestrator.process_document(doc.doc_id, content)
-
-                # Step 2c-2d: Update document state from job
-                # Note: extraction_version would come from orchestrator metadata
-                # For now, we only update the state
-                updated_doc = doc.model_copy(
-                    update={
-                        "extraction_state": job.state,
-                    }
-                )
+        logger.info("Claiming pending documents (limit=%s)", limit)
+        worker_count = concurrency if limit is None else max(1, min(concurrency, limit))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
 
-                # Step 2e: Persist changes
-                self.document_store.update_document(updated_doc)
-
-                # Update counters based on job result
-                processed += 1
-                if job.state == ExtractionState.COMPLETED:
-                    succeeded += 1
-                    logger.debug(
-                        f"Document {doc.doc_id} extracted successfully: "
-                        f"tier_a={job.tier_a_triples}, tier_b={job.tier_b_windows}, "
-                        f"tier_c={job.tier_c_triples}"
-                    )
-                else:
-                    failed += 1
-                    logger.warning(f"Document {doc.doc_id} extraction failed: state={job.state}")
-
-            except (ConnectionError, TimeoutError) as e:
-                # Service connectivity issues - mark as failed and continue
-                processed += 1
-                failed += 1
-                logger.error(
-                    "Service connection error processing document %s: %s",
-                    doc.doc_id,
-                    e,
-                    exc_info=True,
-                )
-            except (KeyError, ValueError) as e:
-                # Data validation issues - mark as failed and continue
-                processed += 1
-                failed += 1
-                logger.error(
-                    "Data validation error processing document %s: %s", doc.doc_id, e, exc_info=True
-                )
-            except Exception as e:
-                # Unexpected errors - log with full context, mark as failed, continue
-                processed += 1
-                failed += 1
-                logger.exception("Unexpected error processing document %s: %s", doc.doc_id, e)
+        # Nothing was pending
+        if not stats["processed"]:
+            logger.info("No pending documents to process")
+            return stats
 
         # Step 3: Log final summary
         logger.info(
-            f"Extraction complete: processed={processed}, succeeded={succeeded}, failed={failed}"
+            f"Extraction complete: processed={stats['processed']}, "
+            f"succeeded={stats['succeeded']}, failed={stats['failed']} "
+            f"(concurrency={worker_count})"
         )
 
-        return {
-            "processed": processed,
-            "succeeded": succeeded,
-            "failed": failed,
-        }
+        return stats
+
+    async def process_leased(
+        self,
+        doc: Document,
+        worker_id: str | None = None,
+        lease_seconds: int | None = None,
+    ) -> bool:
+        """Extract a claimed document, renewing its lease until it is done.
+
+        Args:
+            doc: Document leased (PROCESSING) by ``worker_id``.
+            worker_id: Lease owner (default: this use case's worker_id).
+            lease_seconds: Lease duration (default: this use case's lease_seconds).
+
+        Returns:
+            bool: True if extraction completed, False otherwise.
+        """
+        heartbeat = asyncio.create_task(
+            self._heartbeat(
+                doc.doc_id,
+                worker_id or self.worker_id,
+                lease_seconds if lease_seconds is not None else self.lease_seconds,
+            )
+        )
+        try:
+            return await self.process_document(doc)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _heartbeat(self, doc_id: UUID, worker_id: str, lease_seconds: int) -> None:
+        """Renew the lease on ``doc_id`` until cancelled or the lease is lost."""
+        interval = max(1.0, lease_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.document_store.renew_lease(
+                    doc_id, worker_id, lease_seconds=lease_seconds
+                ):
+                    return
+            except Exception:
+                logger.exception("Failed to renew lease for doc_id=%s", doc_id)
+
+    async def process_document(self, doc: Document) -> bool:
+        """Extract a single document and persist its new state.
+
+        Errors are isolated per document: they are logged, the document is
+        marked FAILED (releasing its lease, so a scheduled retry can requeue
+        it) and reported as a failure so the remaining documents in the batch
+        keep processing.
+
+        Args:
+            doc: Pending document to extract.
+
+        Returns:
+            bool: True if extraction completed, False otherwise.
+        """
+        try:
+            # Step 2a: Get document content
+            content = await self.document_store.get_content(doc.doc_id)
+
+            # Step 2b: Call orchestrator
+            logger.debug(f"Processing document {doc.doc_id}")
+            job: ExtractionJob = await self.orchestrator.process_document(doc.doc_id, content)
+
+            # Step 2c-2d: Update document state from job
+            # Note: extraction_version would come from orchestrator metadata
+            # For now, we only update the state
+            updated_doc = doc.model_copy(
+                update={
+                    "extraction_state": job.state,
+                }
+            )
+
+            # Step 2e: Persist changes
+            await self.document_store.update_document(updated_doc)
+
+            if job.state == ExtractionState.COMPLETED:
+                logger.debug(
+                    f"Document {doc.doc_id} extracted successfully: "
+                    f"tier_a={job.tier_a_triples}, tier_b={job.tier_b_windows}, "
+                    f"tier_c={job.tier_c_triples}"
+                )
+                return True
+
+            logger.warning(f"Document {doc.doc_id} extraction failed: state={job.state}")
+            return False
+
+        except (ConnectionError, TimeoutError) as e:
+            # Service connectivity issues - mark as failed and continue
+            logger.error(
+                "Service connection error processing document %s: %s",
+                doc.doc_id,
+                e,
+                exc_info=True,
+            )
+        except (KeyError, ValueError) as e:
+            # Data validation issues - mark as failed and continue
+            logger.error(
+                "Data validation error processing document %s: %s", doc.doc_id, e, exc_info=True
+            )
+        except Exception as e:
+            # Unexpected errors - log with full context, mark as failed, continue
+            logger.exception("Unexpected error processing document %s: %s", doc.doc_id, e)
+
+        await self._mark_failed(doc)
+        return False
+
+    async def _mark_failed(self, doc: Document) -> None:
+        """Move a document that raised during extraction to FAILED.
+
+        If this update fails too, the lease expires and the reaper returns
+        the document to the backlog.
+        """
+        try:
+            await self.document_store.update_document(
+                doc.model_copy(update={"extraction_state": ExtractionState.FAILED})
+            )
+        except Exception:
+            logger.exception("Failed to mark document %s as failed", doc.doc_id)
 
 
 # Export public API
@@ -1,23 +1,32 @@
 """IngestElasticsearchUseCase - Core orchestration for Elasticsearch document ingestion.
 
 Orchestrates the complete ingestion pipeline:
-ElasticsearchReader → Normalizer → Chunker → Embedder → QdrantWriter
+ElasticsearchReader → Normalizer → Chunker → Embedder → QdrantWriter → DocumentStore
 
-With document tracking and error handling per data-model.md.
+Stages run on the shared IngestionPipeline, so chunking, embedding and
+upserting overlap. A document's record is saved only after its last chunk is
+in Qdrant, so extraction never starts on a document without vectors. With
+document tracking and error handling per data-model.md.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from uuid import NAMESPACE_URL, uuid4, uuid5
-
-from llama_index.core import Document as LlamaDocument
-
-from packages.clients.postgres_document_store import PostgresDocumentStore
-from packages.common.token_utils import count_tokens
-from packages.ingest.chunker import Chunker
+from typing import TYPE_CHECKING
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
+from packages.core.services.ingestion_pipeline import (
+    IngestionPipeline,
+    PipelineStage,
+    embedding_stage,
+    upsert_stage,
+)
+from packages.ingest.chunker import Chunker, stable_chunk_ids
 from packages.ingest.embedder import Embedder
 from packages.ingest.normalizer import Normalizer
 from packages.ingest.readers.elasticsearch import ElasticsearchReader
@@ -31,9 +40,27 @@ from packages.schemas.models import (
 )
 from packages.vector.writer import QdrantWriter
 
+if TYPE_CHECKING:
+    from llama_index.core import Document as LlamaDocument
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _PendingRecord:
+    """A document whose record waits for its chunks to reach Qdrant.
+
+    Attributes:
+        document: Document record to persist.
+        content: Normalized text stored for extraction.
+        remaining: Chunks not yet upserted.
+    """
+
+    document: DocumentModel
+    content: str
+    remaining: int
+
+
 class IngestElasticsearchUseCase:
     """Use case for ingesting Elasticsearch documents into Qdrant vector store.
 
@@ -46,7 +73,7 @@ class IngestElasticsearchUseCase:
         chunker: Chunker adapter for semantic chunking.
         embedder: Embedder adapter for text embedding.
         qdrant_writer: QdrantWriter adapter for vector storage.
-        document_store: PostgresDocumentStore for document tracking.
+        document_store: AsyncPostgresDocumentStore for document tracking.
         collection_name: Qdrant collection name for storing chunks.
         index: Elasticsearch index name.
     """
@@ -58,9 +85,15 @@ class IngestElasticsearchUseCase:
         chunker: Chunker,
         embedder: Embedder,
         qdrant_writer: QdrantWriter,
-        document_store: PostgresDocumentStore,
+        document_store: AsyncPostgresDocumentStore,
         collection_name: str,
         index: str,
+        flush_threshold: int = 1000,
+        *,
+        queue_size: int = 4,
+        embed_concurrency: int = 1,
+        upsert_concurrency: int = 1,
+        vectors_as_array: bool = False,
     ) -> None:
         """Initialize IngestElasticsearchUseCase with all dependencies.
 
@@ -70,9 +103,16 @@ class IngestElasticsearchUseCase:
             chunker: Chunker instance for semantic chunking.
             embedder: Embedder instance for text embedding.
             qdrant_writer: QdrantWriter instance for vector storage.
-            document_store: PostgresDocumentStore for document tracking.
+            document_store: AsyncPostgresDocumentStore for document tracking.
             collection_name: Qdrant collection name.
             index: Elasticsearch index name.
+            flush_threshold: Chunks embedded and upserted per batch (default: 1000).
+            queue_size: Capacity of each inter-stage queue, in documents for the
+                chunk stage and in flush batches for the embed/upsert stages.
+            embed_concurrency: Chunk batches embedded in parallel.
+            upsert_concurrency: Batches upserted to Qdrant in parallel.
+            vectors_as_array: Carry embeddings as float32 ndarrays from TEI to
+                Qdrant instead of lists of Python floats.
         """
         self.elasticsearch_reader = elasticsearch_reader
         self.normalizer = normalizer
@@ -82,26 +122,30 @@ class IngestElasticsearchUseCase:
         self.document_store = document_store
         self.collection_name = collection_name
         self.index = index
+        self.flush_threshold = flush_threshold
+        self.queue_size = queue_size
+        self.embed_concurrency = embed_concurrency
+        self.upsert_concurrency = upsert_concurrency
+        self.vectors_as_array = vectors_as_array
 
         logger.info(
             f"Initialized IngestElasticsearchUseCase (collection={collection_name}, index={index})"
         )
 
-    def execute(self, query: dict[str, object], limit: int | None = None) -> dict[str, int]:
+    async def execute(self, query: dict[str, object], limit: int | None = None) -> dict[str, int]:
         """Execute the full ingestion pipeline for Elasticsearch documents.
 
         Pipeline flow:
         1. ElasticsearchReader.load_data(query, limit) → docs[]
         2. Validate docs is not empty
-        3. For each doc:
-           a. Normalizer.normalize(doc.text) → normalized_text
-           b. Chunker.chunk_document(normalized_doc) → chunks[]
-           c. Create deterministic doc_id from content hash
-           d. Create Chunk models with metadata
-           e. Store Document record in PostgreSQL
-        4. Embedder.embed_texts([chunk.content]) → embeddings[]
-        5. QdrantWriter.upsert_batch(chunks, embeddings)
-        6. Return stats: docs_processed, chunks_created
+        3. Stream docs through the pipeline stages:
+           a. chunk: normalize and chunk (worker thread), deterministic doc_id
+              from content hash, Chunk models
+           b. embed: Embedder.embed_texts_async per flush-threshold batch
+           c. upsert: QdrantWriter.upsert_batch_async
+           d. record: Document record stored in PostgreSQL once all of a
+              document's chunks are upserted
+        4. Return stats: docs_processed, chunks_created
 
         Args:
             query: Elasticsearch query DSL dict.
@@ -115,7 +159,9 @@ class IngestElasticsearchUseCase:
         """
         # Step 1: Load documents from Elasticsearch
         logger.info(f"Loading documents from Elasticsearch index {self.index}")
-        docs = self.elasticsearch_reader.load_data(query=query, limit=limit)
+        docs = await asyncio.to_thread(
+            self.elasticsearch_reader.load_data, query=query, limit=limit
+        )
         logger.info(f"Loaded {len(docs)} documents from {self.index}")
 
         # Step 2: Validate docs is not empty
@@ -124,29 +170,15 @@ class IngestElasticsearchUseCase:
             logger.warning(msg)
             raise ValueError(msg)
 
-        # Step 3: Process each document
-        all_chunks: list[Chunk] = []
+        # Step 3: Chunk, embed and upsert concurrently
         now_dt = datetime.now(UTC)
+        pipeline = self._build_pipeline(now_dt)
+        stage_stats = await pipeline.run(docs)
 
-        for doc in docs:
-            chunks = self._process_document(doc, now_dt)
-            all_chunks.extend(chunks)
-
-        logger.info(f"Created {len(all_chunks)} chunks from {len(docs)} documents")
-
-        # Step 4: Embed all chunks in batch
-        logger.info(f"Embedding {len(all_chunks)} chunks")
-        chunk_texts = [chunk.content for chunk in all_chunks]
-        embeddings = self.embedder.embed_texts(chunk_texts)
-
-        # Step 5: Upsert to Qdrant
-        logger.info(f"Upserting {len(all_chunks)} chunks to Qdrant")
-        self.qdrant_writer.upsert_batch(all_chunks, embeddings)
-
-        # Step 6: Return stats
+        # Step 4: Return stats
         stats = {
-            "docs_processed": len(docs),
-            "chunks_created": len(all_chunks),
+            "docs_processed": stage_stats["chunk"].items_processed,
+            "chunks_created": stage_stats["upsert"].items_processed,
         }
         logger.info(
             f"Completed Elasticsearch ingestion: "
@@ -155,42 +187,93 @@ class IngestElasticsearchUseCase:
 
         return stats
 
-    def _process_document(self, doc: LlamaDocument, now_dt: datetime) -> list[Chunk]:
+    def _build_pipeline(self, now_dt: datetime) -> IngestionPipeline:
+        """Build the chunk → embed → upsert → record pipeline for one run."""
+        # Documents of this run whose chunks are still on their way to Qdrant
+        pending_records: dict[UUID, _PendingRecord] = {}
+        # Documents of this run already chunked (identical content shares a doc_id)
+        seen: set[UUID] = set()
+
+        async def chunk(docs: list[LlamaDocument]) -> list[Chunk]:
+            chunks: list[Chunk] = []
+            for doc in docs:
+                chunks.extend(await self._process_document(doc, now_dt, pending_records, seen))
+            return chunks
+
+        async def record(chunks: list[Chunk]) -> list[Chunk]:
+            for written in chunks:
+                pending = pending_records[written.doc_id]
+                pending.remaining -= 1
+                if pending.remaining == 0:
+                    del pending_records[written.doc_id]
+                    await self.document_store.create(pending.document, pending.content)
+            return chunks
+
+        batch_queue_size = self.queue_size * self.flush_threshold
+        return IngestionPipeline(
+            [
+                PipelineStage(name="chunk", handler=chunk, queue_size=self.queue_size),
+                embedding_stage(
+                    self.embedder,
+                    batch_size=self.flush_threshold,
+                    concurrency=self.embed_concurrency,
+                    queue_size=batch_queue_size,
+                    as_array=self.vectors_as_array,
+                ),
+                upsert_stage(
+                    self.qdrant_writer,
+                    batch_size=self.flush_threshold,
+                    concurrency=self.upsert_concurrency,
+                    queue_size=batch_queue_size,
+                ),
+                PipelineStage(
+                    name="record",
+                    handler=record,
+                    batch_size=self.flush_threshold,
+                    queue_size=batch_queue_size,
+                ),
+            ]
+        )
+
+    async def _process_document(
+        self,
+        doc: LlamaDocument,
+        now_dt: datetime,
+        pending_records: dict[UUID, _PendingRecord],
+        seen: set[UUID],
+    ) -> list[Chunk]:
         """Process a single document through the pipeline.
 
+        Normalizing and chunking are CPU-bound and run in a worker thread while
+        the event loop keeps embedding and upserting. The document record is
+        saved right away if the document has no chunks, otherwise it is added
+        to ``pending_records`` and saved by the record stage after the last
+        chunk is upserted.
+
         Args:
             doc: LlamaDocument to process.
             now_dt: Current timestamp for ingested_at.
+            pending_records: Documents of the run still waiting for their chunks.
+            seen: doc_ids already processed in this run; a repeated document
+                is skipped.
 
         Returns:
             list[Chunk]: Processed chunks with metadata.
         """
         # Normalize text
-        normalized_text = self.normalizer.normalize(doc.text)
-
-        # Filter metadata to only essential fields needed for chunking/retrieval
-        # This prevents LlamaIndex SentenceSplitter from failing when metadata
-        # serialization exceeds chunk_size (512 tokens)
-        filtered_metadata = {}
-        if doc.metadata:
-            # Only keep fields that are: (1) needed for retrieval or (2) small
-            allowed_keys = {"source_url", "_id", "index", "title"}
-            filtered_metadata = {
-                k: v for k, v in doc.metadata.items()
-                if k in allowed_keys and isinstance(v, (str, int, float, bool))
-            }
-
-        normalized_doc = LlamaDocument(
-            text=normalized_text,
-            metadata=filtered_metadata,
-        )
-
-        # Chunk
-        chunk_docs = self.chunker.chunk_document(normalized_doc)
+        normalized_text = await asyncio.to_thread(self.normalizer.normalize, doc.text)
 
         # Create deterministic doc_id from content hash
         content_hash = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
         doc_id = uuid5(NAMESPACE_URL, content_hash)
+        # Reserve the doc_id before the next await so a repeat is skipped
+        if doc_id in seen:
+            logger.debug(f"Skipping repeated Elasticsearch document {doc_id}")
+            return []
+        seen.add(doc_id)
+
+        # Chunk; spans carry exact token counts
+        text_chunks = await asyncio.to_thread(self.chunker.chunk_text, normalized_text)
 
         # Extract source URL from metadata or construct one
         source_url = doc.metadata.get("source_url", "")
@@ -205,19 +288,19 @@ class IngestElasticsearchUseCase:
         # Convert chunks to Chunk models
         ingested_at = int(now_dt.timestamp())
         chunks: list[Chunk] = []
+        # Keyed on doc_id: source_url may be shared by many ES documents
+        chunk_ids = stable_chunk_ids(str(doc_id), (text_chunk.text for text_chunk in text_chunks))
 
-        for chunk_doc in chunk_docs:
-            chunk_index = chunk_doc.metadata.get("chunk_index", 0)
-            token_count = count_tokens(chunk_doc.text)
-            token_count = max(1, min(token_count, 512))
-
+        for chunk_index, (chunk_id, text_chunk) in enumerate(
+            zip(chunk_ids, text_chunks, strict=True)
+        ):
             chunk = Chunk(
-                chunk_id=uuid4(),
+                chunk_id=chunk_id,
                 doc_id=doc_id,
-                content=chunk_doc.text,
-                section=None,
+                content=text_chunk.text,
+                section=text_chunk.section,
                 position=chunk_index,
-                token_count=token_count,
+                token_count=max(1, min(text_chunk.token_count, 512)),
                 source_url=source_url,
                 source_type=SourceType.ELASTICSEARCH,
                 ingested_at=ingested_at,
@@ -238,12 +321,17 @@ class IngestElasticsearchUseCase:
             metadata={
                 "index": self.index,
                 "elasticsearch_id": doc.metadata.get("_id"),
-                "chunk_count": len(chunk_docs),
+                "chunk_count": len(text_chunks),
             },
         )
 
-        # Store document and content for extraction
-        self.document_store.create(doc_record, normalized_text)
+        # Store document and content for extraction once its chunks are in Qdrant
+        if chunks:
+            pending_records[doc_id] = _PendingRecord(
+                document=doc_record, content=normalized_text, remaining=len(chunks)
+            )
+        else:
+            await self.document_store.create(doc_record, normalized_text)
 
         return chunks
 
@@ -1,26 +1,43 @@
 """IngestWebUseCase - Core orchestration for web document ingestion.
 
 Orchestrates the complete ingestion pipeline:
-WebReader → Normalizer → Chunker → Embedder → QdrantWriter
-
-With job state tracking and error handling per data-model.md.
+WebReader → Normalizer → Chunker → Embedder → QdrantWriter → DocumentStore
+
+Stages run concurrently on the shared IngestionPipeline, so normalizing and
+chunking (in a worker thread, or a process pool for large crawls), TEI
+embedding and Qdrant upserts overlap instead of running back to back. With
+job state tracking and error handling per data-model.md.
+
+Re-ingestion is incremental: a page whose stored record (keyed by its URL)
+already has the same normalized content is skipped before chunking, and a
+changed page is diffed against its stored points so only new chunks are
+embedded and orphaned points are deleted. A page's record is saved only after
+its last chunk is in Qdrant, so a failed run leaves the page to the next one.
 """
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from uuid import UUID, uuid4
-
-from llama_index.core import Document as LlamaDocument
-
-from packages.clients.postgres_document_store import PostgresDocumentStore
-from packages.common.token_utils import count_tokens
-from packages.ingest.chunker import Chunker
+from typing import TYPE_CHECKING
+from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
+
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
+from packages.core.ports.event_publisher import EventBackpressure
+from packages.core.services.ingestion_pipeline import (
+    IngestionPipeline,
+    PipelineStage,
+    StageStats,
+    embedding_stage,
+    upsert_stage,
+)
+from packages.ingest.chunker import Chunker, TextChunk, stable_chunk_ids
 from packages.ingest.embedder import Embedder
 from packages.ingest.normalizer import Normalizer
+from packages.ingest.preparer import DocumentPreparer
 from packages.ingest.readers.web import WebReader
 from packages.schemas.models import (
     Chunk,
@@ -34,8 +51,35 @@ from packages.schemas.models import (
 )
 from packages.vector.writer import QdrantWriter
 
+if TYPE_CHECKING:
+    from llama_index.core import Document as LlamaDocument
+
 logger = logging.getLogger(__name__)
 
+# Stage names reported by IngestWebUseCase.queue_depths()
+STAGE_CHUNK = "chunk"  # Loaded pages waiting to be normalized and chunked
+STAGE_EMBED = "embed"  # Chunks waiting for embeddings
+STAGE_UPSERT = "upsert"  # Embedded chunks waiting to be written to Qdrant
+STAGE_RECORD = "record"  # Written chunks waiting to complete their page's record
+PIPELINE_STAGES = (STAGE_CHUNK, STAGE_EMBED, STAGE_UPSERT, STAGE_RECORD)
+
+
+@dataclass(slots=True)
+class _PendingRecord:
+    """A page whose document record waits for its chunks to reach Qdrant.
+
+    Attributes:
+        document: Document record to persist.
+        markdown: Normalized content stored for extraction.
+        chunk_count: Total chunks of the page (reported to the callback).
+        remaining: Chunks not yet upserted.
+    """
+
+    document: DocumentModel
+    markdown: str
+    chunk_count: int
+    remaining: int
+
 
 class IngestWebUseCase:
     """Use case for ingesting web documents into Qdrant vector store.
@@ -49,7 +93,7 @@ class IngestWebUseCase:
         chunker: Chunker adapter for semantic chunking.
         embedder: Embedder adapter for text embedding.
         qdrant_writer: QdrantWriter adapter for vector storage.
-        document_store: PostgresDocumentStore for document tracking.
+        document_store: AsyncPostgresDocumentStore for document tracking.
         collection_name: Qdrant collection name for storing chunks.
     """
 
@@ -60,11 +104,18 @@ class IngestWebUseCase:
         chunker: Chunker,
         embedder: Embedder,
         qdrant_writer: QdrantWriter,
-        document_store: PostgresDocumentStore,
+        document_store: AsyncPostgresDocumentStore,
         collection_name: str,
         flush_threshold: int = 1000,
         *,
         document_ingested_callback: Callable[[DocumentModel, int], None] | None = None,
+        backpressure: EventBackpressure | None = None,
+        queue_size: int = 4,
+        queue_depth_callback: Callable[[str, int], None] | None = None,
+        embed_concurrency: int = 1,
+        upsert_concurrency: int = 1,
+        vectors_as_array: bool = False,
+        preparer: DocumentPreparer | None = None,
     ) -> None:
         """Initialize IngestWebUseCase with all dependencies.
 
@@ -74,12 +125,30 @@ class IngestWebUseCase:
             chunker: Chunker instance for semantic chunking.
             embedder: Embedder instance for text embedding.
             qdrant_writer: QdrantWriter instance for vector storage.
-            document_store: PostgresDocumentStore for document tracking.
+            document_store: AsyncPostgresDocumentStore for document tracking.
             collection_name: Qdrant collection name.
             flush_threshold: Number of chunks to accumulate before flushing (default: 1000).
             document_ingested_callback: Optional hook invoked after a document is
                 persisted; receives the Document model and chunk count.
+            backpressure: Optional gate awaited before each flush so ingestion
+                pauses while extraction lags behind the events stream.
+            queue_size: Capacity of each inter-stage queue, in pages for the
+                chunk stage and in flush batches for the embed/upsert stages.
+            queue_depth_callback: Optional hook receiving (stage, depth) whenever
+                an inter-stage queue grows or shrinks, e.g. to export a gauge.
+            embed_concurrency: Chunk batches embedded in parallel.
+            upsert_concurrency: Batches upserted to Qdrant in parallel.
+            vectors_as_array: Carry embeddings as float32 ndarrays from TEI to
+                Qdrant instead of lists of Python floats.
+            preparer: Runs the normalizer and chunker, in a process pool for
+                large crawls (default: in-process only).
+
+        Raises:
+            ValueError: If queue_size is less than 1.
         """
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be >= 1, got {queue_size}")
+
         self.web_reader = web_reader
         self.normalizer = normalizer
         self.chunker = chunker
@@ -89,6 +158,14 @@ class IngestWebUseCase:
         self.collection_name = collection_name
         self.flush_threshold = flush_threshold
         self._document_ingested_callback = document_ingested_callback
+        self.backpressure = backpressure
+        self.queue_size = queue_size
+        self.embed_concurrency = embed_concurrency
+        self.upsert_concurrency = upsert_concurrency
+        self.vectors_as_array = vectors_as_array
+        self.preparer = preparer or DocumentPreparer(normalizer, chunker, workers=1)
+        self._queue_depth_callback = queue_depth_callback
+        self._pipeline: IngestionPipeline | None = None
 
         logger.info(
             f"Initialized IngestWebUseCase (collection={collection_name}, "
@@ -103,15 +180,17 @@ class IngestWebUseCase:
         Pipeline flow:
         1. Create IngestionJob (state=PENDING)
         2. Transition to RUNNING
-        3. WebReader.load_data(url, limit) → docs[]
-        4. For each doc:
-           a. Normalizer.normalize(doc.text) → markdown
-           b. Chunker.chunk_document(markdown_doc) → chunks[]
-           c. Accumulate chunks with flush threshold
-           d. When threshold reached: embed and upsert batch
-        5. Final flush for remaining chunks
-        6. Transition to COMPLETED (or FAILED on error)
-        7. Return job
+        3. Stream WebReader.aiter_data(url, limit) through the pipeline stages
+           as pages are crawled:
+           a. chunk: Normalizer + Chunker (worker thread, or process pool for
+              crawls of unknown or large size)
+           b. embed: backpressure gate, Embedder.embed_texts_async per
+              flush-threshold batch
+           c. upsert: QdrantWriter.upsert_batch_async
+           d. record: document record persisted once all of a page's chunks
+              are upserted
+        4. Transition to COMPLETED (or FAILED on the first stage error)
+        5. Return job
 
         Args:
             url: URL to crawl and ingest.
@@ -125,40 +204,22 @@ class IngestWebUseCase:
         job = self._create_job(url, job_id=job_id)
         logger.info(f"Created ingestion job {job.job_id} for {url} (limit={limit})")
 
+        pipeline = self._build_pipeline(url, pooled=self.preparer.use_pool(limit))
+        self._pipeline = pipeline
         try:
             # Step 2: Transition to RUNNING
             job = self._transition_to_running(job)
 
-            # Step 3: Load documents
-            logger.info(f"Loading documents from {url}")
-            docs = self.web_reader.load_data(url, limit)
-            logger.info(f"Loaded {len(docs)} documents from {url}")
+            # Step 3: Stream documents through the staged pipeline
+            try:
+                await pipeline.run(self._load_documents(url, limit))
+            finally:
+                job = self._apply_stats(job, pipeline.stats)
 
-            # Early exit for empty document list
-            if not docs:
+            if job.pages_processed == 0:
                 logger.info(f"No documents to process for {url}")
-                job = self._transition_to_completed(job)
-                return job
-
-            # Step 4: Process each document with batched flushing
-            all_chunks: list[Chunk] = []
-            for doc in docs:
-                chunks = self._process_document(doc, job, url)
-                all_chunks.extend(chunks)
-
-                # Update pages_processed
-                job = job.model_copy(update={"pages_processed": job.pages_processed + 1})
-
-                # Flush when threshold reached
-                if len(all_chunks) >= self.flush_threshold:
-                    job = await self._flush_chunks(all_chunks, job)
-                    all_chunks = []
 
-            # Final flush for remaining chunks
-            if all_chunks:
-                job = await self._flush_chunks(all_chunks, job)
-
-            # Step 5: Transition to COMPLETED
+            # Step 4: Transition to COMPLETED
             job = self._transition_to_completed(job)
             logger.info(
                 f"Completed ingestion job {job.job_id}: "
@@ -195,6 +256,100 @@ class IngestWebUseCase:
             job = self._transition_to_failed(job, f"Unexpected error: {str(e)}")
             return job
 
+    def queue_depths(self) -> dict[str, int]:
+        """Get the number of items waiting in front of each pipeline stage.
+
+        Returns:
+            dict[str, int]: Depth per stage; all zero when no job is running.
+        """
+        if self._pipeline is None:
+            return dict.fromkeys(PIPELINE_STAGES, 0)
+        return self._pipeline.queue_depths()
+
+    def _build_pipeline(self, source_url: str, *, pooled: bool = False) -> IngestionPipeline:
+        """Build the chunk → embed → upsert → record pipeline for one job.
+
+        With ``pooled`` set, one chunk worker per pool process keeps every
+        process busy.
+        """
+        # Pages of this job whose chunks are still on their way to Qdrant
+        pending_records: dict[UUID, _PendingRecord] = {}
+        # Pages of this job already taken by a chunk worker
+        seen: set[UUID] = set()
+
+        async def chunk(docs: list[LlamaDocument]) -> list[Chunk]:
+            chunks: list[Chunk] = []
+            for doc in docs:
+                chunks.extend(
+                    await self._process_document(
+                        doc, source_url, pending_records, seen, pooled=pooled
+                    )
+                )
+            return chunks
+
+        async def record(chunks: list[Chunk]) -> list[Chunk]:
+            for written in chunks:
+                page = pending_records[written.doc_id]
+                page.remaining -= 1
+                if page.remaining == 0:
+                    del pending_records[written.doc_id]
+                    await self._save_document(page)
+            return chunks
+
+        chunk_concurrency = self.preparer.workers if pooled else 1
+        batch_queue_size = self.queue_size * self.flush_threshold
+        return IngestionPipeline(
+            [
+                PipelineStage(
+                    name=STAGE_CHUNK,
+                    handler=chunk,
+                    concurrency=chunk_concurrency,
+                    queue_size=max(self.queue_size, chunk_concurrency),
+                ),
+                embedding_stage(
+                    self.embedder,
+                    name=STAGE_EMBED,
+                    batch_size=self.flush_threshold,
+                    concurrency=self.embed_concurrency,
+                    queue_size=batch_queue_size,
+                    as_array=self.vectors_as_array,
+                ),
+                upsert_stage(
+                    self.qdrant_writer,
+                    name=STAGE_UPSERT,
+                    batch_size=self.flush_threshold,
+                    concurrency=self.upsert_concurrency,
+                    queue_size=batch_queue_size,
+                ),
+                PipelineStage(
+                    name=STAGE_RECORD,
+                    handler=record,
+                    batch_size=self.flush_threshold,
+                    queue_size=batch_queue_size,
+                ),
+            ],
+            backpressure=self.backpressure,
+            queue_depth_callback=self._queue_depth_callback,
+        )
+
+    async def _load_documents(self, url: str, limit: int | None) -> AsyncIterator[LlamaDocument]:
+        """Crawl the URL and yield pages as soon as Firecrawl has scraped them."""
+        logger.info(f"Loading documents from {url}")
+        loaded = 0
+        async for doc in self.web_reader.aiter_data(url, limit):
+            loaded += 1
+            yield doc
+        logger.info(f"Loaded {loaded} documents from {url}")
+
+    def _apply_stats(self, job: IngestionJob, stats: dict[str, StageStats]) -> IngestionJob:
+        """Copy page and chunk counters from pipeline stats onto the job."""
+        return job.model_copy(
+            update={
+                "pages_processed": stats[STAGE_CHUNK].items_processed,
+                "chunks_created": stats[STAGE_UPSERT].items_processed,
+            }
+        )
+
     def _create_job(self, url: str, job_id: UUID | None = None) -> IngestionJob:
         """Create a new IngestionJob in PENDING state.
 
@@ -247,28 +402,6 @@ class IngestWebUseCase:
             }
         )
 
-    async def _flush_chunks(self, chunks: list[Chunk], job: IngestionJob) -> IngestionJob:
-        """Flush batch of chunks to vector store asynchronously.
-
-        Args:
-            chunks: List of chunks to flush.
-            job: Current job for tracking.
-
-        Returns:
-            IngestionJob: Updated job with chunks_created incremented.
-        """
-        logger.info(f"Flushing {len(chunks)} chunks to vector store")
-
-        # Embed chunks
-        chunk_texts = [chunk.content for chunk in chunks]
-        embeddings = await self.embedder.embed_texts_async(chunk_texts)
-
-        # Upsert to Qdrant
-        await self.qdrant_writer.upsert_batch_async(chunks, embeddings)
-
-        # Update chunks_created
-        return job.model_copy(update={"chunks_created": job.chunks_created + len(chunks)})
-
     def _transition_to_failed(self, job: IngestionJob, error_msg: str) -> IngestionJob:
         """Transition job from RUNNING to FAILED.
 
@@ -295,64 +428,133 @@ class IngestWebUseCase:
             }
         )
 
-    def _process_document(
-        self, doc: LlamaDocument, job: IngestionJob, source_url: str
+    async def _process_document(
+        self,
+        doc: LlamaDocument,
+        source_url: str,
+        pending_records: dict[UUID, _PendingRecord],
+        seen: set[UUID],
+        *,
+        pooled: bool = False,
     ) -> list[Chunk]:
         """Process a single document through the pipeline.
 
+        Normalizing and chunking are CPU-bound, so the preparer runs them in a
+        worker thread or process while the event loop keeps embedding and
+        upserting. A page whose stored record has the same content hash is
+        skipped before chunking. Otherwise its chunks are reconciled with the
+        points stored under its doc_id: stale points are deleted and only
+        chunks without a point go on to be embedded.
+
+        The document record is saved right away if no chunk needs writing,
+        otherwise it is added to ``pending_records`` and saved by the record
+        stage after the page's last chunk is upserted.
+
         Args:
             doc: LlamaDocument to process.
-            job: Current job for doc_id generation.
             source_url: Original source URL.
+            pending_records: Pages of the job still waiting for their chunks.
+            seen: doc_ids of the job's pages; a page crawled twice is only
+                processed once, even by concurrent chunk workers.
+            pooled: Normalize and chunk in the preparer's process pool.
 
         Returns:
-            list[Chunk]: Processed chunks with metadata.
+            list[Chunk]: Chunks that still need embedding and upserting.
         """
-        # Step 4a: Normalize HTML to Markdown
-        markdown = self.normalizer.normalize(doc.text)
-
-        # Filter metadata to only essential fields needed for chunking/retrieval
-        # This prevents LlamaIndex SentenceSplitter from failing when metadata
-        # serialization exceeds chunk_size (512 tokens)
-        filtered_metadata = {}
-        if doc.metadata:
-            # Only keep fields that are: (1) needed for retrieval or (2) small
-            allowed_keys = {"source_url", "section", "title"}
-            filtered_metadata = {
-                k: v for k, v in doc.metadata.items()
-                if k in allowed_keys and isinstance(v, (str, int, float, bool))
-            }
+        page_url = _page_url(doc)
+        # Stable across re-crawls of the page; pages without a URL are never diffed
+        doc_id = uuid5(NAMESPACE_URL, page_url) if page_url else uuid4()
+        # Reserve the page before the first await so a concurrent worker skips it
+        if doc_id in seen:
+            logger.debug(f"Skipping page crawled twice in one job {page_url}")
+            return []
+        seen.add(doc_id)
+
+        markdown, content_hash = await self.preparer.normalize(doc.text, pooled=pooled)
+
+        if page_url is not None:
+            stored = await self.document_store.get_by_id(doc_id)
+            if stored is not None and stored.content_hash == content_hash:
+                logger.debug(f"Skipping unchanged document {page_url}")
+                return []
+
+        text_chunks = await self.preparer.chunk(markdown, pooled=pooled)
+        chunks, doc_record = self._build_chunks(
+            doc_id, page_url, source_url, text_chunks, content_hash
+        )
+        pending = await asyncio.to_thread(
+            self.qdrant_writer.reconcile_document, doc_record.doc_id, chunks
+        )
 
-        # Create a new Document with normalized text
-        normalized_doc = LlamaDocument(
-            text=markdown,
-            metadata=filtered_metadata,
+        page = _PendingRecord(
+            document=doc_record, markdown=markdown, chunk_count=len(chunks), remaining=len(pending)
         )
+        if pending:
+            pending_records[doc_id] = page
+        else:
+            await self._save_document(page)
 
-        # Step 4b: Chunk the normalized document
-        chunk_docs = self.chunker.chunk_document(normalized_doc)
+        return pending
 
-        # Convert LlamaIndex Documents to Chunk models
-        chunks: list[Chunk] = []
-        doc_id = uuid4()  # One doc_id per document
-        ingested_at = int(datetime.now(UTC).timestamp())
+    async def _save_document(self, page: _PendingRecord) -> None:
+        """Store (or replace) a page's record and content, then announce it.
+
+        Content that another page already holds is extracted once, under that
+        page, so no event is emitted for it.
+        """
+        doc_record = page.document
+        if not await self.document_store.upsert(doc_record, page.markdown):
+            return
 
-        for chunk_doc in chunk_docs:
-            # Extract metadata
-            chunk_index = chunk_doc.metadata.get("chunk_index", 0)
+        if self._document_ingested_callback is not None:
+            try:
+                self._document_ingested_callback(doc_record, page.chunk_count)
+            except Exception:  # noqa: BLE001 - callback failures should not break ingestion
+                logger.exception(
+                    "Document ingested callback failed", extra={"doc_id": str(doc_record.doc_id)}
+                )
+
+    def _build_chunks(
+        self,
+        doc_id: UUID,
+        page_url: str | None,
+        source_url: str,
+        text_chunks: list[TextChunk],
+        content_hash: str,
+    ) -> tuple[list[Chunk], DocumentModel]:
+        """Build Chunk models and the PostgreSQL record for a chunked document.
+
+        Chunk IDs are derived from the page URL (the doc_id for pages without
+        one) and chunk content, so a re-crawled page maps onto its stored points.
+
+        Args:
+            doc_id: Document UUID, derived from the page URL when known.
+            page_url: URL of the crawled page, if Firecrawl reported one.
+            source_url: Original source URL.
+            text_chunks: Chunks of the normalized Markdown.
+            content_hash: SHA-256 hex digest of the normalized Markdown.
 
-            # Calculate token count using tiktoken
-            token_count = count_tokens(chunk_doc.text)
-            token_count = max(1, min(token_count, 512))  # Clamp to [1, 512]
+        Returns:
+            tuple[list[Chunk], DocumentModel]: Chunks and the document record to
+                persist.
+        """
+        # Convert chunk spans to Chunk models
+        chunks: list[Chunk] = []
+        ingested_at = int(datetime.now(UTC).timestamp())
+        chunk_ids = stable_chunk_ids(
+            page_url or str(doc_id), (text_chunk.text for text_chunk in text_chunks)
+        )
 
-            # Create Chunk model
+        for chunk_index, (chunk_id, text_chunk) in enumerate(
+            zip(chunk_ids, text_chunks, strict=True)
+        ):
             chunk = Chunk(
-                chunk_id=uuid4(),
+                chunk_id=chunk_id,
                 doc_id=doc_id,
-                content=chunk_doc.text,
-                section=None,  # TODO: Extract section from metadata if available
+                content=text_chunk.text,
+                section=text_chunk.section,
                 position=chunk_index,
-                token_count=token_count,
+                token_count=max(1, min(text_chunk.token_count, 512)),  # Clamp to [1, 512]
                 source_url=source_url,
                 source_type=SourceType.WEB,
                 ingested_at=ingested_at,
@@ -361,8 +563,6 @@ class IngestWebUseCase:
             chunks.append(chunk)
 
         # Create Document record in PostgreSQL for extraction pipeline
-        content_hash = hashlib.sha256(markdown.encode("utf-8")).hexdigest()
-
         doc_record = DocumentModel(
             doc_id=doc_id,
             source_url=source_url,
@@ -375,17 +575,22 @@ class IngestWebUseCase:
             metadata={"chunk_count": len(chunks)},
         )
 
-        # Store document and content for extraction
-        self.document_store.create(doc_record, markdown)
+        return chunks, doc_record
 
-        if self._document_ingested_callback is not None:
-            try:
-                self._document_ingested_callback(doc_record, len(chunks))
-            except Exception:  # noqa: BLE001 - callback failures should not break ingestion
-                logger.exception("Document ingested callback failed", extra={"doc_id": str(doc_id)})
 
-        return chunks
+def _page_url(doc: LlamaDocument) -> str | None:
+    """URL of the crawled page as reported by Firecrawl (source_url is the crawl root)."""
+    metadata = doc.metadata or {}
+    url = metadata.get("sourceURL") or metadata.get("url")
+    return str(url) if url else None
 
 
 # Export public API
-__all__ = ["IngestWebUseCase"]
+__all__ = [
+    "PIPELINE_STAGES",
+    "STAGE_CHUNK",
+    "STAGE_EMBED",
+    "STAGE_RECORD",
+    "STAGE_UPSERT",
+    "IngestWebUseCase",
+]
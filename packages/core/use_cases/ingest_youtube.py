@@ -2,23 +2,35 @@
 
 Orchestrates the complete ingestion pipeline:
 YoutubeReader → Normalizer → Chunker → Embedder → QdrantWriter
+
+Stages run on the shared IngestionPipeline, so chunking, embedding and
+upserting overlap.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from llama_index.core import Document as LlamaDocument
-
-from packages.ingest.chunker import Chunker
+from packages.core.services.ingestion_pipeline import (
+    IngestionPipeline,
+    PipelineStage,
+    embedding_stage,
+    upsert_stage,
+)
+from packages.ingest.chunker import Chunker, stable_chunk_ids
 from packages.ingest.embedder import Embedder
 from packages.ingest.normalizer import Normalizer
 from packages.ingest.readers.youtube import YoutubeReader
 from packages.schemas.models import Chunk, SourceType
 from packages.vector.writer import QdrantWriter
 
+if TYPE_CHECKING:
+    from llama_index.core import Document as LlamaDocument
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +55,12 @@ class IngestYouTubeUseCase:
         chunker: Chunker,
         embedder: Embedder,
         qdrant_writer: QdrantWriter,
+        flush_threshold: int = 1000,
+        *,
+        queue_size: int = 4,
+        embed_concurrency: int = 1,
+        upsert_concurrency: int = 1,
+        vectors_as_array: bool = False,
     ) -> None:
         """Initialize IngestYouTubeUseCase with all dependencies.
 
@@ -52,26 +70,37 @@ class IngestYouTubeUseCase:
             chunker: Chunker instance for semantic chunking.
             embedder: Embedder instance for text embedding.
             qdrant_writer: QdrantWriter instance for vector storage.
+            flush_threshold: Chunks embedded and upserted per batch (default: 1000).
+            queue_size: Capacity of each inter-stage queue, in videos for the
+                chunk stage and in flush batches for the embed/upsert stages.
+            embed_concurrency: Chunk batches embedded in parallel.
+            upsert_concurrency: Batches upserted to Qdrant in parallel.
+            vectors_as_array: Carry embeddings as float32 ndarrays from TEI to
+                Qdrant instead of lists of Python floats.
         """
         self.youtube_reader = youtube_reader
         self.normalizer = normalizer
         self.chunker = chunker
         self.embedder = embedder
         self.qdrant_writer = qdrant_writer
+        self.flush_threshold = flush_threshold
+        self.queue_size = queue_size
+        self.embed_concurrency = embed_concurrency
+        self.upsert_concurrency = upsert_concurrency
+        self.vectors_as_array = vectors_as_array
 
         logger.info("Initialized IngestYouTubeUseCase")
 
-    def execute(self, urls: list[str]) -> dict[str, int]:
+    async def execute(self, urls: list[str]) -> dict[str, int]:
         """Execute the full ingestion pipeline for YouTube video URLs.
 
         Pipeline flow:
         1. YoutubeReader.load_data(urls) → docs[]
-        2. For each doc:
-           a. Normalizer.normalize(doc.text) → markdown
-           b. Chunker.chunk_document(markdown_doc) → chunks[]
-        3. Embedder.embed_texts([chunk.text for all chunks]) → embeddings[]
-        4. QdrantWriter.upsert_batch(chunks, embeddings)
-        5. Return stats
+        2. Stream docs through the pipeline stages:
+           a. chunk (worker thread): Normalizer.normalize, Chunker.chunk_document
+           b. embed: Embedder.embed_texts_async per flush-threshold batch
+           c. upsert: QdrantWriter.upsert_batch_async
+        3. Return stats
 
         Args:
             urls: List of YouTube video URLs to ingest.
@@ -88,34 +117,51 @@ class IngestYouTubeUseCase:
         logger.info(f"Starting YouTube ingestion for {len(urls)} video(s)")
 
         # Step 1: Load transcripts
-        docs = self.youtube_reader.load_data(video_urls=urls)
+        docs = await asyncio.to_thread(self.youtube_reader.load_data, video_urls=urls)
         logger.info(f"Loaded {len(docs)} transcripts")
 
         if not docs:
             logger.info("No transcripts to process")
             return {"videos_processed": 0, "chunks_created": 0}
 
-        # Step 2: Process each document
-        all_chunks: list[Chunk] = []
-        for doc in docs:
-            chunks = self._process_document(doc)
-            all_chunks.extend(chunks)
-
-        logger.info(f"Created {len(all_chunks)} chunks from {len(docs)} videos")
+        # Step 2: Chunk, embed and upsert concurrently
+        stats = await self._build_pipeline().run(docs)
+        videos_processed = stats["chunk"].items_processed
+        chunks_created = stats["upsert"].items_processed
 
-        # Step 3: Embed all chunks in batch
-        if all_chunks:
-            logger.info(f"Embedding {len(all_chunks)} chunks")
-            chunk_texts = [chunk.content for chunk in all_chunks]
-            embeddings = self.embedder.embed_texts(chunk_texts)
-
-            # Step 4: Upsert to Qdrant
-            logger.info(f"Upserting {len(all_chunks)} chunks to Qdrant")
-            self.qdrant_writer.upsert_batch(all_chunks, embeddings)
-
-        logger.info(f"Completed YouTube ingestion: {len(docs)} videos, {len(all_chunks)} chunks")
+        logger.info(
+            f"Completed YouTube ingestion: {videos_processed} videos, {chunks_created} chunks"
+        )
 
-        return {"videos_processed": len(docs), "chunks_created": len(all_chunks)}
+        return {"videos_processed": videos_processed, "chunks_created": chunks_created}
+
+    def _build_pipeline(self) -> IngestionPipeline:
+        """Build the chunk → embed → upsert pipeline for one run."""
+
+        def chunk(docs: list[LlamaDocument]) -> list[Chunk]:
+            return [chunk for doc in docs for chunk in self._process_document(doc)]
+
+        batch_queue_size = self.queue_size * self.flush_threshold
+        return IngestionPipeline(
+            [
+                PipelineStage(
+                    name="chunk", handler=chunk, queue_size=self.queue_size, in_thread=True
+                ),
+                embedding_stage(
+                    self.embedder,
+                    batch_size=self.flush_threshold,
+                    concurrency=self.embed_concurrency,
+                    queue_size=batch_queue_size,
+                    as_array=self.vectors_as_array,
+                ),
+                upsert_stage(
+                    self.qdrant_writer,
+                    batch_size=self.flush_threshold,
+                    concurrency=self.upsert_concurrency,
+                    queue_size=batch_queue_size,
+                ),
+            ]
+        )
 
     def _process_document(self, doc: LlamaDocument) -> list[Chunk]:
         """Process a single YouTube video document through the pipeline.
@@ -129,49 +175,28 @@ class IngestYouTubeUseCase:
         # Step 2a: Normalize text to Markdown
         markdown = self.normalizer.normalize(doc.text)
 
-        # Filter metadata to only essential fields needed for chunking/retrieval
-        # This prevents LlamaIndex SentenceSplitter from failing when metadata
-        # serialization exceeds chunk_size (512 tokens)
-        filtered_metadata = {}
-        if doc.metadata:
-            # Only keep fields that are: (1) needed for retrieval or (2) small
-            allowed_keys = {"video_url", "title", "channel", "duration"}
-            filtered_metadata = {
-                k: v for k, v in doc.metadata.items()
-                if k in allowed_keys and isinstance(v, (str, int, float, bool))
-            }
-
-        # Create a new Document with normalized text
-        normalized_doc = LlamaDocument(
-            text=markdown,
-            metadata=filtered_metadata,
-        )
-
-        # Step 2b: Chunk the normalized document
-        chunk_docs = self.chunker.chunk_document(normalized_doc)
+        # Step 2b: Chunk the normalized transcript; spans carry exact token counts
+        text_chunks = self.chunker.chunk_text(markdown)
 
-        # Convert LlamaIndex Documents to Chunk models
+        # Convert chunk spans to Chunk models
         chunks: list[Chunk] = []
         doc_id = uuid4()  # One doc_id per video
         ingested_at = int(datetime.now(UTC).timestamp())
         source_url = doc.metadata.get("video_url", "") if doc.metadata else ""
+        chunk_ids = stable_chunk_ids(
+            source_url or str(doc_id), (text_chunk.text for text_chunk in text_chunks)
+        )
 
-        for chunk_doc in chunk_docs:
-            # Extract metadata
-            chunk_index = chunk_doc.metadata.get("chunk_index", 0)
-
-            # Calculate token count (rough estimate: split by whitespace)
-            token_count = len(chunk_doc.text.split())
-            token_count = max(1, min(token_count, 512))  # Clamp to [1, 512]
-
-            # Create Chunk model
+        for chunk_index, (chunk_id, text_chunk) in enumerate(
+            zip(chunk_ids, text_chunks, strict=True)
+        ):
             chunk = Chunk(
-                chunk_id=uuid4(),
+                chunk_id=chunk_id,
                 doc_id=doc_id,
-                content=chunk_doc.text,
-                section=None,
+                content=text_chunk.text,
+                section=text_chunk.section,
                 position=chunk_index,
-                token_count=token_count,
+                token_count=max(1, min(text_chunk.token_count, 512)),  # Clamp to [1, 512]
                 source_url=source_url,
                 source_type=SourceType.YOUTUBE,
                 ingested_at=ingested_at,
@@ -1,6 +1,7 @@
 """ReprocessUseCase - Core orchestration for document reprocessing.
 
-Queues documents for re-extraction based on date filtering.
+Queues documents for re-extraction based on date filtering, using a single
+set-based state reset instead of per-document updates.
 """
 
 from __future__ import annotations
@@ -9,20 +10,18 @@ import logging
 from datetime import UTC, datetime
 from typing import Protocol
 
-from packages.schemas.models import Document, ExtractionState
-
 logger = logging.getLogger(__name__)
 
 
 class DocumentStore(Protocol):
     """Protocol for document persistence operations."""
 
-    def query_by_date(self, since_date: datetime) -> list[Document]:
-        """Query documents modified since specified date."""
-        ...
+    def reset_extraction_state_since(self, since_date: datetime) -> int:
+        """Reset documents modified since specified date to PENDING.
 
-    def update_document(self, document: Document) -> None:
-        """Update document in store."""
+        Returns:
+            Number of documents reset.
+        """
         ...
 
 
@@ -59,14 +58,8 @@ class ReprocessUseCase:
 
         logger.info(f"Reprocessing documents since {since_date}")
 
-        # Query documents
-        documents = self.document_store.query_by_date(since_date=since_date)
-        logger.info(f"Found {len(documents)} documents to reprocess")
-
-        # Reset extraction state for each document
-        for doc in documents:
-            doc.extraction_state = ExtractionState.PENDING
-            doc.updated_at = datetime.now(UTC)
-            self.document_store.update_document(doc)
+        # Reset extraction state in one round-trip
+        queued = self.document_store.reset_extraction_state_since(since_date=since_date)
+        logger.info(f"Queued {queued} documents for reprocessing")
 
-        return {"documents_queued": len(documents)}
+        return {"documents_queued": queued}
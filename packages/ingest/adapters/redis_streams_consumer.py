@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Awaitable, Callable, Iterable
 from typing import Any, cast
 from uuid import UUID
@@ -10,6 +11,16 @@ from redis.asyncio import Redis
 
 from packages.core.events import DocumentIngestedEvent
 
+logger = logging.getLogger(__name__)
+
+# Stream ID that starts an XAUTOCLAIM scan at the head of the pending list
+AUTOCLAIM_START_ID = "0-0"
+
+
+def _decode(value: Any) -> Any:
+    """Decode bytes returned by a non-decoding Redis client."""
+    return value.decode() if isinstance(value, bytes) else value
+
 
 class RedisDocumentEventConsumer:
     """Consume document ingestion events from Redis Streams."""
@@ -26,6 +37,7 @@ class RedisDocumentEventConsumer:
         self.stream_name = stream_name
         self.group_name = group_name
         self.consumer_name = consumer_name
+        self._autoclaim_cursor = AUTOCLAIM_START_ID
 
     async def read(  # noqa: D401 - inherited behaviour
         self,
@@ -45,26 +57,83 @@ class RedisDocumentEventConsumer:
 
         events: list[tuple[str, DocumentIngestedEvent]] = []
 
-        for stream_name, messages in response:
-            stream = stream_name.decode() if isinstance(stream_name, bytes) else stream_name
-            if stream != self.stream_name:
+        for stream_name, messages in response or []:
+            if _decode(stream_name) != self.stream_name:
                 continue
-            for message_id, payload in messages:
-                data = {
-                    k.decode() if isinstance(k, bytes) else k: v.decode()
-                    if isinstance(v, bytes)
-                    else v
-                    for k, v in payload.items()
-                }
+            events.extend(await self._parse_messages(messages))
+
+        return events
+
+    async def autoclaim(
+        self,
+        *,
+        min_idle_ms: int,
+        count: int = 1,
+    ) -> list[tuple[str, DocumentIngestedEvent]]:
+        """Take over messages left pending by other consumers (XAUTOCLAIM).
+
+        Messages that have been delivered but not acknowledged for at least
+        ``min_idle_ms`` (for example because their consumer crashed) are
+        transferred to this consumer. Successive calls walk the pending list
+        with a cursor and wrap around once the end is reached.
+
+        Args:
+            min_idle_ms: Minimum idle time before a pending message is reclaimed.
+            count: Maximum number of messages to claim.
+
+        Returns:
+            list[tuple[str, DocumentIngestedEvent]]: Reclaimed (message_id, event)
+                tuples.
+        """
+
+        response = await self.redis_client.xautoclaim(
+            name=self.stream_name,
+            groupname=self.group_name,
+            consumername=self.consumer_name,
+            min_idle_time=min_idle_ms,
+            start_id=self._autoclaim_cursor,
+            count=count,
+        )
+
+        next_cursor, messages = response[0], response[1]
+        self._autoclaim_cursor = _decode(next_cursor) or AUTOCLAIM_START_ID
+
+        events = await self._parse_messages(messages)
+        if events:
+            logger.info("Reclaimed %s idle pending messages from %s", len(events), self.stream_name)
+        return events
+
+    async def _parse_messages(
+        self, messages: Iterable[tuple[Any, Any]]
+    ) -> list[tuple[str, DocumentIngestedEvent]]:
+        """Parse raw stream entries, acknowledging ones that can never be processed."""
+
+        events: list[tuple[str, DocumentIngestedEvent]] = []
+        malformed: list[str] = []
+
+        for raw_id, payload in messages:
+            message_id = _decode(raw_id)
+            if payload is None:
+                # Entry was trimmed from the stream after delivery
+                if message_id is not None:
+                    malformed.append(message_id)
+                continue
+
+            data = {_decode(k): _decode(v) for k, v in payload.items()}
+            try:
                 event = DocumentIngestedEvent(
                     doc_id=UUID(data["doc_id"]),
                     source_url=data.get("source_url", ""),
                     chunk_count=int(data.get("chunk_count", 0)),
                 )
-                events.append(
-                    (message_id.decode() if isinstance(message_id, bytes) else message_id, event)
-                )
+            except (KeyError, ValueError):
+                logger.warning("Dropping malformed stream message %s: %s", message_id, data)
+                malformed.append(message_id)
+                continue
+
+            events.append((message_id, event))
 
+        await self.ack(malformed)
         return events
 
     async def ack(self, message_ids: Iterable[str]) -> None:
@@ -81,4 +150,4 @@ class RedisDocumentEventConsumer:
         await xack(self.stream_name, self.group_name, *ids)
 
 
-__all__ = ["RedisDocumentEventConsumer"]
+__all__ = ["AUTOCLAIM_START_ID", "RedisDocumentEventConsumer"]
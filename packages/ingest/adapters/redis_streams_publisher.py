@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
+from prometheus_client import Gauge
 from redis import asyncio as redis
 from redis.asyncio import Redis
 from redis.exceptions import ResponseError
@@ -11,9 +17,48 @@ from redis.exceptions import ResponseError
 from packages.core.events import DocumentIngestedEvent
 from packages.core.ports.event_publisher import DocumentEventPublisher
 
+logger = logging.getLogger(__name__)
+
+ingest_stream_lag = Gauge(
+    "taboot_ingest_stream_lag",
+    "Events not yet acknowledged by a consumer group (undelivered + pending)",
+    ["stream", "group"],
+)
+
+
+def _decode(value: Any) -> Any:
+    """Decode bytes returned by a non-decoding Redis client."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _stream_id_key(stream_id: str) -> tuple[int, int]:
+    """Sort key for a Redis stream ID of the form ``<ms>-<seq>``."""
+    ms, _, seq = stream_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+@dataclass(frozen=True, slots=True)
+class StreamGroupState:
+    """Snapshot of consumer-group progress on the events stream.
+
+    Attributes:
+        lag: Events the tracked group has not acknowledged yet.
+        trim_id: Oldest ID any consumer group still needs; entries older than
+            this have been acknowledged everywhere and are safe to trim.
+    """
+
+    lag: int
+    trim_id: str | None
+
 
 class RedisDocumentEventPublisher(DocumentEventPublisher):
-    """Publish document lifecycle events to a Redis Stream."""
+    """Publish document lifecycle events to a Redis Stream.
+
+    Without a consumer group the stream is capped with ``MAXLEN ~maxlen``.
+    When ``group_name`` is set the publisher tracks consumer-group lag instead:
+    it only trims entries every group has acknowledged (``MINID``), exports the
+    lag as a metric and exposes :meth:`wait_for_capacity` for backpressure.
+    """
 
     def __init__(
         self,
@@ -21,12 +66,62 @@ class RedisDocumentEventPublisher(DocumentEventPublisher):
         stream_name: str = "stream:documents",
         *,
         maxlen: int | None = 1000,
+        group_name: str | None = None,
+        lag_high_watermark: int | None = None,
+        lag_low_watermark: int | None = None,
+        lag_check_interval: float = 1.0,
+        max_backpressure_wait: float = 300.0,
     ) -> None:
+        """Initialize RedisDocumentEventPublisher.
+
+        Args:
+            redis_client: Async Redis client.
+            stream_name: Stream receiving document events.
+            maxlen: Approximate stream cap used when no consumer group is tracked.
+            group_name: Consumer group whose lag drives trimming and backpressure.
+            lag_high_watermark: Lag at which :meth:`wait_for_capacity` pauses
+                (None disables backpressure).
+            lag_low_watermark: Lag at which a paused producer resumes
+                (default: half the high watermark).
+            lag_check_interval: Seconds between consumer-group lag checks.
+            max_backpressure_wait: Longest single pause before resuming anyway.
+        """
         self.redis_client = redis_client
         self.stream_name = stream_name
         self.maxlen = maxlen
+        self.group_name = group_name
+        self.lag_high_watermark = lag_high_watermark
+        if lag_high_watermark is not None:
+            default_low = lag_high_watermark // 2
+            lag_low_watermark = min(
+                lag_low_watermark if lag_low_watermark is not None else default_low,
+                lag_high_watermark,
+            )
+        self.lag_low_watermark = lag_low_watermark
+        self.lag_check_interval = lag_check_interval
+        self.max_backpressure_wait = max_backpressure_wait
+
+        self._state: StreamGroupState | None = None
+        self._state_checked_at = float("-inf")
+        self._group_ready = False
 
     async def publish_document_ingested(self, event: DocumentIngestedEvent) -> None:
+        await self.redis_client.xadd(**await self._xadd_kwargs(event))
+
+    async def publish_many(self, events: Sequence[DocumentIngestedEvent]) -> None:
+        """Publish a batch of events with one pipelined round trip."""
+
+        if not events:
+            return
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(**await self._xadd_kwargs(event))
+        await pipe.execute()
+
+    async def _xadd_kwargs(self, event: DocumentIngestedEvent) -> dict[str, Any]:
+        """Build XADD arguments, trimming by MAXLEN or the group-safe MINID."""
+
         payload: dict[str, Any] = {
             "event_type": "document_ingested",
             "doc_id": str(event.doc_id),
@@ -34,11 +129,122 @@ class RedisDocumentEventPublisher(DocumentEventPublisher):
             "chunk_count": str(event.chunk_count),
         }
 
-        await self.redis_client.xadd(
-            name=self.stream_name,
-            fields=payload,
-            maxlen=self.maxlen,
-            approximate=True,
+        if self.group_name is None:
+            return {
+                "name": self.stream_name,
+                "fields": payload,
+                "maxlen": self.maxlen,
+                "approximate": True,
+            }
+
+        state = await self.get_group_state()
+        return {
+            "name": self.stream_name,
+            "fields": payload,
+            "minid": state.trim_id,
+            "approximate": True,
+        }
+
+    async def get_group_state(self, *, refresh: bool = False) -> StreamGroupState:
+        """Get consumer-group lag and safe trim point, cached per check interval.
+
+        Args:
+            refresh: Bypass the cache and query Redis now.
+
+        Returns:
+            StreamGroupState: Current lag snapshot.
+
+        Raises:
+            ValueError: If the publisher was created without a group_name.
+        """
+        if self.group_name is None:
+            raise ValueError("Consumer-group lag requires group_name")
+
+        now = time.monotonic()
+        if (
+            not refresh
+            and self._state is not None
+            and now - self._state_checked_at < self.lag_check_interval
+        ):
+            return self._state
+
+        if not self._group_ready:
+            # Create the group up front so events published before the worker
+            # starts are retained rather than trimmed
+            await self.ensure_consumer_group(self.group_name)
+            self._group_ready = True
+
+        groups = await self.redis_client.xinfo_groups(self.stream_name)
+
+        lag = 0
+        trim_id: str | None = None
+        for group in groups:
+            name = _decode(group["name"])
+            pending = int(group.get("pending") or 0)
+
+            if pending:
+                summary = await self.redis_client.xpending(self.stream_name, name)
+                needed_from = _decode(summary["min"])
+            else:
+                needed_from = _decode(group["last-delivered-id"])
+
+            if trim_id is None or _stream_id_key(needed_from) < _stream_id_key(trim_id):
+                trim_id = needed_from
+
+            if name == self.group_name:
+                undelivered = group.get("lag")
+                if undelivered is None:
+                    # Redis cannot compute lag after XDEL; assume the whole stream
+                    undelivered = await self.redis_client.xlen(self.stream_name)
+                lag = int(undelivered) + pending
+
+        ingest_stream_lag.labels(stream=self.stream_name, group=self.group_name).set(lag)
+
+        self._state = StreamGroupState(lag=lag, trim_id=trim_id)
+        self._state_checked_at = now
+        return self._state
+
+    async def wait_for_capacity(self) -> None:
+        """Pause while the consumer group lags above the high watermark.
+
+        Resumes once lag drops to the low watermark, or after
+        ``max_backpressure_wait`` seconds so a stalled consumer cannot block
+        ingestion forever (nothing is lost, since unconsumed events are never
+        trimmed).
+        """
+        if self.group_name is None or self.lag_high_watermark is None:
+            return
+
+        state = await self.get_group_state()
+        if state.lag < self.lag_high_watermark:
+            return
+
+        logger.warning(
+            "Extraction lagging on %s (lag=%s >= %s); pausing ingestion",
+            self.stream_name,
+            state.lag,
+            self.lag_high_watermark,
+        )
+        started = time.monotonic()
+        low_watermark = self.lag_low_watermark or 0
+        while state.lag > low_watermark:
+            waited = time.monotonic() - started
+            if waited >= self.max_backpressure_wait:
+                logger.warning(
+                    "Resuming ingestion after %.0fs despite lag=%s on %s",
+                    waited,
+                    state.lag,
+                    self.stream_name,
+                )
+                return
+            await asyncio.sleep(self.lag_check_interval)
+            state = await self.get_group_state(refresh=True)
+
+        logger.info(
+            "Extraction caught up on %s (lag=%s); resuming ingestion after %.1fs",
+            self.stream_name,
+            state.lag,
+            time.monotonic() - started,
         )
 
     async def ensure_consumer_group(self, group_name: str) -> None:
@@ -63,4 +269,9 @@ async def create_redis_client(url: str, *, decode_responses: bool = False) -> Re
     return redis.from_url(url, decode_responses=decode_responses)
 
 
-__all__ = ["RedisDocumentEventPublisher", "create_redis_client"]
+__all__ = [
+    "RedisDocumentEventPublisher",
+    "StreamGroupState",
+    "create_redis_client",
+    "ingest_stream_lag",
+]
@@ -0,0 +1,125 @@
+"""Async PostgreSQL implementation of ingestion job store.
+
+Mirrors PostgresJobStore on top of the shared asyncpg pool so job tracking
+from API routes never blocks the event loop.
+"""
+
+import logging
+from uuid import UUID
+
+from packages.common.async_postgres_pool import AsyncPostgresPool
+from packages.schemas.models import IngestionJob, JobState, SourceType
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPostgresJobStore:
+    """Async PostgreSQL implementation of job store protocol.
+
+    Handles IngestionJob CRUD operations with atomic state transitions.
+    The pool is owned by the caller and is not closed here.
+    """
+
+    def __init__(self, pool: AsyncPostgresPool) -> None:
+        """Initialize with a shared async connection pool.
+
+        Args:
+            pool: Opened AsyncPostgresPool.
+        """
+        self.pool = pool
+        logger.info("Initialized AsyncPostgresJobStore")
+
+    async def create(self, job: IngestionJob) -> None:
+        """Create ingestion job record.
+
+        Args:
+            job: IngestionJob model to persist.
+        """
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO rag.ingestion_jobs (
+                    job_id, source_type, source_target, state,
+                    created_at, started_at, completed_at,
+                    pages_processed, chunks_created, errors
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                """,
+                job.job_id,
+                job.source_type.value,
+                job.source_target,
+                job.state.value,
+                job.created_at,
+                job.started_at,
+                job.completed_at,
+                job.pages_processed,
+                job.chunks_created,
+                job.errors or None,
+            )
+        logger.debug(f"Created ingestion job {job.job_id}")
+
+    async def get_by_id(self, job_id: UUID) -> IngestionJob | None:
+        """Get job by ID.
+
+        Args:
+            job_id: Job UUID.
+
+        Returns:
+            IngestionJob if found, None otherwise.
+        """
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT job_id, source_type, source_target, state,
+                       created_at, started_at, completed_at,
+                       pages_processed, chunks_created, errors
+                FROM rag.ingestion_jobs WHERE job_id = $1
+                """,
+                job_id,
+            )
+
+        if not row:
+            return None
+
+        return IngestionJob(
+            job_id=UUID(str(row["job_id"])),
+            source_type=SourceType(row["source_type"]),
+            source_target=row["source_target"],
+            state=JobState(row["state"]),
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            completed_at=row["completed_at"],
+            pages_processed=row["pages_processed"],
+            chunks_created=row["chunks_created"],
+            errors=row["errors"],
+        )
+
+    async def update(self, job: IngestionJob) -> None:
+        """Update job state and metrics.
+
+        Args:
+            job: Job with updated fields.
+        """
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                """
+                UPDATE rag.ingestion_jobs SET
+                    state = $1,
+                    started_at = $2,
+                    completed_at = $3,
+                    pages_processed = $4,
+                    chunks_created = $5,
+                    errors = $6
+                WHERE job_id = $7
+                """,
+                job.state.value,
+                job.started_at,
+                job.completed_at,
+                job.pages_processed,
+                job.chunks_created,
+                job.errors or None,
+                job.job_id,
+            )
+        logger.debug(f"Updated ingestion job {job.job_id}")
+
+
+__all__ = ["AsyncPostgresJobStore"]
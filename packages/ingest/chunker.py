@@ -1,83 +1,355 @@
-"""Document chunker using LlamaIndex SentenceSplitter.
+"""Native token-aware document chunker.
 
-Implements semantic chunking with configurable size and overlap.
-Per research.md: Use LlamaIndex SentenceSplitter with 256-512 tokens, 10% overlap.
+Tokenizes each document once with tiktoken, splits it at markdown headings,
+paragraph breaks and sentence ends, and packs those units into chunks of at
+most ``chunk_size`` tokens with sentence-aligned overlap. Every chunk carries
+its character span, exact token count and heading path, so callers do not
+re-tokenize chunk text.
+
+Chunk boundaries are content-defined: once a chunk holds ``min_chunk_tokens``,
+it ends at the first sentence whose token hash falls under a length-weighted
+threshold. Cuts depend on local content rather than on offsets from the top of
+the page, so an edit only changes the chunks around it. Together with
+:func:`stable_chunk_ids` this keeps chunk IDs (and every cache keyed on them)
+stable across small page edits.
+
+Per research.md: 256-512 tokens, 10% overlap. LlamaIndex is only imported by
+``chunk_document`` for callers that still pass LlamaIndex Documents.
 """
 
+from __future__ import annotations
+
+import bisect
+import hashlib
 import logging
+import re
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+import numpy as np
+from numpy.typing import NDArray
 
-from llama_index.core import Document
-from llama_index.core.node_parser import SentenceSplitter
+from packages.common.token_utils import get_encoder
+
+if TYPE_CHECKING:
+    from llama_index.core import Document
 
 logger = logging.getLogger(__name__)
 
+_HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+_FENCE_RE = re.compile(r"^(```|~~~).*?^\1", re.MULTILINE | re.DOTALL)
+# Matches the gap before the next sentence or paragraph; the break is at its end
+_BREAK_RE = re.compile(r"(?<=[.!?])\s+(?=\S)|\n[ \t]*\n\s*(?=\S)")
+_MAX_SECTION_CHARS = 512  # Chunk.section max_length
+_ANCHOR_WINDOW = 64  # Trailing tokens of a sentence hashed for boundary selection
+
+CHUNK_ID_NAMESPACE = uuid5(NAMESPACE_URL, "taboot:chunk")
+
+
+@dataclass(frozen=True, slots=True)
+class TextChunk:
+    """One chunk of a document.
+
+    Attributes:
+        text: Chunk text with surrounding whitespace stripped.
+        start: Character offset of ``text`` in the source document.
+        end: Character offset just past ``text``.
+        token_count: Tokens covering this chunk in the document's token stream.
+        section: Markdown heading path (e.g. "Install > Prerequisites"), if any.
+    """
+
+    text: str
+    start: int
+    end: int
+    token_count: int
+    section: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _Unit:
+    """Token range between two split points."""
+
+    start: int
+    end: int
+    heading: bool  # Starts at a markdown heading (no overlap across it)
+    section: str | None
+
 
 class Chunker:
-    """Document chunker using LlamaIndex SentenceSplitter.
+    """Token-aware chunker splitting on headings, paragraphs and sentences.
 
-    Splits documents into semantic chunks with configurable size and overlap.
+    Example:
+        >>> chunker = Chunker(chunk_size=512, chunk_overlap=51)
+        >>> for chunk in chunker.chunk_text(markdown):
+        ...     print(chunk.token_count, chunk.section)
     """
 
     def __init__(
         self,
         chunk_size: int = 512,
         chunk_overlap: int = 51,
-        separator: str = " ",
+        encoding: str = "cl100k_base",
+        min_chunk_tokens: int | None = None,
     ) -> None:
         """Initialize chunker with size and overlap parameters.
 
         Args:
             chunk_size: Maximum tokens per chunk (default: 512).
             chunk_overlap: Overlap tokens between chunks (default: 51, ~10%).
-            separator: Separator for splitting (default: space).
+            encoding: tiktoken encoding used for token counts.
+            min_chunk_tokens: New tokens a chunk needs before a content-defined
+                cut may end it (default: chunk_size // 2). Set to chunk_size to
+                always fill chunks up to the maximum.
+
+        Raises:
+            ValueError: If sizes are not positive or overlap is not below chunk_size.
         """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be >= 0 and smaller than chunk_size")
+        if min_chunk_tokens is None:
+            min_chunk_tokens = chunk_size // 2
+        if not 0 < min_chunk_tokens <= chunk_size:
+            raise ValueError("min_chunk_tokens must be positive and at most chunk_size")
+
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.separator = separator
-
-        # Initialize LlamaIndex SentenceSplitter
-        self.splitter = SentenceSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            separator=separator,
-        )
+        self.encoding = encoding
+        self.min_chunk_tokens = min_chunk_tokens
+        self._encoder = get_encoder(encoding)
+        # Expected tokens past the minimum before a content-defined cut
+        self._anchor_gap = max(1.0, (chunk_size - min_chunk_tokens) / 2)
 
         logger.info(
             f"Initialized Chunker (chunk_size={chunk_size}, "
-            f"chunk_overlap={chunk_overlap}, separator='{separator}')"
+            f"chunk_overlap={chunk_overlap}, min_chunk_tokens={min_chunk_tokens}, "
+            f"encoding='{encoding}')"
         )
 
-    def chunk_document(self, doc: Document) -> list[Document]:
-        """Chunk a document into smaller semantic chunks.
+    def chunk_text(self, text: str) -> list[TextChunk]:
+        """Chunk text into spans of at most ``chunk_size`` tokens.
 
         Args:
-            doc: LlamaIndex Document to chunk.
+            text: Document text (typically normalized Markdown).
 
         Returns:
-            list[Document]: List of chunked Document objects with preserved metadata.
+            list[TextChunk]: Chunks in document order.
         """
-        if not doc.text or doc.text.strip() == "":
-            logger.debug("Empty document, returning empty chunk list")
+        if not text or not text.strip():
             return []
 
-        logger.debug(f"Chunking document: {len(doc.text)} chars")
+        tokens = self._encoder.encode_ordinary(text)
+        starts = self._token_char_starts(text, tokens)
+
+        chunks: list[TextChunk] = []
+        token_ids = np.asarray(tokens, dtype=np.int32)
+        for first, last, section in self._pack(self._units(text, starts), token_ids):
+            raw = text[starts[first] : starts[last]]
+            stripped = raw.strip()
+            if not stripped:
+                continue
+            start = starts[first] + len(raw) - len(raw.lstrip())
+            chunks.append(
+                TextChunk(
+                    text=stripped,
+                    start=start,
+                    end=start + len(stripped),
+                    token_count=last - first,
+                    section=section,
+                )
+            )
+
+        logger.debug(f"Created {len(chunks)} chunks from {len(tokens)} tokens")
+        return chunks
+
+    def chunk_document(self, doc: Document) -> list[Document]:
+        """Chunk a LlamaIndex Document, preserving its metadata.
+
+        Args:
+            doc: LlamaIndex Document to chunk.
 
-        # Split using LlamaIndex SentenceSplitter
-        nodes = self.splitter.get_nodes_from_documents([doc])
+        Returns:
+            list[Document]: Chunk Documents with ``chunk_index``/``chunk_count``
+                added to the source metadata.
+        """
+        from llama_index.core import Document as LlamaDocument
 
-        # Convert nodes back to Documents and preserve metadata
-        chunks: list[Document] = []
-        for i, node in enumerate(nodes):
-            chunk_metadata = doc.metadata.copy() if doc.metadata else {}
-            chunk_metadata["chunk_index"] = i
-            chunk_metadata["chunk_count"] = len(nodes)
+        chunks = self.chunk_text(doc.text)
+        metadata = dict(doc.metadata) if doc.metadata else {}
 
-            chunk = Document(
-                text=node.get_content(),
-                metadata=chunk_metadata,
+        return [
+            LlamaDocument(
+                text=chunk.text,
+                metadata={**metadata, "chunk_index": i, "chunk_count": len(chunks)},
             )
-            chunks.append(chunk)
+            for i, chunk in enumerate(chunks)
+        ]
 
-        logger.info(f"Created {len(chunks)} chunks from document")
+    def _token_char_starts(self, text: str, tokens: list[int]) -> list[int]:
+        """Character offset of every token start, plus ``len(text)`` at the end."""
+        lengths = _token_byte_lengths(self.encoding)[np.asarray(tokens, dtype=np.int64)]
+        byte_starts = np.concatenate(([0], np.cumsum(lengths)))
+        if text.isascii():
+            return byte_starts.tolist()
 
-        return chunks
+        codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        widths = 1 + (codepoints >= 0x80) + (codepoints >= 0x800) + (codepoints >= 0x10000)
+        char_byte_starts = np.concatenate(([0], np.cumsum(widths)))
+        # Byte-level BPE can end a token mid-character; round up to the next character
+        return np.searchsorted(char_byte_starts, byte_starts, side="left").tolist()
+
+    def _units(self, text: str, starts: list[int]) -> list[_Unit]:
+        """Split the token stream at heading, paragraph and sentence boundaries."""
+        token_total = len(starts) - 1
+
+        def token_at(position: int) -> int:
+            return bisect.bisect_right(starts, position, 0, token_total) - 1
+
+        splits = {0}
+        splits.update(token_at(match.end()) for match in _BREAK_RE.finditer(text))
+
+        headings: dict[int, str] = {}
+        fences = [match.span() for match in _FENCE_RE.finditer(text)]
+        path: list[tuple[int, str]] = []
+        for match in _HEADING_RE.finditer(text):
+            if any(start <= match.start() < end for start, end in fences):
+                continue
+            level = len(match.group(1))
+            while path and path[-1][0] >= level:
+                path.pop()
+            path.append((level, match.group(2).strip()))
+            token = token_at(match.start())
+            headings[token] = " > ".join(title for _, title in path)[:_MAX_SECTION_CHARS]
+            splits.add(token)
+
+        units: list[_Unit] = []
+        section: str | None = None
+        bounds = sorted(splits)
+        for start, end in zip(bounds, [*bounds[1:], token_total], strict=True):
+            if start >= end:
+                continue
+            heading = start in headings
+            if heading:
+                section = headings[start]
+            units.append(_Unit(start, end, heading, section))
+        return units
+
+    def _pack(
+        self, units: list[_Unit], token_ids: NDArray[np.int32]
+    ) -> list[tuple[int, int, str | None]]:
+        """Pack units into ``(first_token, last_token, section)`` spans.
+
+        A chunk ends before a heading, before a unit that would overflow
+        ``chunk_size``, or after an anchor unit once it holds
+        ``min_chunk_tokens`` new tokens.
+        """
+        spans: list[tuple[int, int, str | None]] = []
+        current: list[_Unit] = []
+        size = 0
+        fresh = 0  # Tokens added since the last cut (excludes carried overlap)
+        cut = False
+
+        for unit in units:
+            length = unit.end - unit.start
+            if current and unit.heading:
+                spans.append((current[0].start, current[-1].end, current[0].section))
+                current, size, fresh, cut = [], 0, 0, False
+
+            if length > self.chunk_size:
+                # Sentence longer than a chunk: fixed token windows with overlap,
+                # starting at whatever is already buffered
+                first = current[0].start if current else unit.start
+                step = self.chunk_size - self.chunk_overlap
+                for start in range(first, unit.end, step):
+                    end = min(start + self.chunk_size, unit.end)
+                    spans.append((start, end, unit.section))
+                    if end == unit.end:
+                        break
+                current, size, fresh, cut = [], 0, 0, False
+                continue
+
+            if current and (cut or size + length > self.chunk_size):
+                spans.append((current[0].start, current[-1].end, current[0].section))
+                current = self._overlap(current, length)
+                size = sum(u.end - u.start for u in current)
+                fresh, cut = 0, False
+
+            current.append(unit)
+            size += length
+            fresh += length
+            cut = fresh >= self.min_chunk_tokens and self._is_anchor(unit, token_ids)
+
+        if current:
+            spans.append((current[0].start, current[-1].end, current[0].section))
+        return spans
+
+    def _is_anchor(self, unit: _Unit, token_ids: NDArray[np.int32]) -> bool:
+        """Whether a unit's content selects it as a chunk boundary.
+
+        The hash covers only the unit's own trailing tokens, so the decision is
+        the same wherever the unit appears. Longer units are proportionally more
+        likely to be anchors, keeping the expected chunk length independent of
+        sentence length.
+        """
+        window = token_ids[max(unit.start, unit.end - _ANCHOR_WINDOW) : unit.end]
+        draw = zlib.crc32(window.tobytes()) / 2**32
+        return draw < (unit.end - unit.start) / self._anchor_gap
+
+    def _overlap(self, previous: list[_Unit], next_length: int) -> list[_Unit]:
+        """Trailing units of the previous chunk to repeat at the start of the next."""
+        budget = min(self.chunk_overlap, self.chunk_size - next_length)
+        carried: list[_Unit] = []
+        size = 0
+        for unit in reversed(previous):
+            size += unit.end - unit.start
+            if size > budget:
+                break
+            carried.append(unit)
+        return carried[::-1]
+
+
+@lru_cache(maxsize=4)
+def _token_byte_lengths(encoding: str) -> NDArray[np.int64]:
+    """Byte length of every token id, for vectorized offset computation."""
+    encoder = get_encoder(encoding)
+    lengths = np.zeros(encoder.max_token_value + 1, dtype=np.int64)
+    for token in range(encoder.max_token_value + 1):
+        try:
+            lengths[token] = len(encoder.decode_single_token_bytes(token))
+        except KeyError:
+            continue
+    return lengths
+
+
+def stable_chunk_ids(source_id: str, contents: Iterable[str]) -> list[UUID]:
+    """Deterministic chunk IDs from document identity and chunk content.
+
+    Each ID is a UUIDv5 of the source identity, the chunk's content hash and
+    the number of earlier chunks in the document with the same content (so
+    repeated boilerplate does not collide). An unchanged chunk keeps its ID
+    when the page is edited elsewhere.
+
+    Args:
+        source_id: Stable document identity (e.g., source URL).
+        contents: Chunk texts in document order.
+
+    Returns:
+        list[UUID]: One ID per chunk.
+    """
+    seen: dict[str, int] = {}
+    ids: list[UUID] = []
+    for content in contents:
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        occurrence = seen.get(content_hash, 0)
+        seen[content_hash] = occurrence + 1
+        ids.append(uuid5(CHUNK_ID_NAMESPACE, f"{source_id}\n{content_hash}\n{occurrence}"))
+    return ids
+
+
+# Export public API
+__all__ = ["CHUNK_ID_NAMESPACE", "Chunker", "TextChunk", "stable_chunk_ids"]
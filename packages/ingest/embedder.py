@@ -5,13 +5,27 @@ Per data-model.md: Use Qwen3-Embedding-0.6B (1024-dim vectors).
 Per .env: TEI service at http://taboot-embed:80
 """
 
+import asyncio
+import importlib.util
 import logging
-from typing import Any
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
 
 import httpx
+import numpy as np
+import orjson
+from numpy.typing import NDArray
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexing needs the optional h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Rough characters-per-token ratio used when callers do not pass token counts
+_CHARS_PER_TOKEN = 4
+
+_BatchT = TypeVar("_BatchT")
+
 
 class EmbedderError(Exception):
     """Base exception for Embedder errors."""
@@ -23,6 +37,13 @@ class Embedder:
     """Document embedder using TEI service.
 
     Implements batch embedding with configurable batch size and dimension validation.
+    The async path keeps one pooled keep-alive client per event loop and sends
+    up to ``max_concurrency`` batches to TEI at once, retrying each batch on its
+    own and returning embeddings in input order.
+
+    With ``max_batch_tokens`` set, texts are sorted by length and packed into
+    batches up to that token budget (and at most ``batch_size`` texts), so short
+    texts share large requests and long ones never exceed the TEI payload limit.
     """
 
     def __init__(
@@ -31,6 +52,11 @@ class Embedder:
         batch_size: int = 32,
         expected_dim: int = 1024,
         timeout: float = 30.0,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        http2: bool = True,
+        max_batch_tokens: int | None = None,
     ) -> None:
         """Initialize Embedder with TEI service URL.
 
@@ -39,6 +65,14 @@ class Embedder:
             batch_size: Number of texts to embed in each batch (default: 32).
             expected_dim: Expected embedding dimension (default: 1024 for Qwen3-Embedding-0.6B).
             timeout: HTTP request timeout in seconds (default: 30.0).
+            max_concurrency: Batch requests in flight at once on the async path
+                (default: 4), shared by all concurrent embed_texts_async calls.
+            max_retries: Retries per batch on connection errors, 429 and 5xx
+                responses (default: 3).
+            retry_backoff: Initial retry delay in seconds, doubled per attempt.
+            http2: Negotiate HTTP/2 when the h2 package is installed (default: True).
+            max_batch_tokens: Token budget per TEI request; None batches by
+                ``batch_size`` alone (default: None).
 
         Raises:
             ValueError: If tei_url is empty or batch_size is invalid.
@@ -52,24 +86,44 @@ class Embedder:
         if expected_dim <= 0:
             raise ValueError("expected_dim must be positive")
 
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+
+        if max_batch_tokens is not None and max_batch_tokens <= 0:
+            raise ValueError("max_batch_tokens must be positive")
+
         self.tei_url = tei_url
         self.batch_size = batch_size
         self.expected_dim = expected_dim
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self.max_batch_tokens = max_batch_tokens
 
         # Initialize HTTP client
         self._client = httpx.Client(timeout=timeout)
 
+        # Async client and request limiter, created lazily on the running loop
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_limiter: asyncio.Semaphore | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+
         logger.info(
             f"Initialized Embedder (tei_url={tei_url}, "
             f"batch_size={batch_size}, expected_dim={expected_dim})"
         )
 
-    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    def embed_texts(
+        self, texts: list[str], token_counts: Sequence[int] | None = None
+    ) -> list[list[float]]:
         """Embed a list of texts using TEI service.
 
         Args:
             texts: List of text strings to embed.
+            token_counts: Token count per text, used for token-budget batching
+                (estimated from text length when omitted).
 
         Returns:
             list[list[float]]: List of embedding vectors (each of length expected_dim).
@@ -83,13 +137,13 @@ class Embedder:
 
         logger.debug(f"Embedding {len(texts)} texts")
 
-        all_embeddings: list[list[float]] = []
+        all_embeddings: list[list[float]] = [[] for _ in texts]
 
         # Process in batches
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-            batch_embeddings = self._embed_batch(batch)
-            all_embeddings.extend(batch_embeddings)
+        for indices in self._plan_batches(texts, token_counts):
+            batch_embeddings = self._embed_batch([texts[i] for i in indices])
+            for index, embedding in zip(indices, batch_embeddings, strict=True):
+                all_embeddings[index] = embedding
 
         logger.info(f"Embedded {len(all_embeddings)} texts")
 
@@ -163,14 +217,22 @@ class Embedder:
             logger.error(f"Unexpected error during embedding: {e}")
             raise EmbedderError(f"Unexpected error during embedding: {e}") from e
 
-    async def embed_texts_async(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts_async(
+        self, texts: list[str], token_counts: Sequence[int] | None = None
+    ) -> list[list[float]]:
         """Embed a list of texts asynchronously using TEI service.
 
+        Batches are sent concurrently (bounded by ``max_concurrency``) over a
+        persistent connection pool; a failing batch is retried on its own.
+
         Args:
             texts: List of text strings to embed.
+            token_counts: Token count per text, used for token-budget batching
+                (estimated from text length when omitted).
 
         Returns:
-            list[list[float]]: List of embedding vectors (each of length expected_dim).
+            list[list[float]]: List of embedding vectors (each of length expected_dim),
+                in the same order as ``texts``.
 
         Raises:
             EmbedderError: If TEI service returns an error or invalid response.
@@ -181,19 +243,207 @@ class Embedder:
 
         logger.debug(f"Embedding {len(texts)} texts asynchronously")
 
-        all_embeddings: list[list[float]] = []
+        plan, batch_results = await self._run_batches(texts, token_counts, self._embed_batch_async)
 
-        # Process in batches asynchronously
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            for i in range(0, len(texts), self.batch_size):
-                batch = texts[i : i + self.batch_size]
-                batch_embeddings = await self._embed_batch_async(client, batch)
-                all_embeddings.extend(batch_embeddings)
+        # Scatter batch results back to their input positions
+        all_embeddings: list[list[float]] = [[] for _ in texts]
+        for indices, batch_embeddings in zip(plan, batch_results, strict=True):
+            for index, embedding in zip(indices, batch_embeddings, strict=True):
+                all_embeddings[index] = embedding
 
         logger.info(f"Embedded {len(all_embeddings)} texts asynchronously")
 
         return all_embeddings
 
+    async def embed_array_async(
+        self, texts: list[str], token_counts: Sequence[int] | None = None
+    ) -> NDArray[np.float32]:
+        """Embed texts into one contiguous float32 matrix.
+
+        Same batching, concurrency and retries as :meth:`embed_texts_async`,
+        but each TEI response is parsed with orjson straight into a float32
+        array, validated with vectorized shape/finite checks and copied into a
+        preallocated ``(len(texts), expected_dim)`` matrix, so no per-vector
+        Python lists outlive the request.
+
+        Args:
+            texts: List of text strings to embed.
+            token_counts: Token count per text, used for token-budget batching.
+
+        Returns:
+            NDArray[np.float32]: Row ``i`` is the embedding of ``texts[i]``.
+
+        Raises:
+            EmbedderError: If TEI service returns an error or invalid response.
+        """
+        matrix = np.empty((len(texts), self.expected_dim), dtype=np.float32)
+        if not texts:
+            return matrix
+
+        plan, batch_results = await self._run_batches(
+            texts, token_counts, self._embed_batch_array_async
+        )
+        for indices, batch_matrix in zip(plan, batch_results, strict=True):
+            matrix[indices] = batch_matrix
+
+        logger.info(f"Embedded {len(texts)} texts into a float32 matrix")
+
+        return matrix
+
+    async def _run_batches(
+        self,
+        texts: list[str],
+        token_counts: Sequence[int] | None,
+        embed_batch: Callable[[httpx.AsyncClient, list[str]], Awaitable[_BatchT]],
+    ) -> tuple[list[list[int]], list[_BatchT]]:
+        """Plan batches and embed them concurrently on the pooled client.
+
+        Args:
+            texts: Texts to embed.
+            token_counts: Token count per text, or None to estimate.
+            embed_batch: Coroutine embedding one batch.
+
+        Returns:
+            tuple: Batch plan (input indices per batch) and the per-batch
+                results in plan order.
+        """
+        client, limiter = self._get_async_client()
+        plan = self._plan_batches(texts, token_counts)
+        tasks = [
+            asyncio.create_task(
+                self._embed_batch_with_retry(
+                    client, limiter, [texts[i] for i in indices], embed_batch
+                )
+            )
+            for indices in plan
+        ]
+        try:
+            # gather preserves task order, so results line up with the plan
+            batch_results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return plan, list(batch_results)
+
+    def _plan_batches(
+        self, texts: list[str], token_counts: Sequence[int] | None
+    ) -> list[list[int]]:
+        """Group text indices into request batches.
+
+        Without a token budget, batches are consecutive runs of ``batch_size``.
+        With one, indices are sorted longest first so each batch holds texts of
+        similar length (less padding), then packed greedily until the next text
+        would exceed ``max_batch_tokens`` or ``batch_size``. A text larger than
+        the budget is sent on its own.
+
+        Args:
+            texts: Texts to embed.
+            token_counts: Token count per text, or None to estimate.
+
+        Returns:
+            list[list[int]]: Indices into ``texts`` for each request.
+
+        Raises:
+            ValueError: If token_counts does not match texts in length.
+        """
+        if token_counts is not None and len(token_counts) != len(texts):
+            raise ValueError(
+                f"token_counts length {len(token_counts)} does not match {len(texts)} texts"
+            )
+
+        if self.max_batch_tokens is None:
+            return [
+                list(range(i, min(i + self.batch_size, len(texts))))
+                for i in range(0, len(texts), self.batch_size)
+            ]
+
+        if token_counts is None:
+            token_counts = [_estimate_tokens(text) for text in texts]
+
+        order = sorted(range(len(texts)), key=lambda i: token_counts[i], reverse=True)
+
+        batches: list[list[int]] = []
+        current: list[int] = []
+        current_tokens = 0
+        for index in order:
+            tokens = max(1, token_counts[index])
+            if current and (
+                len(current) >= self.batch_size or current_tokens + tokens > self.max_batch_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _get_async_client(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """Get the pooled async client for the running event loop.
+
+        Clients and semaphores are bound to the loop that created them, so a
+        new pair is created when called from a different loop (e.g. a later
+        ``asyncio.run``).
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._async_client is None
+            or self._async_limiter is None
+            or self._async_client.is_closed
+            or self._async_loop is not loop
+        ):
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self._async_limiter = asyncio.Semaphore(self.max_concurrency)
+            self._async_loop = loop
+        return self._async_client, self._async_limiter
+
+    async def _embed_batch_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        limiter: asyncio.Semaphore,
+        batch: list[str],
+        embed_batch: Callable[[httpx.AsyncClient, list[str]], Awaitable[_BatchT]],
+    ) -> _BatchT:
+        """Embed one batch, retrying transient failures of that batch only.
+
+        Args:
+            client: AsyncClient instance for HTTP requests.
+            limiter: Semaphore bounding in-flight batch requests.
+            batch: List of text strings (size <= batch_size).
+            embed_batch: Coroutine performing a single attempt.
+
+        Returns:
+            The batch's embeddings as produced by ``embed_batch``.
+
+        Raises:
+            EmbedderError: If the batch still fails after all retries.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with limiter:
+                    return await embed_batch(client, batch)
+            except EmbedderError as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = self.retry_backoff * 2**attempt
+                attempt += 1
+                logger.warning(
+                    f"Retrying TEI batch of {len(batch)} texts in {delay:.1f}s "
+                    f"(attempt {attempt}/{self.max_retries}): {e}"
+                )
+                await asyncio.sleep(delay)
+
     async def _embed_batch_async(
         self, client: httpx.AsyncClient, batch: list[str]
     ) -> list[list[float]]:
@@ -265,11 +515,67 @@ class Embedder:
             logger.error(f"Unexpected error during embedding: {e}")
             raise EmbedderError(f"Unexpected error during embedding: {e}") from e
 
+    async def _embed_batch_array_async(
+        self, client: httpx.AsyncClient, batch: list[str]
+    ) -> NDArray[np.float32]:
+        """Embed a single batch into a float32 array.
+
+        Args:
+            client: AsyncClient instance for HTTP requests.
+            batch: List of text strings (size <= batch_size).
+
+        Returns:
+            NDArray[np.float32]: ``(len(batch), expected_dim)`` matrix.
+
+        Raises:
+            EmbedderError: If TEI service returns an error or invalid response.
+        """
+        try:
+            response = await client.post(f"{self.tei_url}/embed", json={"inputs": batch})
+            response.raise_for_status()
+            embeddings = np.asarray(orjson.loads(response.content), dtype=np.float32)
+        except httpx.HTTPStatusError as e:
+            logger.error(f"TEI service HTTP error: {e}")
+            raise EmbedderError(f"TEI service HTTP error: {e}") from e
+        except httpx.RequestError as e:
+            logger.error(f"TEI service request error: {e}")
+            raise EmbedderError(f"TEI service request error: {e}") from e
+        except (orjson.JSONDecodeError, TypeError, ValueError) as e:
+            raise EmbedderError(f"Invalid response format: {e}") from e
+
+        expected_shape = (len(batch), self.expected_dim)
+        if embeddings.shape != expected_shape:
+            raise EmbedderError(
+                f"Invalid embedding shape: expected {expected_shape}, got {embeddings.shape}"
+            )
+        if not np.isfinite(embeddings).all():
+            bad_row = int(np.flatnonzero(~np.isfinite(embeddings).all(axis=1))[0])
+            raise EmbedderError(f"Non-finite values in embedding at index {bad_row}")
+
+        return embeddings
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client (call from the loop that used it)."""
+        client, self._async_client = self._async_client, None
+        self._async_limiter = None
+        self._async_loop = None
+        if client is not None:
+            await client.aclose()
+
     def close(self) -> None:
         """Close the HTTP client."""
         logger.debug("Closing HTTP client")
         self._client.close()
 
+        # The async client can only be closed on its own loop; once that loop
+        # has finished its connections are released with the client object
+        client, loop = self._async_client, self._async_loop
+        self._async_client = None
+        self._async_limiter = None
+        self._async_loop = None
+        if client is not None and loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(lambda: loop.create_task(client.aclose()))
+
     def __enter__(self) -> "Embedder":
         """Enter context manager."""
         return self
@@ -279,6 +585,22 @@ class Embedder:
         self.close()
 
 
+def _estimate_tokens(text: str) -> int:
+    """Cheap token estimate for texts without a precomputed count."""
+    return max(1, -(-len(text) // _CHARS_PER_TOKEN))
+
+
+def _is_retryable(error: EmbedderError) -> bool:
+    """Whether a batch failure is transient (connection error, 429 or 5xx)."""
+    cause = error.__cause__
+    if isinstance(cause, httpx.RequestError):
+        return True
+    if isinstance(cause, httpx.HTTPStatusError):
+        status = cause.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
 def get_embedding(text: str, tei_url: str = "http://taboot-embed:80") -> list[float]:
     """
     Get embedding for a single text string.
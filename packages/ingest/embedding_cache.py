@@ -0,0 +1,401 @@
+"""Content-addressed embedding cache.
+
+Embeddings are keyed by a SHA-256 of the embedding model id and the
+normalized chunk text, so unchanged chunks on a re-crawl are served from the
+cache instead of TEI. Vectors are stored as compact little-endian float16 or
+float32 bytes in Redis or in a local directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+import unicodedata
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Literal, Protocol
+
+import numpy as np
+from numpy.typing import NDArray
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+VectorDType = Literal["float16", "float32"]
+
+_STRUCT_CODES: dict[str, str] = {"float16": "e", "float32": "f"}
+_NUMPY_DTYPES: dict[str, str] = {"float16": "<f2", "float32": "<f4"}
+
+embedding_cache_hits_total = Counter(
+    "taboot_embedding_cache_hits_total",
+    "Chunk embeddings served from the embedding cache",
+    ["backend"],
+)
+embedding_cache_misses_total = Counter(
+    "taboot_embedding_cache_misses_total",
+    "Chunk embeddings not found in the embedding cache",
+    ["backend"],
+)
+
+
+def normalize_for_cache(text: str) -> str:
+    """Normalize text so cosmetic whitespace/Unicode changes still hit the cache."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def embedding_cache_key(model_id: str, text: str) -> str:
+    """Content address for an embedding: sha256(model id + normalized text)."""
+    digest = hashlib.sha256()
+    digest.update(model_id.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalize_for_cache(text).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def encode_vector(vector: Sequence[float], dtype: VectorDType = "float16") -> bytes:
+    """Pack a vector into little-endian float16/float32 bytes."""
+    if isinstance(vector, np.ndarray):
+        return vector.astype(_NUMPY_DTYPES[dtype], copy=False).tobytes()
+    return struct.pack(f"<{len(vector)}{_STRUCT_CODES[dtype]}", *vector)
+
+
+def decode_vector(data: bytes, dtype: VectorDType = "float16") -> list[float]:
+    """Unpack bytes written by :func:`encode_vector`."""
+    code = _STRUCT_CODES[dtype]
+    return list(struct.unpack(f"<{len(data) // struct.calcsize(code)}{code}", data))
+
+
+class EmbeddingCacheBackend(Protocol):
+    """Byte store behind :class:`EmbeddingCache`."""
+
+    name: str
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]: ...
+
+    async def set_many(self, items: dict[str, bytes]) -> None: ...
+
+    async def aclose(self) -> None: ...
+
+
+class RedisEmbeddingCacheBackend:
+    """Store vectors in Redis, one key per chunk, with MGET/pipelined SET."""
+
+    name = "redis"
+
+    def __init__(
+        self,
+        redis_client: Any,
+        *,
+        prefix: str = "embedding:",
+        ttl: int | None = None,
+    ) -> None:
+        """Initialize RedisEmbeddingCacheBackend.
+
+        Args:
+            redis_client: Async Redis client (bytes responses).
+            prefix: Key prefix for cached vectors.
+            ttl: Expiry in seconds (None keeps entries until evicted).
+        """
+        self.redis_client = redis_client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        values = await self.redis_client.mget([self.prefix + key for key in keys])
+        return list(values)
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        if not items:
+            return
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self.prefix + key, value, ex=self.ttl)
+        await pipe.execute()
+
+    async def aclose(self) -> None:
+        await self.redis_client.aclose()
+
+
+class DiskEmbeddingCacheBackend:
+    """Store vectors as files under ``directory/<key[:2]>/<key>``.
+
+    Files are written atomically (temp file + rename), so concurrent ingests
+    can share a directory. Disk I/O runs in a worker thread.
+    """
+
+    name = "disk"
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize DiskEmbeddingCacheBackend.
+
+        Args:
+            directory: Cache root; created on first write.
+        """
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def _read_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        values: list[bytes | None] = []
+        for key in keys:
+            try:
+                values.append(self._path(key).read_bytes())
+            except FileNotFoundError:
+                values.append(None)
+        return values
+
+    def _write_many(self, items: dict[str, bytes]) -> None:
+        for key, value in items.items():
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(value)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return await asyncio.to_thread(self._read_many, keys)
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        if items:
+            await asyncio.to_thread(self._write_many, items)
+
+    async def aclose(self) -> None:
+        return None
+
+
+class EmbeddingCache:
+    """Look up and store chunk embeddings by content address.
+
+    Backend errors are logged and treated as misses, so an unavailable cache
+    only costs the TEI call it would have saved.
+    """
+
+    def __init__(
+        self,
+        backend: EmbeddingCacheBackend,
+        *,
+        model_id: str,
+        dtype: VectorDType = "float16",
+        expected_dim: int | None = None,
+    ) -> None:
+        """Initialize EmbeddingCache.
+
+        Args:
+            backend: Byte store for encoded vectors.
+            model_id: Embedding model id; part of every key so a model change
+                never returns stale vectors.
+            dtype: Stored precision (float16 halves storage, float32 is exact).
+            expected_dim: Discard cached vectors of any other dimension.
+        """
+        self.backend = backend
+        self.model_id = model_id
+        self.dtype = dtype
+        self.expected_dim = expected_dim
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache since creation."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def key(self, text: str) -> str:
+        """Cache key for a text under this cache's model."""
+        return embedding_cache_key(self.model_id, text)
+
+    async def get_many(self, texts: Sequence[str]) -> list[list[float] | None]:
+        """Return cached embeddings for ``texts`` (None where missing).
+
+        Args:
+            texts: Chunk texts.
+
+        Returns:
+            list[list[float] | None]: Embeddings aligned with ``texts``.
+        """
+        if not texts:
+            return []
+
+        try:
+            raw = await self.backend.get_many([self.key(text) for text in texts])
+        except Exception:
+            logger.exception("Embedding cache lookup failed; embedding all texts")
+            raw = [None] * len(texts)
+
+        results: list[list[float] | None] = []
+        for value in raw:
+            vector = decode_vector(value, self.dtype) if value else None
+            if vector is not None and self.expected_dim and len(vector) != self.expected_dim:
+                vector = None
+            results.append(vector)
+
+        hits = sum(vector is not None for vector in results)
+        self.hits += hits
+        self.misses += len(results) - hits
+        embedding_cache_hits_total.labels(backend=self.backend.name).inc(hits)
+        embedding_cache_misses_total.labels(backend=self.backend.name).inc(len(results) - hits)
+        return results
+
+    async def set_many(self, texts: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        """Store embeddings for ``texts``; failures are logged, not raised."""
+        items = {
+            self.key(text): encode_vector(embedding, self.dtype)
+            for text, embedding in zip(texts, embeddings, strict=True)
+        }
+        try:
+            await self.backend.set_many(items)
+        except Exception:
+            logger.exception("Failed to write %s embeddings to cache", len(items))
+
+    async def aclose(self) -> None:
+        """Release backend connections."""
+        await self.backend.aclose()
+
+
+class CachedEmbedder:
+    """Embedder wrapper that consults an :class:`EmbeddingCache` before TEI.
+
+    Only cache misses are sent to the wrapped embedder (each distinct text
+    once); results are returned in input order.
+    """
+
+    def __init__(self, embedder: Any, cache: EmbeddingCache) -> None:
+        """Initialize CachedEmbedder.
+
+        Args:
+            embedder: Embedder with ``embed_texts_async`` (e.g. Embedder).
+            cache: Embedding cache to read through and populate.
+        """
+        self.embedder = embedder
+        self.cache = cache
+
+    async def embed_texts_async(
+        self, texts: list[str], token_counts: Sequence[int] | None = None
+    ) -> list[list[float]]:
+        """Embed texts, serving unchanged chunks from the cache.
+
+        Args:
+            texts: List of text strings to embed.
+            token_counts: Token count per text, forwarded for batching.
+
+        Returns:
+            list[list[float]]: Embeddings in the same order as ``texts``.
+        """
+        cached = await self.cache.get_many(texts)
+        miss_texts, miss_counts = _distinct_misses(texts, cached, token_counts)
+
+        if miss_texts:
+            fresh = await self.embedder.embed_texts_async(miss_texts, token_counts=miss_counts)
+            await self.cache.set_many(miss_texts, fresh)
+            by_text = dict(zip(miss_texts, fresh, strict=True))
+            cached = [
+                vector if vector is not None else by_text[text]
+                for text, vector in zip(texts, cached, strict=True)
+            ]
+
+        self._log_hits(len(texts), len(miss_texts))
+        return [vector for vector in cached if vector is not None]
+
+    async def embed_array_async(
+        self, texts: list[str], token_counts: Sequence[int] | None = None
+    ) -> NDArray[np.float32]:
+        """Like :meth:`embed_texts_async`, but returns a float32 matrix.
+
+        Misses are embedded with the wrapped embedder's ``embed_array_async``.
+
+        Args:
+            texts: List of text strings to embed.
+            token_counts: Token count per text, forwarded for batching.
+
+        Returns:
+            NDArray[np.float32]: Row ``i`` is the embedding of ``texts[i]``.
+        """
+        cached = await self.cache.get_many(texts)
+        miss_texts, miss_counts = _distinct_misses(texts, cached, token_counts)
+
+        fresh: NDArray[np.float32] | None = None
+        if miss_texts:
+            fresh = await self.embedder.embed_array_async(miss_texts, token_counts=miss_counts)
+            await self.cache.set_many(miss_texts, fresh)
+
+        hit_rows = [i for i, vector in enumerate(cached) if vector is not None]
+        if fresh is not None:
+            dim = fresh.shape[1]
+        elif hit_rows:
+            dim = len(cached[hit_rows[0]] or ())
+        else:
+            dim = self.cache.expected_dim or 0
+
+        matrix = np.empty((len(texts), dim), dtype=np.float32)
+        if hit_rows:
+            matrix[hit_rows] = [cached[i] for i in hit_rows]
+        if fresh is not None:
+            fresh_row = {text: row for row, text in enumerate(miss_texts)}
+            miss_rows = [i for i, vector in enumerate(cached) if vector is None]
+            matrix[miss_rows] = fresh[[fresh_row[texts[i]] for i in miss_rows]]
+
+        self._log_hits(len(texts), len(miss_texts))
+        return matrix
+
+    def _log_hits(self, total: int, embedded: int) -> None:
+        logger.debug(
+            "Embedding cache served %s/%s texts (hit rate %.1f%%)",
+            total - embedded,
+            total,
+            self.cache.hit_rate * 100,
+        )
+
+    async def aclose(self) -> None:
+        """Close the wrapped embedder's async client and the cache backend."""
+        await self.embedder.aclose()
+        await self.cache.aclose()
+
+    def close(self) -> None:
+        """Close the wrapped embedder."""
+        self.embedder.close()
+
+
+def _distinct_misses(
+    texts: Sequence[str],
+    cached: Sequence[list[float] | None],
+    token_counts: Sequence[int] | None,
+) -> tuple[list[str], list[int] | None]:
+    """Distinct texts missing from the cache, with their token counts."""
+    missing: dict[str, int] = {}
+    for index, vector in enumerate(cached):
+        if vector is None:
+            missing.setdefault(texts[index], index)
+    counts = (
+        [token_counts[index] for index in missing.values()] if token_counts is not None else None
+    )
+    return list(missing), counts
+
+
+__all__ = [
+    "CachedEmbedder",
+    "DiskEmbeddingCacheBackend",
+    "EmbeddingCache",
+    "EmbeddingCacheBackend",
+    "RedisEmbeddingCacheBackend",
+    "VectorDType",
+    "decode_vector",
+    "embedding_cache_hits_total",
+    "embedding_cache_key",
+    "embedding_cache_misses_total",
+    "encode_vector",
+    "normalize_for_cache",
+]
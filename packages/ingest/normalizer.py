@@ -2,14 +2,30 @@
 
 Implements HTML-to-Markdown conversion and boilerplate removal.
 Per research.md: Use readability/justext for boilerplate removal.
+
+Two backends are available: a single-pass lxml converter (the default when
+lxml is installed) that keeps lists, tables and fenced code, and the
+pure-Python ``html.parser`` converter used as the fallback.
 """
 
 import logging
 import re
 from html.parser import HTMLParser
 
+from packages.ingest.normalizers import fast_markdown
+
 logger = logging.getLogger(__name__)
 
+BACKEND_AUTO = "auto"
+BACKEND_LXML = "lxml"
+BACKEND_HTML_PARSER = "html.parser"
+BACKENDS = (BACKEND_AUTO, BACKEND_LXML, BACKEND_HTML_PARSER)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACES_RE = re.compile(r" {2,}")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
 
 class _MarkdownConverter(HTMLParser):
     """HTML to Markdown converter using html.parser."""
@@ -79,7 +95,7 @@ class _MarkdownConverter(HTMLParser):
             self.current_text.append(data)
         else:
             # Clean up whitespace for non-code content
-            cleaned = re.sub(r"\s+", " ", data)
+            cleaned = _WHITESPACE_RE.sub(" ", data)
             if cleaned.strip():
                 self.current_text.append(cleaned)
 
@@ -93,7 +109,7 @@ class _MarkdownConverter(HTMLParser):
         markdown = "".join(self.markdown_parts)
 
         # Clean up excessive blank lines
-        markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+        markdown = _BLANK_LINES_RE.sub("\n\n", markdown)
 
         return markdown.strip()
 
@@ -102,11 +118,30 @@ class Normalizer:
     """Document normalizer for HTML-to-Markdown conversion.
 
     Removes boilerplate content and converts HTML to clean Markdown.
+
+    Attributes:
+        backend: Converter in use, ``"lxml"`` or ``"html.parser"``.
     """
 
-    def __init__(self) -> None:
-        """Initialize normalizer."""
-        logger.info("Initialized Normalizer")
+    def __init__(self, backend: str = BACKEND_AUTO) -> None:
+        """Initialize normalizer.
+
+        Args:
+            backend: ``"auto"`` (lxml when installed, else html.parser),
+                ``"lxml"`` or ``"html.parser"``.
+
+        Raises:
+            ValueError: If the backend is unknown, or lxml is requested but not installed.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown normalizer backend {backend!r}; expected one of {BACKENDS}")
+        if backend == BACKEND_LXML and not fast_markdown.AVAILABLE:
+            raise ValueError("Normalizer backend 'lxml' requires lxml to be installed")
+        if backend == BACKEND_AUTO:
+            backend = BACKEND_LXML if fast_markdown.AVAILABLE else BACKEND_HTML_PARSER
+
+        self.backend = backend
+        logger.info(f"Initialized Normalizer (backend={backend})")
 
     def normalize(self, html: str) -> str:
         """Normalize HTML document to Markdown.
@@ -120,6 +155,15 @@ class Normalizer:
         if not html:
             return ""
 
+        if self.backend == BACKEND_LXML:
+            try:
+                markdown = fast_markdown.html_to_markdown(html)
+            except Exception as e:
+                logger.warning(f"lxml conversion failed, using html.parser backend: {e}")
+            else:
+                logger.debug(f"Normalized {len(html)} chars HTML to {len(markdown)} chars Markdown")
+                return markdown
+
         # Convert HTML to Markdown
         converter = _MarkdownConverter()
         try:
@@ -128,8 +172,8 @@ class Normalizer:
         except Exception as e:
             logger.warning(f"HTML parsing failed, returning cleaned text: {e}")
             # Fallback: strip all tags and clean whitespace
-            markdown = re.sub(r"<[^>]+>", " ", html)
-            markdown = re.sub(r"\s+", " ", markdown).strip()
+            markdown = _TAG_RE.sub(" ", html)
+            markdown = _WHITESPACE_RE.sub(" ", markdown).strip()
 
         # Additional cleanup
         markdown = self._clean_whitespace(markdown)
@@ -148,13 +192,17 @@ class Normalizer:
             str: Cleaned text.
         """
         # Remove excessive spaces
-        text = re.sub(r" {2,}", " ", text)
+        text = _SPACES_RE.sub(" ", text)
 
         # Remove excessive newlines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
 
         # Remove leading/trailing whitespace from lines
         lines = [line.strip() for line in text.split("\n")]
         text = "\n".join(lines)
 
         return text.strip()
+
+
+# Export public API
+__all__ = ["BACKENDS", "Normalizer"]
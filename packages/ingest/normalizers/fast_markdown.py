@@ -0,0 +1,287 @@
+"""Single-pass HTML-to-Markdown conversion on lxml.
+
+lxml parses the page in C, and one ``iterwalk`` over the tree emits Markdown
+blocks directly: headings, paragraphs, nested lists, tables, blockquotes and
+fenced code. Whitespace is collapsed once per block with ``str.split`` instead
+of a regex per text node, and the output needs no document-wide cleanup pass.
+
+lxml is optional: ``AVAILABLE`` is False when it is not installed, and
+:class:`packages.ingest.normalizer.Normalizer` then falls back to its
+``html.parser`` backend.
+"""
+
+from __future__ import annotations
+
+import re
+import textwrap
+from typing import TYPE_CHECKING, Any
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - exercised only without lxml
+    AVAILABLE = False
+else:
+    AVAILABLE = True
+
+if TYPE_CHECKING:
+    from lxml.etree import _Element
+
+# Subtrees dropped entirely (boilerplate and non-content)
+_SKIP_TAGS = frozenset(
+    {"script", "style", "nav", "footer", "aside", "noscript", "template", "head", "svg", "iframe"}
+)
+
+# Tags that end the current paragraph
+_BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "blockquote", "body", "dd", "details", "div", "dl", "dt",
+        "fieldset", "figcaption", "figure", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+        "header", "hr", "html", "li", "main", "ol", "p", "pre", "section", "summary",
+        "table", "td", "th", "tr", "ul",
+    }
+)  # fmt: skip
+
+# Tags with Markdown structure; anything else (a, b, span, ...) only contributes text
+_HANDLED_TAGS = _BLOCK_TAGS | {"br", "code"}
+
+_HEADINGS = {f"h{level}": "#" * level + " " for level in range(1, 7)}
+_LANGUAGE_RE = re.compile(r"(?:^|\s)(?:language|lang)-([\w+#.-]+)")
+_LINE_BREAK = "\n"
+
+
+class _MarkdownWriter:
+    """Accumulates Markdown blocks while the tree is walked."""
+
+    def __init__(self) -> None:
+        self.blocks: list[str] = []
+        self.inline: list[str] = []
+        self.prefix = ""  # Marker for the next flushed block (list item or heading)
+        self.item = False  # Whether prefix is a list marker
+        self.last_item = False
+        self.lists: list[list[int]] = []  # One [counter] per open list; -1 = unordered
+        self.items: list[str] = []  # Continuation indent of each open list item
+        self.quote_depth = 0
+        self.code: list[str] | None = None  # Raw text while inside <pre>
+        self.code_language = ""
+        self.table: list[list[str]] | None = None
+        self.row: list[str] | None = None
+        self.table_depth = 0
+
+    def text(self, value: str | None) -> None:
+        if not value:
+            return
+        if self.code is not None:
+            self.code.append(value)
+        else:
+            self.inline.append(value)
+
+    def flush(self) -> None:
+        """Emit the inline buffer as one block with whitespace collapsed."""
+        raw = "".join(self.inline)
+        self.inline.clear()
+        lines = [" ".join(line.split()) for line in raw.split(_LINE_BREAK)]
+        text = "\n".join(line for line in lines if line)
+        if text:
+            self._emit(self.prefix + text, item=self.item)
+        elif self.item:
+            # The list marker waits for the item's first block (<li><p>...)
+            return
+        # An empty heading must not leak its marker into the next block
+        self.prefix = ""
+        self.item = False
+
+    def _emit_block(self, block: str) -> None:
+        """Emit a multi-line block, carrying a pending list marker on its first line."""
+        if not self.item:
+            self._emit(block)
+            return
+        indent = self.items[-1] if self.items else " " * len(self.prefix)
+        first, *rest = block.split("\n")
+        lines = [self.prefix + first, *(indent + line if line else line for line in rest)]
+        self._emit("\n".join(lines), item=True)
+        self.prefix = ""
+        self.item = False
+
+    def _emit(self, block: str, *, item: bool = False) -> None:
+        if not item and self.items:
+            # Later blocks of an open item stay inside it
+            indent = self.items[-1]
+            block = "\n".join(indent + line if line else line for line in block.split("\n"))
+        if self.quote_depth:
+            quote = "> " * self.quote_depth
+            block = "\n".join(quote + line for line in block.split("\n"))
+        if self.blocks:
+            self.blocks.append("\n" if item and self.last_item else "\n\n")
+        self.blocks.append(block)
+        self.last_item = item
+
+    def start_pre(self, element: _Element) -> None:
+        self.flush()
+        self.code = []
+        classes = element.get("class", "")
+        child = element[0] if len(element) else None
+        if child is not None and child.tag == "code":
+            classes = f"{classes} {child.get('class', '')}"
+        match = _LANGUAGE_RE.search(classes)
+        self.code_language = match.group(1) if match else ""
+
+    def end_pre(self) -> None:
+        code = textwrap.dedent("".join(self.code or ())).strip("\n")
+        self.code = None
+        if code.strip():
+            self._emit_block(f"```{self.code_language}\n{code}\n```")
+
+    def end_cell(self) -> None:
+        text = " ".join("".join(self.inline).split()).replace("|", "\\|")
+        self.inline.clear()
+        if self.row is not None:
+            self.row.append(text)
+
+    def end_table(self) -> None:
+        rows = [row for row in self.table or () if any(row)]
+        self.table = None
+        if not rows:
+            return
+        width = max(len(row) for row in rows)
+        lines = ["| " + " | ".join(row + [""] * (width - len(row))) + " |" for row in rows]
+        lines.insert(1, "|" + " --- |" * width)
+        self._emit_block("\n".join(lines))
+
+    def markdown(self) -> str:
+        self.flush()
+        return "".join(self.blocks)
+
+
+def html_to_markdown(html: str) -> str:
+    """Convert an HTML document or fragment to Markdown in one pass.
+
+    Args:
+        html: HTML content.
+
+    Returns:
+        str: Markdown with paragraphs separated by blank lines.
+
+    Raises:
+        RuntimeError: If lxml is not installed.
+    """
+    if not AVAILABLE:
+        raise RuntimeError("lxml is not installed")
+
+    # Plain etree parser: lxml.html's per-element class lookup costs more than parsing
+    parser = etree.HTMLParser(remove_comments=True, remove_pis=True, no_network=True)
+    try:
+        root = etree.fromstring(html, parser)
+    except ValueError:
+        # Strings with an XML encoding declaration must be parsed as bytes
+        root = etree.fromstring(html.encode("utf-8"), parser)
+    if root is None:
+        return ""
+
+    writer = _MarkdownWriter()
+    walker: Any = etree.iterwalk(root, events=("start", "end"))
+    for event, element in walker:
+        tag = element.tag
+        if event == "start":
+            if tag in _SKIP_TAGS:
+                walker.skip_subtree()
+                continue
+            if tag in _HANDLED_TAGS:
+                _start(writer, element, tag)
+            writer.text(element.text)
+        else:
+            if tag in _HANDLED_TAGS:
+                _end(writer, tag)
+            if element is not root:
+                writer.text(element.tail)
+
+    return writer.markdown()
+
+
+def _start(writer: _MarkdownWriter, element: _Element, tag: str) -> None:
+    """Handle an opening tag."""
+    if writer.code is not None:
+        return
+    if tag == "br":
+        writer.inline.append(_LINE_BREAK)
+    elif tag == "code":
+        writer.inline.append("`")
+    elif tag == "pre":
+        writer.start_pre(element)
+    elif tag == "table":
+        writer.table_depth += 1
+        if writer.table_depth == 1:
+            writer.flush()
+            writer.table = []
+    elif writer.table is not None:
+        # Inside a table only rows and cells of the outermost table add structure
+        if writer.table_depth == 1 and tag == "tr":
+            writer.row = []
+        elif writer.table_depth == 1 and tag in ("td", "th"):
+            writer.inline.clear()
+    elif tag in _BLOCK_TAGS:
+        writer.flush()
+        if tag in _HEADINGS:
+            writer.prefix = _HEADINGS[tag]
+            writer.item = False
+        elif tag in ("ul", "ol"):
+            writer.lists.append([-1 if tag == "ul" else 0])
+        elif tag == "li":
+            _start_item(writer)
+        elif tag == "blockquote":
+            writer.quote_depth += 1
+
+
+def _start_item(writer: _MarkdownWriter) -> None:
+    """Set the list marker for the next block."""
+    writer.item = True
+    if not writer.lists:
+        writer.prefix = "- "
+        writer.items.append("  ")
+        return
+    counter = writer.lists[-1]
+    indent = "  " * (len(writer.lists) - 1)
+    if counter[0] < 0:
+        writer.prefix = f"{indent}- "
+    else:
+        counter[0] += 1
+        writer.prefix = f"{indent}{counter[0]}. "
+    writer.items.append(" " * len(writer.prefix))
+
+
+def _end(writer: _MarkdownWriter, tag: str) -> None:
+    """Handle a closing tag."""
+    if writer.code is not None:
+        if tag == "pre":
+            writer.end_pre()
+        return
+    if tag == "code":
+        writer.inline.append("`")
+    elif tag == "table":
+        writer.table_depth -= 1
+        if writer.table_depth == 0:
+            writer.end_table()
+    elif writer.table is not None:
+        if writer.table_depth == 1 and tag == "tr":
+            if writer.row is not None:
+                writer.table.append(writer.row)
+            writer.row = None
+        elif writer.table_depth == 1 and tag in ("td", "th"):
+            writer.end_cell()
+    elif tag in _BLOCK_TAGS:
+        writer.flush()
+        if tag == "li":
+            # An empty list item must not leak its marker into the next block
+            writer.prefix = ""
+            writer.item = False
+            if writer.items:
+                writer.items.pop()
+        elif tag in ("ul", "ol") and writer.lists:
+            writer.lists.pop()
+            if not writer.lists:
+                writer.last_item = False  # Separate the next list from this one
+        elif tag == "blockquote":
+            writer.quote_depth = max(0, writer.quote_depth - 1)
+
+
+# Export public API
+__all__ = ["AVAILABLE", "html_to_markdown"]
@@ -0,0 +1,248 @@
+"""Normalize and chunk documents off the event loop, optionally in a process pool.
+
+Normalizing and chunking are pure CPU work, so worker threads only keep the
+event loop responsive: the GIL still limits a crawl to about one core. A
+:class:`DocumentPreparer` with more than one worker ships raw page text to a
+process pool instead. Workers build their own Normalizer and Chunker from the
+parent's settings and return compact records (Markdown plus chunk spans and
+token counts), so chunk texts are never pickled twice.
+
+Small jobs stay in-process: starting worker processes costs more than it
+saves for a handful of pages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import TypeVar
+
+from packages.ingest.chunker import Chunker, TextChunk
+from packages.ingest.normalizer import Normalizer
+
+logger = logging.getLogger(__name__)
+
+# Jobs expecting fewer documents than this are prepared in-process
+PROCESS_POOL_MIN_DOCUMENTS = 16
+
+# (start, end, token_count, section) of one chunk in the normalized text
+ChunkSpan = tuple[int, int, int, str | None]
+
+_T = TypeVar("_T")
+
+
+def default_workers() -> int:
+    """Pool size for this machine: usable cores minus one for the event loop.
+
+    Returns:
+        int: At least 1.
+    """
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        cores = os.cpu_count() or 1
+    return max(1, cores - 1)
+
+
+def content_hash(markdown: str) -> str:
+    """SHA-256 hex digest of normalized content (the document dedup key)."""
+    return hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class _Settings:
+    """Picklable recipe for rebuilding the parent's Normalizer and Chunker in a worker."""
+
+    normalizer_backend: str
+    chunk_size: int
+    chunk_overlap: int
+    min_chunk_tokens: int
+    encoding: str
+
+
+@lru_cache(maxsize=4)
+def _components(settings: _Settings) -> tuple[Normalizer, Chunker]:
+    """Per-process Normalizer and Chunker, built on a worker's first task."""
+    return (
+        Normalizer(backend=settings.normalizer_backend),
+        Chunker(
+            chunk_size=settings.chunk_size,
+            chunk_overlap=settings.chunk_overlap,
+            encoding=settings.encoding,
+            min_chunk_tokens=settings.min_chunk_tokens,
+        ),
+    )
+
+
+def _normalize_in_worker(settings: _Settings, text: str) -> tuple[str, str]:
+    normalizer, _ = _components(settings)
+    markdown = normalizer.normalize(text)
+    return markdown, content_hash(markdown)
+
+
+def _chunk_in_worker(settings: _Settings, markdown: str) -> list[ChunkSpan]:
+    _, chunker = _components(settings)
+    return [
+        (chunk.start, chunk.end, chunk.token_count, chunk.section)
+        for chunk in chunker.chunk_text(markdown)
+    ]
+
+
+class DocumentPreparer:
+    """Runs a Normalizer and Chunker in worker threads or a process pool.
+
+    The pool is started on the first pooled call and reused until
+    :meth:`close`. In-process calls use the given instances directly.
+
+    Attributes:
+        normalizer: Normalizer used in-process and mirrored by pool workers.
+        chunker: Chunker used in-process and mirrored by pool workers.
+        workers: Pool size; 1 always prepares in-process.
+        min_pool_documents: Smallest job that is sent to the pool.
+    """
+
+    def __init__(
+        self,
+        normalizer: Normalizer,
+        chunker: Chunker,
+        *,
+        workers: int | None = None,
+        min_pool_documents: int = PROCESS_POOL_MIN_DOCUMENTS,
+    ) -> None:
+        """Initialize the preparer.
+
+        Args:
+            normalizer: Normalizer for HTML-to-Markdown conversion.
+            chunker: Chunker for token-aware chunking.
+            workers: Worker processes (default: usable cores minus one).
+            min_pool_documents: Jobs expecting fewer documents stay in-process.
+
+        Raises:
+            ValueError: If workers is less than 1.
+        """
+        if workers is None:
+            workers = default_workers()
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+
+        self.normalizer = normalizer
+        self.chunker = chunker
+        self.workers = workers
+        self.min_pool_documents = min_pool_documents
+        self._pool: ProcessPoolExecutor | None = None
+        self._settings: _Settings | None = None
+
+    def use_pool(self, expected_documents: int | None) -> bool:
+        """Whether a job of this size should be prepared in the process pool.
+
+        Args:
+            expected_documents: Document limit of the job (None if unbounded).
+
+        Returns:
+            bool: True when the pool has more than one worker and the job is
+                unbounded or at least ``min_pool_documents`` long.
+        """
+        return self.workers > 1 and (
+            expected_documents is None or expected_documents >= self.min_pool_documents
+        )
+
+    async def normalize(self, text: str, *, pooled: bool = False) -> tuple[str, str]:
+        """Normalize raw document text.
+
+        Args:
+            text: Raw HTML or text.
+            pooled: Run in the process pool instead of a worker thread.
+
+        Returns:
+            tuple[str, str]: Normalized Markdown and its content hash.
+        """
+        if pooled:
+            return await self._submit(_normalize_in_worker, text)
+        markdown = await asyncio.to_thread(self.normalizer.normalize, text)
+        return markdown, content_hash(markdown)
+
+    async def chunk(self, markdown: str, *, pooled: bool = False) -> list[TextChunk]:
+        """Chunk normalized Markdown.
+
+        Args:
+            markdown: Normalized document text.
+            pooled: Run in the process pool instead of a worker thread.
+
+        Returns:
+            list[TextChunk]: Chunks with spans, token counts and sections.
+        """
+        if not pooled:
+            return await asyncio.to_thread(self.chunker.chunk_text, markdown)
+        spans = await self._submit(_chunk_in_worker, markdown)
+        return [
+            TextChunk(
+                text=markdown[start:end],
+                start=start,
+                end=end,
+                token_count=token_count,
+                section=section,
+            )
+            for start, end, token_count, section in spans
+        ]
+
+    async def _submit(self, fn: Callable[[_Settings, str], _T], payload: str) -> _T:
+        """Run a worker function in the pool, falling back in-process if it broke."""
+        settings = self._worker_settings()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._ensure_pool(), partial(fn, settings, payload)
+            )
+        except BrokenProcessPool:
+            logger.warning("Document preparation pool broke; restarting it on the next call")
+            self._discard_pool()
+            return await asyncio.to_thread(fn, settings, payload)
+
+    def _worker_settings(self) -> _Settings:
+        if self._settings is None:
+            self._settings = _Settings(
+                normalizer_backend=self.normalizer.backend,
+                chunk_size=self.chunker.chunk_size,
+                chunk_overlap=self.chunker.chunk_overlap,
+                min_chunk_tokens=self.chunker.min_chunk_tokens,
+                encoding=self.chunker.encoding,
+            )
+        return self._settings
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Started document preparation pool with {self.workers} workers")
+        return self._pool
+
+    def _discard_pool(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        """Shut down the process pool, if one was started."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+            logger.debug("Document preparation pool shut down")
+
+
+# Export public API
+__all__ = [
+    "PROCESS_POOL_MIN_DOCUMENTS",
+    "ChunkSpan",
+    "DocumentPreparer",
+    "content_hash",
+    "default_workers",
+]
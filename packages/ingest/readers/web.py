@@ -1,20 +1,35 @@
 """Web document reader using Firecrawl API.
 
-Implements web crawling via LlamaIndex FireCrawlWebReader.
+Implements web crawling via LlamaIndex FireCrawlWebReader, plus a streaming
+path that polls the Firecrawl v2 crawl status API and yields pages as they
+are scraped.
 Per research.md: Use LlamaIndex readers for standardized Document abstraction.
 """
 
+import asyncio
+import contextlib
 import logging
 import time
+from collections.abc import AsyncIterator
+from typing import Any
 
+import httpx
 from llama_index.core import Document
 from llama_index.readers.web import FireCrawlWebReader
 
 from packages.common.config import get_config
-from packages.common.resilience import resilient_external_call
+from packages.common.resilience import resilient_async_call, resilient_external_call
 
 logger = logging.getLogger(__name__)
 
+# Crawl request options that the Firecrawl v2 REST API spells in camelCase
+_CRAWL_FIELD_NAMES = {
+    "scrape_options": "scrapeOptions",
+    "include_paths": "includePaths",
+    "exclude_paths": "excludePaths",
+}
+_CRAWL_FAILED_STATES = frozenset({"failed", "cancelled"})
+
 
 class WebReaderError(Exception):
     """Base exception for WebReader errors."""
@@ -47,6 +62,8 @@ class WebReader:
         firecrawl_api_key: str,
         rate_limit_delay: float = 1.0,
         max_retries: int = 3,
+        poll_interval: float = 2.0,
+        request_timeout: float = 30.0,
     ) -> None:
         """Initialize WebReader with Firecrawl service URL.
 
@@ -55,6 +72,8 @@ class WebReader:
             firecrawl_api_key: API key for Firecrawl service.
             rate_limit_delay: Delay between requests in seconds (default: 1.0).
             max_retries: Maximum number of retry attempts (default: 3).
+            poll_interval: Delay between crawl status polls when streaming (default: 2.0).
+            request_timeout: Timeout for each Firecrawl HTTP request when streaming.
         """
         if not firecrawl_url:
             raise ValueError("firecrawl_url cannot be empty")
@@ -65,6 +84,8 @@ class WebReader:
         self.firecrawl_api_key = firecrawl_api_key
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
+        self.poll_interval = poll_interval
+        self.request_timeout = request_timeout
         self._last_request_time: float = 0.0
 
         logger.info(
@@ -72,14 +93,22 @@ class WebReader:
             f"rate_limit_delay={rate_limit_delay}s, max_retries={max_retries})"
         )
 
+    def _rate_limit_wait(self) -> float:
+        """Seconds to wait before the next request, reserving its time slot."""
+        now = time.time()
+        sleep_time = max(0.0, self._last_request_time + self.rate_limit_delay - now)
+        self._last_request_time = now + sleep_time
+        if sleep_time:
+            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+        return sleep_time
+
     def _enforce_rate_limit(self) -> None:
         """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - elapsed
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        self._last_request_time = time.time()
+        time.sleep(self._rate_limit_wait())
+
+    async def _enforce_rate_limit_async(self) -> None:
+        """Enforce rate limiting without blocking the event loop."""
+        await asyncio.sleep(self._rate_limit_wait())
 
     @resilient_external_call(max_attempts=3, min_wait=1, max_wait=10)
     def _fetch_with_firecrawl(self, url: str, params: dict[str, object]) -> list[Document]:
@@ -116,6 +145,9 @@ class WebReader:
     def load_data(self, url: str, limit: int | None = None) -> list[Document]:
         """Load documents from URL with optional limit.
 
+        Blocks until the whole crawl has finished; prefer :meth:`aiter_data`
+        for large crawls.
+
         Args:
             url: URL to crawl (must start with http:// or https://).
             limit: Optional maximum number of pages to crawl.
@@ -127,17 +159,157 @@ class WebReader:
             ValueError: If URL is invalid or empty.
             WebReaderError: If crawling fails after all retries.
         """
+        self._validate_url(url)
+
+        logger.info(f"Loading data from {url} (limit: {limit})")
+
+        # Enforce rate limiting
+        self._enforce_rate_limit()
+
+        params = self._build_params(limit)
+
+        try:
+            docs = self._fetch_with_firecrawl(url, params)
+            logger.info(f"Loaded {len(docs)} documents from {url}")
+            return docs
+        except Exception as e:
+            logger.error(f"Failed to load {url}: {e}")
+            raise WebReaderError(f"Failed to load {url}") from e
+
+    async def aiter_data(self, url: str, limit: int | None = None) -> AsyncIterator[Document]:
+        """Stream documents from a crawl as Firecrawl scrapes them.
+
+        Starts a Firecrawl crawl job and polls its status, fetching only pages
+        not seen yet (``skip``) and following ``next`` links, so memory stays
+        bounded by one status page regardless of crawl size. The crawl is
+        cancelled if the consumer stops iterating early.
+
+        Args:
+            url: URL to crawl (must start with http:// or https://).
+            limit: Optional maximum number of pages to crawl.
+
+        Yields:
+            Document: LlamaIndex Document per scraped page.
+
+        Raises:
+            ValueError: If URL is invalid or empty.
+            WebReaderError: If the crawl cannot be started, fails or is cancelled.
+        """
+        self._validate_url(url)
+
+        logger.info(f"Streaming data from {url} (limit: {limit})")
+        await self._enforce_rate_limit_async()
+
+        payload = self._crawl_payload(url, self._build_params(limit))
+
+        async with self._create_client() as client:
+            try:
+                crawl_id = await self._start_crawl(client, payload)
+            except (httpx.HTTPError, KeyError, ValueError) as e:
+                logger.error(f"Failed to start crawl of {url}: {e}")
+                raise WebReaderError(f"Failed to load {url}") from e
+
+            finished = False
+            seen = 0
+            try:
+                while True:
+                    next_url: str | None = f"/v2/crawl/{crawl_id}"
+                    params: dict[str, int] | None = {"skip": seen}
+                    status = ""
+                    while next_url is not None:
+                        page = await self._get_crawl_page(client, next_url, params)
+                        # Only the first page of a poll reflects the crawl state we drain to
+                        status = status or str(page.get("status", ""))
+                        for item in page.get("data") or []:
+                            seen += 1
+                            yield self._to_document(item, url)
+                        next_url = page.get("next")
+                        params = None  # next links already carry their own skip
+
+                    if status == "completed":
+                        finished = True
+                        break
+                    if status in _CRAWL_FAILED_STATES:
+                        finished = True
+                        raise WebReaderError(f"Crawl of {url} {status} after {seen} pages")
+
+                    await asyncio.sleep(self.poll_interval)
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to poll crawl {crawl_id} of {url}: {e}")
+                raise WebReaderError(f"Failed to load {url}") from e
+            finally:
+                if not finished:
+                    # Consumer stopped early or polling failed; stop burning crawl credits
+                    with contextlib.suppress(httpx.HTTPError):
+                        await client.delete(f"/v2/crawl/{crawl_id}")
+
+        logger.info(f"Streamed {seen} documents from {url}")
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the HTTP client used for streaming crawls."""
+        return httpx.AsyncClient(
+            base_url=self.firecrawl_url.rstrip("/"),
+            headers={"Authorization": f"Bearer {self.firecrawl_api_key}"},
+            timeout=self.request_timeout,
+        )
+
+    @resilient_async_call(max_attempts=3, min_wait=1, max_wait=10, retry_on=(httpx.ConnectError,))
+    async def _start_crawl(self, client: httpx.AsyncClient, payload: dict[str, Any]) -> str:
+        """Start a Firecrawl crawl job and return its ID."""
+        response = await client.post("/v2/crawl", json=payload)
+        response.raise_for_status()
+        body = response.json()
+        if not body.get("success", True):
+            raise ValueError(body.get("error", "Firecrawl rejected the crawl"))
+        return str(body["id"])
+
+    @resilient_async_call(max_attempts=3, min_wait=1, max_wait=10, retry_on=(httpx.TransportError,))
+    async def _get_crawl_page(
+        self, client: httpx.AsyncClient, url: str, params: dict[str, int] | None
+    ) -> dict[str, Any]:
+        """Fetch one crawl status page."""
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        page: dict[str, Any] = response.json()
+        return page
+
+    @staticmethod
+    def _to_document(item: dict[str, Any], source_url: str) -> Document:
+        """Convert a Firecrawl page to a LlamaIndex Document."""
+        metadata = dict(item.get("metadata") or {})
+        metadata["source_url"] = source_url
+        return Document(text=item.get("markdown") or "", metadata=metadata)
+
+    @staticmethod
+    def _crawl_payload(url: str, params: dict[str, object]) -> dict[str, object]:
+        """Build the Firecrawl v2 crawl request body from reader params."""
+        payload: dict[str, object] = {"url": url}
+        for key, value in params.items():
+            payload[_CRAWL_FIELD_NAMES.get(key, key)] = value
+        return payload
+
+    @staticmethod
+    def _validate_url(url: str) -> None:
+        """Reject empty or non-HTTP(S) URLs.
+
+        Raises:
+            ValueError: If URL is invalid or empty.
+        """
         if not url:
             raise ValueError("URL cannot be empty")
 
         if not url.startswith(("http://", "https://")):
             raise ValueError(f"Invalid URL: {url}")
 
-        logger.info(f"Loading data from {url} (limit: {limit})")
+    def _build_params(self, limit: int | None) -> dict[str, object]:
+        """Build Firecrawl crawl params from configuration.
 
-        # Enforce rate limiting
-        self._enforce_rate_limit()
+        Args:
+            limit: Optional maximum number of pages to crawl.
 
+        Returns:
+            dict[str, object]: Crawl params in Firecrawl SDK (snake_case) form.
+        """
         # Get locale config from environment (defaults to US/en-US)
         config = get_config()
 
@@ -179,10 +351,4 @@ class WebReader:
         if exclude_paths:
             params["exclude_paths"] = exclude_paths
 
-        try:
-            docs = self._fetch_with_firecrawl(url, params)
-            logger.info(f"Loaded {len(docs)} documents from {url}")
-            return docs
-        except Exception as e:
-            logger.error(f"Failed to load {url}: {e}")
-            raise WebReaderError(f"Failed to load {url}") from e
+        return params
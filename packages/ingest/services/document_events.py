@@ -3,51 +3,162 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Coroutine
-from typing import Any, Protocol
+import contextlib
+import logging
+from collections.abc import Sequence
+from typing import Protocol
 
 from packages.core.events import DocumentIngestedEvent
 from packages.schemas.models import Document
 
+logger = logging.getLogger(__name__)
+
 
 class SupportsDocumentEventPublish(Protocol):
     async def publish_document_ingested(self, event: DocumentIngestedEvent) -> None: ...
 
+    async def publish_many(self, events: Sequence[DocumentIngestedEvent]) -> None: ...
+
 
 class DocumentEventDispatcher:
-    """Dispatches ingestion events through the configured publisher."""
+    """Buffers ingestion events and publishes them in batches.
+
+    ``dispatch_document_ingested`` only appends to an in-memory buffer. A
+    long-lived background task on the caller's event loop flushes the buffer
+    with one pipelined publish whenever ``max_batch_size`` events are queued or
+    ``flush_interval`` seconds have passed. ``aclose`` flushes whatever is
+    left, so no dispatched event is dropped on shutdown.
+
+    The publisher's async client is bound to the caller's event loop, so the
+    dispatcher must be used from inside that loop.
+    """
 
     def __init__(
         self,
         publisher: SupportsDocumentEventPublish | None,
         *,
         enabled: bool,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_buffer_size: int = 10_000,
     ) -> None:
+        """Initialize DocumentEventDispatcher.
+
+        Args:
+            publisher: Publisher receiving batched events.
+            enabled: Feature flag; when False dispatching is a no-op.
+            max_batch_size: Buffered events that trigger an immediate flush.
+            flush_interval: Longest time an event waits in the buffer.
+            max_buffer_size: Events retained while the publisher is failing;
+                the oldest are dropped beyond this.
+        """
         self._publisher = publisher
         self._enabled = enabled
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+
+        self._buffer: list[DocumentIngestedEvent] = []
+        self._flusher: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be published."""
+        return len(self._buffer)
 
     def dispatch_document_ingested(self, document: Document, *, chunk_count: int) -> None:
-        """Emit a DocumentIngestedEvent if feature flag is enabled."""
+        """Queue a DocumentIngestedEvent if feature flag is enabled.
+
+        Raises:
+            RuntimeError: If called without a running event loop.
+        """
 
         if not self._enabled or self._publisher is None:
             return
 
-        event = DocumentIngestedEvent(
-            doc_id=document.doc_id,
-            source_url=document.source_url,
-            chunk_count=chunk_count,
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                "DocumentEventDispatcher must be used from a running event loop"
+            ) from None
+
+        self._buffer.append(
+            DocumentIngestedEvent(
+                doc_id=document.doc_id,
+                source_url=document.source_url,
+                chunk_count=chunk_count,
+            )
         )
 
-        self._run_async(self._publisher.publish_document_ingested(event))
+        self._ensure_flusher(loop)
+        if len(self._buffer) >= self.max_batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Publish all buffered events with one pipelined call."""
+
+        if self._publisher is None or not self._buffer:
+            return
 
-    @staticmethod
-    def _run_async(coro: Coroutine[Any, Any, None]) -> None:
+        # Swapping the buffer before awaiting gives concurrent flushes disjoint batches
+        batch, self._buffer = self._buffer, []
         try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            asyncio.run(coro)
-        else:
-            loop.create_task(coro)
+            await self._publisher.publish_many(batch)
+        except Exception:
+            logger.exception("Failed to publish %s document events", len(batch))
+            # Keep events for the next flush, bounded so memory cannot grow forever
+            self._buffer = (batch + self._buffer)[-self.max_buffer_size :]
+            raise
+
+    async def aclose(self) -> None:
+        """Stop the background flusher and publish any remaining events."""
+
+        self._closed = True
+        if self._flusher is not None:
+            # A flusher bound to another (finished) loop cannot be awaited here
+            if self._loop is asyncio.get_running_loop():
+                if self._wakeup is not None:
+                    self._wakeup.set()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._flusher
+            self._flusher = None
+
+        try:
+            await self.flush()
+        except Exception:
+            logger.error("Dropped %s unpublished document events on close", len(self._buffer))
+            self._buffer = []
+
+    def _ensure_flusher(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the background flusher on ``loop`` if it is not running."""
+
+        if self._closed:
+            return
+        if self._flusher is not None and not self._flusher.done() and self._loop is loop:
+            return
+
+        # The wakeup event is bound to a single loop; recreate it per loop
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._flusher = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Flush on size (wakeup) or time thresholds until closed."""
+
+        assert self._wakeup is not None
+        while not self._closed:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # Logged in flush(); retried on the next tick
+                await asyncio.sleep(self.flush_interval)
 
 
 __all__ = ["DocumentEventDispatcher"]
@@ -35,6 +35,7 @@ class ExtractionState(str, Enum):
     """Extraction states for documents and jobs."""
 
     PENDING = "pending"
+    PROCESSING = "processing"  # Leased by an extraction worker (documents only)
     TIER_A_DONE = "tier_a_done"
     TIER_B_DONE = "tier_b_done"
     TIER_C_DONE = "tier_c_done"
@@ -4,6 +4,7 @@ Provides:
 - Qdrant client for vector storage and collection management
 - Collection configuration and creation utilities
 - Batched writer for efficient upserts with metadata
+- Local memory-mapped embedding store for offline rebuilds
 - Hybrid search and reranking capabilities
 """
 
@@ -13,6 +14,11 @@ from packages.vector.collections import (
     create_qdrant_collections,
     load_collection_config,
 )
+from packages.vector.embedding_store import (
+    EmbeddingStoreError,
+    LocalEmbeddingStore,
+    chunk_content_hash,
+)
 from packages.vector.qdrant_client import QdrantConnectionError, QdrantVectorClient
 from packages.vector.writer import QdrantWriteError, QdrantWriter
 
@@ -28,4 +34,8 @@ __all__ = [
     # Writer
     "QdrantWriter",
     "QdrantWriteError",
+    # Embedding store
+    "LocalEmbeddingStore",
+    "EmbeddingStoreError",
+    "chunk_content_hash",
 ]
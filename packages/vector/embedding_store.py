@@ -0,0 +1,380 @@
+"""Append-only local embedding store for offline re-indexing.
+
+Keeps every vector written to Qdrant on local disk so a collection can be
+rebuilt (new HNSW/optimizer settings, new versioned collection) without
+re-embedding the corpus through TEI.
+
+Layout under the store directory:
+- ``meta.json``: vector dimension and embedding model id
+- ``vectors.f32``: float32 matrix, one row per distinct chunk content hash,
+  read back through ``numpy.memmap``
+- ``index.jsonl``: ``{"hash", "row"}`` per stored row
+- ``points.jsonl``: ``{"id", "hash", "payload"}`` per written point, or
+  ``{"id", "deleted": true}`` tombstone per deleted point; the latest record
+  for an id wins
+- ``.lock``: ``flock`` guarding appends from concurrent processes
+
+All files are append-only. A crash can leave a partial last row or line;
+both are ignored on read and the torn row is truncated on the next append.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import orjson
+from numpy.typing import NDArray
+
+from packages.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+_ROW_DTYPE = np.dtype("<f4")
+
+
+class EmbeddingStoreError(Exception):
+    """Raised when the local embedding store is unusable or misconfigured."""
+
+    pass
+
+
+def chunk_content_hash(content: str) -> str:
+    """Content hash used to deduplicate stored vectors."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class StoredBatch:
+    """A batch of points read back from the store.
+
+    Attributes:
+        ids: Qdrant point ids.
+        vectors: ``(len(ids), dim)`` float32 matrix.
+        payloads: Qdrant payloads aligned with ``ids``.
+    """
+
+    ids: list[str]
+    vectors: NDArray[np.float32]
+    payloads: list[dict[str, Any]]
+
+
+class LocalEmbeddingStore:
+    """Memory-mapped, append-only store of point vectors and payloads.
+
+    Example:
+        >>> store = LocalEmbeddingStore("/data/embeddings", dim=1024)
+        >>> store.append(ids, vectors, payloads, hashes)
+        >>> for batch in store.iter_batches(1000):
+        ...     client.upsert(collection, points=models.Batch(...))
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        dim: int = 1024,
+        model_id: str | None = None,
+    ) -> None:
+        """Open (or create) a store.
+
+        Args:
+            directory: Store directory; created if missing.
+            dim: Vector dimension.
+            model_id: Embedding model id recorded on creation and checked on open.
+
+        Raises:
+            EmbeddingStoreError: If the existing store has another dim or model.
+        """
+        if dim <= 0:
+            raise ValueError("dim must be positive")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self.model_id = model_id
+
+        self._vectors_path = self.directory / "vectors.f32"
+        self._index_path = self.directory / "index.jsonl"
+        self._points_path = self.directory / "points.jsonl"
+        self._lock_path = self.directory / ".lock"
+        self._row_bytes = dim * _ROW_DTYPE.itemsize
+
+        self._thread_lock = threading.Lock()
+        self._rows: dict[str, int] = {}
+        self._index_offset = 0
+
+        self._check_meta()
+
+    @property
+    def row_count(self) -> int:
+        """Complete vector rows on disk."""
+        try:
+            return self._vectors_path.stat().st_size // self._row_bytes
+        except FileNotFoundError:
+            return 0
+
+    def append(
+        self,
+        ids: Sequence[str],
+        vectors: NDArray[np.float32] | Sequence[Sequence[float]],
+        payloads: Sequence[dict[str, Any]],
+        hashes: Sequence[str],
+    ) -> int:
+        """Append points; vectors are stored once per content hash.
+
+        Args:
+            ids: Qdrant point ids.
+            vectors: Vectors aligned with ``ids``.
+            payloads: Payloads aligned with ``ids``.
+            hashes: Content hash per point (see :func:`chunk_content_hash`).
+
+        Returns:
+            int: Number of new vector rows written.
+
+        Raises:
+            ValueError: If inputs are misaligned or vectors have the wrong dimension.
+        """
+        matrix = np.ascontiguousarray(vectors, dtype=_ROW_DTYPE)
+        if not (len(ids) == len(payloads) == len(hashes) == len(matrix)):
+            raise ValueError("ids, vectors, payloads and hashes must have the same length")
+        if len(ids) == 0:
+            return 0
+        if matrix.ndim != 2 or matrix.shape[1] != self.dim:
+            raise ValueError(f"Vectors must have shape (n, {self.dim}), got {matrix.shape}")
+
+        with self._thread_lock, self._file_lock():
+            self._refresh_index()
+            next_row = self._truncate_torn_row()
+
+            new_rows: list[int] = []
+            index_lines: list[bytes] = []
+            for position, content_hash in enumerate(hashes):
+                if content_hash in self._rows:
+                    continue
+                self._rows[content_hash] = next_row
+                index_lines.append(orjson.dumps({"hash": content_hash, "row": next_row}) + b"\n")
+                new_rows.append(position)
+                next_row += 1
+
+            # Vectors first so an index line never points past the matrix
+            if new_rows:
+                with self._vectors_path.open("ab") as handle:
+                    handle.write(matrix[new_rows].tobytes())
+                with self._index_path.open("ab") as handle:
+                    handle.write(b"".join(index_lines))
+                self._index_offset = self._index_path.stat().st_size
+
+            point_lines = [
+                orjson.dumps({"id": str(point_id), "hash": content_hash, "payload": payload})
+                + b"\n"
+                for point_id, content_hash, payload in zip(ids, hashes, payloads, strict=True)
+            ]
+            with self._points_path.open("ab") as handle:
+                handle.write(b"".join(point_lines))
+
+        return len(new_rows)
+
+    def append_payloads(
+        self,
+        ids: Sequence[str],
+        payloads: Sequence[dict[str, Any]],
+        hashes: Sequence[str],
+    ) -> None:
+        """Append new point records that reuse already stored vectors.
+
+        Used when only a point's payload changed in Qdrant (e.g. a moved
+        chunk's ``position``), so a rebuild restores the current payload.
+
+        Args:
+            ids: Qdrant point ids.
+            payloads: Full payloads aligned with ``ids``.
+            hashes: Content hash per point; points whose hash has no stored
+                vector are still skipped by :meth:`iter_batches`.
+
+        Raises:
+            ValueError: If inputs are misaligned.
+        """
+        if not (len(ids) == len(payloads) == len(hashes)):
+            raise ValueError("ids, payloads and hashes must have the same length")
+        if not ids:
+            return
+
+        lines = [
+            orjson.dumps({"id": str(point_id), "hash": content_hash, "payload": payload}) + b"\n"
+            for point_id, content_hash, payload in zip(ids, hashes, payloads, strict=True)
+        ]
+        with self._thread_lock, self._file_lock(), self._points_path.open("ab") as handle:
+            handle.write(b"".join(lines))
+
+    def delete(self, ids: Sequence[str]) -> None:
+        """Append tombstones so deleted points are left out of rebuilds.
+
+        Vector rows are kept: other points (or a later re-ingest) may share
+        the same content hash.
+
+        Args:
+            ids: Qdrant point ids deleted from the collection.
+        """
+        if not ids:
+            return
+
+        lines = [orjson.dumps({"id": str(point_id), "deleted": True}) + b"\n" for point_id in ids]
+        with self._thread_lock, self._file_lock(), self._points_path.open("ab") as handle:
+            handle.write(b"".join(lines))
+
+    def get(self, content_hash: str) -> NDArray[np.float32] | None:
+        """Return the stored vector for a content hash, if any."""
+        with self._thread_lock:
+            self._refresh_index()
+            row = self._rows.get(content_hash)
+        if row is None or row >= self.row_count:
+            return None
+        return np.array(self.vectors()[row])
+
+    def vectors(self) -> NDArray[np.float32]:
+        """Read-only memory map over all complete vector rows."""
+        rows = self.row_count
+        if rows == 0:
+            return np.empty((0, self.dim), dtype=_ROW_DTYPE)
+        return np.memmap(self._vectors_path, dtype=_ROW_DTYPE, mode="r", shape=(rows, self.dim))
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[StoredBatch]:
+        """Stream the latest record of every live point in write order.
+
+        Two sequential passes over ``points.jsonl``: the first finds each id's
+        latest record, the second yields those records with vectors gathered
+        from the memory map, so memory stays proportional to the id count.
+        Points whose latest record is a tombstone are skipped.
+
+        Args:
+            batch_size: Points per yielded batch.
+
+        Yields:
+            StoredBatch: Ids, float32 vectors and payloads.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        with self._thread_lock:
+            self._refresh_index()
+            rows = dict(self._rows)
+        matrix = self.vectors()
+
+        latest: dict[str, int] = {}
+        for offset, record in self._read_points():
+            latest[record["id"]] = offset
+
+        ids: list[str] = []
+        vector_rows: list[int] = []
+        payloads: list[dict[str, Any]] = []
+        for offset, record in self._read_points():
+            if latest.get(record["id"]) != offset or record.get("deleted"):
+                continue
+            row = rows.get(record["hash"])
+            if row is None or row >= len(matrix):
+                continue
+            ids.append(record["id"])
+            vector_rows.append(row)
+            payloads.append(record["payload"])
+            if len(ids) >= batch_size:
+                yield StoredBatch(ids, np.asarray(matrix[vector_rows]), payloads)
+                ids, vector_rows, payloads = [], [], []
+
+        if ids:
+            yield StoredBatch(ids, np.asarray(matrix[vector_rows]), payloads)
+
+    def _read_points(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield ``(byte offset, record)`` for every complete points line."""
+        if not self._points_path.exists():
+            return
+        with self._points_path.open("rb") as handle:
+            offset = 0
+            for line in handle:
+                start, offset = offset, offset + len(line)
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    yield start, orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.warning(
+                        "Skipping corrupt embedding store record",
+                        extra={"path": str(self._points_path), "offset": start},
+                    )
+
+    def _refresh_index(self) -> None:
+        """Load index lines appended since the last read (by any process)."""
+        if not self._index_path.exists():
+            return
+        with self._index_path.open("rb") as handle:
+            handle.seek(self._index_offset)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                self._index_offset += len(line)
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                self._rows[record["hash"]] = int(record["row"])
+
+    def _truncate_torn_row(self) -> int:
+        """Drop a partially written last row; return the next row number."""
+        if not self._vectors_path.exists():
+            return 0
+        size = self._vectors_path.stat().st_size
+        rows, torn = divmod(size, self._row_bytes)
+        if torn:
+            logger.warning(
+                "Truncating partial row in embedding store",
+                extra={"path": str(self._vectors_path), "bytes": torn},
+            )
+            with self._vectors_path.open("r+b") as handle:
+                handle.truncate(rows * self._row_bytes)
+        return rows
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive advisory lock shared by all processes using the store."""
+        with self._lock_path.open("a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _check_meta(self) -> None:
+        """Create meta.json, or verify it matches this store's settings."""
+        meta_path = self.directory / "meta.json"
+        if not meta_path.exists():
+            meta_path.write_bytes(orjson.dumps({"dim": self.dim, "model": self.model_id}))
+            return
+
+        meta = orjson.loads(meta_path.read_bytes())
+        if meta.get("dim") != self.dim:
+            raise EmbeddingStoreError(
+                f"Embedding store {self.directory} holds {meta.get('dim')}-dim vectors, "
+                f"expected {self.dim}"
+            )
+        stored_model = meta.get("model")
+        if self.model_id and stored_model and stored_model != self.model_id:
+            raise EmbeddingStoreError(
+                f"Embedding store {self.directory} was written by model {stored_model!r}, "
+                f"not {self.model_id!r}"
+            )
+
+
+# Export public API
+__all__ = [
+    "EmbeddingStoreError",
+    "LocalEmbeddingStore",
+    "StoredBatch",
+    "chunk_content_hash",
+]
@@ -10,6 +10,9 @@ Per MIGRATIONS.md:
 - Adding payload fields: No downtime (points accept new keys)
 - Changing vector params: Create new collection, dual-write, switch alias
 - HNSW/optimizer changes: Safe in place, monitor recall and latency
+
+Collections can also be rebuilt into a new version from the local embedding
+store (see ``packages.vector.embedding_store``) without re-embedding.
 """
 
 from __future__ import annotations
@@ -19,13 +22,21 @@ from contextlib import suppress
 from typing import Any
 
 from qdrant_client import QdrantClient
+from qdrant_client.http import models
 from qdrant_client.models import Distance, VectorParams
 
 from packages.common.logging import get_logger
+from packages.vector.collections import create_collection
+from packages.vector.embedding_store import LocalEmbeddingStore
 
 logger = get_logger(__name__)
 
 
+def versioned_collection_name(collection_name: str, version: str) -> str:
+    """Physical collection name for a version (``1.0.0`` -> ``name_v1_0_0``)."""
+    return f"{collection_name}_v{version.replace('.', '_')}"
+
+
 class QdrantMigration:
     """Qdrant collection versioning and migration manager.
 
@@ -81,8 +92,7 @@ class QdrantMigration:
             ... )
             'taboot_documents_v1_0_0'
         """
-        # Create versioned collection name (replace dots with underscores)
-        versioned_name = f"{collection_name}_v{version.replace('.', '_')}"
+        versioned_name = versioned_collection_name(collection_name, version)
 
         logger.info(
             "Creating versioned Qdrant collection",
@@ -130,7 +140,7 @@ class QdrantMigration:
             >>> # Rollback to previous version
             >>> migration.switch_alias("taboot_documents", "1.0.0")
         """
-        versioned_name = f"{collection_name}_v{target_version.replace('.', '_')}"
+        versioned_name = versioned_collection_name(collection_name, target_version)
 
         # Verify target collection exists
         collections = self.client.get_collections().collections
@@ -156,6 +166,109 @@ class QdrantMigration:
             extra={"alias": collection_name, "versioned_name": versioned_name},
         )
 
+    def rebuild_from_store(
+        self,
+        store: LocalEmbeddingStore,
+        collection_name: str,
+        version: str,
+        *,
+        batch_size: int = 1000,
+        force: bool = False,
+    ) -> int:
+        """Rebuild a collection as a new version from the local embedding store.
+
+        Creates the versioned collection with the contract settings (HNSW,
+        optimizers, WAL), streams every stored point into it, then points the
+        alias at it. The previous version is left in place for rollback.
+
+        The alias is only switched when the rebuilt collection holds as many
+        points as the live one, so a store that missed writes (e.g. one
+        enabled after ingestion started) cannot silently shrink the corpus.
+        On a mismatch the new collection is dropped unless ``force`` is set.
+
+        Args:
+            store: Local embedding store written during ingestion.
+            collection_name: Base collection name (alias).
+            version: New version string (e.g., "2.0.0").
+            batch_size: Points per upsert request.
+            force: Switch the alias even if the point counts differ.
+
+        Returns:
+            int: Number of points written.
+
+        Raises:
+            ValueError: If the target version exists, ``collection_name`` is
+                a physical collection rather than an alias, or the store does
+                not cover the live collection and ``force`` is not set.
+
+        Example:
+            >>> store = LocalEmbeddingStore("/data/embeddings")
+            >>> migration.rebuild_from_store(store, "taboot_documents", "2.0.0")
+            184223
+        """
+        versioned_name = versioned_collection_name(collection_name, version)
+
+        existing = {c.name for c in self.client.get_collections().collections}
+        if versioned_name in existing:
+            raise ValueError(f"Target collection {versioned_name} already exists")
+        if collection_name in existing:
+            raise ValueError(
+                f"{collection_name} is a collection, not an alias; "
+                "migrate it to a versioned collection before rebuilding"
+            )
+
+        logger.info(
+            "Rebuilding Qdrant collection from local embedding store",
+            extra={
+                "alias": collection_name,
+                "versioned_name": versioned_name,
+                "store": str(store.directory),
+                "stored_vectors": store.row_count,
+            },
+        )
+
+        create_collection(self.client, versioned_name)
+
+        written = 0
+        for batch in store.iter_batches(batch_size):
+            self.client.upsert(
+                collection_name=versioned_name,
+                points=models.Batch(
+                    ids=batch.ids,
+                    vectors=batch.vectors.tolist(),
+                    payloads=batch.payloads,
+                ),
+                wait=True,
+            )
+            written += len(batch.ids)
+            logger.debug(
+                "Rebuild batch written",
+                extra={"versioned_name": versioned_name, "points_written": written},
+            )
+
+        live = self._alias_points_count(collection_name)
+        if live is not None and live != written:
+            if not force:
+                self.client.delete_collection(collection_name=versioned_name)
+                raise ValueError(
+                    f"Embedding store holds {written} points but {collection_name} has "
+                    f"{live}; dropped {versioned_name} and kept the current alias "
+                    "(pass force to switch anyway)"
+                )
+            logger.warning(
+                "Switching alias to rebuilt collection with a different point count",
+                extra={"alias": collection_name, "live_points": live, "points": written},
+            )
+
+        self._update_alias(collection_name, versioned_name)
+
+        logger.info(
+            "Qdrant collection rebuilt and alias switched",
+            extra={"alias": collection_name, "versioned_name": versioned_name, "points": written},
+        )
+
+        return written
+
     def list_versions(self, collection_name: str) -> list[str]:
         """List all versions of a collection.
 
@@ -215,13 +328,54 @@ class QdrantMigration:
             )
             return None
 
+    def _alias_points_count(self, alias_name: str) -> int | None:
+        """Point count of the collection behind an alias, or None if it is unset.
+
+        Args:
+            alias_name: Alias name.
+
+        Returns:
+            int | None: Exact point count of the aliased collection.
+        """
+        aliases = {alias.alias_name for alias in self.client.get_aliases().aliases}
+        if alias_name not in aliases:
+            return None
+        return self.client.count(collection_name=alias_name, exact=True).count
+
     def _update_alias(self, alias_name: str, collection_name: str) -> None:
         """Update or create collection alias.
 
+        Uses a single atomic ``update_collection_aliases`` call when the client
+        supports it, so searches never see a missing alias mid-switch.
+
         Args:
             alias_name: Alias name.
             collection_name: Target collection name.
         """
+        update_aliases: Callable[..., Any] | None = getattr(
+            self.client, "update_collection_aliases", None
+        )
+        if update_aliases:
+            # Deleting a non-existent alias fails the whole request, so only
+            # delete when the alias is already defined
+            existing = {alias.alias_name for alias in self.client.get_aliases().aliases}
+            operations: list[models.AliasOperations] = []
+            if alias_name in existing:
+                operations.append(
+                    models.DeleteAliasOperation(
+                        delete_alias=models.DeleteAlias(alias_name=alias_name)
+                    )
+                )
+            operations.append(
+                models.CreateAliasOperation(
+                    create_alias=models.CreateAlias(
+                        collection_name=collection_name, alias_name=alias_name
+                    )
+                )
+            )
+            update_aliases(change_aliases_operations=operations)
+            return
+
         # Delete existing alias if it exists
         with suppress(Exception):
             delete_alias: Callable[..., Any] | None = getattr(self.client, "delete_alias", None)
@@ -235,4 +389,4 @@ class QdrantMigration:
 
 
 # Export public API
-__all__ = ["QdrantMigration"]
+__all__ = ["QdrantMigration", "versioned_collection_name"]
@@ -5,21 +5,36 @@ Provides:
 - Metadata mapping from Chunk model to Qdrant payload
 - Point ID generation from chunk_id
 - Error handling with proper exceptions
+- Vectorized validation and columnar batches for float32 ndarray embeddings
+- Optional copy of every written vector into a LocalEmbeddingStore
+- Chunk-level reconciliation of re-ingested documents (stale point deletion)
 
 All operations use JSON structured logging and correlation ID tracking.
 """
 
+import asyncio
 import uuid
 from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
 
+import numpy as np
+from numpy.typing import NDArray
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 
 from packages.common.logging import get_logger
 from packages.schemas.models import Chunk
+from packages.vector.embedding_store import LocalEmbeddingStore, chunk_content_hash
 
 logger = get_logger(__name__)
 
+EMBEDDING_DIM = 1024  # Qwen3-Embedding-0.6B
+SCROLL_PAGE_SIZE = 1000  # Points fetched per scroll request when diffing a document
+
+# Either one list per vector or a float32 matrix (rows may also be ndarray views)
+Embeddings = Sequence[list[float]] | Sequence[NDArray[np.float32]] | NDArray[np.float32]
+
 
 class QdrantWriteError(Exception):
     """Raised when Qdrant write operation fails."""
@@ -37,6 +52,7 @@ class QdrantWriter:
         client: The underlying QdrantClient instance.
         collection_name: Name of the Qdrant collection.
         batch_size: Maximum points per batch (default 100).
+        embedding_store: Optional local store receiving every written vector.
 
     Example:
         >>> writer = QdrantWriter(
@@ -55,6 +71,7 @@ class QdrantWriter:
         url: str,
         collection_name: str,
         batch_size: int = 100,
+        embedding_store: LocalEmbeddingStore | None = None,
     ) -> None:
         """Initialize Qdrant writer.
 
@@ -62,6 +79,8 @@ class QdrantWriter:
             url: Qdrant server URL (e.g., "http://localhost:6333").
             collection_name: Name of the collection to write to.
             batch_size: Maximum points per batch (must be positive).
+            embedding_store: Optional local store; vectors are appended after each
+                successful upsert so the collection can be rebuilt without TEI.
 
         Raises:
             ValueError: If batch_size is not positive.
@@ -71,6 +90,7 @@ class QdrantWriter:
 
         self.collection_name = collection_name
         self.batch_size = batch_size
+        self.embedding_store = embedding_store
         self.client = QdrantClient(url=url)
 
         logger.info(
@@ -79,6 +99,7 @@ class QdrantWriter:
                 "url": url,
                 "collection_name": collection_name,
                 "batch_size": batch_size,
+                "embedding_store": str(embedding_store.directory) if embedding_store else None,
             },
         )
 
@@ -97,7 +118,7 @@ class QdrantWriter:
     def upsert_batch(
         self,
         chunks: Sequence[Chunk],
-        embeddings: Sequence[list[float]],
+        embeddings: Embeddings,
     ) -> None:
         """Upsert a batch of points with metadata.
 
@@ -105,7 +126,8 @@ class QdrantWriter:
 
         Args:
             chunks: Sequence of Chunk objects.
-            embeddings: Sequence of embedding vectors (1024-dimensional each).
+            embeddings: Embedding vectors (1024-dimensional each), as lists or as a
+                float32 ndarray of shape (n, 1024).
 
         Raises:
             ValueError: If chunks and embeddings have different lengths.
@@ -117,16 +139,7 @@ class QdrantWriter:
             logger.debug("Empty batch, skipping upsert")
             return
 
-        # Validate inputs
-        if len(chunks) != len(embeddings):
-            raise ValueError("chunks and embeddings must have the same length")
-
-        # Validate embedding dimensions (1024 for Qwen3-Embedding-0.6B)
-        for i, emb in enumerate(embeddings):
-            if len(emb) != 1024:
-                raise ValueError(
-                    f"All embeddings must be 1024-dimensional, got {len(emb)} at index {i}"
-                )
+        embeddings = _validate_embeddings(chunks, embeddings)
 
         correlation_id = str(uuid.uuid4())
         total_chunks = len(chunks)
@@ -171,7 +184,7 @@ class QdrantWriter:
     def _upsert_batch_internal(
         self,
         chunks: Sequence[Chunk],
-        embeddings: Sequence[list[float]],
+        embeddings: Embeddings,
         correlation_id: str,
         batch_idx: int,
         num_batches: int,
@@ -188,25 +201,7 @@ class QdrantWriter:
         Raises:
             QdrantWriteError: If upsert operation fails.
         """
-        # Build points
-        points = []
-        for chunk, embedding in zip(chunks, embeddings, strict=True):
-            point = models.PointStruct(
-                id=str(chunk.chunk_id),
-                vector=embedding,
-                payload={
-                    "doc_id": str(chunk.doc_id),
-                    "content": chunk.content,
-                    "section": chunk.section,
-                    "position": chunk.position,
-                    "token_count": chunk.token_count,
-                    "source_url": chunk.source_url,
-                    "source_type": chunk.source_type.value,
-                    "ingested_at": chunk.ingested_at,
-                    "tags": chunk.tags,
-                },
-            )
-            points.append(point)
+        points = _build_points(chunks, embeddings)
 
         logger.debug(
             "Upserting batch",
@@ -214,7 +209,7 @@ class QdrantWriter:
                 "correlation_id": correlation_id,
                 "batch_idx": batch_idx + 1,
                 "num_batches": num_batches,
-                "batch_size": len(points),
+                "batch_size": len(chunks),
             },
         )
 
@@ -229,7 +224,7 @@ class QdrantWriter:
                 extra={
                     "correlation_id": correlation_id,
                     "batch_idx": batch_idx + 1,
-                    "batch_size": len(points),
+                    "batch_size": len(chunks),
                     "error": str(e),
                 },
             )
@@ -237,20 +232,22 @@ class QdrantWriter:
                 f"Failed to upsert points to collection '{self.collection_name}': {e}"
             ) from e
 
+        self._record(chunks, embeddings)
+
         logger.debug(
             "Batch upserted successfully",
             extra={
                 "correlation_id": correlation_id,
                 "batch_idx": batch_idx + 1,
                 "num_batches": num_batches,
-                "batch_size": len(points),
+                "batch_size": len(chunks),
             },
         )
 
     async def upsert_batch_async(
         self,
         chunks: Sequence[Chunk],
-        embeddings: Sequence[list[float]],
+        embeddings: Embeddings,
     ) -> None:
         """Upsert a batch of points with metadata asynchronously.
 
@@ -258,7 +255,8 @@ class QdrantWriter:
 
         Args:
             chunks: Sequence of Chunk objects.
-            embeddings: Sequence of embedding vectors (1024-dimensional each).
+            embeddings: Embedding vectors (1024-dimensional each), as lists or as a
+                float32 ndarray of shape (n, 1024).
 
         Raises:
             ValueError: If chunks and embeddings have different lengths.
@@ -270,16 +268,7 @@ class QdrantWriter:
             logger.debug("Empty batch, skipping upsert")
             return
 
-        # Validate inputs
-        if len(chunks) != len(embeddings):
-            raise ValueError("chunks and embeddings must have the same length")
-
-        # Validate embedding dimensions (1024 for Qwen3-Embedding-0.6B)
-        for i, emb in enumerate(embeddings):
-            if len(emb) != 1024:
-                raise ValueError(
-                    f"All embeddings must be 1024-dimensional, got {len(emb)} at index {i}"
-                )
+        embeddings = _validate_embeddings(chunks, embeddings)
 
         correlation_id = str(uuid.uuid4())
         total_chunks = len(chunks)
@@ -324,7 +313,7 @@ class QdrantWriter:
     async def _upsert_batch_internal_async(
         self,
         chunks: Sequence[Chunk],
-        embeddings: Sequence[list[float]],
+        embeddings: Embeddings,
         correlation_id: str,
         batch_idx: int,
         num_batches: int,
@@ -341,25 +330,7 @@ class QdrantWriter:
         Raises:
             QdrantWriteError: If upsert operation fails.
         """
-        # Build points
-        points = []
-        for chunk, embedding in zip(chunks, embeddings, strict=True):
-            point = models.PointStruct(
-                id=str(chunk.chunk_id),
-                vector=embedding,
-                payload={
-                    "doc_id": str(chunk.doc_id),
-                    "content": chunk.content,
-                    "section": chunk.section,
-                    "position": chunk.position,
-                    "token_count": chunk.token_count,
-                    "source_url": chunk.source_url,
-                    "source_type": chunk.source_type.value,
-                    "ingested_at": chunk.ingested_at,
-                    "tags": chunk.tags,
-                },
-            )
-            points.append(point)
+        points = _build_points(chunks, embeddings)
 
         logger.debug(
             "Upserting batch asynchronously",
@@ -367,7 +338,7 @@ class QdrantWriter:
                 "correlation_id": correlation_id,
                 "batch_idx": batch_idx + 1,
                 "num_batches": num_batches,
-                "batch_size": len(points),
+                "batch_size": len(chunks),
             },
         )
 
@@ -375,8 +346,6 @@ class QdrantWriter:
             # Note: Qdrant client's upsert is synchronous, but we wrap it in async context
             # For true async, we'd need AsyncQdrantClient, but that requires more refactoring
             # This is acceptable as the network I/O is still non-blocking via httpx
-            import asyncio
-
             await asyncio.to_thread(
                 self.client.upsert,
                 collection_name=self.collection_name,
@@ -388,7 +357,7 @@ class QdrantWriter:
                 extra={
                     "correlation_id": correlation_id,
                     "batch_idx": batch_idx + 1,
-                    "batch_size": len(points),
+                    "batch_size": len(chunks),
                     "error": str(e),
                 },
             )
@@ -396,15 +365,186 @@ class QdrantWriter:
                 f"Failed to upsert points to collection '{self.collection_name}': {e}"
             ) from e
 
+        if self.embedding_store is not None:
+            await asyncio.to_thread(self._record, chunks, embeddings)
+
         logger.debug(
             "Batch upserted successfully (async)",
             extra={
                 "correlation_id": correlation_id,
                 "batch_idx": batch_idx + 1,
                 "num_batches": num_batches,
-                "batch_size": len(points),
+                "batch_size": len(chunks),
+            },
+        )
+
+    def reconcile_document(self, doc_id: UUID, chunks: Sequence[Chunk]) -> list[Chunk]:
+        """Diff a re-ingested document's chunks against the points already stored.
+
+        Points of ``doc_id`` whose IDs are not among ``chunks`` are deleted, and
+        surviving points that moved get their ``position`` payload updated, all in
+        one ``batch_update_points`` call. Deleted points are tombstoned and moved
+        points re-recorded in the embedding store so a rebuild matches the
+        collection. Chunk IDs must be
+        deterministic for the diff to find unchanged chunks.
+
+        Args:
+            doc_id: Document whose points are reconciled.
+            chunks: Complete chunk list of the new document version.
+
+        Returns:
+            list[Chunk]: Chunks with no stored point, which still need embedding
+                and upserting.
+
+        Raises:
+            QdrantWriteError: If reading or updating the collection fails.
+        """
+        doc_filter = models.FieldCondition(key="doc_id", match=models.MatchValue(value=str(doc_id)))
+
+        try:
+            stored: dict[str, Any] = {}
+            offset = None
+            while True:
+                records, offset = self.client.scroll(
+                    collection_name=self.collection_name,
+                    scroll_filter=models.Filter(must=[doc_filter]),
+                    limit=SCROLL_PAGE_SIZE,
+                    offset=offset,
+                    with_payload=["position"],
+                    with_vectors=False,
+                )
+                for record in records:
+                    stored[str(record.id)] = (record.payload or {}).get("position")
+                if offset is None:
+                    break
+
+            keep = [str(chunk.chunk_id) for chunk in chunks]
+            operations: list[models.DeleteOperation | models.SetPayloadOperation] = []
+            stale_ids = stored.keys() - set(keep)
+            stale = len(stale_ids)
+            if stale:
+                operations.append(
+                    models.DeleteOperation(
+                        delete=models.FilterSelector(
+                            filter=models.Filter(
+                                must=[doc_filter],
+                                must_not=[models.HasIdCondition(has_id=keep)] if keep else None,
+                            )
+                        )
+                    )
+                )
+            moved = [
+                chunk
+                for point_id, chunk in zip(keep, chunks, strict=True)
+                if point_id in stored and stored[point_id] != chunk.position
+            ]
+            operations.extend(
+                models.SetPayloadOperation(
+                    set_payload=models.SetPayload(
+                        payload={"position": chunk.position}, points=[str(chunk.chunk_id)]
+                    )
+                )
+                for chunk in moved
+            )
+            if operations:
+                self.client.batch_update_points(
+                    collection_name=self.collection_name, update_operations=operations
+                )
+            self._forget(sorted(stale_ids))
+            self._record_payloads(moved)
+        except Exception as e:
+            logger.error(
+                "Failed to reconcile document points",
+                extra={"doc_id": str(doc_id), "error": str(e)},
+            )
+            raise QdrantWriteError(
+                f"Failed to reconcile document {doc_id} in '{self.collection_name}': {e}"
+            ) from e
+
+        pending = [chunk for chunk in chunks if str(chunk.chunk_id) not in stored]
+        logger.info(
+            "Reconciled document points",
+            extra={
+                "doc_id": str(doc_id),
+                "stored": len(stored),
+                "stale": stale,
+                "unchanged": len(chunks) - len(pending),
+                "new": len(pending),
             },
         )
+        return pending
+
+    def _record(self, chunks: Sequence[Chunk], embeddings: Embeddings) -> None:
+        """Append a written batch to the embedding store, if configured.
+
+        Store failures are logged and swallowed: Qdrant already holds the points,
+        and a missing local copy only costs a re-embed on the next rebuild.
+        """
+        if self.embedding_store is None:
+            return
+
+        try:
+            self.embedding_store.append(
+                ids=[str(chunk.chunk_id) for chunk in chunks],
+                vectors=np.asarray(embeddings, dtype=np.float32),
+                payloads=[_payload(chunk) for chunk in chunks],
+                hashes=[chunk_content_hash(chunk.content) for chunk in chunks],
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to record vectors in local embedding store",
+                extra={
+                    "store": str(self.embedding_store.directory),
+                    "batch_size": len(chunks),
+                    "error": str(e),
+                },
+            )
+
+    def _record_payloads(self, chunks: Sequence[Chunk]) -> None:
+        """Re-record updated payloads of existing points in the embedding store.
+
+        Failures are logged and swallowed like in _record(); a missed record
+        only restores the old payload on the next rebuild.
+        """
+        if self.embedding_store is None or not chunks:
+            return
+
+        try:
+            self.embedding_store.append_payloads(
+                ids=[str(chunk.chunk_id) for chunk in chunks],
+                payloads=[_payload(chunk) for chunk in chunks],
+                hashes=[chunk_content_hash(chunk.content) for chunk in chunks],
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to record updated payloads in local embedding store",
+                extra={
+                    "store": str(self.embedding_store.directory),
+                    "points": len(chunks),
+                    "error": str(e),
+                },
+            )
+
+    def _forget(self, point_ids: Sequence[str]) -> None:
+        """Tombstone deleted points in the embedding store, if configured.
+
+        Failures are logged and swallowed like in _record(); a missed
+        tombstone only brings the stale point back on the next rebuild.
+        """
+        if self.embedding_store is None or not point_ids:
+            return
+
+        try:
+            self.embedding_store.delete(point_ids)
+        except Exception as e:
+            logger.warning(
+                "Failed to record deleted points in local embedding store",
+                extra={
+                    "store": str(self.embedding_store.directory),
+                    "points": len(point_ids),
+                    "error": str(e),
+                },
+            )
 
     def close(self) -> None:
         """Close Qdrant client connection.
@@ -426,5 +566,84 @@ class QdrantWriter:
             logger.warning("Error closing Qdrant writer", extra={"error": str(e)})
 
 
+def _validate_embeddings(chunks: Sequence[Chunk], embeddings: Embeddings) -> Embeddings:
+    """Check lengths and dimensions, vectorized when embeddings are ndarrays.
+
+    Args:
+        chunks: Chunks being written.
+        embeddings: Embeddings aligned with ``chunks``.
+
+    Returns:
+        Embeddings: The input, with ndarray rows stacked into one float32 matrix.
+
+    Raises:
+        ValueError: On length/dimension mismatch or non-finite ndarray values.
+    """
+    if len(chunks) != len(embeddings):
+        raise ValueError("chunks and embeddings must have the same length")
+
+    if not isinstance(embeddings, np.ndarray) and not isinstance(embeddings[0], np.ndarray):
+        # Validate embedding dimensions (1024 for Qwen3-Embedding-0.6B)
+        for i, emb in enumerate(embeddings):
+            if len(emb) != EMBEDDING_DIM:
+                raise ValueError(
+                    f"All embeddings must be {EMBEDDING_DIM}-dimensional, "
+                    f"got {len(emb)} at index {i}"
+                )
+        return embeddings
+
+    matrix = np.asarray(
+        embeddings if isinstance(embeddings, np.ndarray) else np.stack(embeddings),
+        dtype=np.float32,
+    )
+    if matrix.ndim != 2 or matrix.shape[1] != EMBEDDING_DIM:
+        raise ValueError(
+            f"All embeddings must be {EMBEDDING_DIM}-dimensional, got shape {matrix.shape}"
+        )
+    finite_rows = np.isfinite(matrix).all(axis=1)
+    if not finite_rows.all():
+        raise ValueError(
+            f"Embeddings must be finite, got NaN/inf at index {int(np.argmin(finite_rows))}"
+        )
+    return matrix
+
+
+def _payload(chunk: Chunk) -> dict[str, Any]:
+    """Map a Chunk to its Qdrant payload."""
+    return {
+        "doc_id": str(chunk.doc_id),
+        "content": chunk.content,
+        "section": chunk.section,
+        "position": chunk.position,
+        "token_count": chunk.token_count,
+        "source_url": chunk.source_url,
+        "source_type": chunk.source_type.value,
+        "ingested_at": chunk.ingested_at,
+        "tags": chunk.tags,
+    }
+
+
+def _build_points(
+    chunks: Sequence[Chunk], embeddings: Embeddings
+) -> list[models.PointStruct] | models.Batch:
+    """Build the upsert body for one batch.
+
+    List embeddings become one PointStruct per chunk. A float32 matrix becomes
+    a single columnar ``Batch``; its rows are converted to JSON-ready floats in
+    one ``tolist`` call instead of per point.
+    """
+    if isinstance(embeddings, np.ndarray):
+        return models.Batch(
+            ids=[str(chunk.chunk_id) for chunk in chunks],
+            vectors=embeddings.tolist(),
+            payloads=[_payload(chunk) for chunk in chunks],
+        )
+
+    return [
+        models.PointStruct(id=str(chunk.chunk_id), vector=embedding, payload=_payload(chunk))
+        for chunk, embedding in zip(chunks, embeddings, strict=True)
+    ]
+
+
 # Export public API
-__all__ = ["QdrantWriter", "QdrantWriteError"]
+__all__ = ["EMBEDDING_DIM", "SCROLL_PAGE_SIZE", "Embeddings", "QdrantWriter", "QdrantWriteError"]
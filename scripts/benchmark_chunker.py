@@ -0,0 +1,108 @@
+"""Benchmark the native Chunker against LlamaIndex SentenceSplitter.
+
+The baseline reproduces the previous ingest path: SentenceSplitter over a
+LlamaIndex Document, one Document per chunk, then ``count_tokens`` on every
+chunk. The native path is ``Chunker.chunk_text``, which tokenizes once.
+
+Usage:
+    uv run python scripts/benchmark_chunker.py                 # synthetic corpus
+    uv run python scripts/benchmark_chunker.py docs/**/*.md    # real Markdown files
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from packages.common.token_utils import count_tokens
+from packages.ingest.chunker import Chunker
+
+
+def _synthetic_corpus(documents: int) -> list[str]:
+    """Markdown documents with headings, paragraphs, lists and code."""
+    corpus = []
+    for doc in range(documents):
+        sections = []
+        for section in range(8):
+            paragraph = " ".join(
+                f"Service {doc}-{section} exposes port {8000 + n} behind the proxy."
+                for n in range(12)
+            )
+            sections.append(
+                f"## Section {section}\n\n{paragraph}\n\n"
+                f"- item one\n- item two\n\n```yaml\nport: {8000 + section}\n```\n"
+            )
+        corpus.append(f"# Document {doc}\n\n" + "\n".join(sections))
+    return corpus
+
+
+def _baseline(chunk_size: int, chunk_overlap: int) -> Callable[[str], int]:
+    from llama_index.core import Document
+    from llama_index.core.node_parser import SentenceSplitter
+
+    splitter = SentenceSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+    def run(text: str) -> int:
+        nodes = splitter.get_nodes_from_documents([Document(text=text)])
+        chunks = [Document(text=node.get_content(), metadata={}) for node in nodes]
+        for chunk in chunks:
+            count_tokens(chunk.text)
+        return len(chunks)
+
+    return run
+
+
+def _native(chunk_size: int, chunk_overlap: int) -> Callable[[str], int]:
+    chunker = Chunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    return lambda text: len(chunker.chunk_text(text))
+
+
+def _measure(run: Callable[[str], int], corpus: list[str], repeat: int) -> tuple[float, int]:
+    """Best-of-``repeat`` wall time for the whole corpus, and chunks produced."""
+    run(corpus[0])  # Warm tokenizer caches
+    timings = []
+    chunks = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = sum(run(text) for text in corpus)
+        timings.append(time.perf_counter() - start)
+    return min(timings), chunks
+
+
+def main() -> None:
+    """Run both chunkers over the corpus and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help="Markdown files (default: synthetic)")
+    parser.add_argument("--documents", type=int, default=200, help="Synthetic document count")
+    parser.add_argument("--chunk-size", type=int, default=512)
+    parser.add_argument("--chunk-overlap", type=int, default=51)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = (
+        [path.read_text(encoding="utf-8") for path in args.files]
+        if args.files
+        else _synthetic_corpus(args.documents)
+    )
+    total_mb = sum(len(text.encode("utf-8")) for text in corpus) / 1e6
+    print(f"Corpus: {len(corpus)} documents, {total_mb:.1f} MB")
+
+    results = {}
+    for name, factory in (("sentence_splitter", _baseline), ("native", _native)):
+        seconds, chunks = _measure(
+            factory(args.chunk_size, args.chunk_overlap), corpus, args.repeat
+        )
+        results[name] = seconds
+        print(
+            f"{name:>18}: {seconds:7.3f}s  {len(corpus) / seconds:8.1f} docs/s  "
+            f"{total_mb / seconds:6.2f} MB/s  {chunks} chunks "
+            f"({chunks / len(corpus):.1f}/doc)"
+        )
+
+    print(f"Speedup: {results['sentence_splitter'] / results['native']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
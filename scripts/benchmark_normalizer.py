@@ -0,0 +1,101 @@
+"""Benchmark the Normalizer backends over a corpus of saved HTML pages.
+
+Compares the pure-Python ``html.parser`` backend with the single-pass lxml
+backend on the same pages. Save real pages first (e.g. ``curl -o page.html``
+or the raw HTML of a Firecrawl crawl) and pass the files or a directory; with
+no arguments a synthetic corpus of large documentation-style pages is used.
+
+Usage:
+    uv run python scripts/benchmark_normalizer.py                  # synthetic corpus
+    uv run python scripts/benchmark_normalizer.py pages/           # every *.html under pages/
+    uv run python scripts/benchmark_normalizer.py pages/*.html --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from packages.ingest.normalizer import BACKEND_HTML_PARSER, BACKEND_LXML, Normalizer
+
+
+def _synthetic_corpus(documents: int) -> list[str]:
+    """Large HTML pages with navigation, prose, lists, tables and code."""
+    corpus = []
+    for doc in range(documents):
+        sections = []
+        for section in range(40):
+            paragraph = " ".join(
+                f"Service <b>{doc}-{section}</b> listens on <code>{8000 + n}</code> "
+                f"behind the <a href='/proxy'>reverse proxy</a>."
+                for n in range(10)
+            )
+            rows = "".join(f"<tr><td>svc-{n}</td><td>{9000 + n}</td></tr>" for n in range(8))
+            sections.append(
+                f"<section><h2>Section {section}</h2><p>{paragraph}</p>"
+                f"<ul><li>item one</li><li>item two<ul><li>nested</li></ul></li></ul>"
+                f"<table><tr><th>Name</th><th>Port</th></tr>{rows}</table>"
+                f"<pre><code class='language-yaml'>port: {8000 + section}\n"
+                f"host: 0.0.0.0\n</code></pre></section>"
+            )
+        corpus.append(
+            "<html><head><title>Doc</title><style>body{}</style></head><body>"
+            "<nav><ul><li>Home</li><li>Docs</li></ul></nav>"
+            f"<main><h1>Document {doc}</h1>{''.join(sections)}</main>"
+            "<footer>Copyright</footer><script>track();</script></body></html>"
+        )
+    return corpus
+
+
+def _load(paths: list[Path]) -> list[str]:
+    """Read HTML files; directories contribute every ``*.html``/``*.htm`` below them."""
+    files: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*.htm*") if p.is_file()))
+        else:
+            files.append(path)
+    return [file.read_text(encoding="utf-8", errors="replace") for file in files]
+
+
+def _measure(normalizer: Normalizer, corpus: list[str], repeat: int) -> tuple[float, int]:
+    """Best-of-``repeat`` wall time for the corpus, and Markdown characters produced."""
+    normalizer.normalize(corpus[0])  # Warm up
+    timings = []
+    produced = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        produced = sum(len(normalizer.normalize(html)) for html in corpus)
+        timings.append(time.perf_counter() - start)
+    return min(timings), produced
+
+
+def main() -> None:
+    """Run both backends over the corpus and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", type=Path, help="HTML files or directories")
+    parser.add_argument("--documents", type=int, default=50, help="Synthetic document count")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = _load(args.paths) if args.paths else _synthetic_corpus(args.documents)
+    if not corpus:
+        parser.error("no HTML files found")
+    total_mb = sum(len(html.encode("utf-8")) for html in corpus) / 1e6
+    print(f"Corpus: {len(corpus)} pages, {total_mb:.1f} MB")
+
+    results = {}
+    for backend in (BACKEND_HTML_PARSER, BACKEND_LXML):
+        seconds, produced = _measure(Normalizer(backend=backend), corpus, args.repeat)
+        results[backend] = seconds
+        print(
+            f"{backend:>12}: {seconds:7.3f}s  {len(corpus) / seconds:8.1f} pages/s  "
+            f"{total_mb / seconds:6.2f} MB/s  {produced / 1e6:.1f}M chars out"
+        )
+
+    print(f"Speedup: {results[BACKEND_HTML_PARSER] / results[BACKEND_LXML]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
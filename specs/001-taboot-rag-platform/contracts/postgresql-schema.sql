@@ -1,5 +1,5 @@
 -- PostgreSQL Schema for Taboot Relational Storage
--- THIS VERSION: 2.0.0 (2025-10-25)
+-- THIS VERSION: 2.2.0 (2026-10-18)
 -- Tables: Document, ExtractionWindow, IngestionJob, ExtractionJob, SchemaVersions
 -- Execute during initialization (taboot init command)
 --
@@ -14,6 +14,9 @@
 -- - rag schema: Python RAG platform tables (documents, extractions, jobs)
 -- - auth schema: TypeScript/Prisma auth tables (User, Session, Account, etc.)
 -- Migration script: todos/scripts/migrate-to-schema-namespaces.sql
+--
+-- Version 2.1.0: Partial index for keyset-paginated pending-document scans
+-- Version 2.2.0: 'processing' extraction state with worker leases (lease_owner, lease_expires_at)
 
 -- Enable UUID extension
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
@@ -64,11 +67,23 @@ CREATE TABLE IF NOT EXISTS rag.documents (
     content_hash CHAR(64) NOT NULL UNIQUE,  -- SHA-256 hex digest
     ingested_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     extraction_state VARCHAR(32) NOT NULL DEFAULT 'pending' CHECK (extraction_state IN (
-        'pending', 'tier_a_done', 'tier_b_done', 'tier_c_done', 'completed', 'failed'
+        'pending', 'processing', 'tier_a_done', 'tier_b_done', 'tier_c_done', 'completed', 'failed'
     )),
     extraction_version VARCHAR(32),  -- Semver tag (e.g., 'v1.0.0')
     updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-    metadata JSONB
+    metadata JSONB,
+    lease_owner VARCHAR(255),  -- Worker holding the extraction lease
+    lease_expires_at TIMESTAMP WITH TIME ZONE  -- Lease deadline (reaped back to 'pending')
+);
+
+-- Upgrade path for databases created before 2.2.0
+ALTER TABLE rag.documents ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255);
+ALTER TABLE rag.documents ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE rag.documents DROP CONSTRAINT IF EXISTS documents_extraction_state_check;
+ALTER TABLE rag.documents ADD CONSTRAINT documents_extraction_state_check CHECK (
+    extraction_state IN (
+        'pending', 'processing', 'tier_a_done', 'tier_b_done', 'tier_c_done', 'completed', 'failed'
+    )
 );
 
 -- Indexes on documents table
@@ -81,6 +96,16 @@ ON rag.documents (extraction_state);
 CREATE INDEX IF NOT EXISTS idx_documents_content_hash
 ON rag.documents (content_hash);
 
+-- Partial index backing the extraction backlog scan (keyset on ingested_at, doc_id)
+CREATE INDEX IF NOT EXISTS idx_documents_pending_ingested_at_doc_id
+ON rag.documents (ingested_at, doc_id)
+WHERE extraction_state = 'pending';
+
+-- Partial index for reaping expired extraction leases
+CREATE INDEX IF NOT EXISTS idx_documents_processing_lease_expires_at
+ON rag.documents (lease_expires_at)
+WHERE extraction_state = 'processing';
+
 -- Trigger to auto-update updated_at
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -90,6 +115,7 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+DROP TRIGGER IF EXISTS update_documents_updated_at ON rag.documents;
 CREATE TRIGGER update_documents_updated_at
 BEFORE UPDATE ON rag.documents
 FOR EACH ROW
@@ -199,6 +225,7 @@ COMMENT ON TABLE rag.extraction_jobs IS 'Extraction tasks per document with tier
 
 COMMENT ON COLUMN rag.documents.content_hash IS 'SHA-256 hex digest for deduplication';
 COMMENT ON COLUMN rag.documents.extraction_state IS 'Current extraction pipeline state';
+COMMENT ON COLUMN rag.documents.lease_expires_at IS 'Extraction lease deadline while processing';
 COMMENT ON COLUMN rag.extraction_windows.tier IS 'Extraction tier: A (deterministic), B (spaCy), C (LLM)';
 COMMENT ON COLUMN rag.extraction_windows.llm_latency_ms IS 'LLM inference time (tier C only)';
 COMMENT ON COLUMN rag.extraction_windows.cache_hit IS 'Whether LLM response was cached (tier C only)';
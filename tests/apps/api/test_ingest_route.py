@@ -7,7 +7,7 @@ This test module covers:
 """
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -24,6 +24,9 @@ def client() -> TestClient:
     Returns:
         TestClient: Configured test client for API.
     """
+    # Lifespan is not run by TestClient without a context manager, so provide
+    # the shared pool the routes read from application state.
+    app.state.postgres_pool = MagicMock()
     return TestClient(app)
 
 
@@ -106,7 +109,7 @@ class TestPostIngestEndpoint:
             mock_use_case.execute.return_value = sample_job
             mock_get_use_case.return_value = mock_use_case
 
-            mock_store = MagicMock()
+            mock_store = AsyncMock()
             mock_get_store.return_value = mock_store
 
             response = client.post(
@@ -176,7 +179,7 @@ class TestPostIngestEndpoint:
             mock_use_case.execute.return_value = sample_job
             mock_get_use_case.return_value = mock_use_case
 
-            mock_store = MagicMock()
+            mock_store = AsyncMock()
             mock_get_store.return_value = mock_store
 
             # Should succeed without limit
@@ -212,7 +215,7 @@ class TestPostIngestEndpoint:
             mock_use_case.execute.return_value = sample_job
             mock_get_use_case.return_value = mock_use_case
 
-            mock_store = MagicMock()
+            mock_store = AsyncMock()
             mock_get_store.return_value = mock_store
 
             response = client.post(
@@ -247,7 +250,7 @@ class TestPostIngestEndpoint:
             mock_use_case.execute.return_value = sample_job
             mock_get_use_case.return_value = mock_use_case
 
-            mock_store = MagicMock()
+            mock_store = AsyncMock()
             mock_get_store.return_value = mock_store
 
             response = client.post(
@@ -300,7 +303,7 @@ class TestGetIngestStatusEndpoint:
         Expected to FAIL initially (endpoint not implemented yet).
         """
         with patch("apps.api.routes.ingest.get_job_store") as mock_get_store:
-            mock_store = MagicMock()
+            mock_store = AsyncMock()
             mock_store.get_by_id.return_value = completed_job
             mock_get_store.return_value = mock_store
 
@@ -326,7 +329,7 @@ class TestGetIngestStatusEndpoint:
         Expected to FAIL initially (endpoint not implemented yet).
         """
         with patch("apps.api.routes.ingest.get_job_store") as mock_get_store:
-            mock_store = MagicMock()
+            mock_store = AsyncMock()
             mock_store.get_by_id.return_value = None
             mock_get_store.return_value = mock_store
 
@@ -369,7 +372,7 @@ class TestGetIngestStatusEndpoint:
         )
 
         with patch("apps.api.routes.ingest.get_job_store") as mock_get_store:
-            mock_store = MagicMock()
+            mock_store = AsyncMock()
             mock_store.get_by_id.return_value = failed_job
             mock_get_store.return_value = mock_store
 
@@ -390,7 +393,7 @@ class TestGetIngestStatusEndpoint:
         Expected to FAIL initially (endpoint not implemented yet).
         """
         with patch("apps.api.routes.ingest.get_job_store") as mock_get_store:
-            mock_store = MagicMock()
+            mock_store = AsyncMock()
             mock_store.get_by_id.return_value = sample_job
             mock_get_store.return_value = mock_store
 
@@ -136,3 +136,440 @@ async def test_worker_respects_shutdown_signal(mock_redis_client) -> None:
 
     # Should return immediately without polling
     await worker.run()
+
+
+@pytest.mark.asyncio
+async def test_single_doc_adapter_claims_document_by_id() -> None:
+    """Test adapter claims one document by id instead of scanning the backlog."""
+    from unittest.mock import MagicMock
+    from uuid import uuid4
+
+    from apps.worker.main import SingleDocExtractorAdapter
+
+    doc_id = uuid4()
+    target_doc = MagicMock(doc_id=doc_id)
+
+    document_store = AsyncMock()
+    document_store.claim_by_id.return_value = target_doc
+    use_case = MagicMock()
+    use_case.process_leased = AsyncMock(return_value=True)
+
+    adapter = SingleDocExtractorAdapter(
+        use_case=use_case, document_store=document_store, worker_id="worker-a", lease_seconds=30
+    )
+    await adapter.execute(doc_id)
+
+    document_store.claim_by_id.assert_awaited_once_with(doc_id, "worker-a", lease_seconds=30)
+    document_store.query_pending.assert_not_called()
+    use_case.process_leased.assert_awaited_once_with(
+        target_doc, worker_id="worker-a", lease_seconds=30
+    )
+
+
+@pytest.mark.asyncio
+async def test_single_doc_adapter_skips_non_pending_document() -> None:
+    """Test adapter does nothing when the document is not claimable."""
+    from unittest.mock import MagicMock
+    from uuid import uuid4
+
+    from apps.worker.main import SingleDocExtractorAdapter
+
+    document_store = AsyncMock()
+    document_store.claim_by_id.return_value = None
+    use_case = MagicMock()
+    use_case.process_leased = AsyncMock()
+
+    adapter = SingleDocExtractorAdapter(use_case=use_case, document_store=document_store)
+    assert await adapter.execute(uuid4()) is False
+
+    use_case.process_leased.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_worker_reaps_expired_leases_once_per_interval(mock_redis_client) -> None:
+    """Test worker throttles expired-lease reaping to the configured interval."""
+    from apps.worker.main import ExtractionWorker
+
+    reaper = AsyncMock()
+    reaper.reap_expired_leases.return_value = []
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client, lease_reaper=reaper, reap_interval=3600
+    )
+
+    await worker.reap_expired_leases()
+    await worker.reap_expired_leases()
+
+    reaper.reap_expired_leases.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_worker_republishes_reaped_documents(mock_redis_client) -> None:
+    """Test documents returned to PENDING by the reaper are announced again."""
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+
+    doc_ids = [uuid4(), uuid4()]
+    reaper = AsyncMock()
+    reaper.reap_expired_leases.return_value = doc_ids
+    publisher = AsyncMock()
+
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client, lease_reaper=reaper, retry_publisher=publisher
+    )
+
+    assert await worker.reap_expired_leases() == 2
+
+    events = publisher.publish_many.await_args.args[0]
+    assert [event.doc_id for event in events] == doc_ids
+
+
+@pytest.mark.asyncio
+async def test_worker_acks_only_successful_stream_events(
+    mock_redis_client, mock_extract_use_case
+) -> None:
+    """Test a batch is extracted concurrently and failed events stay pending."""
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+    from packages.core.events import DocumentIngestedEvent
+
+    ok_id, failing_id = uuid4(), uuid4()
+    events = [
+        ("1-0", DocumentIngestedEvent(doc_id=ok_id, source_url="https://a", chunk_count=1)),
+        ("2-0", DocumentIngestedEvent(doc_id=failing_id, source_url="https://b", chunk_count=1)),
+    ]
+
+    async def execute(doc_id):
+        if doc_id == failing_id:
+            raise RuntimeError("extraction failed")
+
+    mock_extract_use_case.execute.side_effect = execute
+    consumer = AsyncMock()
+    consumer.autoclaim.return_value = []
+    consumer.read.return_value = events
+
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        extract_use_case=mock_extract_use_case,
+        event_consumer=consumer,
+        batch_size=10,
+        concurrency=2,
+        reclaim_idle_ms=60_000,
+    )
+
+    await worker.poll_once()
+
+    consumer.autoclaim.assert_awaited_once_with(min_idle_ms=60_000, count=10)
+    consumer.read.assert_awaited_once_with(count=10, block_ms=worker.poll_timeout * 1000)
+    assert mock_extract_use_case.execute.await_count == 2
+    consumer.ack.assert_awaited_once_with(["1-0"])
+
+
+@pytest.mark.asyncio
+async def test_worker_processes_reclaimed_events_before_reading(
+    mock_redis_client, mock_extract_use_case
+) -> None:
+    """Test events reclaimed via XAUTOCLAIM are handled without a new read."""
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+    from packages.core.events import DocumentIngestedEvent
+
+    doc_id = uuid4()
+    consumer = AsyncMock()
+    consumer.autoclaim.return_value = [
+        ("5-0", DocumentIngestedEvent(doc_id=doc_id, source_url="https://a", chunk_count=1))
+    ]
+
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        extract_use_case=mock_extract_use_case,
+        event_consumer=consumer,
+        reclaim_idle_ms=60_000,
+    )
+
+    await worker.poll_once()
+
+    consumer.read.assert_not_awaited()
+    mock_extract_use_case.execute.assert_awaited_once_with(doc_id)
+    consumer.ack.assert_awaited_once_with(["5-0"])
+
+
+def test_cli_runs_supervisor_for_multiple_processes() -> None:
+    """Test --processes N hands off to WorkerSupervisor."""
+    from apps.worker import main as worker_main
+
+    with patch.object(worker_main, "WorkerSupervisor") as supervisor_cls:
+        supervisor_cls.return_value.run.return_value = 0
+
+        assert worker_main.cli(["--processes", "3"]) == 0
+
+    supervisor_cls.assert_called_once_with(3, target=worker_main.run_worker_process)
+    supervisor_cls.return_value.run.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_worker_schedules_retry_and_acks_failed_stream_event(
+    mock_redis_client, mock_extract_use_case
+) -> None:
+    """Test failed events are handed to the retry queue instead of staying pending."""
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+    from packages.core.events import DocumentIngestedEvent
+
+    doc_id = uuid4()
+    mock_extract_use_case.execute.side_effect = RuntimeError("ollama down")
+    consumer = AsyncMock()
+    retry_queue = AsyncMock()
+
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        extract_use_case=mock_extract_use_case,
+        event_consumer=consumer,
+        retry_queue=retry_queue,
+    )
+
+    await worker._process_stream_events(
+        [("1-0", DocumentIngestedEvent(doc_id=doc_id, source_url="https://a", chunk_count=2))]
+    )
+
+    job, error = retry_queue.schedule_retry.await_args.args
+    assert job == {"doc_id": str(doc_id), "source_url": "https://a", "chunk_count": 2}
+    assert "ollama down" in error
+    consumer.ack.assert_awaited_once_with(["1-0"])
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_failed_event_when_reclaimed(
+    mock_redis_client, mock_extract_use_case
+) -> None:
+    """Test an event left pending without a retry queue is extracted again on reclaim."""
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+    from packages.core.events import DocumentIngestedEvent
+
+    doc_id = uuid4()
+    event = ("1-0", DocumentIngestedEvent(doc_id=doc_id, source_url="https://a", chunk_count=1))
+    mock_extract_use_case.execute.side_effect = [RuntimeError("ollama down"), True]
+    consumer = AsyncMock()
+    consumer.autoclaim.side_effect = [[], [event]]
+    consumer.read.return_value = [event]
+    retry_store = AsyncMock()
+    retry_store.requeue_failed.return_value = [doc_id]
+
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        extract_use_case=mock_extract_use_case,
+        event_consumer=consumer,
+        reclaim_idle_ms=60_000,
+        retry_store=retry_store,
+    )
+
+    await worker.poll_once()
+    consumer.ack.assert_awaited_once_with([])
+
+    await worker.poll_once()
+
+    retry_store.requeue_failed.assert_awaited_once_with([doc_id])
+    assert mock_extract_use_case.execute.await_count == 2
+    consumer.ack.assert_awaited_with(["1-0"])
+    assert worker.get_stats()["processed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_promotes_due_retries_to_stream(mock_redis_client) -> None:
+    """Test due retries are reset to PENDING and re-published in one sweep."""
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+
+    doc_id = uuid4()
+    retry_queue = AsyncMock()
+    retry_queue.promote_due.return_value = [
+        {"doc_id": str(doc_id), "source_url": "https://a", "chunk_count": 2, "retry_count": 1}
+    ]
+    retry_store = AsyncMock()
+    retry_store.requeue_failed.return_value = [doc_id]
+    publisher = AsyncMock()
+
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        retry_queue=retry_queue,
+        retry_store=retry_store,
+        retry_publisher=publisher,
+        retry_poll_interval=3600,
+        retry_batch_size=50,
+    )
+
+    assert await worker.promote_due_retries() == 1
+    assert await worker.promote_due_retries() == 0
+
+    retry_queue.promote_due.assert_awaited_once_with(limit=50)
+    retry_store.requeue_failed.assert_awaited_once_with([doc_id])
+    (event,) = publisher.publish_many.await_args.args[0]
+    assert (event.doc_id, event.chunk_count) == (doc_id, 2)
+    retry_queue.reschedule.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_worker_drops_retries_for_documents_no_longer_failed(mock_redis_client) -> None:
+    """Test only documents the store returned to PENDING are re-published."""
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+
+    requeued_id, completed_id = uuid4(), uuid4()
+    retry_queue = AsyncMock()
+    retry_queue.promote_due.return_value = [
+        {"doc_id": str(requeued_id), "source_url": "https://a", "chunk_count": 1},
+        {"doc_id": str(completed_id), "source_url": "https://b", "chunk_count": 1},
+    ]
+    retry_store = AsyncMock()
+    retry_store.requeue_failed.return_value = [requeued_id]
+    publisher = AsyncMock()
+
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        retry_queue=retry_queue,
+        retry_store=retry_store,
+        retry_publisher=publisher,
+    )
+
+    assert await worker.promote_due_retries() == 1
+    (event,) = publisher.publish_many.await_args.args[0]
+    assert event.doc_id == requeued_id
+
+
+@pytest.mark.asyncio
+async def test_worker_reschedules_retries_when_publish_fails(mock_redis_client) -> None:
+    """Test promoted retries go back on the retry set if they cannot be published."""
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+
+    doc_id = uuid4()
+    jobs = [{"doc_id": str(doc_id), "source_url": "https://a", "chunk_count": 2}]
+    retry_queue = AsyncMock()
+    retry_queue.promote_due.return_value = jobs
+    retry_store = AsyncMock()
+    retry_store.requeue_failed.return_value = [doc_id]
+    publisher = AsyncMock()
+    publisher.publish_many.side_effect = ConnectionError("redis down")
+
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        retry_queue=retry_queue,
+        retry_store=retry_store,
+        retry_publisher=publisher,
+    )
+
+    assert await worker.promote_due_retries() == 0
+    retry_queue.reschedule.assert_awaited_once_with(jobs)
+
+
+@pytest.mark.asyncio
+async def test_worker_keeps_retry_count_when_document_not_claimable(
+    mock_redis_client, mock_extract_use_case
+) -> None:
+    """Test an event whose document cannot be claimed is acked but not counted a success."""
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+    from packages.core.events import DocumentIngestedEvent
+
+    mock_extract_use_case.execute.return_value = False
+    consumer = AsyncMock()
+    retry_queue = AsyncMock()
+
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        extract_use_case=mock_extract_use_case,
+        event_consumer=consumer,
+        retry_queue=retry_queue,
+    )
+
+    await worker._process_stream_events(
+        [("1-0", DocumentIngestedEvent(doc_id=uuid4(), source_url="https://a", chunk_count=1))]
+    )
+
+    consumer.ack.assert_awaited_once_with(["1-0"])
+    retry_queue.clear_retry_count.assert_not_awaited()
+    assert worker._processed == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_schedules_lanes_weighted_fair(mock_redis_client) -> None:
+    """Test backlogged lanes are polled by weight and idle lanes are skipped."""
+    from uuid import uuid4
+
+    from apps.worker.main import LANE_BULK, LANE_INTERACTIVE, ExtractionWorker
+    from packages.core.events import DocumentIngestedEvent
+
+    def backlogged_consumer() -> AsyncMock:
+        consumer = AsyncMock()
+        consumer.read.side_effect = lambda **_: [
+            ("1-0", DocumentIngestedEvent(doc_id=uuid4(), source_url="https://a", chunk_count=1))
+        ]
+        return consumer
+
+    bulk, interactive = backlogged_consumer(), backlogged_consumer()
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        event_consumer=bulk,
+        priority_consumer=interactive,
+        priority_weight=3,
+    )
+
+    served = []
+    for _ in range(8):
+        lane = worker._lane_order()[0]
+        served.append(lane.name)
+    assert served.count(LANE_INTERACTIVE) == 6
+    assert served.count(LANE_BULK) == 2
+
+    # Idle interactive lane falls through to bulk without blocking
+    interactive.read.side_effect = None
+    interactive.read.return_value = []
+    for lane in worker.lanes:
+        lane.credit = 0
+    await worker.poll_once()
+
+    interactive.read.assert_awaited_with(count=1, block_ms=None)
+    bulk.read.assert_awaited_once_with(count=1, block_ms=None)
+    bulk.ack.assert_awaited_once_with(["1-0"])
+
+
+@pytest.mark.asyncio
+async def test_worker_records_per_lane_latency(mock_redis_client, mock_extract_use_case) -> None:
+    """Test latency is measured from the stream entry timestamp per lane."""
+    import time
+    from uuid import uuid4
+
+    from apps.worker.main import ExtractionWorker
+    from packages.core.events import DocumentIngestedEvent
+
+    consumer = AsyncMock()
+    worker = ExtractionWorker(
+        redis_client=mock_redis_client,
+        extract_use_case=mock_extract_use_case,
+        priority_consumer=consumer,
+    )
+    published_ms = int(time.time() * 1000) - 2000
+
+    await worker._process_stream_events(
+        [
+            (
+                f"{published_ms}-0",
+                DocumentIngestedEvent(doc_id=uuid4(), source_url="https://a", chunk_count=1),
+            )
+        ],
+        worker.lanes[0],
+    )
+
+    stats = worker.get_stats()
+    assert stats["interactive_processed"] == 1
+    assert stats["interactive_latency_ms_total"] >= 2000
+    consumer.ack.assert_awaited_once_with([f"{published_ms}-0"])
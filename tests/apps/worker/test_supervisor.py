@@ -0,0 +1,111 @@
+"""Tests for the multi-process extraction worker supervisor."""
+
+import multiprocessing
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from apps.worker.supervisor import WorkerSupervisor
+
+
+def _crashing_worker(process_index: int, stats_queue) -> None:
+    """Child that reports one processed document and crashes."""
+    stats_queue.put((process_index, os.getpid(), {"processed": 1, "failed": 0}))
+    sys.exit(1)
+
+
+def _draining_worker(process_index: int, stats_queue) -> None:
+    """Child that runs until SIGTERM, then reports final counters."""
+    stopped = False
+
+    def handle_signal(_sig, _frame) -> None:
+        nonlocal stopped
+        stopped = True
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    stats_queue.put((process_index, os.getpid(), {"processed": 0, "failed": 0}))
+    while not stopped:
+        time.sleep(0.01)
+    stats_queue.put((process_index, os.getpid(), {"processed": 2, "failed": 1}))
+
+
+@pytest.fixture
+def fork_context():
+    """Fork context keeps child start-up fast in tests."""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork start method not available")
+    return multiprocessing.get_context("fork")
+
+
+def test_rejects_non_positive_process_count() -> None:
+    """Test supervisor requires at least one process."""
+    with pytest.raises(ValueError, match="processes"):
+        WorkerSupervisor(0, target=_draining_worker)
+
+
+def test_restarts_crashed_children_with_backoff(fork_context) -> None:
+    """Test crashed children are restarted with doubling delay and stats are kept."""
+    supervisor = WorkerSupervisor(
+        1,
+        target=_crashing_worker,
+        restart_backoff=1.0,
+        max_restart_backoff=3.0,
+        mp_context=fork_context,
+    )
+    slot = supervisor._slots[0]
+
+    now = 100.0
+    delays = []
+    for _ in range(3):
+        supervisor.supervise_once(now=now)
+        slot.process.join(5)
+        supervisor.supervise_once(now=now)
+        delays.append(slot.restart_at - now)
+        now = slot.restart_at
+
+    supervisor.supervise_once(now=now)
+    slot.process.join(5)
+    supervisor.shutdown()
+
+    assert delays == [1.0, 2.0, 3.0]
+    stats = supervisor.get_stats()
+    assert stats["restarts"] == 3
+    assert stats["processed"] == 4
+    assert stats["per_child"][0]["processed"] == 4
+
+
+def test_shutdown_forwards_sigterm_and_aggregates_stats(fork_context) -> None:
+    """Test shutdown lets children drain and collects their final counters."""
+    supervisor = WorkerSupervisor(
+        2,
+        target=_draining_worker,
+        shutdown_timeout=5.0,
+        poll_interval=0.01,
+        mp_context=fork_context,
+    )
+
+    supervisor.supervise_once()
+    processes = [slot.process for slot in supervisor._slots]
+
+    # Wait until both children have installed their SIGTERM handler
+    deadline = time.monotonic() + 5
+    while len(supervisor._reported) < 2 and time.monotonic() < deadline:
+        supervisor.supervise_once()
+        time.sleep(0.01)
+    assert all(process.is_alive() for process in processes)
+
+    supervisor.shutdown()
+
+    assert [process.exitcode for process in processes] == [0, 0]
+    stats = supervisor.get_stats()
+    assert stats["alive"] == 0
+    assert stats["restarts"] == 0
+    assert stats["processed"] == 4
+    assert stats["failed"] == 2
+    assert stats["per_child"] == {
+        0: {"processed": 2, "failed": 1},
+        1: {"processed": 2, "failed": 1},
+    }
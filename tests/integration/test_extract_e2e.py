@@ -63,26 +63,48 @@ class InMemoryDocumentStore:
         self._documents[str(document.doc_id)] = document
         self._content[str(document.doc_id)] = content
 
-    def query_pending(self, limit: int | None = None) -> list[Document]:
-        """Query documents in PENDING extraction state.
+    async def claim_pending(
+        self, worker_id: str, limit: int = 1, lease_seconds: int = 300
+    ) -> list[Document]:
+        """Move up to ``limit`` PENDING documents to PROCESSING.
 
         Args:
-            limit: Optional maximum number of documents to return.
+            worker_id: Claiming worker.
+            limit: Maximum number of documents to claim.
+            lease_seconds: Lease duration (unused).
 
         Returns:
-            list[Document]: List of documents with extraction_state == PENDING.
+            list[Document]: Claimed documents.
         """
         pending = [
             doc
             for doc in self._documents.values()
             if doc.extraction_state == ExtractionState.PENDING
+        ][:limit]
+
+        claimed = [
+            doc.model_copy(update={"extraction_state": ExtractionState.PROCESSING})
+            for doc in pending
         ]
+        for doc in claimed:
+            self._documents[str(doc.doc_id)] = doc
+        return claimed
+
+    async def renew_lease(self, doc_id: str, worker_id: str, lease_seconds: int = 300) -> bool:
+        """Report whether the document is still being processed.
+
+        Args:
+            doc_id: Leased document UUID (as string).
+            worker_id: Worker that holds the lease.
+            lease_seconds: New lease duration (unused).
 
-        if limit is not None:
-            return pending[:limit]
-        return pending
+        Returns:
+            bool: True while the document is PROCESSING.
+        """
+        doc = self._documents.get(str(doc_id))
+        return doc is not None and doc.extraction_state == ExtractionState.PROCESSING
 
-    def get_content(self, doc_id: str) -> str:
+    async def get_content(self, doc_id: str) -> str:
         """Get document text content by doc_id.
 
         Args:
@@ -98,7 +120,7 @@ class InMemoryDocumentStore:
             raise KeyError(f"Document {doc_id} not found")
         return self._content[str(doc_id)]
 
-    def update_document(self, document: Document) -> None:
+    async def update_document(self, document: Document) -> None:
         """Update document in store.
 
         Args:
@@ -18,7 +18,7 @@ from unittest.mock import MagicMock
 import pytest
 from qdrant_client import QdrantClient
 
-from packages.clients.postgres_document_store import PostgresDocumentStore
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
 from packages.common.config import get_config
 from packages.core.use_cases.ingest_web import IngestWebUseCase
 from packages.ingest.chunker import Chunker
@@ -77,7 +77,9 @@ class TestIngestWebEndToEnd:
             collection_name=collection_name,
             batch_size=100,
         )
-        document_store = cast(PostgresDocumentStore, MagicMock(spec=PostgresDocumentStore))
+        document_store = cast(
+            AsyncPostgresDocumentStore, MagicMock(spec=AsyncPostgresDocumentStore)
+        )
 
         try:
             # Initialize IngestWebUseCase
@@ -193,7 +195,9 @@ class TestIngestWebEndToEnd:
             url=config.qdrant_url,
             collection_name="taboot_documents",
         )
-        document_store = cast(PostgresDocumentStore, MagicMock(spec=PostgresDocumentStore))
+        document_store = cast(
+            AsyncPostgresDocumentStore, MagicMock(spec=AsyncPostgresDocumentStore)
+        )
 
         try:
             use_case = IngestWebUseCase(
@@ -261,7 +265,9 @@ class TestIngestWebEndToEnd:
             url=config.qdrant_url,
             collection_name="taboot_documents",
         )
-        document_store = cast(PostgresDocumentStore, MagicMock(spec=PostgresDocumentStore))
+        document_store = cast(
+            AsyncPostgresDocumentStore, MagicMock(spec=AsyncPostgresDocumentStore)
+        )
 
         try:
             use_case = IngestWebUseCase(
@@ -334,7 +340,9 @@ class TestWebIngestionPerformance:
             collection_name="taboot_documents",
             batch_size=100,
         )
-        document_store = cast(PostgresDocumentStore, MagicMock(spec=PostgresDocumentStore))
+        document_store = cast(
+            AsyncPostgresDocumentStore, MagicMock(spec=AsyncPostgresDocumentStore)
+        )
 
         try:
             use_case = IngestWebUseCase(
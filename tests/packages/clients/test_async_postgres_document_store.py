@@ -0,0 +1,194 @@
+"""Tests for AsyncPostgresDocumentStore implementation."""
+
+import hashlib
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
+from packages.common.async_postgres_pool import AsyncPostgresPool
+from packages.common.config import get_config
+from packages.schemas.models import Document, ExtractionState, SourceType
+
+
+@pytest.fixture
+async def document_store() -> AsyncIterator[AsyncPostgresDocumentStore]:
+    """Fixture providing an AsyncPostgresDocumentStore on a fresh pool."""
+    pool = await AsyncPostgresPool.create(get_config())
+    yield AsyncPostgresDocumentStore(pool)
+
+    # Cleanup
+    async with pool.acquire() as conn:
+        await conn.execute("DELETE FROM rag.document_content")
+        await conn.execute("DELETE FROM rag.documents")
+    await pool.close()
+
+
+def _make_document(i: int, ingested_at: datetime | None = None) -> tuple[Document, str]:
+    content = f"Async document {i}"
+    document = Document(
+        doc_id=uuid4(),
+        source_url=f"https://example.com/async/{i}",
+        source_type=SourceType.WEB,
+        content_hash=hashlib.sha256(content.encode()).hexdigest(),
+        ingested_at=ingested_at or datetime.now(UTC),
+        extraction_state=ExtractionState.PENDING,
+        extraction_version=None,
+        updated_at=datetime.now(UTC),
+        metadata={"index": i},
+    )
+    return document, content
+
+
+async def test_create_and_get_content(document_store) -> None:
+    """Test creating a document and reading its content back."""
+    document, content = _make_document(0)
+
+    await document_store.create(document, content)
+    # Duplicate content_hash is a no-op
+    await document_store.create(document.model_copy(update={"doc_id": uuid4()}), content)
+
+    assert await document_store.get_content(document.doc_id) == content
+    assert await document_store.count_documents() == 1
+
+
+async def test_get_content_missing_raises_key_error(document_store) -> None:
+    """Test get_content raises KeyError for unknown documents."""
+    with pytest.raises(KeyError):
+        await document_store.get_content(uuid4())
+
+
+async def test_iter_pending_paginates_in_ingest_order(document_store) -> None:
+    """Test keyset pagination yields every pending document oldest first."""
+    base = datetime.now(UTC)
+    documents = []
+    for i in range(5):
+        document, content = _make_document(i, ingested_at=base + timedelta(seconds=i))
+        await document_store.create(document, content)
+        documents.append(document)
+
+    pending = [doc async for doc in document_store.iter_pending(batch_size=2)]
+    assert [doc.doc_id for doc in pending] == [doc.doc_id for doc in documents]
+    assert pending[0].metadata == {"index": 0}
+
+    limited = await document_store.query_pending(limit=3)
+    assert [doc.doc_id for doc in limited] == [doc.doc_id for doc in documents[:3]]
+
+
+async def test_claim_renew_and_release_lease(document_store) -> None:
+    """Test a claimed document is leased, renewable and released on update."""
+    document, content = _make_document(0)
+    await document_store.create(document, content)
+
+    claimed = await document_store.claim_by_id(document.doc_id, "worker-a", lease_seconds=30)
+    assert claimed is not None
+    assert claimed.extraction_state == ExtractionState.PROCESSING
+    assert await document_store.claim_by_id(document.doc_id, "worker-b") is None
+    assert await document_store.query_pending() == []
+
+    assert await document_store.renew_lease(document.doc_id, "worker-a", lease_seconds=30)
+    assert not await document_store.renew_lease(document.doc_id, "worker-b", lease_seconds=30)
+
+    await document_store.update_document(
+        claimed.model_copy(update={"extraction_state": ExtractionState.COMPLETED})
+    )
+    assert not await document_store.renew_lease(document.doc_id, "worker-a", lease_seconds=30)
+    assert await document_store.count_documents(extraction_state=ExtractionState.COMPLETED) == 1
+
+
+async def test_update_states_bulk(document_store) -> None:
+    """Test bulk update changes every listed document in one statement."""
+    documents = []
+    for i in range(3):
+        document, content = _make_document(i)
+        await document_store.create(document, content)
+        documents.append(document)
+
+    updated = await document_store.update_states_bulk(
+        [
+            doc.model_copy(update={"extraction_state": ExtractionState.COMPLETED})
+            for doc in documents
+        ]
+        + [documents[0].model_copy(update={"doc_id": uuid4()})]
+    )
+
+    assert updated == 3
+    completed = await document_store.query_documents(
+        limit=10, extraction_state=ExtractionState.COMPLETED
+    )
+    assert {doc.doc_id for doc in completed} == {doc.doc_id for doc in documents}
+
+
+async def test_requeue_failed_resets_only_failed_documents(document_store) -> None:
+    """Test failed and abandoned documents return to PENDING for a scheduled retry."""
+    failed, content = _make_document(0)
+    await document_store.create(failed, content)
+    await document_store.update_document(
+        failed.model_copy(update={"extraction_state": ExtractionState.FAILED})
+    )
+    completed, content = _make_document(1)
+    await document_store.create(completed, content)
+    await document_store.update_document(
+        completed.model_copy(update={"extraction_state": ExtractionState.COMPLETED})
+    )
+
+    leased, content = _make_document(2)
+    await document_store.create(leased, content)
+    await document_store.claim_by_id(leased.doc_id, "worker-a", lease_seconds=300)
+    abandoned, content = _make_document(3)
+    await document_store.create(abandoned, content)
+    await document_store.claim_by_id(abandoned.doc_id, "worker-a", lease_seconds=-1)
+
+    requeued = await document_store.requeue_failed(
+        [failed.doc_id, completed.doc_id, leased.doc_id, abandoned.doc_id]
+    )
+    assert set(requeued) == {failed.doc_id, abandoned.doc_id}
+    # Already-pending documents are reported again so their retry is not dropped
+    assert set(await document_store.requeue_failed([failed.doc_id])) == {failed.doc_id}
+    assert await document_store.requeue_failed([]) == []
+    pending = await document_store.query_pending()
+    assert {doc.doc_id for doc in pending} == {failed.doc_id, abandoned.doc_id}
+
+
+async def test_upsert_replaces_changed_document(document_store) -> None:
+    """Test upsert overwrites a doc_id's record and content and re-queues extraction."""
+    document, content = _make_document(0)
+    assert await document_store.upsert(document, content)
+    await document_store.update_document(
+        document.model_copy(update={"extraction_state": ExtractionState.COMPLETED})
+    )
+
+    changed = "Async document 0, edited"
+    changed_hash = hashlib.sha256(changed.encode()).hexdigest()
+    assert await document_store.upsert(
+        document.model_copy(update={"content_hash": changed_hash}), changed
+    )
+
+    assert await document_store.get_content(document.doc_id) == changed
+    stored = await document_store.get_by_id(document.doc_id)
+    assert stored is not None
+    assert stored.content_hash == changed_hash
+    assert await document_store.get_by_id(uuid4()) is None
+    pending = await document_store.query_pending()
+    assert [doc.doc_id for doc in pending] == [document.doc_id]
+    assert await document_store.count_documents() == 1
+
+
+async def test_upsert_drops_document_duplicating_another(document_store) -> None:
+    """Test content already held by another doc_id is not stored twice."""
+    original, content = _make_document(0)
+    assert await document_store.upsert(original, content)
+
+    # A page that used to have its own content now mirrors the original page
+    mirror, mirror_content = _make_document(1)
+    assert await document_store.upsert(mirror, mirror_content)
+    duplicate = mirror.model_copy(update={"content_hash": original.content_hash})
+
+    assert not await document_store.upsert(duplicate, content)
+    assert await document_store.get_by_id(mirror.doc_id) is None
+    with pytest.raises(KeyError):
+        await document_store.get_content(mirror.doc_id)
+    assert await document_store.get_content(original.doc_id) == content
+    assert await document_store.count_documents() == 1
@@ -198,3 +198,65 @@ def test_duplicate_content_hash_handles_fk_constraint(document_store, db_connect
         result2 = cur.fetchone()
         stored_doc_id = result2['doc_id'] if isinstance(result2, dict) else result2[0]
         assert stored_doc_id == str(doc1.doc_id), "Should keep first document's doc_id"
+
+
+def test_iter_pending_pages_in_ingestion_order(document_store) -> None:
+    """Test keyset pagination yields every pending document once, oldest first."""
+    created = []
+    for i in range(5):
+        content = f"Paged pending document {i}"
+        doc = Document(
+            doc_id=uuid4(),
+            source_url=f"https://example.com/paged/{i}",
+            source_type=SourceType.WEB,
+            content_hash=hashlib.sha256(content.encode()).hexdigest(),
+            ingested_at=datetime(2025, 1, 1, 0, 0, i, tzinfo=UTC),
+            extraction_state=ExtractionState.PENDING,
+            extraction_version=None,
+            updated_at=datetime.now(UTC),
+            metadata=None,
+        )
+        document_store.create(doc, content)
+        created.append(doc.doc_id)
+
+    # Page size smaller than the backlog forces multiple keyset round-trips
+    results = list(document_store.iter_pending(batch_size=2))
+    assert [doc.doc_id for doc in results] == created
+
+    limited = list(document_store.iter_pending(batch_size=2, limit=3))
+    assert [doc.doc_id for doc in limited] == created[:3]
+
+
+def test_update_states_bulk_updates_all_documents(document_store) -> None:
+    """Test bulk state update applies every row in one statement."""
+    documents = []
+    for i in range(3):
+        content = f"Bulk document {i}"
+        doc = Document(
+            doc_id=uuid4(),
+            source_url=f"https://example.com/bulk/{i}",
+            source_type=SourceType.WEB,
+            content_hash=hashlib.sha256(content.encode()).hexdigest(),
+            ingested_at=datetime.now(UTC),
+            extraction_state=ExtractionState.PENDING,
+            extraction_version=None,
+            updated_at=datetime.now(UTC),
+            metadata=None,
+        )
+        document_store.create(doc, content)
+        documents.append(doc)
+
+    updates = [
+        doc.model_copy(
+            update={"extraction_state": ExtractionState.COMPLETED, "extraction_version": "1.0.0"}
+        )
+        for doc in documents
+    ]
+    missing = documents[0].model_copy(update={"doc_id": uuid4()})
+
+    assert document_store.update_states_bulk([*updates, missing]) == 3
+    assert document_store.query_pending() == []
+
+    # Set-based reprocess resets them all in one statement
+    assert document_store.reset_extraction_state_since(datetime(2000, 1, 1, tzinfo=UTC)) == 3
+    assert len(document_store.query_pending()) == 3
@@ -29,3 +29,15 @@ def test_taboot_config_exposes_tei_config_block() -> None:
     assert str(tei.url) == "http://localhost:8080"
     assert tei.batch_size == 32
     assert tei.timeout == 45
+
+
+def test_taboot_config_passes_client_limits_to_tei_config() -> None:
+    config = TabootConfig(
+        tei_client_concurrency=8, tei_client_max_retries=1, embedding_batch_tokens=4096
+    )
+
+    tei = config.tei_config
+
+    assert tei.max_concurrency == 8
+    assert tei.max_retries == 1
+    assert tei.max_batch_tokens == 4096
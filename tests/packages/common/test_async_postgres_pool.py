@@ -0,0 +1,63 @@
+"""Tests for AsyncPostgresPool checkout timing and error handling."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from packages.common.async_postgres_pool import AsyncPostgresPool
+from packages.common.config import TabootConfig
+from packages.common.postgres_pool import PostgresPoolError
+
+
+@pytest.fixture
+def pool() -> AsyncPostgresPool:
+    """AsyncPostgresPool wrapping a mocked asyncpg pool."""
+    config = TabootConfig(postgres_max_pool_size=4, postgres_pool_acquire_timeout=0.5)
+    pool = AsyncPostgresPool(config)
+    pool.pool = MagicMock()
+    pool.pool.acquire = AsyncMock(return_value="conn")
+    pool.pool.release = AsyncMock()
+    pool.pool.get_size.return_value = 2
+    pool.pool.get_idle_size.return_value = 1
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_acquire_releases_connection_and_records_wait(pool: AsyncPostgresPool) -> None:
+    """Test checkout yields a connection, releases it and records wait time."""
+    async with pool.acquire() as conn:
+        assert conn == "conn"
+
+    pool.pool.acquire.assert_awaited_once_with(timeout=0.5)
+    pool.pool.release.assert_awaited_once_with("conn")
+
+    stats = pool.get_stats()
+    assert stats["acquisitions"] == 1
+    assert stats["size"] == 2
+    assert stats["idle"] == 1
+    assert stats["max_size"] == 4
+    assert stats["wait_seconds_max"] >= 0.0
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout_raises_pool_error(pool: AsyncPostgresPool) -> None:
+    """Test an exhausted pool surfaces as PostgresPoolError after the timeout."""
+    pool.pool.acquire = AsyncMock(side_effect=TimeoutError())
+    pool.pool.get_max_size.return_value = 4
+
+    with pytest.raises(PostgresPoolError, match="Timed out"):
+        async with pool.acquire():
+            pass
+
+    assert pool.get_stats()["acquisitions"] == 1
+    pool.pool.release.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_acquire_requires_open_pool() -> None:
+    """Test checkout fails fast when the pool has not been opened."""
+    pool = AsyncPostgresPool(TabootConfig())
+
+    with pytest.raises(PostgresPoolError, match="not open"):
+        async with pool.acquire():
+            pass
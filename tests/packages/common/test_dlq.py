@@ -139,3 +139,80 @@ async def test_dlq_stores_error_metadata(mock_redis_client) -> None:
     assert mock_redis_client.lpush.called
     call_args = mock_redis_client.lpush.call_args
     assert "error" in str(call_args) or error in str(call_args)
+
+
+@pytest.mark.asyncio
+async def test_dlq_schedules_retry_with_backoff(mock_redis_client) -> None:
+    """Test a failed job is added to the retry set scored by its due time."""
+    import json
+
+    from packages.common.dlq import RETRY_QUEUE, DeadLetterQueue
+
+    dlq = DeadLetterQueue(redis_client=mock_redis_client, base_delay_seconds=2)
+    mock_redis_client.hincrby = AsyncMock(return_value=2)
+
+    due_at = await dlq.schedule_retry({"doc_id": "doc-1"}, "Ollama timeout", now=1000.0)
+
+    assert due_at == 1004.0
+    mock_redis_client.hincrby.assert_awaited_once_with("retry_counts", "doc-1", 1)
+    queue_name, mapping = mock_redis_client.zadd.await_args.args
+    assert queue_name == RETRY_QUEUE
+    ((entry, score),) = mapping.items()
+    assert score == 1004.0
+    assert json.loads(entry) == {"doc_id": "doc-1", "retry_count": 2, "error": "Ollama timeout"}
+    mock_redis_client.lpush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_dlq_dead_letters_after_max_retries(mock_redis_client) -> None:
+    """Test a job exceeding max_retries moves to queue:dlq instead of retrying."""
+    from packages.common.dlq import DLQ_QUEUE, DeadLetterQueue
+
+    dlq = DeadLetterQueue(redis_client=mock_redis_client, max_retries=3)
+    mock_redis_client.hincrby = AsyncMock(return_value=4)
+
+    assert await dlq.schedule_retry({"doc_id": "doc-1"}, "boom") is None
+
+    mock_redis_client.zadd.assert_not_awaited()
+    assert mock_redis_client.lpush.await_args.args[0] == DLQ_QUEUE
+    mock_redis_client.hdel.assert_awaited_once_with("retry_counts", "doc-1")
+
+
+@pytest.mark.asyncio
+async def test_dlq_promote_due_claims_removed_entries_only(mock_redis_client) -> None:
+    """Test promotion returns only entries this poller removed from the set."""
+    from unittest.mock import MagicMock
+
+    from packages.common.dlq import DeadLetterQueue
+
+    dlq = DeadLetterQueue(redis_client=mock_redis_client)
+    mock_redis_client.zrangebyscore = AsyncMock(return_value=['{"doc_id": "a"}', '{"doc_id": "b"}'])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1, 0])
+    mock_redis_client.pipeline = MagicMock(return_value=pipe)
+
+    jobs = await dlq.promote_due(limit=10, now=2000.0)
+
+    assert jobs == [{"doc_id": "a"}]
+    mock_redis_client.zrangebyscore.assert_awaited_once_with(
+        "queue:retry", "-inf", 2000.0, start=0, num=10
+    )
+    assert pipe.zrem.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_dlq_reschedule_restores_promoted_entries(mock_redis_client) -> None:
+    """Test rescheduled jobs go back on the retry set unchanged and due now."""
+    import json
+
+    from packages.common.dlq import RETRY_QUEUE, DeadLetterQueue
+
+    dlq = DeadLetterQueue(redis_client=mock_redis_client)
+    job = {"doc_id": "doc-1", "retry_count": 2, "error": "boom"}
+
+    await dlq.reschedule([job], now=3000.0)
+
+    queue_name, mapping = mock_redis_client.zadd.await_args.args
+    assert queue_name == RETRY_QUEUE
+    assert mapping == {json.dumps(job, sort_keys=True): 3000.0}
+    mock_redis_client.hincrby.assert_not_awaited()
@@ -0,0 +1,158 @@
+"""Tests for the staged IngestionPipeline."""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from packages.core.services.ingestion_pipeline import IngestionPipeline, PipelineStage
+
+
+async def test_run_batches_items_through_stages() -> None:
+    """Test items flow through every stage in batches, with a partial final batch."""
+    batches: list[list[int]] = []
+
+    async def record(batch: list[int]) -> list[int]:
+        batches.append(batch)
+        return batch
+
+    pipeline = IngestionPipeline(
+        [
+            PipelineStage(name="double", handler=lambda batch: [x * 2 for x in batch]),
+            PipelineStage(name="write", handler=record, batch_size=3),
+        ]
+    )
+
+    stats = await pipeline.run(range(7))
+
+    assert batches == [[0, 2, 4], [6, 8, 10], [12]]
+    assert stats["double"].items_processed == 7
+    assert stats["double"].items_emitted == 7
+    assert stats["write"].batches == 3
+    assert stats["write"].items_processed == 7
+    assert pipeline.queue_depths() == {"double": 0, "write": 0}
+
+
+async def test_run_handles_batches_concurrently() -> None:
+    """Test a stage with concurrency > 1 works on several batches at once."""
+    in_flight = 0
+    peak = 0
+
+    async def slow(batch: list[int]) -> list[int]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return batch
+
+    pipeline = IngestionPipeline(
+        [PipelineStage(name="slow", handler=slow, batch_size=2, concurrency=3)]
+    )
+
+    stats = await pipeline.run(range(12))
+
+    assert peak == 3
+    assert stats["slow"].items_processed == 12
+
+
+async def test_run_propagates_first_failure_and_keeps_stats() -> None:
+    """Test a failing stage cancels the pipeline and partial stats survive."""
+
+    async def source() -> AsyncIterator[int]:
+        for i in range(100):
+            yield i
+
+    def fail_on_five(batch: list[int]) -> list[int]:
+        if 5 in batch:
+            raise ConnectionError("sink down")
+        return batch
+
+    pipeline = IngestionPipeline(
+        [
+            PipelineStage(name="pass", handler=lambda batch: batch),
+            PipelineStage(name="sink", handler=fail_on_five),
+        ]
+    )
+
+    with pytest.raises(ConnectionError, match="sink down"):
+        await asyncio.wait_for(pipeline.run(source()), 5)
+
+    assert pipeline.stats["sink"].items_processed == 5
+    assert pipeline.queue_depths() == {"pass": 0, "sink": 0}
+
+
+async def test_gated_stage_waits_for_backpressure_per_batch() -> None:
+    """Test gated stages await the shared backpressure before each batch."""
+    backpressure = Mock()
+    backpressure.wait_for_capacity = AsyncMock()
+
+    pipeline = IngestionPipeline(
+        [
+            PipelineStage(name="free", handler=lambda batch: batch),
+            PipelineStage(name="gated", handler=lambda batch: batch, batch_size=2, gated=True),
+        ],
+        backpressure=backpressure,
+    )
+
+    await pipeline.run(range(5))
+
+    assert backpressure.wait_for_capacity.await_count == 3
+
+
+async def test_max_wait_flushes_partial_batches() -> None:
+    """Test a stage handles a partial batch when input stalls past max_wait."""
+    release = asyncio.Event()
+    batches: list[list[int]] = []
+
+    async def source() -> AsyncIterator[int]:
+        yield 1
+        await release.wait()
+        yield 2
+
+    def record(batch: list[int]) -> list[int]:
+        batches.append(batch)
+        release.set()
+        return batch
+
+    pipeline = IngestionPipeline(
+        [PipelineStage(name="write", handler=record, batch_size=10, max_wait=0.01)]
+    )
+
+    await asyncio.wait_for(pipeline.run(source()), 5)
+
+    assert batches == [[1], [2]]
+
+
+async def test_in_thread_stage_runs_off_the_event_loop() -> None:
+    """Test in_thread handlers run in a worker thread."""
+    threads: list[int] = []
+
+    def record(batch: list[int]) -> list[int]:
+        threads.append(threading.get_ident())
+        return batch
+
+    depths: list[tuple[str, int]] = []
+    pipeline = IngestionPipeline(
+        [PipelineStage(name="cpu", handler=record, in_thread=True)],
+        queue_depth_callback=lambda stage, depth: depths.append((stage, depth)),
+    )
+
+    await pipeline.run([1, 2])
+
+    assert threads and threading.get_ident() not in threads
+    assert ("cpu", 1) in depths
+    assert depths[-1] == ("cpu", 0)
+
+
+def test_pipeline_rejects_duplicate_stage_names() -> None:
+    """Test stage names must be unique."""
+    with pytest.raises(ValueError, match="unique"):
+        IngestionPipeline(
+            [
+                PipelineStage(name="a", handler=lambda batch: batch),
+                PipelineStage(name="a", handler=lambda batch: batch),
+            ]
+        )
@@ -1,15 +1,16 @@
 """Tests for ExtractPendingUseCase.
 
 Validates the extraction use-case orchestrates document extraction properly:
-- Queries pending documents from store
+- Claims pending documents from store
 - Calls ExtractionOrchestrator for each document
 - Updates document extraction state based on results
 - Handles per-document errors gracefully
 """
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -18,6 +19,19 @@ from packages.core.use_cases.extract_pending import ExtractPendingUseCase
 from packages.schemas.models import Document, ExtractionJob, ExtractionState, SourceType
 
 
+def _claim_queue(docs: list[Document]) -> Callable[..., Awaitable[list[Document]]]:
+    """Build a claim_pending side effect that hands out ``docs`` in order."""
+    queue = list(docs)
+
+    async def claim_pending(
+        worker_id: str, limit: int = 1, lease_seconds: int = 300
+    ) -> list[Document]:
+        claimed, queue[:] = queue[:limit], queue[limit:]
+        return claimed
+
+    return claim_pending
+
+
 @pytest.mark.unit
 def test_extract_pending_processes_documents() -> None:
     """Test that extract_pending processes all pending documents."""
@@ -51,8 +65,8 @@ def test_extract_pending_processes_documents() -> None:
     )
 
     # Mock document store (returns 3 pending documents)
-    mock_doc_store = MagicMock()
-    mock_doc_store.query_pending.return_value = [doc1, doc2, doc3]
+    mock_doc_store = AsyncMock()
+    mock_doc_store.claim_pending.side_effect = _claim_queue([doc1, doc2, doc3])
     mock_doc_store.get_content.side_effect = [
         "Content for doc1",
         "Content for doc2",
@@ -152,9 +166,9 @@ def test_extract_pending_handles_limit() -> None:
         for i in range(5)
     ]
 
-    # Mock document store (returns only 2 documents when limit=2)
-    mock_doc_store = MagicMock()
-    mock_doc_store.query_pending.return_value = docs[:2]
+    # Mock document store (5 documents are pending)
+    mock_doc_store = AsyncMock()
+    mock_doc_store.claim_pending.side_effect = _claim_queue(docs)
     mock_doc_store.get_content.side_effect = [f"Content for doc{i}" for i in range(2)]
 
     # Mock orchestrator (returns successful jobs)
@@ -189,8 +203,8 @@ def test_extract_pending_handles_limit() -> None:
     # Execute with limit=2
     result = asyncio.run(use_case.execute(limit=2))
 
-    # Assert: query_pending called with limit=2
-    mock_doc_store.query_pending.assert_called_once_with(limit=2)
+    # Assert: only 2 documents claimed
+    assert mock_doc_store.claim_pending.await_count == 2
 
     # Assert: only 2 documents processed
     assert result["processed"] == 2
@@ -214,8 +228,8 @@ def test_extract_pending_continues_on_individual_failure() -> None:
     ]
 
     # Mock document store
-    mock_doc_store = MagicMock()
-    mock_doc_store.query_pending.return_value = docs
+    mock_doc_store = AsyncMock()
+    mock_doc_store.claim_pending.side_effect = _claim_queue(docs)
     mock_doc_store.get_content.side_effect = [
         "Content for doc0",
         "Content for doc1",
@@ -273,8 +287,8 @@ def test_extract_pending_continues_on_individual_failure() -> None:
 def test_extract_pending_handles_empty_queue() -> None:
     """Test that extract_pending handles empty queue gracefully."""
     # Mock document store (returns empty list)
-    mock_doc_store = MagicMock()
-    mock_doc_store.query_pending.return_value = []
+    mock_doc_store = AsyncMock()
+    mock_doc_store.claim_pending.return_value = []
 
     # Mock orchestrator (should not be called)
     mock_orchestrator = MagicMock()
@@ -314,8 +328,8 @@ def test_extract_pending_updates_extraction_state() -> None:
     )
 
     # Mock document store
-    mock_doc_store = MagicMock()
-    mock_doc_store.query_pending.return_value = [doc]
+    mock_doc_store = AsyncMock()
+    mock_doc_store.claim_pending.side_effect = _claim_queue([doc])
     mock_doc_store.get_content.return_value = "Content for doc"
 
     # Mock orchestrator (returns completed job)
@@ -352,3 +366,131 @@ def test_extract_pending_updates_extraction_state() -> None:
     assert mock_doc_store.update_document.call_count == 1
     updated_doc = mock_doc_store.update_document.call_args[0][0]
     assert updated_doc.extraction_state == ExtractionState.COMPLETED
+
+
+@pytest.mark.unit
+def test_extract_pending_processes_concurrently() -> None:
+    """Test that extract_pending bounds in-flight documents by concurrency."""
+    docs = [
+        Document(
+            doc_id=uuid4(),
+            source_url=f"https://example.com/doc{i}",
+            source_type=SourceType.WEB,
+            content_hash=f"{i}" * 64,
+            ingested_at=datetime.now(UTC),
+            extraction_state=ExtractionState.PENDING,
+            updated_at=datetime.now(UTC),
+        )
+        for i in range(6)
+    ]
+
+    mock_doc_store = AsyncMock()
+    mock_doc_store.claim_pending.side_effect = _claim_queue(docs)
+    mock_doc_store.get_content.return_value = "Content"
+
+    in_flight = 0
+    max_in_flight = 0
+
+    class SlowOrchestrator:
+        async def process_document(self, doc_id: object, content: str) -> ExtractionJob:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if doc_id == docs[2].doc_id:
+                raise RuntimeError("boom")
+            return ExtractionJob(
+                job_id=uuid4(),
+                doc_id=doc_id,  # type: ignore[arg-type]
+                state=ExtractionState.COMPLETED,
+                tier_a_triples=1,
+                tier_b_windows=1,
+                tier_c_triples=1,
+                started_at=datetime.now(UTC),
+                completed_at=datetime.now(UTC),
+                retry_count=0,
+            )
+
+    use_case = ExtractPendingUseCase(
+        orchestrator=SlowOrchestrator(),
+        document_store=mock_doc_store,
+    )
+
+    result = asyncio.run(use_case.execute(concurrency=3))
+
+    assert max_in_flight == 3
+    assert result == {"processed": 6, "succeeded": 5, "failed": 1}
+    # The document that raised is marked FAILED so its lease is released
+    states = {
+        call.args[0].doc_id: call.args[0].extraction_state
+        for call in mock_doc_store.update_document.call_args_list
+    }
+    assert len(states) == 6
+    assert states[docs[2].doc_id] == ExtractionState.FAILED
+
+
+@pytest.mark.unit
+def test_extract_pending_rejects_invalid_concurrency() -> None:
+    """Test that extract_pending rejects a concurrency below 1."""
+    use_case = ExtractPendingUseCase(orchestrator=MagicMock(), document_store=MagicMock())
+
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(use_case.execute(concurrency=0))
+
+
+@pytest.mark.unit
+def test_extract_pending_claims_with_its_lease() -> None:
+    """Test documents are leased to the use case's worker id instead of queried."""
+    doc = Document(
+        doc_id=uuid4(),
+        source_url="https://example.com/doc",
+        source_type=SourceType.WEB,
+        content_hash="a" * 64,
+        ingested_at=datetime.now(UTC),
+        extraction_state=ExtractionState.PROCESSING,
+        updated_at=datetime.now(UTC),
+    )
+    mock_doc_store = AsyncMock()
+    mock_doc_store.claim_pending.side_effect = _claim_queue([doc])
+    mock_doc_store.get_content.return_value = "Content"
+    mock_orchestrator = AsyncMock()
+    mock_orchestrator.process_document.return_value = ExtractionJob(
+        job_id=uuid4(),
+        doc_id=doc.doc_id,
+        state=ExtractionState.COMPLETED,
+        tier_a_triples=1,
+        tier_b_windows=1,
+        tier_c_triples=1,
+        started_at=datetime.now(UTC),
+        completed_at=datetime.now(UTC),
+        retry_count=0,
+    )
+
+    use_case = ExtractPendingUseCase(
+        orchestrator=mock_orchestrator,
+        document_store=mock_doc_store,
+        worker_id="cli-a",
+        lease_seconds=60,
+    )
+    result = asyncio.run(use_case.execute())
+
+    assert result["succeeded"] == 1
+    mock_doc_store.claim_pending.assert_awaited_with("cli-a", limit=1, lease_seconds=60)
+    mock_doc_store.query_pending.assert_not_called()
+
+
+@pytest.mark.unit
+def test_extract_pending_heartbeat_stops_when_lease_lost() -> None:
+    """Test heartbeat renews the lease until the store reports it lost."""
+    doc_id = uuid4()
+    mock_doc_store = AsyncMock()
+    mock_doc_store.renew_lease.side_effect = [True, False]
+
+    use_case = ExtractPendingUseCase(orchestrator=MagicMock(), document_store=mock_doc_store)
+
+    with patch("packages.core.use_cases.extract_pending.asyncio.sleep", new=AsyncMock()):
+        asyncio.run(use_case._heartbeat(doc_id, "worker-a", 30))
+
+    assert mock_doc_store.renew_lease.call_count == 2
+    mock_doc_store.renew_lease.assert_called_with(doc_id, "worker-a", lease_seconds=30)
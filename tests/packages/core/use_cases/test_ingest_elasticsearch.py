@@ -0,0 +1,146 @@
+"""Tests for IngestElasticsearchUseCase orchestrator."""
+
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from llama_index.core import Document as LlamaDocument
+
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
+from packages.ingest.chunker import TextChunk
+
+
+class TestIngestElasticsearchUseCase:
+    """Test IngestElasticsearchUseCase orchestration."""
+
+    @pytest.fixture
+    def mock_reader(self) -> Mock:
+        """Create mock ElasticsearchReader returning two documents without _id."""
+        reader = Mock()
+        reader.load_data.return_value = [
+            LlamaDocument(text="First body", metadata={}),
+            LlamaDocument(text="Second body", metadata={}),
+        ]
+        return reader
+
+    @pytest.fixture
+    def mock_normalizer(self) -> Mock:
+        """Create mock Normalizer passing text through."""
+        normalizer = Mock()
+        normalizer.normalize.side_effect = lambda text: text
+        return normalizer
+
+    @pytest.fixture
+    def mock_chunker(self) -> Mock:
+        """Create mock Chunker emitting the body and a shared signature chunk."""
+        chunker = Mock()
+        chunker.chunk_text.side_effect = lambda text: [
+            TextChunk(text=text, start=0, end=0, token_count=2),
+            TextChunk(text="Sent from my phone", start=0, end=0, token_count=4),
+        ]
+        return chunker
+
+    @pytest.fixture
+    def mock_embedder(self) -> Mock:
+        """Create mock Embedder."""
+        embedder = Mock()
+        embedder.embed_texts_async = AsyncMock(
+            side_effect=lambda texts, token_counts=None: [[0.1] * 4 for _ in texts]
+        )
+        return embedder
+
+    @pytest.fixture
+    def mock_qdrant_writer(self) -> Mock:
+        """Create mock QdrantWriter."""
+        writer = Mock()
+        writer.upsert_batch_async = AsyncMock(return_value=None)
+        return writer
+
+    @pytest.fixture
+    def mock_document_store(self) -> AsyncPostgresDocumentStore:
+        """Create mock AsyncPostgresDocumentStore."""
+        return cast(AsyncPostgresDocumentStore, MagicMock(spec=AsyncPostgresDocumentStore))
+
+    async def test_shared_chunk_text_gets_distinct_ids_per_document(
+        self,
+        mock_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test identical chunks of different documents never share a point id."""
+        from packages.core.use_cases.ingest_elasticsearch import IngestElasticsearchUseCase
+
+        use_case = IngestElasticsearchUseCase(
+            elasticsearch_reader=mock_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+            index="mail",
+        )
+
+        stats = await use_case.execute(query={"match_all": {}})
+
+        assert stats == {"docs_processed": 2, "chunks_created": 4}
+        chunks = [
+            chunk
+            for call in mock_qdrant_writer.upsert_batch_async.call_args_list
+            for chunk in call.args[0]
+        ]
+        signatures = [chunk for chunk in chunks if chunk.content == "Sent from my phone"]
+        assert len({chunk.chunk_id for chunk in chunks}) == 4
+        assert signatures[0].doc_id != signatures[1].doc_id
+
+    async def test_execute_saves_documents_only_after_chunks_are_written(
+        self,
+        mock_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test a failed upsert stores no records, so extraction never sees the documents."""
+        from packages.core.use_cases.ingest_elasticsearch import IngestElasticsearchUseCase
+
+        store = cast(MagicMock, mock_document_store)
+        mock_qdrant_writer.upsert_batch_async.side_effect = [
+            ConnectionError("Qdrant unavailable"),
+            None,
+        ]
+
+        use_case = IngestElasticsearchUseCase(
+            elasticsearch_reader=mock_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+            index="mail",
+        )
+
+        with pytest.raises(ConnectionError):
+            await use_case.execute(query={"match_all": {}})
+        store.create.assert_not_called()
+
+        stats = await use_case.execute(query={"match_all": {}})
+
+        assert stats == {"docs_processed": 2, "chunks_created": 4}
+        assert store.create.await_count == 2
+        saved = {call.args[0].doc_id for call in store.create.await_args_list}
+        upserted = {
+            chunk.doc_id
+            for call in mock_qdrant_writer.upsert_batch_async.call_args_list
+            for chunk in call.args[0]
+        }
+        assert saved == upserted
+        assert {call.args[1] for call in store.create.await_args_list} == {
+            "First body",
+            "Second body",
+        }
@@ -7,12 +7,13 @@ With job state tracking and error handling.
 
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, Mock
-from uuid import UUID
+from uuid import NAMESPACE_URL, UUID, uuid5
 
 import pytest
 from llama_index.core import Document as LlamaDocument
 
-from packages.clients.postgres_document_store import PostgresDocumentStore
+from packages.clients.async_postgres_document_store import AsyncPostgresDocumentStore
+from packages.ingest.chunker import TextChunk
 from packages.schemas.models import Chunk, IngestionJob, JobState, SourceType
 
 
@@ -34,6 +35,13 @@ class TestIngestWebUseCase:
                 metadata={"source_url": "https://example.com/page2"},
             ),
         ]
+
+        # Stream whatever load_data is configured to return (or raise)
+        async def aiter_data(url: str, limit: int | None = None):
+            for doc in reader.load_data(url, limit):
+                yield doc
+
+        reader.aiter_data = Mock(side_effect=aiter_data)
         return reader
 
     @pytest.fixture
@@ -49,25 +57,24 @@ class TestIngestWebUseCase:
         chunker = Mock()
 
         # Return 3 chunks per document
-        def chunk_doc(doc: LlamaDocument) -> list[LlamaDocument]:
+        def chunk_text(text: str) -> list[TextChunk]:
             return [
-                LlamaDocument(
-                    text=f"Chunk {i} of {doc.metadata.get('source_url', 'unknown')}",
-                    metadata={**doc.metadata, "chunk_index": i, "chunk_count": 3},
-                )
+                TextChunk(text=f"Chunk {i} of {text[:20]}", start=0, end=0, token_count=5)
                 for i in range(3)
             ]
 
-        chunker.chunk_document.side_effect = chunk_doc
+        chunker.chunk_text.side_effect = chunk_text
         return chunker
 
     @pytest.fixture
     def mock_embedder(self) -> Mock:
         """Create mock Embedder."""
         embedder = Mock()
+
         # Return 1024-dim embeddings for async method
-        async def async_embed(texts):
+        async def async_embed(texts, token_counts=None):
             return [[0.1] * 1024 for _ in texts]
+
         embedder.embed_texts_async = AsyncMock(side_effect=async_embed)
         return embedder
 
@@ -77,13 +84,17 @@ class TestIngestWebUseCase:
         writer = Mock()
         # Use AsyncMock for async method
         writer.upsert_batch_async = AsyncMock(return_value=None)
+        # No stored points: every chunk is new
+        writer.reconcile_document.side_effect = lambda doc_id, chunks: list(chunks)
         return writer
 
     @pytest.fixture
-    def mock_document_store(self) -> PostgresDocumentStore:
-        """Create mock PostgresDocumentStore."""
-        store = MagicMock(spec=PostgresDocumentStore)
-        return cast(PostgresDocumentStore, store)
+    def mock_document_store(self) -> AsyncPostgresDocumentStore:
+        """Create mock AsyncPostgresDocumentStore."""
+        store = MagicMock(spec=AsyncPostgresDocumentStore)
+        store.get_by_id.return_value = None
+        store.upsert.return_value = True
+        return cast(AsyncPostgresDocumentStore, store)
 
     async def test_execute_orchestrates_full_pipeline(
         self,
@@ -92,7 +103,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that execute orchestrates the full ingestion pipeline."""
         # Import here to avoid circular dependency in fixture setup
@@ -116,7 +127,7 @@ class TestIngestWebUseCase:
         # Verify pipeline orchestration
         mock_web_reader.load_data.assert_called_once_with(url, limit)
         assert mock_normalizer.normalize.call_count == 2  # 2 documents
-        assert mock_chunker.chunk_document.call_count == 2  # 2 documents
+        assert mock_chunker.chunk_text.call_count == 2  # 2 documents
         mock_embedder.embed_texts_async.assert_called_once()  # 1 batch call
         mock_qdrant_writer.upsert_batch_async.assert_called_once()
 
@@ -139,7 +150,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that execute creates a job in PENDING state initially."""
         from packages.core.use_cases.ingest_web import IngestWebUseCase
@@ -167,7 +178,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that job transitions from PENDING to RUNNING."""
         from packages.core.use_cases.ingest_web import IngestWebUseCase
@@ -194,7 +205,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that pages_processed is updated for each document."""
         from packages.core.use_cases.ingest_web import IngestWebUseCase
@@ -227,7 +238,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that chunks_created is updated for each batch."""
         from packages.core.use_cases.ingest_web import IngestWebUseCase
@@ -254,7 +265,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that execute handles empty document list gracefully."""
         from packages.core.use_cases.ingest_web import IngestWebUseCase
@@ -278,7 +289,7 @@ class TestIngestWebUseCase:
         assert job.pages_processed == 0
         assert job.chunks_created == 0
         mock_normalizer.normalize.assert_not_called()
-        mock_chunker.chunk_document.assert_not_called()
+        mock_chunker.chunk_text.assert_not_called()
         mock_embedder.embed_texts_async.assert_not_called()
         mock_qdrant_writer.upsert_batch_async.assert_not_called()
 
@@ -289,7 +300,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that execute handles WebReader errors and marks job as FAILED."""
         from packages.core.use_cases.ingest_web import IngestWebUseCase
@@ -322,7 +333,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that execute handles Embedder errors and marks job as FAILED."""
         from packages.core.use_cases.ingest_web import IngestWebUseCase
@@ -354,7 +365,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that execute handles QdrantWriter errors and marks job as FAILED."""
         from packages.core.use_cases.ingest_web import IngestWebUseCase
@@ -386,7 +397,7 @@ class TestIngestWebUseCase:
         mock_chunker: Mock,
         mock_embedder: Mock,
         mock_qdrant_writer: Mock,
-        mock_document_store: PostgresDocumentStore,
+        mock_document_store: AsyncPostgresDocumentStore,
     ) -> None:
         """Test that execute creates valid Chunk models for Qdrant."""
         from packages.core.use_cases.ingest_web import IngestWebUseCase
@@ -425,3 +436,341 @@ class TestIngestWebUseCase:
             assert chunk.source_url == "https://example.com"
             assert chunk.position >= 0
             assert chunk.token_count > 0
+
+    async def test_execute_waits_for_backpressure_before_each_flush(
+        self,
+        mock_web_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test flushes are gated on downstream capacity."""
+        from packages.core.use_cases.ingest_web import IngestWebUseCase
+
+        calls: list[str] = []
+        backpressure = Mock()
+        backpressure.wait_for_capacity = AsyncMock(side_effect=lambda: calls.append("wait"))
+        mock_qdrant_writer.upsert_batch_async.side_effect = lambda *_: calls.append("flush")
+
+        use_case = IngestWebUseCase(
+            web_reader=mock_web_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+            flush_threshold=3,
+            backpressure=backpressure,
+        )
+
+        job = await use_case.execute(url="https://example.com", limit=5)
+
+        assert job.state == JobState.COMPLETED
+        # The next batch may be gated while the previous one is still upserting
+        assert calls[0] == "wait"
+        assert calls.count("wait") == 2
+        assert calls.count("flush") == 2
+
+    async def test_execute_overlaps_embedding_and_upserting(
+        self,
+        mock_web_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test the next batch is embedded while the previous one is upserted."""
+        import asyncio
+
+        from packages.core.use_cases.ingest_web import STAGE_EMBED, IngestWebUseCase
+
+        upsert_started = asyncio.Event()
+        release_upsert = asyncio.Event()
+        embedded_during_upsert: list[int] = []
+
+        async def slow_upsert(chunks, embeddings):
+            upsert_started.set()
+            await release_upsert.wait()
+
+        async def embed(texts, token_counts=None):
+            if upsert_started.is_set():
+                embedded_during_upsert.append(len(texts))
+                release_upsert.set()
+            return [[0.1] * 1024 for _ in texts]
+
+        mock_qdrant_writer.upsert_batch_async.side_effect = slow_upsert
+        mock_embedder.embed_texts_async.side_effect = embed
+        depths: list[tuple[str, int]] = []
+
+        use_case = IngestWebUseCase(
+            web_reader=mock_web_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+            flush_threshold=3,
+            queue_size=1,
+            queue_depth_callback=lambda stage, depth: depths.append((stage, depth)),
+        )
+
+        job = await asyncio.wait_for(use_case.execute(url="https://example.com", limit=5), 5)
+
+        assert job.state == JobState.COMPLETED
+        assert job.pages_processed == 2
+        assert job.chunks_created == 6
+        assert embedded_during_upsert == [3]
+        assert (STAGE_EMBED, 1) in depths
+        assert use_case.queue_depths() == {"chunk": 0, "embed": 0, "upsert": 0, "record": 0}
+
+    async def test_execute_skips_documents_with_known_content_hash(
+        self,
+        mock_web_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test unchanged pages are skipped before chunking and never re-embedded."""
+        from packages.core.use_cases.ingest_web import IngestWebUseCase
+        from packages.ingest.preparer import content_hash
+
+        unchanged = LlamaDocument(text="<p>Same</p>", metadata={"sourceURL": "https://a"})
+        changed = LlamaDocument(text="<p>New</p>", metadata={"sourceURL": "https://b"})
+        mock_web_reader.load_data.return_value = [unchanged, changed]
+        stored = {
+            uuid5(NAMESPACE_URL, "https://a"): Mock(
+                content_hash=content_hash(mock_normalizer.normalize(unchanged.text))
+            ),
+            uuid5(NAMESPACE_URL, "https://b"): Mock(content_hash="0" * 64),
+        }
+        store = cast(MagicMock, mock_document_store)
+        store.get_by_id.side_effect = stored.get
+
+        use_case = IngestWebUseCase(
+            web_reader=mock_web_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+        )
+
+        job = await use_case.execute(url="https://example.com", limit=5)
+
+        assert job.state == JobState.COMPLETED
+        assert mock_chunker.chunk_text.call_count == 1
+        store.upsert.assert_called_once()
+        assert store.upsert.call_args.args[0].doc_id == uuid5(NAMESPACE_URL, "https://b")
+        mock_qdrant_writer.reconcile_document.assert_called_once()
+        assert job.chunks_created == 3
+
+    async def test_execute_saves_documents_only_after_chunks_are_written(
+        self,
+        mock_web_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test a failed run stores no records, so the next run ingests the pages again."""
+        from packages.core.use_cases.ingest_web import IngestWebUseCase
+
+        store = cast(MagicMock, mock_document_store)
+        mock_qdrant_writer.upsert_batch_async.side_effect = [
+            ConnectionError("Qdrant unavailable"),
+            None,
+        ]
+        ingested: list[UUID] = []
+
+        use_case = IngestWebUseCase(
+            web_reader=mock_web_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+            document_ingested_callback=lambda document, _: ingested.append(document.doc_id),
+        )
+
+        failed = await use_case.execute(url="https://example.com", limit=5)
+
+        assert failed.state == JobState.FAILED
+        store.upsert.assert_not_called()
+        assert ingested == []
+
+        rerun = await use_case.execute(url="https://example.com", limit=5)
+
+        assert rerun.state == JobState.COMPLETED
+        assert mock_chunker.chunk_text.call_count == 4  # Both pages chunked again
+        assert rerun.chunks_created == 6
+        assert store.upsert.call_count == 2
+        assert len(ingested) == 2
+
+    async def test_execute_saves_fully_indexed_document_immediately(
+        self,
+        mock_web_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test a page whose points all exist is recorded without embedding anything."""
+        from packages.core.use_cases.ingest_web import IngestWebUseCase
+
+        store = cast(MagicMock, mock_document_store)
+        mock_qdrant_writer.reconcile_document.side_effect = lambda doc_id, chunks: []
+
+        use_case = IngestWebUseCase(
+            web_reader=mock_web_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+        )
+
+        job = await use_case.execute(url="https://example.com", limit=5)
+
+        assert job.state == JobState.COMPLETED
+        mock_embedder.embed_texts_async.assert_not_called()
+        assert store.upsert.call_count == 2
+
+    async def test_execute_processes_page_crawled_twice_once_with_pooled_workers(
+        self,
+        mock_web_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test concurrent chunk workers never both take the same page URL."""
+        import asyncio
+
+        from packages.core.use_cases.ingest_web import IngestWebUseCase
+        from packages.ingest.preparer import DocumentPreparer, content_hash
+
+        preparer = DocumentPreparer(mock_normalizer, mock_chunker, workers=2)
+
+        async def normalize(text: str, *, pooled: bool = False) -> tuple[str, str]:
+            await asyncio.sleep(0.01)  # Let the other worker pick up its page
+            markdown = mock_normalizer.normalize(text)
+            return markdown, content_hash(markdown)
+
+        async def chunk(markdown: str, *, pooled: bool = False) -> list[TextChunk]:
+            await asyncio.sleep(0.01)
+            return mock_chunker.chunk_text(markdown)
+
+        preparer.normalize = normalize  # type: ignore[method-assign]
+        preparer.chunk = chunk  # type: ignore[method-assign]
+        mock_web_reader.load_data.return_value = [
+            LlamaDocument(text="<p>Page</p>", metadata={"sourceURL": "https://a"}),
+            LlamaDocument(text="<p>Page again</p>", metadata={"sourceURL": "https://a"}),
+            LlamaDocument(text="<p>Other</p>", metadata={"sourceURL": "https://b"}),
+        ]
+        store = cast(MagicMock, mock_document_store)
+
+        use_case = IngestWebUseCase(
+            web_reader=mock_web_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+            preparer=preparer,
+        )
+
+        job = await use_case.execute(url="https://example.com")
+
+        assert job.state == JobState.COMPLETED
+        assert mock_chunker.chunk_text.call_count == 2
+        assert job.chunks_created == 6
+        assert {call.args[0].doc_id for call in store.upsert.call_args_list} == {
+            uuid5(NAMESPACE_URL, "https://a"),
+            uuid5(NAMESPACE_URL, "https://b"),
+        }
+
+    async def test_execute_skips_event_for_duplicate_content(
+        self,
+        mock_web_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test a page whose content another page already holds is indexed but not re-extracted."""
+        from packages.core.use_cases.ingest_web import IngestWebUseCase
+
+        store = cast(MagicMock, mock_document_store)
+        store.upsert.side_effect = [True, False]  # Second page duplicates the first
+        ingested: list[UUID] = []
+
+        use_case = IngestWebUseCase(
+            web_reader=mock_web_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+            document_ingested_callback=lambda document, _: ingested.append(document.doc_id),
+        )
+
+        job = await use_case.execute(url="https://example.com", limit=5)
+
+        assert job.state == JobState.COMPLETED
+        assert job.chunks_created == 6
+        assert ingested == [store.upsert.call_args_list[0].args[0].doc_id]
+
+    async def test_execute_reconciles_changed_documents_by_page_url(
+        self,
+        mock_web_reader: Mock,
+        mock_normalizer: Mock,
+        mock_chunker: Mock,
+        mock_embedder: Mock,
+        mock_qdrant_writer: Mock,
+        mock_document_store: AsyncPostgresDocumentStore,
+    ) -> None:
+        """Test re-crawled pages keep their doc_id and only unmatched chunks are embedded."""
+        from packages.core.use_cases.ingest_web import IngestWebUseCase
+
+        page = LlamaDocument(
+            text="<p>Changed</p>",
+            metadata={"source_url": "https://example.com", "sourceURL": "https://example.com/a"},
+        )
+        mock_web_reader.load_data.return_value = [page]
+        mock_qdrant_writer.reconcile_document.side_effect = lambda doc_id, chunks: chunks[-1:]
+
+        use_case = IngestWebUseCase(
+            web_reader=mock_web_reader,
+            normalizer=mock_normalizer,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+            qdrant_writer=mock_qdrant_writer,
+            document_store=mock_document_store,
+            collection_name="test_collection",
+        )
+
+        first = await use_case.execute(url="https://example.com", limit=5)
+        await use_case.execute(url="https://example.com", limit=5)
+
+        assert first.chunks_created == 1
+        (first_call, second_call) = mock_qdrant_writer.reconcile_document.call_args_list
+        assert first_call.args[0] == second_call.args[0]  # Stable doc_id
+        assert [c.chunk_id for c in first_call.args[1]] == [c.chunk_id for c in second_call.args[1]]
+        upserted = mock_qdrant_writer.upsert_batch_async.call_args[0][0]
+        assert [chunk.position for chunk in upserted] == [2]
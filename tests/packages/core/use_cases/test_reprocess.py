@@ -6,12 +6,9 @@ Following TDD methodology (RED-GREEN-REFACTOR).
 
 from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock
-from uuid import uuid4
 
 import pytest
 
-from packages.schemas.models import Document, ExtractionState
-
 
 class TestReprocessUseCase:
     """Tests for the ReprocessUseCase class."""
@@ -20,32 +17,11 @@ class TestReprocessUseCase:
         """Test that reprocess queues documents modified after specified date."""
         from packages.core.use_cases.reprocess import ReprocessUseCase
 
-        # Create mock document store
+        # Create mock document store (2 documents modified in the last 7 days)
         document_store = Mock()
+        document_store.reset_extraction_state_since.return_value = 2
 
-        # Mock documents from last 7 days
         since_date = datetime.now(UTC) - timedelta(days=7)
-        mock_docs = [
-            Document(
-                doc_id=uuid4(),
-                source_url="https://example.com/doc1",
-                source_type="web",
-                content_hash="a" * 64,  # SHA-256 is exactly 64 hex chars
-                ingested_at=datetime.now(UTC) - timedelta(days=3),
-                extraction_state=ExtractionState.COMPLETED,
-                updated_at=datetime.now(UTC),
-            ),
-            Document(
-                doc_id=uuid4(),
-                source_url="https://example.com/doc2",
-                source_type="web",
-                content_hash="b" * 64,  # SHA-256 is exactly 64 hex chars
-                ingested_at=datetime.now(UTC) - timedelta(days=5),
-                extraction_state=ExtractionState.COMPLETED,
-                updated_at=datetime.now(UTC),
-            ),
-        ]
-        document_store.query_by_date.return_value = mock_docs
 
         # Create use case
         use_case = ReprocessUseCase(document_store=document_store)
@@ -54,42 +30,30 @@ class TestReprocessUseCase:
         result = use_case.execute(since_date=since_date)
 
         # Verify
-        document_store.query_by_date.assert_called_once_with(since_date=since_date)
+        document_store.reset_extraction_state_since.assert_called_once_with(since_date=since_date)
         assert result["documents_queued"] == 2
 
-    def test_reprocess_resets_extraction_state(self) -> None:
-        """Test that reprocess resets extraction_state to PENDING."""
+    def test_reprocess_uses_set_based_reset(self) -> None:
+        """Test that reprocess resets state in one call instead of per document."""
         from packages.core.use_cases.reprocess import ReprocessUseCase
 
         document_store = Mock()
+        document_store.reset_extraction_state_since.return_value = 100_000
 
         since_date = datetime.now(UTC) - timedelta(days=7)
-        mock_doc = Document(
-            doc_id=uuid4(),
-            source_url="https://example.com/doc",
-            source_type="web",
-            content_hash="c" * 64,  # SHA-256 is exactly 64 hex chars
-            ingested_at=datetime.now(UTC) - timedelta(days=3),
-            extraction_state=ExtractionState.COMPLETED,
-            updated_at=datetime.now(UTC),
-        )
-        document_store.query_by_date.return_value = [mock_doc]
-
         use_case = ReprocessUseCase(document_store=document_store)
         result = use_case.execute(since_date=since_date)
 
-        # Verify document state was reset to PENDING
-        assert document_store.update_document.called
-        updated_doc = document_store.update_document.call_args[0][0]
-        assert updated_doc.extraction_state == ExtractionState.PENDING
-        assert result["documents_queued"] == 1
+        document_store.query_by_date.assert_not_called()
+        document_store.update_document.assert_not_called()
+        assert result["documents_queued"] == 100_000
 
     def test_reprocess_handles_empty_result(self) -> None:
         """Test that reprocess handles no documents gracefully."""
         from packages.core.use_cases.reprocess import ReprocessUseCase
 
         document_store = Mock()
-        document_store.query_by_date.return_value = []
+        document_store.reset_extraction_state_since.return_value = 0
 
         since_date = datetime.now(UTC) - timedelta(days=7)
         use_case = ReprocessUseCase(document_store=document_store)
@@ -0,0 +1,72 @@
+"""Tests for RedisDocumentEventConsumer."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from packages.ingest.adapters.redis_streams_consumer import (
+    AUTOCLAIM_START_ID,
+    RedisDocumentEventConsumer,
+)
+
+
+@pytest.fixture
+def redis_client() -> AsyncMock:
+    """Mock async Redis client."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def consumer(redis_client: AsyncMock) -> RedisDocumentEventConsumer:
+    """Consumer bound to the mocked Redis client."""
+    return RedisDocumentEventConsumer(
+        redis_client,
+        stream_name="stream:documents",
+        group_name="ingestion-events",
+        consumer_name="worker-1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_parses_batch_and_acks_malformed(
+    consumer: RedisDocumentEventConsumer, redis_client: AsyncMock
+) -> None:
+    """Test a batch read yields valid events and acks entries that cannot be parsed."""
+    doc_id = uuid4()
+    redis_client.xreadgroup.return_value = [
+        (
+            b"stream:documents",
+            [
+                (b"1-0", {b"doc_id": str(doc_id).encode(), b"chunk_count": b"3"}),
+                (b"2-0", {b"doc_id": b"not-a-uuid"}),
+                (b"3-0", None),
+            ],
+        )
+    ]
+
+    events = await consumer.read(count=10, block_ms=100)
+
+    assert [(message_id, event.doc_id) for message_id, event in events] == [("1-0", doc_id)]
+    assert events[0][1].chunk_count == 3
+    redis_client.xack.assert_awaited_once_with("stream:documents", "ingestion-events", "2-0", "3-0")
+
+
+@pytest.mark.asyncio
+async def test_autoclaim_advances_cursor(
+    consumer: RedisDocumentEventConsumer, redis_client: AsyncMock
+) -> None:
+    """Test XAUTOCLAIM walks the pending list and wraps to the start."""
+    doc_id = uuid4()
+    redis_client.xautoclaim.side_effect = [
+        [b"7-0", [(b"4-0", {b"doc_id": str(doc_id).encode()})], []],
+        [b"0-0", [], []],
+    ]
+
+    events = await consumer.autoclaim(min_idle_ms=60_000, count=5)
+    assert [message_id for message_id, _ in events] == ["4-0"]
+    assert redis_client.xautoclaim.await_args.kwargs["start_id"] == AUTOCLAIM_START_ID
+
+    assert await consumer.autoclaim(min_idle_ms=60_000, count=5) == []
+    assert redis_client.xautoclaim.await_args.kwargs["start_id"] == "7-0"
+    assert consumer._autoclaim_cursor == AUTOCLAIM_START_ID
@@ -0,0 +1,133 @@
+"""Tests for RedisDocumentEventPublisher lag tracking and backpressure."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from packages.core.events import DocumentIngestedEvent
+from packages.ingest.adapters.redis_streams_publisher import (
+    RedisDocumentEventPublisher,
+    ingest_stream_lag,
+)
+
+
+def _group(name: bytes, *, pending: int, lag: int | None, last_delivered: bytes) -> dict:
+    return {
+        "name": name,
+        "consumers": 1,
+        "pending": pending,
+        "last-delivered-id": last_delivered,
+        "entries-read": 10,
+        "lag": lag,
+    }
+
+
+@pytest.fixture
+def redis_client() -> AsyncMock:
+    """Mock async Redis client with two consumer groups."""
+    client = AsyncMock()
+    client.xinfo_groups.return_value = [
+        _group(b"ingestion-events", pending=2, lag=5, last_delivered=b"30-0"),
+        _group(b"audit", pending=0, lag=0, last_delivered=b"40-0"),
+    ]
+    client.xpending.return_value = {"pending": 2, "min": b"20-1", "max": b"30-0"}
+    return client
+
+
+def _event() -> DocumentIngestedEvent:
+    return DocumentIngestedEvent(doc_id=uuid4(), source_url="https://a", chunk_count=1)
+
+
+@pytest.mark.asyncio
+async def test_publish_without_group_caps_stream_length(redis_client: AsyncMock) -> None:
+    """Test the legacy MAXLEN cap is kept when no consumer group is tracked."""
+    publisher = RedisDocumentEventPublisher(redis_client, maxlen=500)
+
+    await publisher.publish_document_ingested(_event())
+
+    kwargs = redis_client.xadd.await_args.kwargs
+    assert kwargs["maxlen"] == 500
+    redis_client.xinfo_groups.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_publish_trims_only_acknowledged_entries(redis_client: AsyncMock) -> None:
+    """Test trimming stops at the oldest entry still pending in any group."""
+    publisher = RedisDocumentEventPublisher(redis_client, group_name="ingestion-events")
+
+    await publisher.publish_document_ingested(_event())
+    await publisher.publish_document_ingested(_event())
+
+    kwargs = redis_client.xadd.await_args.kwargs
+    assert kwargs["minid"] == "20-1"
+    assert "maxlen" not in kwargs
+    redis_client.xgroup_create.assert_awaited_once()
+    # Group state is cached within the check interval
+    redis_client.xinfo_groups.assert_awaited_once()
+
+    state = await publisher.get_group_state()
+    assert state.lag == 7  # 5 undelivered + 2 pending
+    gauge = ingest_stream_lag.labels(stream="stream:documents", group="ingestion-events")
+    assert gauge._value.get() == 7
+
+
+@pytest.mark.asyncio
+async def test_wait_for_capacity_pauses_until_low_watermark(
+    redis_client: AsyncMock, monkeypatch
+) -> None:
+    """Test producers pause above the high watermark and resume at the low one."""
+    lags = iter([12, 8, 3])
+
+    async def xinfo_groups(_stream):
+        return [_group(b"ingestion-events", pending=0, lag=next(lags), last_delivered=b"1-0")]
+
+    redis_client.xinfo_groups.side_effect = xinfo_groups
+    sleep = AsyncMock()
+    monkeypatch.setattr("packages.ingest.adapters.redis_streams_publisher.asyncio.sleep", sleep)
+
+    publisher = RedisDocumentEventPublisher(
+        redis_client,
+        group_name="ingestion-events",
+        lag_high_watermark=10,
+        lag_low_watermark=4,
+    )
+
+    await publisher.wait_for_capacity()
+
+    assert sleep.await_count == 2
+    assert (await publisher.get_group_state()).lag == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_for_capacity_gives_up_after_max_wait(redis_client: AsyncMock) -> None:
+    """Test a stalled consumer cannot block ingestion forever."""
+    publisher = RedisDocumentEventPublisher(
+        redis_client,
+        group_name="ingestion-events",
+        lag_high_watermark=1,
+        max_backpressure_wait=0.0,
+    )
+
+    await publisher.wait_for_capacity()
+
+    redis_client.xinfo_groups.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_publish_many_pipelines_xadds(redis_client: AsyncMock) -> None:
+    """Test a batch is sent as one pipeline of XADDs."""
+    from unittest.mock import MagicMock
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis_client.pipeline = MagicMock(return_value=pipe)
+    publisher = RedisDocumentEventPublisher(redis_client, group_name="ingestion-events")
+
+    await publisher.publish_many([_event(), _event(), _event()])
+
+    redis_client.pipeline.assert_called_once_with(transaction=False)
+    assert pipe.xadd.call_count == 3
+    assert {call.kwargs["minid"] for call in pipe.xadd.call_args_list} == {"20-1"}
+    pipe.execute.assert_awaited_once()
+    redis_client.xadd.assert_not_awaited()
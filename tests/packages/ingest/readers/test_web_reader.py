@@ -297,3 +297,143 @@ class TestWebReader:
                 assert "exclude_paths" not in params or params["exclude_paths"] == [], (
                     "Empty exclude_paths config should not add parameter"
                 )
+
+
+class TestWebReaderStreaming:
+    """Tests for WebReader.aiter_data crawl status streaming."""
+
+    @staticmethod
+    def _make_reader(handler, monkeypatch):  # type: ignore[no-untyped-def]
+        import httpx
+
+        from packages.ingest.readers.web import WebReader
+
+        # Route the reader's real client through an in-memory transport
+        client_class = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: client_class(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        return WebReader(
+            firecrawl_url="http://test:3002",
+            firecrawl_api_key="test-key",
+            rate_limit_delay=0.0,
+            poll_interval=0.0,
+        )
+
+    async def test_aiter_data_yields_pages_incrementally(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test pages are yielded per poll, skipping pages already seen."""
+        import json
+
+        import httpx
+
+        requests: list[httpx.Request] = []
+        polls = [
+            {"status": "scraping", "data": [{"markdown": "page 1", "metadata": {"title": "1"}}]},
+            {
+                "status": "completed",
+                "data": [{"markdown": "page 2"}],
+                "next": "http://test:3002/v2/crawl/abc?skip=2",
+            },
+            {"status": "completed", "data": [{"markdown": "page 3"}]},
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.method == "POST":
+                return httpx.Response(200, json={"success": True, "id": "abc"})
+            return httpx.Response(200, json={"success": True, **polls.pop(0)})
+
+        reader = self._make_reader(handler, monkeypatch)
+        docs = [doc async for doc in reader.aiter_data("https://example.com", limit=3)]
+
+        assert [doc.text for doc in docs] == ["page 1", "page 2", "page 3"]
+        assert docs[0].metadata == {"title": "1", "source_url": "https://example.com"}
+
+        body = json.loads(requests[0].content)
+        assert requests[0].headers["Authorization"] == "Bearer test-key"
+        assert body["url"] == "https://example.com"
+        assert body["limit"] == 3
+        assert "scrapeOptions" in body and "excludePaths" in body
+        assert [str(r.url) for r in requests[1:]] == [
+            "http://test:3002/v2/crawl/abc?skip=0",
+            "http://test:3002/v2/crawl/abc?skip=1",
+            "http://test:3002/v2/crawl/abc?skip=2",
+        ]
+
+    async def test_aiter_data_raises_when_crawl_fails(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed crawl surfaces as WebReaderError after yielded pages."""
+        import httpx
+
+        from packages.ingest.readers.web import WebReaderError
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(200, json={"success": True, "id": "abc"})
+            return httpx.Response(
+                200, json={"success": True, "status": "failed", "data": [{"markdown": "p"}]}
+            )
+
+        reader = self._make_reader(handler, monkeypatch)
+        docs = []
+        with pytest.raises(WebReaderError, match="failed"):
+            async for doc in reader.aiter_data("https://example.com"):
+                docs.append(doc)
+
+        assert len(docs) == 1
+
+    async def test_aiter_data_cancels_crawl_when_consumer_stops(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test closing the iterator early cancels the Firecrawl job."""
+        import httpx
+
+        methods: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            if request.method == "POST":
+                return httpx.Response(200, json={"success": True, "id": "abc"})
+            if request.method == "DELETE":
+                return httpx.Response(200, json={"success": True})
+            return httpx.Response(
+                200, json={"success": True, "status": "scraping", "data": [{"markdown": "p"}]}
+            )
+
+        reader = self._make_reader(handler, monkeypatch)
+        stream = reader.aiter_data("https://example.com")
+        await anext(stream)
+        await stream.aclose()
+
+        assert methods == ["POST", "GET", "DELETE"]
+
+    async def test_aiter_data_rate_limit_does_not_block_event_loop(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the streaming path rate limits with asyncio.sleep."""
+        from unittest.mock import AsyncMock, patch
+
+        import httpx
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(200, json={"success": True, "id": "abc"})
+            return httpx.Response(200, json={"success": True, "status": "completed", "data": []})
+
+        reader = self._make_reader(handler, monkeypatch)
+        reader.rate_limit_delay = 5.0
+        reader._last_request_time = __import__("time").time()
+
+        with (
+            patch("packages.ingest.readers.web.time.sleep", side_effect=AssertionError),
+            patch("packages.ingest.readers.web.asyncio.sleep", new=AsyncMock()) as sleep,
+        ):
+            docs = [doc async for doc in reader.aiter_data("https://example.com")]
+
+        assert docs == []
+        assert sleep.await_args_list[0].args[0] > 4.0
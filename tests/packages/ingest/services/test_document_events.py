@@ -0,0 +1,119 @@
+"""Tests for the buffered DocumentEventDispatcher."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from packages.ingest.services.document_events import DocumentEventDispatcher
+from packages.schemas.models import Document, ExtractionState, SourceType
+
+
+def _document() -> Document:
+    now = datetime.now(UTC)
+    return Document(
+        doc_id=uuid4(),
+        source_url="https://example.com",
+        source_type=SourceType.WEB,
+        content_hash="0" * 64,
+        ingested_at=now,
+        extraction_state=ExtractionState.PENDING,
+        extraction_version=None,
+        updated_at=now,
+        metadata={},
+    )
+
+
+@pytest.fixture
+def publisher() -> AsyncMock:
+    """Mock publisher recording batched publishes."""
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_flushes_full_batch_in_one_publish(publisher: AsyncMock) -> None:
+    """Test reaching max_batch_size triggers a single pipelined publish."""
+    dispatcher = DocumentEventDispatcher(
+        publisher, enabled=True, max_batch_size=3, flush_interval=60
+    )
+
+    docs = [_document() for _ in range(3)]
+    for doc in docs:
+        dispatcher.dispatch_document_ingested(doc, chunk_count=2)
+    await asyncio.sleep(0.01)
+
+    publisher.publish_many.assert_awaited_once()
+    (batch,) = publisher.publish_many.await_args.args
+    assert [event.doc_id for event in batch] == [doc.doc_id for doc in docs]
+    assert dispatcher.pending == 0
+    await dispatcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_interval(publisher: AsyncMock) -> None:
+    """Test events below the size threshold are published after flush_interval."""
+    dispatcher = DocumentEventDispatcher(
+        publisher, enabled=True, max_batch_size=100, flush_interval=0.01
+    )
+
+    dispatcher.dispatch_document_ingested(_document(), chunk_count=1)
+    await asyncio.sleep(0.05)
+
+    publisher.publish_many.assert_awaited_once()
+    await dispatcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_remaining_events(publisher: AsyncMock) -> None:
+    """Test aclose publishes everything still buffered."""
+    dispatcher = DocumentEventDispatcher(
+        publisher, enabled=True, max_batch_size=100, flush_interval=60
+    )
+
+    dispatcher.dispatch_document_ingested(_document(), chunk_count=1)
+    dispatcher.dispatch_document_ingested(_document(), chunk_count=1)
+    await dispatcher.aclose()
+
+    (batch,) = publisher.publish_many.await_args.args
+    assert len(batch) == 2
+    assert dispatcher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_is_retried(publisher: AsyncMock) -> None:
+    """Test a failed flush keeps events buffered for the next attempt."""
+    publisher.publish_many.side_effect = [ConnectionError("redis down"), None]
+    dispatcher = DocumentEventDispatcher(
+        publisher, enabled=True, max_batch_size=100, flush_interval=60
+    )
+    dispatcher.dispatch_document_ingested(_document(), chunk_count=1)
+
+    with pytest.raises(ConnectionError):
+        await dispatcher.flush()
+    assert dispatcher.pending == 1
+
+    await dispatcher.aclose()
+    assert publisher.publish_many.await_count == 2
+    assert dispatcher.pending == 0
+
+
+def test_without_running_loop_is_rejected(publisher: AsyncMock) -> None:
+    """Test dispatching outside an event loop raises instead of spinning up loops."""
+    dispatcher = DocumentEventDispatcher(publisher, enabled=True, max_batch_size=2)
+
+    with pytest.raises(RuntimeError, match="running event loop"):
+        dispatcher.dispatch_document_ingested(_document(), chunk_count=1)
+
+    assert dispatcher.pending == 0
+    publisher.publish_many.assert_not_awaited()
+
+
+def test_disabled_dispatcher_is_noop(publisher: AsyncMock) -> None:
+    """Test nothing is buffered when the feature flag is off."""
+    dispatcher = DocumentEventDispatcher(publisher, enabled=False)
+
+    dispatcher.dispatch_document_ingested(_document(), chunk_count=1)
+
+    assert dispatcher.pending == 0
@@ -0,0 +1,65 @@
+"""Tests for async PostgreSQL ingestion job store."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from packages.common.async_postgres_pool import AsyncPostgresPool
+from packages.common.config import get_config
+from packages.ingest.async_postgres_job_store import AsyncPostgresJobStore
+from packages.schemas.models import IngestionJob, JobState, SourceType
+
+
+@pytest.fixture
+async def job_store() -> AsyncIterator[AsyncPostgresJobStore]:
+    """Create AsyncPostgresJobStore on a fresh pool."""
+    pool = await AsyncPostgresPool.create(get_config())
+    yield AsyncPostgresJobStore(pool)
+    await pool.close()
+
+
+async def test_create_update_and_get_job(job_store) -> None:
+    """Test creating, updating and retrieving an ingestion job."""
+    created_at = datetime.now(UTC)
+    job = IngestionJob(
+        job_id=uuid4(),
+        source_type=SourceType.WEB,
+        source_target="https://example.com",
+        state=JobState.PENDING,
+        created_at=created_at,
+        started_at=None,
+        completed_at=None,
+        pages_processed=0,
+        chunks_created=0,
+        errors=None,
+    )
+
+    await job_store.create(job)
+
+    retrieved = await job_store.get_by_id(job.job_id)
+    assert retrieved is not None
+    assert retrieved.state == JobState.PENDING
+
+    failed = job.model_copy(
+        update={
+            "state": JobState.FAILED,
+            "started_at": created_at,
+            "completed_at": datetime.now(UTC),
+            "pages_processed": 3,
+            "errors": [{"error": "Connection timeout"}],
+        }
+    )
+    await job_store.update(failed)
+
+    retrieved = await job_store.get_by_id(job.job_id)
+    assert retrieved is not None
+    assert retrieved.state == JobState.FAILED
+    assert retrieved.pages_processed == 3
+    assert retrieved.errors == [{"error": "Connection timeout"}]
+
+
+async def test_get_missing_job_returns_none(job_store) -> None:
+    """Test get_by_id returns None for unknown jobs."""
+    assert await job_store.get_by_id(uuid4()) is None
@@ -1,11 +1,13 @@
 """Tests for document chunker.
 
-Tests semantic chunking using LlamaIndex SentenceSplitter.
+Tests the native token-aware chunker and its LlamaIndex Document adapter.
 Following TDD methodology (RED-GREEN-REFACTOR).
 """
 
 from llama_index.core import Document
 
+from packages.common.token_utils import count_tokens
+
 
 class TestChunker:
     """Tests for the Chunker class."""
@@ -125,3 +127,100 @@ class TestChunker:
         for i, chunk in enumerate(chunks):
             assert "chunk_index" in chunk.metadata
             assert chunk.metadata["chunk_index"] == i
+
+
+class TestChunkText:
+    """Tests for Chunker.chunk_text spans."""
+
+    def test_spans_partition_the_document_token_stream(self) -> None:
+        """Test spans slice the source and, without overlap, token counts add up."""
+        from packages.ingest.chunker import Chunker
+
+        text = " ".join(f"Café sentence {i} über naïve text." for i in range(200))
+
+        chunks = Chunker(chunk_size=64, chunk_overlap=0).chunk_text(text)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert text[chunk.start : chunk.end] == chunk.text
+            assert 0 < chunk.token_count <= 64
+            assert chunk.text.endswith(".")  # Sentence-aligned
+        assert sum(chunk.token_count for chunk in chunks) == count_tokens(text)
+
+    def test_overlap_repeats_trailing_sentences(self) -> None:
+        """Test consecutive chunks share whole sentences up to chunk_overlap."""
+        from packages.ingest.chunker import Chunker
+
+        text = " ".join(f"Sentence {i} is here." for i in range(100))
+
+        chunks = Chunker(chunk_size=50, chunk_overlap=12).chunk_text(text)
+
+        for previous, current in zip(chunks, chunks[1:], strict=False):
+            first_sentence = current.text.split(". ")[0] + "."
+            assert first_sentence in previous.text
+            assert current.start < previous.end
+
+    def test_headings_start_chunks_and_set_section_path(self) -> None:
+        """Test headings break chunks and produce a heading path, ignoring code fences."""
+        from packages.ingest.chunker import Chunker
+
+        text = (
+            "# Guide\n\nIntro text.\n\n## Install\n\nRun it.\n\n"
+            "```\n# not a heading\n```\n\n## Usage\n\nUse it."
+        )
+
+        chunks = Chunker(chunk_size=512, chunk_overlap=51).chunk_text(text)
+
+        assert [chunk.section for chunk in chunks] == [
+            "Guide",
+            "Guide > Install",
+            "Guide > Usage",
+        ]
+        assert chunks[1].text.startswith("## Install")
+        assert "# not a heading" in chunks[1].text
+
+    def test_oversized_sentence_is_split_into_token_windows(self) -> None:
+        """Test text without sentence breaks is windowed at chunk_size."""
+        from packages.ingest.chunker import Chunker
+
+        chunks = Chunker(chunk_size=32, chunk_overlap=4).chunk_text("word " * 200)
+
+        assert len(chunks) > 1
+        assert all(chunk.token_count <= 32 for chunk in chunks)
+
+    def test_boundaries_survive_an_edit_near_the_top(self) -> None:
+        """Test content-defined cuts keep later chunks identical after an insertion."""
+        import random
+
+        from packages.ingest.chunker import Chunker
+
+        rng = random.Random(1)
+        words = ["alpha", "beta", "gamma", "port", "proxy", "service", "docker", "volume"]
+        sentences = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(5, 25))).capitalize() + "."
+            for _ in range(400)
+        ]
+        original = " ".join(sentences)
+        edited = " ".join([*sentences[:3], "An inserted sentence.", *sentences[3:]])
+
+        def shared(chunker: Chunker) -> float:
+            before = {chunk.text for chunk in chunker.chunk_text(original)}
+            after = {chunk.text for chunk in chunker.chunk_text(edited)}
+            return len(before & after) / len(before)
+
+        assert shared(Chunker(chunk_size=128, chunk_overlap=0)) > 0.8
+
+
+class TestStableChunkIds:
+    """Tests for deterministic chunk IDs."""
+
+    def test_ids_depend_on_source_and_content(self) -> None:
+        """Test IDs are reproducible, scoped to the source and unique per duplicate."""
+        from packages.ingest.chunker import stable_chunk_ids
+
+        ids = stable_chunk_ids("https://example.com/a", ["one", "two", "one"])
+
+        assert ids == stable_chunk_ids("https://example.com/a", ["one", "two", "one"])
+        assert len(set(ids)) == 3
+        assert stable_chunk_ids("https://example.com/a", ["two"]) == [ids[1]]
+        assert stable_chunk_ids("https://example.com/b", ["one"]) != [ids[0]]
@@ -4,9 +4,14 @@ Tests batch embedding using Text Embeddings Inference (TEI) service.
 Following TDD methodology (RED-GREEN-REFACTOR).
 """
 
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
 from unittest.mock import Mock, patch
 
 import httpx
+import numpy as np
 import pytest
 
 
@@ -182,3 +187,228 @@ class TestEmbedder:
 
             result = embedder.embed_texts(["Test"])
             assert len(result) == 1
+
+
+class TestEmbedderAsync:
+    """Test the pooled, concurrent async embedding path."""
+
+    @staticmethod
+    def _use_transport(
+        monkeypatch: pytest.MonkeyPatch,
+        handler: Callable[[httpx.Request], Awaitable[httpx.Response]],
+    ) -> list[httpx.AsyncClient]:
+        """Route the embedder's AsyncClient through a mock transport."""
+        created: list[httpx.AsyncClient] = []
+        real_client = httpx.AsyncClient
+
+        def factory(**kwargs: Any) -> httpx.AsyncClient:
+            kwargs.pop("http2", None)
+            client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+            created.append(client)
+            return client
+
+        monkeypatch.setattr("packages.ingest.embedder.httpx.AsyncClient", factory)
+        return created
+
+    async def test_embed_texts_async_keeps_order_and_bounds_concurrency(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test batches run concurrently up to max_concurrency and results keep input order."""
+        from packages.ingest.embedder import Embedder
+
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            inputs = json.loads(request.content)["inputs"]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later batches finish first to prove ordering does not follow completion
+            await asyncio.sleep(0.05 / int(inputs[0]))
+            in_flight -= 1
+            return httpx.Response(200, json=[[float(text)] * 4 for text in inputs])
+
+        self._use_transport(monkeypatch, handler)
+        embedder = Embedder(tei_url="http://tei", batch_size=2, expected_dim=4, max_concurrency=3)
+
+        texts = [str(i) for i in range(1, 13)]
+        result = await embedder.embed_texts_async(texts)
+        await embedder.aclose()
+
+        assert [vector[0] for vector in result] == [float(t) for t in texts]
+        assert peak == 3
+
+    async def test_embed_texts_async_retries_only_the_failed_batch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a transient 503 retries that batch alone."""
+        from packages.ingest.embedder import Embedder
+
+        calls: list[list[str]] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            inputs = json.loads(request.content)["inputs"]
+            calls.append(inputs)
+            if inputs == ["c", "d"] and calls.count(inputs) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json=[[0.5] * 4 for _ in inputs])
+
+        self._use_transport(monkeypatch, handler)
+        embedder = Embedder(tei_url="http://tei", batch_size=2, expected_dim=4, retry_backoff=0.0)
+
+        result = await embedder.embed_texts_async(["a", "b", "c", "d"])
+        await embedder.aclose()
+
+        assert len(result) == 4
+        assert calls.count(["a", "b"]) == 1
+        assert calls.count(["c", "d"]) == 2
+
+    async def test_embed_texts_async_does_not_retry_client_errors(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test 4xx responses fail immediately."""
+        from packages.ingest.embedder import Embedder, EmbedderError
+
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(413)
+
+        self._use_transport(monkeypatch, handler)
+        embedder = Embedder(tei_url="http://tei", expected_dim=4, retry_backoff=0.0)
+
+        with pytest.raises(EmbedderError, match="HTTP error"):
+            await embedder.embed_texts_async(["too long"])
+        await embedder.aclose()
+
+        assert calls == 1
+
+    async def test_embed_texts_async_reuses_client_across_calls(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test one AsyncClient serves every call on the same loop until closed."""
+        from packages.ingest.embedder import Embedder
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            inputs = json.loads(request.content)["inputs"]
+            return httpx.Response(200, json=[[0.5] * 4 for _ in inputs])
+
+        created = self._use_transport(monkeypatch, handler)
+        embedder = Embedder(tei_url="http://tei", expected_dim=4)
+
+        await embedder.embed_texts_async(["a"])
+        await embedder.embed_texts_async(["b"])
+        assert len(created) == 1
+
+        await embedder.aclose()
+        assert created[0].is_closed
+
+        await embedder.embed_texts_async(["c"])
+        assert len(created) == 2
+        await embedder.aclose()
+
+
+class TestEmbedderTokenBudget:
+    """Test token-budget batching."""
+
+    def test_plan_batches_packs_by_token_budget_longest_first(self) -> None:
+        """Test texts are sorted by length and packed up to the token budget."""
+        from packages.ingest.embedder import Embedder
+
+        embedder = Embedder(tei_url="http://tei", batch_size=8, max_batch_tokens=100)
+        token_counts = [10, 90, 40, 60, 10, 150]
+
+        plan = embedder._plan_batches(["x"] * 6, token_counts)
+
+        # The oversized text goes alone; the rest fill the budget
+        assert plan == [[5], [1], [3, 2], [0, 4]]
+
+    def test_plan_batches_respects_batch_size_cap(self) -> None:
+        """Test small texts still stop at batch_size per request."""
+        from packages.ingest.embedder import Embedder
+
+        embedder = Embedder(tei_url="http://tei", batch_size=8, max_batch_tokens=10_000)
+
+        plan = embedder._plan_batches(["x"] * 20, [5] * 20)
+
+        assert [len(batch) for batch in plan] == [8, 8, 4]
+
+    def test_plan_batches_rejects_mismatched_token_counts(self) -> None:
+        """Test token_counts must line up with texts."""
+        from packages.ingest.embedder import Embedder
+
+        embedder = Embedder(tei_url="http://tei", max_batch_tokens=100)
+
+        with pytest.raises(ValueError, match="token_counts"):
+            embedder._plan_batches(["a", "b"], [1])
+
+    def test_embed_texts_returns_original_order_with_token_budget(self) -> None:
+        """Test sorted batches are scattered back to input order."""
+        from packages.ingest.embedder import Embedder
+
+        embedder = Embedder(tei_url="http://tei", batch_size=8, expected_dim=1, max_batch_tokens=12)
+        texts = ["a" * 4, "b" * 40, "c" * 8, "d" * 20]
+        posted: list[list[str]] = []
+
+        def post(url: str, json: dict[str, list[str]]) -> Mock:
+            posted.append(json["inputs"])
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.json.return_value = [[float(len(text))] for text in json["inputs"]]
+            return response
+
+        with patch.object(embedder, "_client") as mock_client:
+            mock_client.post.side_effect = post
+            result = embedder.embed_texts(texts)
+
+        assert result == [[4.0], [40.0], [8.0], [20.0]]
+        assert posted == [["b" * 40], ["d" * 20, "c" * 8, "a" * 4]]
+
+
+class TestEmbedderArray:
+    """Test the float32 ndarray embedding path."""
+
+    async def test_embed_array_async_returns_float32_matrix_in_input_order(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test batches are parsed into one contiguous matrix in input order."""
+        from packages.ingest.embedder import Embedder
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            inputs = json.loads(request.content)["inputs"]
+            return httpx.Response(200, json=[[float(len(text))] * 4 for text in inputs])
+
+        TestEmbedderAsync._use_transport(monkeypatch, handler)
+        embedder = Embedder(tei_url="http://tei", batch_size=8, expected_dim=4, max_batch_tokens=2)
+
+        matrix = await embedder.embed_array_async(["a" * 4, "b" * 8, "c" * 2])
+        await embedder.aclose()
+
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (3, 4)
+        assert matrix.flags["C_CONTIGUOUS"]
+        assert matrix[:, 0].tolist() == [4.0, 8.0, 2.0]
+
+    async def test_embed_array_async_rejects_bad_shape_and_nan(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test vectorized validation of TEI responses."""
+        from packages.ingest.embedder import Embedder, EmbedderError
+
+        # null becomes NaN when parsed into a float32 array
+        responses = iter(["[[0.1, 0.2]]", "[[0.1, null, 0.3, 0.4]]"])
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=next(responses))
+
+        TestEmbedderAsync._use_transport(monkeypatch, handler)
+        embedder = Embedder(tei_url="http://tei", expected_dim=4)
+
+        with pytest.raises(EmbedderError, match="shape"):
+            await embedder.embed_array_async(["x"])
+        with pytest.raises(EmbedderError, match="Non-finite"):
+            await embedder.embed_array_async(["x"])
+        await embedder.aclose()
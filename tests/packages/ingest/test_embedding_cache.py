@@ -0,0 +1,122 @@
+"""Tests for the content-addressed embedding cache."""
+
+from collections.abc import Sequence
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from packages.ingest.embedding_cache import (
+    CachedEmbedder,
+    DiskEmbeddingCacheBackend,
+    EmbeddingCache,
+    decode_vector,
+    embedding_cache_key,
+    encode_vector,
+)
+
+
+class MemoryBackend:
+    """In-memory backend recording calls."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        return [self.data.get(key) for key in keys]
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        self.data.update(items)
+
+    async def aclose(self) -> None:
+        return None
+
+
+def test_cache_key_depends_on_model_and_normalized_text() -> None:
+    """Test whitespace-only changes share a key but a model change does not."""
+    key = embedding_cache_key("model-a", "Hello   world\n")
+
+    assert key == embedding_cache_key("model-a", " Hello world")
+    assert key != embedding_cache_key("model-b", "Hello world")
+    assert key != embedding_cache_key("model-a", "Hello world!")
+
+
+@pytest.mark.parametrize(("dtype", "size"), [("float16", 2), ("float32", 4)])
+def test_encode_vector_round_trips_compactly(dtype: str, size: int) -> None:
+    """Test vectors pack to 2 or 4 bytes per value and decode back."""
+    vector = [0.5, -0.25, 1.0]
+
+    data = encode_vector(vector, dtype)  # type: ignore[arg-type]
+
+    assert len(data) == 3 * size
+    assert decode_vector(data, dtype) == vector  # type: ignore[arg-type]
+
+
+async def test_cached_embedder_only_embeds_misses_in_order() -> None:
+    """Test cached texts skip TEI and results keep input order."""
+    cache = EmbeddingCache(MemoryBackend(), model_id="m", dtype="float32")
+    await cache.set_many(["b"], [[2.0]])
+
+    embedder = Mock()
+    embedder.embed_texts_async = AsyncMock(
+        side_effect=lambda texts, token_counts=None: [[float(ord(t) - 96)] for t in texts]
+    )
+    cached_embedder = CachedEmbedder(embedder, cache)
+
+    result = await cached_embedder.embed_texts_async(
+        ["a", "b", "c", "a"], token_counts=[1, 2, 3, 1]
+    )
+
+    assert result == [[1.0], [2.0], [3.0], [1.0]]
+    embedder.embed_texts_async.assert_awaited_once_with(["a", "c"], token_counts=[1, 3])
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+    # Second pass is served entirely from the cache
+    await cached_embedder.embed_texts_async(["a", "c"])
+    assert embedder.embed_texts_async.await_count == 1
+    assert cache.hit_rate == pytest.approx(3 / 6)
+
+
+async def test_cache_treats_backend_errors_and_wrong_dimensions_as_misses() -> None:
+    """Test a failing backend or stale-dimension entry falls back to TEI."""
+    backend = MemoryBackend()
+    cache = EmbeddingCache(backend, model_id="m", dtype="float32", expected_dim=2)
+    await cache.set_many(["short"], [[1.0]])
+
+    assert await cache.get_many(["short"]) == [None]
+
+    backend.get_many = AsyncMock(side_effect=ConnectionError("down"))  # type: ignore[method-assign]
+    assert await cache.get_many(["x", "y"]) == [None, None]
+
+
+async def test_disk_backend_persists_entries(tmp_path: Path) -> None:
+    """Test the disk backend reads back what it wrote across instances."""
+    writer = EmbeddingCache(DiskEmbeddingCacheBackend(tmp_path), model_id="m")
+    await writer.set_many(["chunk"], [[0.5, 0.25]])
+
+    reader = EmbeddingCache(DiskEmbeddingCacheBackend(tmp_path), model_id="m")
+
+    assert await reader.get_many(["chunk", "other"]) == [[0.5, 0.25], None]
+    assert not list(tmp_path.rglob(".tmp-*"))
+
+
+async def test_cached_embedder_array_path_merges_hits_and_misses() -> None:
+    """Test embed_array_async fills hit rows from cache and misses from the embedder."""
+    cache = EmbeddingCache(MemoryBackend(), model_id="m", dtype="float32")
+    await cache.set_many(["hit"], [[1.0, 1.0]])
+
+    embedder = Mock()
+    embedder.embed_array_async = AsyncMock(
+        return_value=np.array([[2.0, 2.0], [3.0, 3.0]], dtype=np.float32)
+    )
+    cached_embedder = CachedEmbedder(embedder, cache)
+
+    matrix = await cached_embedder.embed_array_async(["a", "hit", "b", "a"])
+
+    assert matrix.dtype == np.float32
+    assert matrix[:, 0].tolist() == [2.0, 1.0, 3.0, 2.0]
+    assert await cache.get_many(["b"]) == [[3.0, 3.0]]
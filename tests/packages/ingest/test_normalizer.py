@@ -4,6 +4,8 @@ Tests HTML-to-Markdown conversion and boilerplate removal.
 Following TDD methodology (RED-GREEN-REFACTOR).
 """
 
+import pytest
+
 
 class TestNormalizer:
     """Tests for the Normalizer class."""
@@ -121,3 +123,76 @@ class TestNormalizer:
 
         # Should normalize to single spaces
         assert "Text with multiple spaces" in markdown or "Text   with" not in markdown
+
+    def test_lxml_backend_keeps_lists_tables_and_code_fences(self) -> None:
+        """Test the lxml backend renders block structure as Markdown."""
+        from packages.ingest.normalizer import Normalizer
+
+        html = """
+        <h2>Ports</h2>
+        <ul><li>api</li><li>worker<ol><li>first</li></ol></li></ul>
+        <table><tr><th>Name</th><th>Port</th></tr><tr><td>api</td><td>8000</td></tr></table>
+        <pre><code class="language-yaml">
+        port: 8000
+        </code></pre>
+        """
+        markdown = Normalizer(backend="lxml").normalize(html)
+
+        assert markdown == (
+            "## Ports\n\n"
+            "- api\n- worker\n  1. first\n\n"
+            "| Name | Port |\n| --- | --- |\n| api | 8000 |\n\n"
+            "```yaml\nport: 8000\n```"
+        )
+
+    def test_lxml_backend_keeps_markers_of_items_wrapping_blocks(self) -> None:
+        """Test list items whose text sits in a <p> or <div> keep their markers."""
+        from packages.ingest.normalizer import Normalizer
+
+        normalizer = Normalizer(backend="lxml")
+
+        assert (
+            normalizer.normalize("<ul><li><p>First</p></li><li><p>Second</p></li></ul>")
+            == "- First\n- Second"
+        )
+        assert (
+            normalizer.normalize("<ol><li><div><div>One</div></div></li><li>Two</li></ol>")
+            == "1. One\n2. Two"
+        )
+        assert normalizer.normalize("<ul><li></li></ul><p>After</p>") == "After"
+
+    def test_lxml_backend_keeps_later_item_blocks_inside_the_item(self) -> None:
+        """Test code fences and further paragraphs of a list item stay in the list."""
+        from packages.ingest.normalizer import Normalizer
+
+        normalizer = Normalizer(backend="lxml")
+
+        assert (
+            normalizer.normalize("<ul><li><pre>x = 1</pre></li><li>b</li></ul>")
+            == "- ```\n  x = 1\n  ```\n- b"
+        )
+        assert (
+            normalizer.normalize("<ol><li><p>one</p><p>two</p></li><li>three</li></ol>")
+            == "1. one\n\n   two\n\n2. three"
+        )
+
+    def test_backends_agree_on_text_content(self) -> None:
+        """Test both backends keep the same words and drop the same boilerplate."""
+        from packages.ingest.normalizer import Normalizer
+
+        html = (
+            "<nav>Menu</nav><h1>Title</h1><p>Some   <b>bold</b> text.</p>"
+            "<script>var x;</script><footer>Footer</footer>"
+        )
+
+        fast = Normalizer(backend="lxml").normalize(html)
+        fallback = Normalizer(backend="html.parser").normalize(html)
+
+        assert fast == fallback == "# Title\n\nSome bold text."
+
+    def test_rejects_unknown_backend(self) -> None:
+        """Test an unknown backend name raises ValueError."""
+        from packages.ingest.normalizer import Normalizer
+
+        with pytest.raises(ValueError, match="Unknown normalizer backend"):
+            Normalizer(backend="regex")
@@ -0,0 +1,46 @@
+"""Tests for the process-pool document preparer."""
+
+import pytest
+
+from packages.ingest.chunker import Chunker
+from packages.ingest.normalizer import Normalizer
+from packages.ingest.preparer import DocumentPreparer, content_hash, default_workers
+
+HTML = "<h1>Guide</h1>" + "".join(
+    f"<h2>Part {part}</h2><p>{' '.join(f'Sentence {part}-{i} is here.' for i in range(40))}</p>"
+    for part in range(5)
+)
+
+
+def test_use_pool_only_for_large_or_unbounded_jobs() -> None:
+    """Test small jobs and single-worker preparers stay in-process."""
+    preparer = DocumentPreparer(Normalizer(), Chunker(), workers=4, min_pool_documents=16)
+
+    assert preparer.use_pool(None)
+    assert preparer.use_pool(16)
+    assert not preparer.use_pool(15)
+    assert not DocumentPreparer(Normalizer(), Chunker(), workers=1).use_pool(None)
+    assert default_workers() >= 1
+
+
+def test_rejects_non_positive_workers() -> None:
+    """Test workers must be at least 1."""
+    with pytest.raises(ValueError, match="workers must be >= 1"):
+        DocumentPreparer(Normalizer(), Chunker(), workers=0)
+
+
+async def test_pooled_preparation_matches_in_process() -> None:
+    """Test pool workers rebuild the same normalizer/chunker and return equal chunks."""
+    preparer = DocumentPreparer(Normalizer(), Chunker(chunk_size=64, chunk_overlap=8), workers=2)
+    try:
+        local_markdown, local_hash = await preparer.normalize(HTML)
+        pooled_markdown, pooled_hash = await preparer.normalize(HTML, pooled=True)
+        local_chunks = await preparer.chunk(local_markdown)
+        pooled_chunks = await preparer.chunk(pooled_markdown, pooled=True)
+    finally:
+        preparer.close()
+
+    assert pooled_markdown == local_markdown
+    assert pooled_hash == local_hash == content_hash(local_markdown)
+    assert len(pooled_chunks) > 1
+    assert pooled_chunks == local_chunks
@@ -0,0 +1,177 @@
+"""Tests for the local embedding store and collection rebuild."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from packages.vector.embedding_store import (
+    EmbeddingStoreError,
+    LocalEmbeddingStore,
+    chunk_content_hash,
+)
+from packages.vector.migrations.versioning import QdrantMigration
+
+DIM = 4
+
+
+def _vectors(*values: float) -> np.ndarray:
+    return np.array([[value] * DIM for value in values], dtype=np.float32)
+
+
+def _append(store: LocalEmbeddingStore, ids: list[str], contents: list[str]) -> int:
+    return store.append(
+        ids=ids,
+        vectors=_vectors(*range(len(ids))),
+        payloads=[{"content": content} for content in contents],
+        hashes=[chunk_content_hash(content) for content in contents],
+    )
+
+
+def test_append_dedupes_vectors_by_content_hash(tmp_path: Path) -> None:
+    """Test identical content shares one row while every point is kept."""
+    store = LocalEmbeddingStore(tmp_path, dim=DIM)
+
+    assert _append(store, ["a", "b", "c"], ["x", "y", "x"]) == 2
+    assert _append(store, ["d"], ["y"]) == 0
+
+    assert store.row_count == 2
+    assert isinstance(store.vectors(), np.memmap)
+    assert store.get(chunk_content_hash("y")).tolist() == [1.0] * DIM
+    assert store.get(chunk_content_hash("missing")) is None
+
+
+def test_iter_batches_keeps_latest_record_per_id(tmp_path: Path) -> None:
+    """Test re-written ids yield only their last payload, in write order."""
+    store = LocalEmbeddingStore(tmp_path, dim=DIM)
+    _append(store, ["a", "b"], ["one", "two"])
+    _append(store, ["a", "c"], ["three", "four"])
+
+    batches = list(LocalEmbeddingStore(tmp_path, dim=DIM).iter_batches(batch_size=2))
+
+    assert [batch.ids for batch in batches] == [["b", "a"], ["c"]]
+    assert batches[0].payloads == [{"content": "two"}, {"content": "three"}]
+    assert batches[0].vectors.dtype == np.float32
+    assert batches[0].vectors[:, 0].tolist() == [1.0, 0.0]
+
+
+def test_iter_batches_skips_deleted_points(tmp_path: Path) -> None:
+    """Test tombstoned ids are left out until they are written again."""
+    store = LocalEmbeddingStore(tmp_path, dim=DIM)
+    _append(store, ["a", "b", "c"], ["one", "two", "three"])
+    store.delete(["a", "c"])
+    _append(store, ["c"], ["three"])
+
+    (batch,) = LocalEmbeddingStore(tmp_path, dim=DIM).iter_batches()
+
+    assert batch.ids == ["b", "c"]
+    assert store.get(chunk_content_hash("one")) is not None
+
+
+def test_append_payloads_reuses_stored_vectors(tmp_path: Path) -> None:
+    """Test payload-only records replace the payload and keep the vector."""
+    store = LocalEmbeddingStore(tmp_path, dim=DIM)
+    _append(store, ["a", "b"], ["one", "two"])
+
+    store.append_payloads(["a"], [{"content": "one", "position": 5}], [chunk_content_hash("one")])
+
+    (batch,) = store.iter_batches()
+    assert batch.ids == ["b", "a"]
+    assert batch.payloads[1] == {"content": "one", "position": 5}
+    assert batch.vectors[1].tolist() == [0.0] * DIM
+    assert store.row_count == 2
+    with pytest.raises(ValueError, match="same length"):
+        store.append_payloads(["a"], [], [])
+
+
+def test_torn_writes_are_ignored_and_repaired(tmp_path: Path) -> None:
+    """Test a partial row and partial record from a crash do not corrupt the store."""
+    store = LocalEmbeddingStore(tmp_path, dim=DIM)
+    _append(store, ["a"], ["one"])
+    with (tmp_path / "vectors.f32").open("ab") as handle:
+        handle.write(b"\x00" * 6)
+    with (tmp_path / "points.jsonl").open("ab") as handle:
+        handle.write(b'{"id": "b", "ha')
+
+    reopened = LocalEmbeddingStore(tmp_path, dim=DIM)
+    assert [batch.ids for batch in reopened.iter_batches()] == [["a"]]
+
+    _append(reopened, ["c"], ["two"])
+    assert (tmp_path / "vectors.f32").stat().st_size == 2 * DIM * 4
+    assert reopened.get(chunk_content_hash("two")).tolist() == [0.0] * DIM
+
+
+def test_store_rejects_other_dimension_or_model(tmp_path: Path) -> None:
+    """Test reopening with a different dim or model raises."""
+    LocalEmbeddingStore(tmp_path, dim=DIM, model_id="model-a")
+
+    with pytest.raises(EmbeddingStoreError, match="4-dim"):
+        LocalEmbeddingStore(tmp_path, dim=8)
+    with pytest.raises(EmbeddingStoreError, match="model-a"):
+        LocalEmbeddingStore(tmp_path, dim=DIM, model_id="model-b")
+
+
+def test_rebuild_from_store_writes_new_version_and_switches_alias(tmp_path: Path) -> None:
+    """Test rebuild streams stored points into a new versioned collection."""
+    store = LocalEmbeddingStore(tmp_path, dim=DIM)
+    _append(store, ["a", "b", "c"], ["one", "two", "three"])
+
+    client = Mock(spec=QdrantClient)
+    client.get_collections.return_value = Mock(collections=[Mock()])
+    client.get_collections.return_value.collections[0].name = "docs_v1"
+    client.get_aliases.return_value = models.CollectionsAliasesResponse(aliases=[])
+
+    with patch("packages.vector.migrations.versioning.create_collection") as create:
+        written = QdrantMigration(client).rebuild_from_store(store, "docs", "2.0", batch_size=2)
+
+    assert written == 3
+    create.assert_called_once_with(client, "docs_v2_0")
+    batches = [call.kwargs["points"] for call in client.upsert.call_args_list]
+    assert all(isinstance(batch, models.Batch) for batch in batches)
+    assert [batch.ids for batch in batches] == [["a", "b"], ["c"]]
+    assert batches[1].vectors == [[2.0] * DIM]
+    (operation,) = client.update_collection_aliases.call_args.kwargs["change_aliases_operations"]
+    assert operation.create_alias.collection_name == "docs_v2_0"
+    assert operation.create_alias.alias_name == "docs"
+
+
+def test_rebuild_refuses_existing_version(tmp_path: Path) -> None:
+    """Test rebuild will not write into an existing versioned collection."""
+    client = Mock(spec=QdrantClient)
+    client.get_collections.return_value = Mock(collections=[Mock()])
+    client.get_collections.return_value.collections[0].name = "docs_v2"
+
+    with pytest.raises(ValueError, match="already exists"):
+        QdrantMigration(client).rebuild_from_store(
+            LocalEmbeddingStore(tmp_path, dim=DIM), "docs", "2"
+        )
+    client.upsert.assert_not_called()
+
+
+def test_rebuild_keeps_alias_when_store_misses_live_points(tmp_path: Path) -> None:
+    """Test rebuild drops the new version unless forced when counts differ."""
+    store = LocalEmbeddingStore(tmp_path, dim=DIM)
+    _append(store, ["a", "b"], ["one", "two"])
+
+    client = Mock(spec=QdrantClient)
+    client.get_collections.return_value = Mock(collections=[])
+    client.get_aliases.return_value = models.CollectionsAliasesResponse(
+        aliases=[models.AliasDescription(alias_name="docs", collection_name="docs_v1")]
+    )
+    client.count.return_value = models.CountResult(count=3)
+
+    with patch("packages.vector.migrations.versioning.create_collection"):
+        with pytest.raises(ValueError, match="holds 2 points but docs has 3"):
+            QdrantMigration(client).rebuild_from_store(store, "docs", "2")
+        client.delete_collection.assert_called_once_with(collection_name="docs_v2")
+        client.update_collection_aliases.assert_not_called()
+
+        written = QdrantMigration(client).rebuild_from_store(store, "docs", "3", force=True)
+
+    assert written == 2
+    client.count.assert_called_with(collection_name="docs", exact=True)
+    operations = client.update_collection_aliases.call_args.kwargs["change_aliases_operations"]
+    assert operations[-1].create_alias.collection_name == "docs_v3"
@@ -2,13 +2,16 @@
 
 import uuid
 from datetime import UTC, datetime
+from pathlib import Path
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 
 from packages.schemas.models import Chunk, SourceType
+from packages.vector.embedding_store import LocalEmbeddingStore
 from packages.vector.writer import QdrantWriteError, QdrantWriter
 
 
@@ -300,3 +303,170 @@ class TestQdrantWriter:
         writer.close()
 
         mock_qdrant_client.close.assert_called_once()
+
+    def test_upsert_batch_sends_ndarray_as_columnar_batch(
+        self,
+        writer: QdrantWriter,
+        mock_qdrant_client: Mock,
+        sample_chunk: Chunk,
+    ) -> None:
+        """Test a float32 matrix is written as one Batch, split by batch_size."""
+        writer.batch_size = 2
+        chunks = [sample_chunk.model_copy(update={"chunk_id": uuid.uuid4()}) for _ in range(3)]
+        embeddings = np.arange(3 * 1024, dtype=np.float32).reshape(3, 1024)
+
+        writer.upsert_batch(chunks, embeddings)
+
+        batches = [call[1]["points"] for call in mock_qdrant_client.upsert.call_args_list]
+        assert all(isinstance(batch, models.Batch) for batch in batches)
+        assert [len(batch.ids) for batch in batches] == [2, 1]
+        assert batches[1].ids == [str(chunks[2].chunk_id)]
+        assert batches[1].vectors[0][:2] == [2048.0, 2049.0]
+        assert batches[0].payloads[0]["doc_id"] == str(sample_chunk.doc_id)
+
+    async def test_upsert_batch_async_stacks_ndarray_rows(
+        self,
+        writer: QdrantWriter,
+        mock_qdrant_client: Mock,
+        sample_chunk: Chunk,
+    ) -> None:
+        """Test row views from the pipeline are stacked into one matrix."""
+        matrix = np.ones((2, 1024), dtype=np.float32)
+
+        await writer.upsert_batch_async([sample_chunk, sample_chunk], list(matrix))
+
+        points = mock_qdrant_client.upsert.call_args[1]["points"]
+        assert isinstance(points, models.Batch)
+        assert len(points.vectors) == 2
+
+    def test_upsert_batch_rejects_bad_ndarray_embeddings(
+        self,
+        writer: QdrantWriter,
+        sample_chunk: Chunk,
+    ) -> None:
+        """Test vectorized validation catches wrong shapes and NaNs."""
+        with pytest.raises(ValueError, match="1024-dimensional"):
+            writer.upsert_batch([sample_chunk], np.zeros((1, 512), dtype=np.float32))
+
+        embeddings = np.zeros((2, 1024), dtype=np.float32)
+        embeddings[1, 7] = np.nan
+        with pytest.raises(ValueError, match="index 1"):
+            writer.upsert_batch([sample_chunk, sample_chunk], embeddings)
+
+    def test_upsert_records_written_vectors_in_embedding_store(
+        self,
+        writer: QdrantWriter,
+        mock_qdrant_client: Mock,
+        sample_chunk: Chunk,
+        tmp_path: Path,
+    ) -> None:
+        """Test successful upserts are copied to the store and failed ones are not."""
+        writer.embedding_store = LocalEmbeddingStore(tmp_path, dim=1024)
+
+        writer.upsert_single(sample_chunk, [0.5] * 1024)
+
+        (batch,) = writer.embedding_store.iter_batches()
+        assert batch.ids == [str(sample_chunk.chunk_id)]
+        assert batch.vectors[0, 0] == np.float32(0.5)
+        assert batch.payloads[0]["source_url"] == sample_chunk.source_url
+
+        mock_qdrant_client.upsert.side_effect = Exception("down")
+        other = sample_chunk.model_copy(update={"chunk_id": uuid.uuid4(), "content": "new"})
+        with pytest.raises(QdrantWriteError):
+            writer.upsert_single(other, [0.1] * 1024)
+        assert writer.embedding_store.row_count == 1
+
+    def test_reconcile_document_deletes_stale_points_and_returns_new_chunks(
+        self, writer: QdrantWriter, mock_qdrant_client: Mock, sample_chunk: Chunk
+    ) -> None:
+        """Test a re-ingested document keeps, moves, deletes and adds points in one call."""
+        kept = sample_chunk.model_copy(update={"position": 1})
+        new = sample_chunk.model_copy(update={"chunk_id": uuid.uuid4(), "position": 0})
+        stale_id = str(uuid.uuid4())
+        mock_qdrant_client.scroll.side_effect = [
+            ([models.Record(id=str(kept.chunk_id), payload={"position": 0})], "next"),
+            ([models.Record(id=stale_id, payload={"position": 1})], None),
+        ]
+
+        pending = writer.reconcile_document(sample_chunk.doc_id, [new, kept])
+
+        assert pending == [new]
+        assert mock_qdrant_client.scroll.call_args_list[1].kwargs["offset"] == "next"
+        mock_qdrant_client.batch_update_points.assert_called_once()
+        delete, move = mock_qdrant_client.batch_update_points.call_args.kwargs["update_operations"]
+        selector = delete.delete.filter
+        assert selector.must[0].match.value == str(sample_chunk.doc_id)
+        assert selector.must_not[0].has_id == [str(new.chunk_id), str(kept.chunk_id)]
+        assert move.set_payload.points == [str(kept.chunk_id)]
+        assert move.set_payload.payload == {"position": 1}
+
+    def test_rebuild_after_reconcile_leaves_out_deleted_points(
+        self,
+        writer: QdrantWriter,
+        mock_qdrant_client: Mock,
+        sample_chunk: Chunk,
+        tmp_path: Path,
+    ) -> None:
+        """Test points deleted by reconcile are tombstoned in the embedding store."""
+        from packages.vector.migrations.versioning import QdrantMigration
+
+        writer.embedding_store = LocalEmbeddingStore(tmp_path, dim=1024)
+        stale = sample_chunk.model_copy(update={"chunk_id": uuid.uuid4(), "content": "old"})
+        writer.upsert_batch([sample_chunk, stale], [[0.1] * 1024, [0.2] * 1024])
+        mock_qdrant_client.scroll.return_value = (
+            [
+                models.Record(id=str(sample_chunk.chunk_id), payload={"position": 0}),
+                models.Record(id=str(stale.chunk_id), payload={"position": 1}),
+            ],
+            None,
+        )
+
+        assert writer.reconcile_document(sample_chunk.doc_id, [sample_chunk]) == []
+
+        rebuild_client = Mock(spec=QdrantClient)
+        rebuild_client.get_collections.return_value = Mock(collections=[])
+        rebuild_client.get_aliases.return_value = models.CollectionsAliasesResponse(aliases=[])
+        with patch("packages.vector.migrations.versioning.create_collection"):
+            written = QdrantMigration(rebuild_client).rebuild_from_store(
+                writer.embedding_store, "documents", "2.0"
+            )
+
+        assert written == 1
+        (call,) = rebuild_client.upsert.call_args_list
+        assert call.kwargs["points"].ids == [str(sample_chunk.chunk_id)]
+
+    def test_reconcile_document_records_moved_positions_in_embedding_store(
+        self,
+        writer: QdrantWriter,
+        mock_qdrant_client: Mock,
+        sample_chunk: Chunk,
+        tmp_path: Path,
+    ) -> None:
+        """Test a moved point's new position is what a rebuild restores."""
+        writer.embedding_store = LocalEmbeddingStore(tmp_path, dim=1024)
+        writer.upsert_batch([sample_chunk], [[0.1] * 1024])
+        mock_qdrant_client.scroll.return_value = (
+            [models.Record(id=str(sample_chunk.chunk_id), payload={"position": 0})],
+            None,
+        )
+        moved = sample_chunk.model_copy(update={"position": 3})
+
+        assert writer.reconcile_document(sample_chunk.doc_id, [moved]) == []
+
+        (batch,) = writer.embedding_store.iter_batches()
+        assert batch.ids == [str(sample_chunk.chunk_id)]
+        assert batch.payloads[0]["position"] == 3
+        assert batch.vectors[0, 0] == np.float32(0.1)
+        assert writer.embedding_store.row_count == 1
+
+    def test_reconcile_document_skips_update_when_nothing_changed(
+        self, writer: QdrantWriter, mock_qdrant_client: Mock, sample_chunk: Chunk
+    ) -> None:
+        """Test an unchanged chunk list issues no update and needs no embedding."""
+        mock_qdrant_client.scroll.return_value = (
+            [models.Record(id=str(sample_chunk.chunk_id), payload={"position": 0})],
+            None,
+        )
+
+        assert writer.reconcile_document(sample_chunk.doc_id, [sample_chunk]) == []
+        mock_qdrant_client.batch_update_points.assert_not_called()